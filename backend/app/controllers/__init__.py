@@ -3,5 +3,9 @@ Controllers Package
 """
 from .pdf_controller import router as pdf_router
 from .profile_controller import router as profile_router
+from .pipeline_controller import router as pipeline_router
+from .job_controller import router as job_router
+from .analysis_job_controller import router as analysis_job_router
+from .metrics_controller import router as metrics_router
 
-__all__ = ["pdf_router", "profile_router"]
+__all__ = ["pdf_router", "profile_router", "pipeline_router", "job_router", "analysis_job_router", "metrics_router"]
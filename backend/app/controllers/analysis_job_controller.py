@@ -0,0 +1,155 @@
+"""
+분석 작업 컨트롤러 - LLM 분석을 작업 큐에 제출하고 상태/결과를 조회
+"""
+from fastapi import APIRouter, HTTPException, Query
+from app.services.analysis_queue import analysis_queue
+from app.models import (
+    ProfileAnalysisRequest,
+    ProfileAnalysisResponse,
+    UserProfile,
+    CareerIdentityRequest,
+    CareerIdentityResponse,
+    AnalysisJobSubmitResponse,
+    AnalysisJobStatusResponse,
+    AnalysisQueueStatsResponse
+)
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+router = APIRouter(
+    prefix="/api",
+    tags=["Analysis Job"]
+)
+
+
+@router.post("/analysis-jobs/profile", response_model=AnalysisJobSubmitResponse, status_code=202)
+async def submit_profile_analysis(request: ProfileAnalysisRequest):
+    """
+    프로필 분석을 작업 큐에 제출하고 작업 ID를 바로 반환합니다.
+
+    결과는 GET /api/analysis-jobs/{job_id} 로 조회합니다.
+
+    Args:
+        request: 프로필 분석 요청 (/api/analyze-profile과 동일)
+
+    Returns:
+        AnalysisJobSubmitResponse: 작업 ID와 대기열 정보
+    """
+    return await _submit("profile", request.model_dump())
+
+
+@router.post("/analysis-jobs/career-identity", response_model=AnalysisJobSubmitResponse, status_code=202)
+async def submit_career_identity_analysis(request: CareerIdentityRequest):
+    """
+    직업정체성 분석을 작업 큐에 제출하고 작업 ID를 바로 반환합니다.
+
+    결과는 GET /api/analysis-jobs/{job_id} 로 조회합니다.
+
+    Args:
+        request: 직업정체성 분석 요청 (/api/analyze-career-identity와 동일)
+
+    Returns:
+        AnalysisJobSubmitResponse: 작업 ID와 대기열 정보
+    """
+    return await _submit("career_identity", request.model_dump())
+
+
+@router.get("/analysis-jobs/stats", response_model=AnalysisQueueStatsResponse)
+async def get_analysis_queue_stats():
+    """
+    분석 작업 큐 통계 (대기열 깊이, 대기 시간, 실행 시간)를 반환합니다.
+    """
+    return AnalysisQueueStatsResponse(**await analysis_queue.get_stats())
+
+
+@router.get("/analysis-jobs/{job_id}", response_model=AnalysisJobStatusResponse)
+async def get_analysis_job(
+    job_id: str,
+    wait: float = Query(0.0, ge=0.0, le=settings.ANALYSIS_JOB_MAX_WAIT, description="작업이 끝날 때까지 기다릴 최대 시간 (초, long-poll)")
+):
+    """
+    분석 작업의 상태와 결과를 조회합니다.
+
+    wait를 지정하면 작업이 끝나거나 wait초가 지날 때까지 응답을 보류합니다. (long-poll)
+
+    Args:
+        job_id: 작업 ID
+        wait: 최대 대기 시간 (초, 0이면 즉시 응답)
+
+    Returns:
+        AnalysisJobStatusResponse: 작업 상태 (완료 시 결과 포함)
+    """
+    job = await analysis_queue.wait(job_id, wait) if wait > 0 else await analysis_queue.get(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다.")
+
+    return _build_status_response(job)
+
+
+async def _submit(kind: str, payload: dict) -> AnalysisJobSubmitResponse:
+    """작업 제출 (대기열이 가득 차면 503)"""
+    submitted = await analysis_queue.submit(kind, payload)
+
+    if not submitted["success"]:
+        raise HTTPException(status_code=503, detail=submitted["error"])
+
+    job = submitted["job"]
+    logger.info(f"분석 작업 제출 - {job['job_id']} ({kind}), 대기 {submitted['queue_depth']}개")
+
+    return AnalysisJobSubmitResponse(
+        job_id=job["job_id"],
+        kind=kind,
+        status=job["status"],
+        queue_position=job["queue_position"],
+        queue_depth=submitted["queue_depth"],
+        status_url=f"/api/analysis-jobs/{job['job_id']}"
+    )
+
+
+def _build_status_response(job: dict) -> AnalysisJobStatusResponse:
+    """작업 행을 상태 응답으로 변환 (결과는 동기 분석 API와 같은 응답 모델로)"""
+    result = None
+    data = job["result"]
+
+    if job["status"] == "succeeded" and data is not None:
+        if job["kind"] == "profile":
+            result = ProfileAnalysisResponse(
+                success=True,
+                profile=UserProfile(**data["profile"]),
+                raw_response=data["raw_response"],
+                model_used=data["model_used"],
+                cache_status=data.get("cache_status", "disabled"),
+                compaction=data.get("compaction")
+            )
+        else:
+            result = CareerIdentityResponse(
+                success=True,
+                career_identity=data["career_identity"],
+                rationale=data["rationale"],
+                raw_response=data["raw_response"],
+                model_used=data["model_used"],
+                cache_status=data.get("cache_status", "disabled"),
+                engine=data.get("engine", "llm"),
+                degraded=data.get("degraded", False)
+            )
+
+    started_at, finished_at = job["started_at"], job["finished_at"]
+
+    return AnalysisJobStatusResponse(
+        job_id=job["job_id"],
+        kind=job["kind"],
+        status=job["status"],
+        queue_position=job["queue_position"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=started_at,
+        finished_at=finished_at,
+        wait_time_ms=round((started_at - job["created_at"]) * 1000, 1) if started_at else None,
+        run_time_ms=round((finished_at - started_at) * 1000, 1) if started_at and finished_at else None,
+        result=result,
+        error=job["error"]
+    )
@@ -0,0 +1,54 @@
+"""
+직업 추천 컨트롤러 - API 엔드포인트 레이어
+"""
+from fastapi import APIRouter, HTTPException
+from app.services.job_store import job_store
+from app.models import (
+    JobRecommendationRequest,
+    JobRecommendationResponse,
+    JobStoreStatsResponse
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+router = APIRouter(
+    prefix="/api",
+    tags=["Job"]
+)
+
+
+@router.post("/recommend-jobs", response_model=JobRecommendationResponse)
+async def recommend_jobs(request: JobRecommendationRequest):
+    """
+    사용자 프로필과 가장 유사한 직업을 Mini-DB에서 찾아 추천합니다.
+
+    Args:
+        request: 직업 추천 요청 (profile, top_k)
+
+    Returns:
+        JobRecommendationResponse: 유사도 순 추천 직업 목록
+    """
+    result = await job_store.recommend(request.profile.model_dump(), request.top_k)
+
+    if not result["success"]:
+        raise HTTPException(
+            status_code=503,
+            detail=f"직업 추천 실패: {result.get('error', 'Unknown error')}"
+        )
+
+    logger.info(
+        f"직업 추천 완료 - 상위 {len(result['recommendations'])}개 / {result['total_jobs']}개 "
+        f"(임베딩 {result['embed_time_ms']:.3f}ms, 검색 {result['search_time_ms']:.3f}ms)"
+    )
+
+    return JobRecommendationResponse(**result)
+
+
+@router.get("/jobs/stats", response_model=JobStoreStatsResponse)
+async def get_job_store_stats():
+    """
+    직업 저장소(로드된 직업 수, 행렬 크기, 평균 검색 시간) 통계를 반환합니다.
+    """
+    return JobStoreStatsResponse(**job_store.get_stats())
@@ -0,0 +1,33 @@
+"""
+메트릭 컨트롤러 - Prometheus 수집 엔드포인트
+"""
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.core.metrics import metrics
+
+# 라우터 생성 (Prometheus 기본 수집 경로에 맞춰 /api 접두사 없음)
+router = APIRouter(
+    tags=["Metrics"]
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4"  # charset=utf-8은 응답 클래스가 붙임
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    모든 워커의 메트릭을 합산하여 Prometheus 텍스트 형식으로 반환합니다.
+
+    - jobjalhane_stage_duration_seconds: 업로드 읽기/저장, PDF 추출 대기/실행, 파일 저장, LLM 호출/파싱 등 단계별 소요 시간
+    - jobjalhane_http_request_duration_seconds: 라우트별 HTTP 요청 처리 시간
+    - jobjalhane_llm_tokens_total: 제공자/모델별 입력·출력·캐시 토큰 수
+    - jobjalhane_http_requests_in_flight, jobjalhane_extraction_executor_queue_depth 등: 현재 부하 게이지
+
+    Returns:
+        PlainTextResponse: Prometheus 텍스트 형식 (version 0.0.4)
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다.")
+
+    return PlainTextResponse(await metrics.render(), media_type=CONTENT_TYPE)
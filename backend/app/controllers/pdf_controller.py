@@ -2,9 +2,17 @@
 PDF 컨트롤러 - API 엔드포인트 레이어
 """
 from fastapi import APIRouter, File, UploadFile, HTTPException
-from app.services import PDFService
-from app.models import PDFUploadResponse, SupportedFormatsResponse
-from app.core.utils import generate_unique_filename, save_uploaded_file, get_file_size, save_extracted_text
+from app.services import PDFService, UploadService, extraction_cache
+from app.models import (
+    PDFUploadResponse,
+    SupportedFormatsResponse,
+    ExtractionCacheStatsResponse,
+    FileWriterStatsResponse,
+    ScoreExtractionResponse
+)
+from app.core.config import settings
+from app.core.file_writer import file_writer
+from app.core.metrics import stage_seconds
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,6 +25,7 @@ router = APIRouter(
 
 # 서비스 인스턴스
 pdf_service = PDFService()
+upload_service = UploadService()
 
 
 @router.get("/supported-formats", response_model=SupportedFormatsResponse)
@@ -43,85 +52,164 @@ async def upload_pdf(file: UploadFile = File(...)):
         PDFUploadResponse: 추출된 텍스트와 메타데이터
     """
     # 파일 확장자 확인
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(
-            status_code=400,
-            detail="PDF 파일만 업로드 가능합니다."
-        )
-
-    # 파일 크기 제한 (10MB)
-    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
+    error = upload_service.validate_filename(file.filename)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
 
     try:
-        # 파일 읽기
-        contents = await file.read()
+        # 파일 저장 (청크 단위로 읽으며 크기 제한 확인, 해시 계산)
+        with stage_seconds.time(component="pdf_controller", stage="receive_upload"):
+            upload = await upload_service.receive_upload(file)
+        if not upload["success"]:
+            raise HTTPException(status_code=400, detail=upload["error"])
 
-        # 파일 크기 확인
-        if len(contents) > MAX_FILE_SIZE:
+        # 텍스트 추출 (서비스 레이어 호출)
+        with stage_seconds.time(component="pdf_controller", stage="process_upload"):
+            result = await upload_service.process_upload(file.filename, upload)
+
+        if not result["success"]:
             raise HTTPException(
-                status_code=400,
-                detail="파일 크기는 10MB를 초과할 수 없습니다."
+                status_code=500,
+                detail=f"PDF 텍스트 추출 실패: {result.get('error', 'Unknown error')}"
             )
 
-        logger.info(f"Processing PDF file: {file.filename} ({len(contents)} bytes)")
+        return _build_upload_response(
+            file.filename,
+            result["entry"],
+            result["content_hash"],
+            cache_hit=result["cache_hit"]
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing PDF: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}"
+        )
+
 
-        # 고유한 파일명 생성
-        unique_filename = generate_unique_filename(file.filename)
+@router.post("/extract-scores", response_model=ScoreExtractionResponse)
+async def extract_scores(file: UploadFile = File(...)):
+    """
+    직업선호도검사 (L형) PDF에서 흥미/성격/생활사 점수를 LLM 없이 추출합니다.
 
-        # 파일 저장
-        file_path = save_uploaded_file(contents, unique_filename)
-        file_size = get_file_size(file_path)
+    응답의 riasec_scores, big5_scores, life_history_scores는
+    /api/analyze-career-identity 요청에 그대로 사용할 수 있습니다.
 
-        logger.info(f"File saved: {file_path} ({file_size} bytes)")
+    Args:
+        file: 업로드된 PDF 파일
 
-        # PDF 텍스트 추출 (서비스 레이어 호출)
-        result = await pdf_service.extract_text_from_pdf(contents)
+    Returns:
+        ScoreExtractionResponse: 섹션별 점수
+    """
+    # 파일 확장자 확인
+    error = upload_service.validate_filename(file.filename)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
 
-        if not result["success"]:
+    try:
+        # 파일 저장 (청크 단위로 읽으며 크기 제한 확인, 해시 계산)
+        with stage_seconds.time(component="pdf_controller", stage="receive_upload"):
+            upload = await upload_service.receive_upload(file)
+        if not upload["success"]:
+            raise HTTPException(status_code=400, detail=upload["error"])
+
+        # 표/단어 위치 기반 점수 추출 (서비스 레이어 호출)
+        result = await pdf_service.extract_scores(upload["file_path"])
+
+        # PDF 자체를 열지 못한 경우 (일부 섹션 누락은 success=False로 응답)
+        if result["pages_scanned"] == 0:
             raise HTTPException(
                 status_code=500,
-                detail=f"PDF 텍스트 추출 실패: {result.get('error', 'Unknown error')}"
+                detail=f"점수 추출 실패: {result.get('error', 'Unknown error')}"
             )
 
-        # 형식 감지 결과 확인
-        format_detected = result["metadata"]["format_detected"]
-        is_supported = pdf_service.is_supported_format(format_detected)
-
-        # 추출된 텍스트를 파일로 저장
-        extracted_text_path = save_extracted_text(result["text"], unique_filename)
-        logger.info(f"Extracted text saved to: {extracted_text_path}")
-
-        # 응답 데이터 구성
-        response_data = {
-            "success": True,
-            "filename": file.filename,
-            "saved_filename": unique_filename,
-            "file_path": file_path,
-            "file_size": file_size,
-            "text": result["text"],
-            "total_pages": result["metadata"]["total_pages"],
-            "format_detected": format_detected,
-            "is_supported_format": is_supported,
-            "preview": result["text"][:500] + "..." if len(result["text"]) > 500 else result["text"],
-            "extracted_text_path": extracted_text_path
-        }
-
-        # 지원하지 않는 형식 경고
-        if format_detected == "Unknown":
-            logger.warning(f"Unknown PDF format detected for file: {file.filename}")
-            response_data["warning"] = "감지된 형식이 지원 목록에 없습니다. 텍스트 추출은 완료되었으나, 정확한 분석이 어려울 수 있습니다."
-        elif not is_supported:
-            response_data["warning"] = f"'{format_detected}' 형식은 현재 지원되지 않습니다."
-
-        logger.info(f"Successfully processed PDF: {file.filename} - Format: {format_detected}")
-
-        return PDFUploadResponse(**response_data)
+        if not result["success"]:
+            logger.warning(f"Score extraction incomplete: {file.filename} - {result['missing_sections']}")
+
+        return ScoreExtractionResponse(
+            filename=file.filename,
+            saved_filename=upload["saved_filename"],
+            content_hash=upload["content_hash"],
+            **result
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing PDF: {str(e)}")
+        logger.error(f"Error extracting scores: {str(e)}")
         raise HTTPException(
             status_code=500,
-            detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}"
+            detail=f"점수 추출 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.get("/extraction-cache/stats", response_model=ExtractionCacheStatsResponse)
+async def get_extraction_cache_stats():
+    """
+    추출 캐시 적중/미스 통계를 반환합니다.
+    """
+    return ExtractionCacheStatsResponse(
+        enabled=settings.EXTRACTION_CACHE_ENABLED,
+        **extraction_cache.get_stats()
+    )
+
+
+@router.get("/file-writer/stats", response_model=FileWriterStatsResponse)
+async def get_file_writer_stats():
+    """
+    파일 저장 큐 통계(대기 수, 저장 성공/실패)를 반환합니다.
+    """
+    return FileWriterStatsResponse(**file_writer.get_stats())
+
+
+def _build_upload_response(
+    filename: str,
+    entry: dict,
+    content_hash: str,
+    cache_hit: bool
+) -> PDFUploadResponse:
+    """
+    추출 결과 항목으로 업로드 응답 구성
+
+    Args:
+        filename: 원본 파일명
+        entry: 추출 결과 항목 (새로 추출했거나 캐시에서 조회한 값)
+        content_hash: PDF 내용의 SHA-256 해시
+        cache_hit: 캐시 적중 여부
+
+    Returns:
+        PDFUploadResponse: 업로드 응답
+    """
+    # 형식 감지 결과 확인
+    format_detected = entry["format_detected"]
+    is_supported = pdf_service.is_supported_format(format_detected)
+    text = entry["text"]
+
+    # 응답 데이터 구성
+    response_data = {
+        "success": True,
+        "filename": filename,
+        "saved_filename": entry["saved_filename"],
+        "file_path": entry["file_path"],
+        "file_size": entry["file_size"],
+        "text": text,
+        "total_pages": entry["total_pages"],
+        "format_detected": format_detected,
+        "is_supported_format": is_supported,
+        "preview": text[:500] + "..." if len(text) > 500 else text,
+        "extracted_text_path": entry["extracted_text_path"],
+        "content_hash": content_hash,
+        "cache_hit": cache_hit
+    }
+
+    # 지원하지 않는 형식 경고
+    if format_detected == "Unknown":
+        logger.warning(f"Unknown PDF format detected for file: {filename}")
+    response_data["warning"] = upload_service.get_format_warning(format_detected)
+
+    logger.info(f"Successfully processed PDF: {filename} - Format: {format_detected}")
+
+    return PDFUploadResponse(**response_data)
@@ -0,0 +1,192 @@
+"""
+파이프라인 컨트롤러 - 업로드부터 프로필 분석까지 한 번에 처리
+"""
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, File, Form, UploadFile, HTTPException
+from fastapi.responses import StreamingResponse
+from app.services import UploadService, LLMService, BatchService
+from app.models import PipelineAnalysisResponse, UserProfile, BatchItemResult, BatchSummary
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+router = APIRouter(
+    prefix="/api",
+    tags=["Pipeline"]
+)
+
+# 서비스 인스턴스
+upload_service = UploadService()
+llm_service = LLMService()
+batch_service = BatchService()
+
+
+@router.post("/upload-and-analyze", response_model=PipelineAnalysisResponse)
+async def upload_and_analyze(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    include_text: bool = Form(False),
+    use_cache: bool = Form(True),
+    full_extraction: bool = Form(False)
+):
+    """
+    PDF 업로드, 텍스트 추출, 형식 감지, 프로필 분석을 서버에서 한 번에 처리합니다.
+
+    추출된 텍스트가 클라이언트와 서버 사이를 두 번 오가지 않도록
+    기본적으로 원문 텍스트는 응답에 포함하지 않습니다.
+    압축(TEXT_COMPACTION_ENABLED)이 켜져 있으면 전체를 추출한 뒤 중요 구간만 프롬프트에 넣고,
+    꺼져 있으면 분석 예산(ANALYSIS_CHAR_BUDGET)만큼만 읽고 멈추며
+    나머지 페이지는 응답 이후 백그라운드에서 전체 추출합니다.
+
+    Args:
+        file: 업로드된 PDF 파일
+        include_text: 추출된 텍스트를 응답에 포함할지 여부
+        use_cache: LLM 응답 캐시 사용 여부
+        full_extraction: 예산 없이 전체 페이지를 바로 추출할지 여부
+
+    Returns:
+        PipelineAnalysisResponse: 프로필과 간단한 메타데이터
+    """
+    # 파일 확장자 확인
+    error = upload_service.validate_filename(file.filename)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    try:
+        # 파일 저장 (청크 단위로 읽으며 크기 제한 확인, 해시 계산)
+        upload = await upload_service.receive_upload(file)
+        if not upload["success"]:
+            raise HTTPException(status_code=400, detail=upload["error"])
+
+        # 1. 텍스트 추출 (기본: 분석 예산만큼만 추출, 압축 사용 시 문자 예산 없음)
+        if full_extraction:
+            upload_result = await upload_service.process_upload(file.filename, upload)
+        else:
+            char_budget, page_budget = upload_service.get_analysis_budget()
+            upload_result = await upload_service.process_upload(
+                file.filename,
+                upload,
+                char_budget=char_budget,
+                page_budget=page_budget
+            )
+
+        if not upload_result["success"]:
+            raise HTTPException(
+                status_code=500,
+                detail=f"PDF 텍스트 추출 실패: {upload_result.get('error', 'Unknown error')}"
+            )
+
+        entry = upload_result["entry"]
+        format_detected = entry["format_detected"]
+
+        # 예산 추출로 남은 페이지는 응답 이후 전체 추출
+        if entry.get("truncated") and not upload_result["cache_hit"]:
+            background_tasks.add_task(
+                upload_service.complete_extraction,
+                upload_result["content_hash"],
+                entry
+            )
+
+        # 2. LLM 프로필 분석
+        logger.info(f"파이프라인 프로필 분석 시작 - 형식: {format_detected}")
+
+        result = await llm_service.analyze_profile(
+            text=entry["text"],
+            format_detected=format_detected,
+            use_cache=use_cache
+        )
+
+        if not result["success"]:
+            raise HTTPException(
+                status_code=500,
+                detail=f"프로필 분석 실패: {result.get('error', 'Unknown error')}"
+            )
+
+        # 응답 데이터 구성
+        response = PipelineAnalysisResponse(
+            success=True,
+            filename=file.filename,
+            saved_filename=entry["saved_filename"],
+            content_hash=upload_result["content_hash"],
+            file_size=entry["file_size"],
+            total_pages=entry["total_pages"],
+            pages_extracted=entry.get("pages_extracted", entry["total_pages"]),
+            extraction_truncated=entry.get("truncated", False),
+            text_length=len(entry["text"]),
+            format_detected=format_detected,
+            is_supported_format=upload_service.pdf_service.is_supported_format(format_detected),
+            extraction_cache_hit=upload_result["cache_hit"],
+            profile=UserProfile(**result["profile"]),
+            model_used=result["model_used"],
+            cache_status=result.get("cache_status", "disabled"),
+            compaction=result.get("compaction"),
+            text=entry["text"] if include_text else None,
+            warning=upload_service.get_format_warning(format_detected)
+        )
+
+        logger.info(f"파이프라인 처리 완료 - {file.filename}, 모델: {result['model_used']}")
+
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"파이프라인 처리 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"파이프라인 처리 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/batch-analyze")
+async def batch_analyze(
+    files: List[UploadFile] = File(...),
+    concurrency: Optional[int] = Form(None),
+    use_cache: bool = Form(True)
+):
+    """
+    여러 PDF(또는 PDF가 담긴 ZIP)를 한 번에 추출·프로필 분석하고,
+    파일별 결과를 완료되는 순서대로 NDJSON(한 줄에 JSON 하나)으로 스트리밍합니다.
+
+    줄 종류:
+        - result: 파일별 결과 (BatchItemResult, 실패한 파일도 stage/error와 함께 포함)
+        - summary: 모든 파일이 끝난 뒤 처리량 요약 (BatchSummary, 마지막 줄)
+
+    Args:
+        files: 업로드된 PDF/ZIP 파일 목록
+        concurrency: 동시에 진행할 프로필 분석 수 (기본값 BATCH_CONCURRENCY)
+        use_cache: LLM 응답 캐시 사용 여부
+
+    Returns:
+        StreamingResponse: application/x-ndjson 응답
+    """
+    concurrency = concurrency or settings.BATCH_CONCURRENCY
+    if not 1 <= concurrency <= settings.BATCH_MAX_CONCURRENCY:
+        raise HTTPException(
+            status_code=400,
+            detail=f"concurrency는 1 이상 {settings.BATCH_MAX_CONCURRENCY} 이하여야 합니다."
+        )
+
+    # 응답 스트리밍 전에 모든 파일을 저장 (요청 전체 오류는 400으로 응답)
+    received = await batch_service.receive_files(files)
+    if not received["success"]:
+        raise HTTPException(status_code=400, detail=received["error"])
+
+    items = received["items"]
+    logger.info(f"일괄 분석 시작 - {len(items)}개 파일, 동시 분석 {concurrency}")
+
+    async def ndjson_stream():
+        async for result in batch_service.analyze(items, concurrency, use_cache):
+            model = BatchSummary(**result) if result["type"] == "summary" else BatchItemResult(**result)
+            yield model.model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(
+        ndjson_stream(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # 프록시 버퍼링 방지
+        }
+    )
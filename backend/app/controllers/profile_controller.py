@@ -2,14 +2,27 @@
 프로파일링 컨트롤러 - API 엔드포인트 레이어
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.services import LLMService
+from app.services.llm_cache import llm_response_cache
+from app.services.text_compactor import text_compactor
+from app.services.single_flight import llm_single_flight
+from app.services.provider_limiter import provider_limiters
+from app.services.provider_router import llm_router
+from app.services.llm_usage import llm_usage
+from app.services.stream_json import stream_validation
+from app.services.structured_output import structured_output
+from app.services.identity_cache import career_identity_cache
+from app.services.identity_template import identity_templates
 from app.models import (
     ProfileAnalysisRequest,
     ProfileAnalysisResponse,
     UserProfile,
     CareerIdentityRequest,
-    CareerIdentityResponse
+    CareerIdentityResponse,
+    LLMStatsResponse
 )
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,7 +54,8 @@ async def analyze_profile(request: ProfileAnalysisRequest):
         # LLM을 통한 프로필 분석
         result = await llm_service.analyze_profile(
             text=request.text,
-            format_detected=request.format_detected
+            format_detected=request.format_detected,
+            use_cache=request.use_cache
         )
 
         if not result["success"]:
@@ -57,10 +71,15 @@ async def analyze_profile(request: ProfileAnalysisRequest):
             success=True,
             profile=profile,
             raw_response=result["raw_response"],
-            model_used=result["model_used"]
+            model_used=result["model_used"],
+            cache_status=result.get("cache_status", "disabled"),
+            compaction=result.get("compaction")
         )
 
-        logger.info(f"프로필 분석 완료 - 모델: {result['model_used']}")
+        logger.info(
+            f"프로필 분석 완료 - 모델: {result['model_used']}, 캐시: {response.cache_status}, "
+            f"합류: {result.get('coalesced', False)}"
+        )
 
         return response
 
@@ -96,7 +115,11 @@ async def analyze_career_identity(request: CareerIdentityRequest):
         }
 
         # LLM을 통한 직업정체성 분석
-        result = await llm_service.analyze_career_identity(input_data=input_data)
+        result = await llm_service.analyze_career_identity(
+            input_data=input_data,
+            use_cache=request.use_cache,
+            use_template=request.use_template
+        )
 
         if not result["success"]:
             raise HTTPException(
@@ -110,10 +133,16 @@ async def analyze_career_identity(request: CareerIdentityRequest):
             career_identity=result["career_identity"],
             rationale=result["rationale"],
             raw_response=result["raw_response"],
-            model_used=result["model_used"]
+            model_used=result["model_used"],
+            cache_status=result.get("cache_status", "disabled"),
+            engine=result.get("engine", "llm"),
+            degraded=result.get("degraded", False)
         )
 
-        logger.info(f"직업정체성 분석 완료 - 모델: {result['model_used']}")
+        logger.info(
+            f"직업정체성 분석 완료 - 모델: {result['model_used']}, 캐시: {response.cache_status}, "
+            f"합류: {result.get('coalesced', False)}"
+        )
 
         return response
 
@@ -125,3 +154,65 @@ async def analyze_career_identity(request: CareerIdentityRequest):
             status_code=500,
             detail=f"직업정체성 분석 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.post("/analyze-career-identity/stream")
+async def analyze_career_identity_stream(request: CareerIdentityRequest):
+    """
+    직업정체성 분석 결과를 Server-Sent Events로 스트리밍합니다.
+
+    이벤트 종류:
+        - delta: 제공자가 생성한 응답 텍스트 조각 ({"text": "..."})
+        - result: 파싱된 최종 결과 (CareerIdentityResponse와 동일한 필드)
+        - error: 분석 실패 ({"success": false, "error": "..."})
+
+    Args:
+        request: 직업정체성 분석 요청 (riasec_scores, big5_scores, life_history_scores)
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    logger.info("직업정체성 스트리밍 분석 시작")
+
+    # 입력 데이터 구조화
+    input_data = {
+        "riasec_scores": request.riasec_scores,
+        "big5_scores": request.big5_scores,
+        "life_history_scores": request.life_history_scores
+    }
+
+    async def event_stream():
+        async for event in llm_service.stream_career_identity(
+            input_data=input_data,
+            use_cache=request.use_cache,
+            use_template=request.use_template
+        ):
+            data = json.dumps(event["data"], ensure_ascii=False)
+            yield f"event: {event['event']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # 프록시 버퍼링 방지
+        }
+    )
+
+@router.get("/llm/stats", response_model=LLMStatsResponse)
+async def get_llm_stats():
+    """
+    LLM 호출 계층(응답 캐시 등)의 통계를 반환합니다.
+    """
+    return LLMStatsResponse(
+        response_cache=await llm_response_cache.get_stats(),
+        text_compaction=text_compactor.get_stats(),
+        single_flight=llm_single_flight.get_stats(),
+        provider_limits=provider_limiters.get_stats(),
+        routing=llm_router.get_stats(),
+        token_usage=llm_usage.get_stats(),
+        stream_validation=stream_validation.get_stats(),
+        structured_output=structured_output.get_stats(),
+        identity_cache=await career_identity_cache.get_stats(),
+        identity_template=identity_templates.get_stats()
+    )
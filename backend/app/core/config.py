@@ -2,7 +2,7 @@
 애플리케이션 설정
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -21,6 +21,52 @@ class Settings(BaseSettings):
 
     # 파일 업로드 설정
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024  # 업로드 파일을 읽고 저장하는 청크 크기
+    UPLOAD_BODY_OVERHEAD: int = 64 * 1024  # 요청 본문 제한에 더할 multipart 헤더/폼 필드 여유분
+
+    # 파일 저장 설정
+    FILE_WRITE_BACKGROUND: bool = True  # 추출 텍스트/캐시 파일을 응답과 무관하게 백그라운드 저장 (False면 저장 완료까지 대기, 실패 시 오류 응답)
+    FILE_WRITE_FSYNC: bool = False  # 저장 후 fsync로 디스크 동기화 (업로드 파일 포함)
+    FILE_WRITE_QUEUE_SIZE: int = 256  # 백그라운드 저장 대기 최대 개수 (가득 차면 직접 저장)
+
+    # PDF 추출 설정
+    PDF_EXTRACTION_WORKERS: int = 0  # 추출 프로세스 풀 크기 (0이면 CPU 코어 수)
+    ANALYSIS_CHAR_BUDGET: int = 3000  # 예산 추출 시 이만큼 읽으면 중단 (압축 비활성화 시 분석 텍스트 길이)
+    ANALYSIS_TOKEN_BUDGET: int = 1500  # 프로필 분석 프롬프트에 넣을 텍스트 최대 토큰 수
+    TEXT_COMPACTION_ENABLED: bool = True  # 중요 구간 선택으로 분석 텍스트 압축 (False면 앞부분만 사용)
+    ANALYSIS_PAGE_BUDGET: int = 0  # 예산 추출 시 최대 페이지 수 (0이면 제한 없음)
+
+    # 일괄 분석 설정 (여러 PDF 또는 ZIP 업로드)
+    BATCH_MAX_FILES: int = 500  # 요청 1회당 최대 PDF 수 (ZIP 내부 파일 포함)
+    BATCH_MAX_BODY_SIZE: int = 500 * 1024 * 1024  # 일괄 업로드 요청 본문 최대 크기
+    BATCH_CONCURRENCY: int = 8  # 동시에 진행할 프로필 분석(LLM 호출) 수 기본값
+    BATCH_MAX_CONCURRENCY: int = 32  # 요청에서 지정할 수 있는 최대 동시 분석 수
+
+    # 추출 결과 캐시 설정
+    EXTRACTION_CACHE_ENABLED: bool = True
+    EXTRACTION_CACHE_MAX_ENTRIES: int = 128  # 메모리 LRU 계층 최대 항목 수
+    EXTRACTION_CACHE_DIR: str = "extracted/cache"  # 디스크 계층 경로
+
+    # 직업 매칭 설정 (Mini-DB)
+    JOB_DB_PATH: str = "data/jobs.json"  # 직업 데이터 JSON 경로 (startup 시 로드)
+    EMBEDDING_BACKEND: str = "local"  # local(문자 n-gram 해싱 + TF-IDF, 네트워크 없음) 또는 openai
+    EMBEDDING_DIM: int = 64  # 로컬 임베딩 차원 (직업 행 벡터는 적성/흥미 2블록이라 2배, 클수록 충돌은 줄지만 검색 시 읽는 메모리 증가)
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    OPENAI_EMBEDDING_DIM: int = 256  # 원격 임베딩 차원 (API dimensions 파라미터)
+    OPENAI_EMBEDDING_BATCH_SIZE: int = 256  # API 요청 1회당 최대 문구 수
+    EMBEDDING_CACHE_PATH: str = "cache/embedding_cache.sqlite3"  # 원격 임베딩 문구 캐시 (모든 워커가 공유)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10000  # 문구 캐시 메모리 계층 최대 항목 수
+    JOB_APTITUDE_WEIGHT: float = 0.6  # 강점 ↔ 필요 적성 유사도 가중치
+    JOB_INTEREST_WEIGHT: float = 0.4  # 흥미 ↔ 관련 흥미 유사도 가중치
+    JOB_WEAKNESS_PENALTY: float = 0.3  # 약점과 비슷한 적성을 요구하는 직업의 감점 비율
+    JOB_RECOMMEND_MAX_K: int = 20  # 한 번에 추천할 수 있는 최대 직업 수
+    JOB_INDEX_TYPE: str = "auto"  # exact(전체 비교), ivf(근사), auto(직업 수가 JOB_INDEX_IVF_MIN_ROWS 이상이면 ivf)
+    JOB_INDEX_IVF_MIN_ROWS: int = 20000
+    JOB_INDEX_NLIST: int = 0  # IVF 클러스터 수 (0이면 √직업 수)
+    JOB_INDEX_NPROBE: int = 32  # IVF 검색 시 검사할 클러스터 수 (클수록 정확하지만 느림)
+    JOB_INDEX_MAX_DELTA: int = 1000  # 증분 추가분이 이만큼 쌓이면 본 인덱스에 합침
+    JOB_INDEX_DIR: str = "cache/job_index"  # 인덱스 저장 경로 (비어 있으면 저장 안 함, 워커 간 메모리 맵 공유)
+    JOB_INDEX_MMAP: bool = True  # 저장된 벡터를 메모리 맵으로 열기
 
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
@@ -30,6 +76,80 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""
     LLM_PROVIDER: str = "openai"  # openai 또는 anthropic
     LLM_MODEL: str = "gpt-4o"
+    OPENAI_BASE_URL: str = ""  # 비어 있으면 SDK 기본값 (로컬 스텁 서버 테스트용)
+    ANTHROPIC_BASE_URL: str = ""
+
+    # LLM HTTP 커넥션 풀 설정
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 60.0  # 유휴 커넥션 유지 시간 (초)
+    LLM_HTTP_TIMEOUT: float = 120.0  # 요청 타임아웃 (초)
+    LLM_HTTP_CONNECT_TIMEOUT: float = 10.0  # 연결 타임아웃 (초)
+
+    # LLM 제공자 호출 제한 설정 (워커 프로세스 단위 - 여러 워커면 제공자 한도를 워커 수로 나누어 설정)
+    LLM_REQUESTS_PER_MINUTE: int = 0  # 제공자별 분당 요청 수 한도 (0이면 제한 없음)
+    LLM_TOKENS_PER_MINUTE: int = 0  # 제공자별 분당 토큰 수 한도 (프롬프트 추정치 + 최대 출력, 0이면 제한 없음)
+    LLM_INITIAL_CONCURRENCY: int = 16  # 동시 호출 한도 시작값 (429 비율에 따라 자동 조정)
+    LLM_MIN_CONCURRENCY: int = 1
+    LLM_MAX_CONCURRENCY: int = 64
+    LLM_RETRY_MAX_ATTEMPTS: int = 4  # 429/5xx/연결 실패 시 최대 시도 횟수 (첫 시도 포함)
+    LLM_RETRY_BASE_DELAY: float = 0.5  # 지수 백오프 기준 대기 시간 (초, full jitter)
+    LLM_RETRY_MAX_DELAY: float = 20.0  # 재시도 대기 상한 (Retry-After가 이보다 길면 재시도하지 않음)
+    LLM_CALL_TIMEOUT: float = 60.0  # 일반 호출 시도 1회 제한 시간 (초, 스트리밍 검증 호출은 LLM_STREAM_IDLE_TIMEOUT, SSE 스트리밍은 LLM_HTTP_TIMEOUT만 적용)
+    LLM_STREAM_IDLE_TIMEOUT: float = 30.0  # 스트리밍 검증 호출의 조각 간 최대 대기 (초, 첫 조각 포함, 길지만 계속 생성 중인 응답은 끊지 않음)
+
+    # 제공자 프롬프트 캐시 (정적 지침은 시스템 프롬프트 prefix, OpenAI는 1024토큰 이상 prefix를 자동 캐시)
+    LLM_PROMPT_CACHE_ENABLED: bool = True  # Anthropic 시스템 프롬프트에 cache_control 블록 사용
+
+    # 스트리밍 응답 형태 검증 (조각을 받는 대로 파싱하여 스키마를 만족할 수 없으면 스트림 중단)
+    LLM_STREAM_VALIDATION_ENABLED: bool = True  # 프로필/직업정체성 분석도 스트리밍으로 호출하여 검증
+    LLM_SCHEMA_RETRY_ATTEMPTS: int = 1  # 형태 위반 시 같은 후보로 즉시 재요청할 횟수
+
+    # 구조화 출력 (응답 모델에서 만든 JSON 스키마로 출력 제한, 형식 오류는 재요청 전에 로컬 복구)
+    LLM_STRUCTURED_OUTPUT_ENABLED: bool = True  # OpenAI json_schema response_format, Anthropic 도구 호출 강제
+
+    # LLM 라우팅 설정 (제공자/모델별 지연·오류율 기반 선택, 워커 프로세스 단위 집계)
+    LLM_ROUTING_CANDIDATES: List[str] = []  # "제공자:모델" 목록 (예: ["openai:gpt-4o", "anthropic:claude-3-5-sonnet-20241022"], 비어 있으면 LLM_PROVIDER/LLM_MODEL만 사용)
+    LLM_ROUTING_WINDOW: int = 200  # 후보별 지연/오류율 계산에 쓰는 최근 호출 수
+    LLM_ROUTING_WINDOW_SECONDS: float = 300.0  # 이보다 오래된 기록은 제외 (밀려난 후보 재시도)
+    LLM_ROUTING_MIN_SAMPLES: int = 5  # 표본이 이보다 적은 후보는 먼저 시도
+    LLM_HEDGE_ENABLED: bool = False  # 느린 호출에 헤지 요청 추가 (먼저 성공한 응답 사용, 제공자 비용 증가)
+    LLM_HEDGE_DELAY: float = 0.0  # 헤지 요청까지 기다릴 시간 (초, 0이면 선택된 후보의 p95)
+
+    # LLM 응답 캐시 설정 (SQLite, 모든 워커가 공유)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "cache/llm_cache.sqlite3"
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60  # 7일
+    LLM_CACHE_MAX_ENTRIES: int = 10000
+
+    # 직업정체성 근사 캐시 설정 (양자화 점수 서명의 최근접 검색, SQLite, 모든 워커가 공유)
+    IDENTITY_CACHE_ENABLED: bool = False  # 비슷한 점수의 입력에 저장된 직업정체성 문단 재사용 (문단 속 점수가 입력과 조금 다를 수 있음)
+    IDENTITY_CACHE_PATH: str = "cache/identity_cache.sqlite3"
+    IDENTITY_CACHE_BIN_WIDTH: float = 5.0  # 점수 구간 폭 (점, 같은 구간이면 같은 서명)
+    IDENTITY_CACHE_BIN_WIDTHS: Dict[str, float] = {}  # 구역별 구간 폭 (예: {"life_history_scores": 10})
+    IDENTITY_CACHE_RANK_CODES: int = 3  # 서명에 넣을 RIASEC 상위 코드 수 (순서가 같아야 재사용)
+    IDENTITY_CACHE_MAX_DISTANCE: float = 1.0  # 재사용할 최대 구간 거리 (유클리드, 0이면 모든 점수가 같은 구간일 때만)
+    IDENTITY_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60  # 7일
+    IDENTITY_CACHE_MAX_ENTRIES: int = 10000
+
+    # 직업정체성 템플릿 엔진 설정 (LLM 호출 없이 사전 작성된 문장 조각으로 생성)
+    IDENTITY_TEMPLATE_PATH: str = "data/identity_fragments.json"  # 문장 조각 라이브러리 (startup 시 로드)
+    IDENTITY_TEMPLATE_FALLBACK: bool = False  # LLM 호출 실패 시 오류 대신 템플릿 결과로 응답 (degraded=true)
+
+    # 분석 작업 큐 설정 (SQLite 작업 테이블, 모든 워커가 공유)
+    ANALYSIS_QUEUE_PATH: str = "cache/analysis_jobs.sqlite3"
+    ANALYSIS_QUEUE_WORKERS: int = 4  # 프로세스당 작업 워커 수 (동시에 실행할 분석 수)
+    ANALYSIS_QUEUE_MAX_DEPTH: int = 1000  # 대기 작업이 이만큼 쌓이면 제출 거절 (503)
+    ANALYSIS_QUEUE_POLL_INTERVAL: float = 0.5  # 다른 워커 프로세스가 제출/완료한 작업 확인 주기 (초)
+    ANALYSIS_JOB_TIMEOUT: float = 300.0  # 작업 1개 실행 제한 시간 (초)
+    ANALYSIS_JOB_MAX_ATTEMPTS: int = 3  # 워커가 중단되어 다시 대기열에 넣을 때의 최대 실행 횟수
+    ANALYSIS_JOB_RETENTION_SECONDS: int = 24 * 60 * 60  # 완료된 작업 보관 기간
+    ANALYSIS_JOB_MAX_WAIT: float = 30.0  # 상태 조회 long-poll 최대 대기 시간 (초)
+
+    # 메트릭 설정 (Prometheus /metrics, 워커별 스냅샷 파일을 합산)
+    METRICS_ENABLED: bool = True  # False면 /metrics가 404, 스냅샷 저장 안 함 (기록은 메모리 갱신만 하므로 그대로 둠)
+    METRICS_DIR: str = "cache/metrics"  # 워커별 스냅샷 저장 경로 (비어 있으면 응답한 워커의 값만 노출)
+    METRICS_FLUSH_INTERVAL: float = 1.0  # 스냅샷 저장 주기 (초, 값이 바뀌었을 때만 저장)
 
     class Config:
         env_file = ".env"
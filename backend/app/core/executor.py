@@ -0,0 +1,100 @@
+"""
+PDF 텍스트 추출 실행기 관리
+
+pdfplumber 작업은 CPU 바운드이므로 이벤트 루프가 아닌 프로세스 풀에서 실행합니다.
+풀은 애플리케이션 startup/shutdown 수명주기에 맞춰 생성/종료됩니다.
+"""
+import os
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+from app.core.config import settings
+from app.core.metrics import executor_tasks, executor_queue_depth
+
+logger = logging.getLogger(__name__)
+
+# 애플리케이션 전역 추출 실행기
+_extraction_executor: Optional[Executor] = None
+
+
+def get_extraction_workers() -> int:
+    """
+    설정값을 기반으로 추출 워커 수 계산
+
+    Returns:
+        int: 워커 프로세스 수 (설정값이 0 이하이면 CPU 코어 수)
+    """
+    if settings.PDF_EXTRACTION_WORKERS > 0:
+        return settings.PDF_EXTRACTION_WORKERS
+    return os.cpu_count() or 1
+
+
+def start_extraction_executor() -> Executor:
+    """
+    추출용 프로세스 풀 생성 (startup 시 호출)
+
+    Returns:
+        Executor: 생성된 프로세스 풀
+    """
+    global _extraction_executor
+
+    if _extraction_executor is None:
+        workers = get_extraction_workers()
+        _extraction_executor = ProcessPoolExecutor(max_workers=workers)
+        logger.info(f"PDF 추출 프로세스 풀 시작 (workers={workers})")
+
+    return _extraction_executor
+
+
+def shutdown_extraction_executor() -> None:
+    """
+    추출용 프로세스 풀 종료 (shutdown 시 호출)
+    """
+    global _extraction_executor
+
+    if _extraction_executor is not None:
+        _extraction_executor.shutdown(wait=True, cancel_futures=True)
+        _extraction_executor = None
+        logger.info("PDF 추출 프로세스 풀 종료")
+
+
+def restart_extraction_executor(broken: Optional[Executor]) -> Optional[Executor]:
+    """
+    워커 프로세스가 비정상 종료되어 망가진(BrokenProcessPool) 프로세스 풀을 새로 생성
+
+    동시에 실패한 여러 요청이 각각 호출해도 풀은 한 번만 다시 만들어집니다.
+    (현재 풀이 broken과 같을 때만 교체)
+
+    Args:
+        broken: 실패한 작업을 제출했던 실행기
+
+    Returns:
+        Optional[Executor]: 현재 프로세스 풀
+    """
+    global _extraction_executor
+
+    if _extraction_executor is not None and _extraction_executor is broken:
+        broken.shutdown(wait=False, cancel_futures=True)
+        workers = get_extraction_workers()
+        _extraction_executor = ProcessPoolExecutor(max_workers=workers)
+        logger.warning(f"PDF 추출 프로세스 풀 재시작 (워커 비정상 종료, workers={workers})")
+
+    return _extraction_executor
+
+
+def get_extraction_executor() -> Optional[Executor]:
+    """
+    현재 추출 실행기 반환
+
+    Returns:
+        Optional[Executor]: 프로세스 풀 (시작되지 않았다면 None → 기본 스레드 풀 사용)
+    """
+    return _extraction_executor
+
+
+def _queue_depth() -> float:
+    """제출되었지만 아직 워커 프로세스를 받지 못한 작업 수"""
+    return max(0.0, (executor_tasks.get() or 0.0) - get_extraction_workers())
+
+
+executor_queue_depth.set_function(_queue_depth)
@@ -0,0 +1,169 @@
+"""
+비동기 파일 저장기
+
+추출 텍스트, 추출 캐시 파일처럼 응답에 필요하지 않은 파일 쓰기는
+백그라운드 큐에 넣고 바로 반환합니다. 실제 쓰기(mkdir/write/fsync/rename)는
+워커 태스크가 스레드에서 수행하므로 이벤트 루프를 막지 않습니다.
+큐는 애플리케이션 startup/shutdown 수명주기에 맞춰 시작/종료(남은 작업 처리)됩니다.
+"""
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+from app.core.config import settings
+from app.core.metrics import stage_seconds, file_writer_queue_depth
+
+logger = logging.getLogger(__name__)
+
+
+def write_file_sync(path: Union[str, Path], data: Union[str, bytes], fsync: bool = False) -> None:
+    """
+    파일을 원자적으로 저장 (임시 파일 작성 후 교체, 동기)
+
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 내용 (str이면 UTF-8로 저장)
+        fsync: 교체 전에 디스크 동기화(fsync)할지 여부
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class BackgroundFileWriter:
+    """백그라운드 파일 저장 큐 (단일 워커, 제출 순서대로 저장)"""
+
+    def __init__(
+        self,
+        fsync: bool = settings.FILE_WRITE_FSYNC,
+        background: bool = settings.FILE_WRITE_BACKGROUND,
+        max_pending: int = settings.FILE_WRITE_QUEUE_SIZE
+    ):
+        self.fsync = fsync
+        self.background = background
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # 저장 결과 통계
+        self.writes = 0
+        self.failures = 0
+        self.inline_writes = 0
+        self.last_error: Optional[str] = None
+        self.last_error_path: Optional[str] = None
+        self.last_error_at: Optional[float] = None
+
+    async def start(self) -> None:
+        """저장 워커 시작 (startup 시 호출)"""
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._worker = asyncio.create_task(self._run())
+            logger.info(f"파일 저장 큐 시작 (background={self.background}, fsync={self.fsync})")
+
+    async def close(self) -> None:
+        """남은 저장 작업을 모두 처리한 뒤 워커 종료 (shutdown 시 호출)"""
+        if self._worker is None:
+            return
+
+        await self._queue.join()
+        self._worker.cancel()
+
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        self._queue = None
+        self._worker = None
+        logger.info(f"파일 저장 큐 종료 (writes={self.writes}, failures={self.failures})")
+
+    async def submit(self, path: Union[str, Path], data: Union[str, bytes]) -> None:
+        """
+        파일 저장 요청
+
+        백그라운드 모드에서는 큐에 넣고 바로 반환하며, 실패는 로그와 통계로 보고됩니다.
+        워커가 없거나 큐가 가득 찼거나 백그라운드 모드가 꺼져 있으면
+        스레드에서 직접 저장하고 완료를 기다리며, 이때 실패는 호출자에게 예외로 전달됩니다.
+
+        Args:
+            path: 저장할 파일 경로
+            data: 저장할 내용
+        """
+        if self.background and self._queue is not None and not self._queue.full():
+            self._queue.put_nowait((str(path), data))
+            return
+
+        self.inline_writes += 1
+        try:
+            with stage_seconds.time(component="file_writer", stage="write_inline"):
+                await asyncio.to_thread(write_file_sync, path, data, self.fsync)
+        except Exception as e:
+            self._record_failure(str(path), e)
+            raise
+
+        self.writes += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        저장 통계 반환
+
+        Returns:
+            Dict[str, Any]: 저장 통계
+        """
+        return {
+            "background": self.background,
+            "fsync": self.fsync,
+            "running": self._worker is not None,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "max_pending": self.max_pending,
+            "writes": self.writes,
+            "inline_writes": self.inline_writes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "last_error_path": self.last_error_path,
+            "last_error_at": self.last_error_at
+        }
+
+    async def _run(self) -> None:
+        """큐에서 저장 작업을 꺼내 스레드에서 실행"""
+        while True:
+            path, data = await self._queue.get()
+
+            try:
+                with stage_seconds.time(component="file_writer", stage="write"):
+                    await asyncio.to_thread(write_file_sync, path, data, self.fsync)
+                self.writes += 1
+            except Exception as e:
+                self._record_failure(path, e)
+            finally:
+                self._queue.task_done()
+
+    def _record_failure(self, path: str, error: Exception) -> None:
+        """저장 실패 기록"""
+        self.failures += 1
+        self.last_error = str(error)
+        self.last_error_path = path
+        self.last_error_at = time.time()
+        logger.error(f"파일 저장 실패 ({path}): {str(error)}")
+
+
+# 애플리케이션 전역 파일 저장기
+file_writer = BackgroundFileWriter()
+file_writer_queue_depth.set_function(lambda: file_writer._queue.qsize() if file_writer._queue is not None else 0)
@@ -0,0 +1,360 @@
+"""
+Prometheus 메트릭 - 단계별 지연 히스토그램, 토큰 카운터, 진행 중 요청/실행기 대기 게이지
+
+기록은 이벤트 루프에서 메모리 값만 갱신합니다. (잠금, 파일 I/O 없음)
+여러 uvicorn 워커의 값을 합치기 위해 각 워커는 METRICS_FLUSH_INTERVAL마다 자기 값을
+METRICS_DIR/<pid>.json 스냅샷으로 저장하고, /metrics를 받은 워커가 자기 값(실시간)과
+다른 워커의 스냅샷을 합산해 텍스트 형식으로 응답합니다.
+- 카운터/히스토그램: 종료된 워커의 스냅샷도 합산 (재시작해도 합계가 줄지 않음)
+- 게이지: 살아 있는 워커의 값만 합산
+"""
+import asyncio
+import bisect
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "jobjalhane"
+
+# 단계 지연 버킷 (초) - 디스크 쓰기(ms 단위)부터 LLM 호출(수십 초)까지
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[str, ...]
+
+
+class _Metric:
+    """레이블 값 조합별 값을 가진 메트릭"""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = f"{PREFIX}_{name}"
+        self.help = help_text
+        self.labels = labels
+        self._values: Dict[LabelKey, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def get(self, **labels: Any) -> Any:
+        """이 워커의 현재 값 (기록된 적이 없으면 None)"""
+        return self._values.get(self._key(labels))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"\x1f".join(key): value for key, value in self._values.items()}
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """현재 값 게이지 (수집 시점에 값을 계산하는 함수도 지정 가능)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, help_text, labels)
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = float(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """수집 시점에 값을 계산할 함수 지정 (레이블 없는 게이지)"""
+        self._function = function
+
+    @contextmanager
+    def track(self, **labels: Any) -> Iterator[None]:
+        """블록 실행 동안 1 증가"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self._function is not None:
+            try:
+                return {"": float(self._function())}
+            except Exception:
+                return {}
+        return super().snapshot()
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (버킷별 개수, 합계, 개수)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            # [버킷별 개수..., +Inf 개수, 합계]
+            entry = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        entry[bisect.bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """블록 실행 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+
+class MetricsRegistry:
+    """메트릭 등록, 워커별 스냅샷 저장, 워커 합산 텍스트 출력"""
+
+    def __init__(
+        self,
+        directory: str = settings.METRICS_DIR,
+        flush_interval: float = settings.METRICS_FLUSH_INTERVAL
+    ):
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self.pid = os.getpid()
+        self._metrics: Dict[str, _Metric] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._last_snapshot: Optional[str] = None
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def _register(self, metric: _Metric) -> Any:
+        self._metrics[metric.name] = metric
+        return metric
+
+    async def start(self) -> None:
+        """스냅샷 저장 작업 시작 (startup 시 호출, 워커 프로세스마다 실행)"""
+        if self._flusher is None and self.directory is not None and settings.METRICS_ENABLED:
+            self.pid = os.getpid()
+            await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+            self._flusher = asyncio.create_task(self._run())
+            logger.info(f"메트릭 스냅샷 저장 시작 ({self.directory}/{self.pid}.json, {self.flush_interval}s 주기)")
+
+    async def close(self) -> None:
+        """스냅샷 저장 작업 종료 (마지막 값을 저장하고 게이지는 비움)"""
+        if self._flusher is None:
+            return
+
+        self._flusher.cancel()
+        try:
+            await self._flusher
+        except asyncio.CancelledError:
+            pass
+        self._flusher = None
+
+        await self.flush(final=True)
+
+    async def flush(self, final: bool = False) -> None:
+        """현재 값을 스냅샷 파일로 저장 (바뀐 값이 없으면 건너뜀)"""
+        if self.directory is None:
+            return
+
+        snapshot = self.snapshot(include_gauges=not final)
+        data = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"))
+        if data == self._last_snapshot:
+            return
+
+        try:
+            await asyncio.to_thread(self._write_sync, data)
+            self._last_snapshot = data
+        except OSError as e:
+            logger.warning(f"메트릭 스냅샷 저장 실패: {str(e)}")
+
+    def snapshot(self, include_gauges: bool = True) -> Dict[str, Any]:
+        """이 워커의 모든 메트릭 값"""
+        return {
+            "pid": self.pid,
+            "metrics": {
+                name: metric.snapshot() for name, metric in self._metrics.items()
+                if include_gauges or metric.kind != "gauge"
+            }
+        }
+
+    async def render(self) -> str:
+        """
+        모든 워커의 값을 합산한 Prometheus 텍스트 형식 (version 0.0.4)
+
+        Returns:
+            str: /metrics 응답 본문
+        """
+        snapshots = [self.snapshot()]
+        if self.directory is not None:
+            snapshots += await asyncio.to_thread(self._read_others_sync)
+        return self._format(self._merge(snapshots))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _write_sync(self, data: str) -> None:
+        path = self.directory / f"{self.pid}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.replace(path)
+
+    def _read_others_sync(self) -> List[Dict[str, Any]]:
+        """다른 워커의 스냅샷 (종료된 워커는 게이지 제외)"""
+        snapshots = []
+        for path in self.directory.glob("*.json"):
+            if path.stem == str(self.pid):
+                continue
+            try:
+                snapshot = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+            if not _is_alive(snapshot.get("pid")):
+                snapshot["metrics"] = {
+                    name: values for name, values in snapshot.get("metrics", {}).items()
+                    if name in self._metrics and self._metrics[name].kind != "gauge"
+                }
+            snapshots.append(snapshot)
+        return snapshots
+
+    def _merge(self, snapshots: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        merged: Dict[str, Dict[str, Any]] = {name: {} for name in self._metrics}
+        for snapshot in snapshots:
+            for name, values in snapshot.get("metrics", {}).items():
+                if name not in merged:
+                    continue
+                target = merged[name]
+                for key, value in values.items():
+                    if isinstance(value, list):
+                        current = target.get(key)
+                        if current is None or len(current) != len(value):
+                            target[key] = list(value)
+                        else:
+                            target[key] = [a + b for a, b in zip(current, value)]
+                    else:
+                        target[key] = target.get(key, 0.0) + value
+        return merged
+
+    def _format(self, merged: Dict[str, Dict[str, Any]]) -> str:
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(merged[name].items()):
+                labels = list(zip(metric.labels, key.split("\x1f"))) if metric.labels else []
+                if metric.kind == "histogram":
+                    cumulative = 0
+                    for bound, count in zip(list(metric.buckets) + [float("inf")], value[:-1]):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else _format_value(bound)
+                        lines.append(f"{name}_bucket{_format_labels(labels + [('le', le)])} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value[-1])}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _is_alive(pid: Any) -> bool:
+    if not isinstance(pid, int):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{name}="{value.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), chr(92) + "n")}"'
+        for name, value in labels
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# 애플리케이션 전역 메트릭 (워커 프로세스마다 하나)
+metrics = MetricsRegistry()
+
+stage_seconds = metrics.histogram(
+    "stage_duration_seconds",
+    "요청 처리 단계별 소요 시간 (초)",
+    ("component", "stage")
+)
+http_request_seconds = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (초, 라우트 경로 기준)",
+    ("method", "route", "status")
+)
+llm_tokens = metrics.counter(
+    "llm_tokens_total",
+    "제공자/모델별 LLM 토큰 수 (type: input, output, cached, cache_write)",
+    ("provider", "model", "type")
+)
+http_in_flight = metrics.gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수"
+)
+executor_tasks = metrics.gauge(
+    "extraction_executor_tasks",
+    "PDF 추출 프로세스 풀에 제출되어 끝나지 않은 작업 수"
+)
+executor_queue_depth = metrics.gauge(
+    "extraction_executor_queue_depth",
+    "PDF 추출 프로세스 풀에서 실행을 기다리는 작업 수 (제출된 작업 - 워커 수)"
+)
+file_writer_queue_depth = metrics.gauge(
+    "file_writer_queue_depth",
+    "백그라운드 파일 저장 큐 대기 수"
+)
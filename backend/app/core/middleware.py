@@ -0,0 +1,138 @@
+"""
+ASGI 미들웨어 모음
+"""
+import json
+import time
+import logging
+from typing import Any, Dict, Iterable
+from fastapi import HTTPException
+from app.core.metrics import http_in_flight, http_request_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    업로드 요청 본문 크기 제한 미들웨어
+
+    multipart 파싱은 라우트 핸들러가 실행되기 전에 본문 전체를 읽으므로,
+    핸들러 안에서의 크기 확인만으로는 초과 업로드를 끝까지 받게 됩니다.
+    이 미들웨어는 Content-Length가 제한을 넘으면 본문을 읽기 전에 거절하고,
+    청크 전송처럼 길이를 알 수 없는 경우에도 제한을 넘는 첫 청크에서 중단합니다.
+    """
+
+    def __init__(self, app, max_body_size: int, paths: Iterable[str]):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.paths = set(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        # 1. 선언된 길이로 먼저 확인 (본문을 읽지 않고 즉시 거절)
+        content_length = self._get_content_length(scope)
+        if content_length is not None and content_length > self.max_body_size:
+            logger.warning(f"Upload rejected by Content-Length: {scope['path']} ({content_length} bytes)")
+            await self._send_too_large(send)
+            return
+
+        # 2. 실제로 받은 바이트 수를 세며 제한을 넘는 순간 중단
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    logger.warning(f"Upload rejected while streaming: {scope['path']} ({received} bytes)")
+                    raise HTTPException(status_code=413, detail=self._detail())
+
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        """크기 제한 초과 오류 메시지"""
+        return f"요청 크기는 {self.max_body_size // (1024 * 1024)}MB를 초과할 수 없습니다."
+
+    @staticmethod
+    def _get_content_length(scope) -> "int | None":
+        """요청 헤더의 Content-Length 값 (없거나 잘못된 값이면 None)"""
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    async def _send_too_large(self, send) -> None:
+        """413 응답 전송"""
+        body = json.dumps({"detail": self._detail()}, ensure_ascii=False).encode("utf-8")
+
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 메트릭 미들웨어 (처리 중 요청 수, 라우트별 처리 시간)
+
+    처리 시간의 route 레이블은 실제 경로가 아니라 매칭된 라우트의 경로 템플릿
+    (예: /api/analysis-jobs/{job_id})이므로 레이블 조합 수가 라우트 수로 제한됩니다.
+    매칭되지 않은 요청은 "unmatched"로 묶습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: Dict[Any, str] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def tracked_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with http_in_flight.track():
+            try:
+                await self.app(scope, receive, tracked_send)
+            finally:
+                http_request_seconds.observe(
+                    time.perf_counter() - started,
+                    method=scope["method"],
+                    route=self._route_path(scope),
+                    status=status
+                )
+
+    def _route_path(self, scope) -> str:
+        """라우터가 scope에 남긴 endpoint로 경로 템플릿 조회 (처음 한 번만 라우트 목록 검색)"""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            routes = getattr(scope.get("app"), "routes", [])
+            path = next((route.path for route in routes if getattr(route, "endpoint", None) is endpoint), "unmatched")
+            self._route_paths[endpoint] = path
+        return path
@@ -2,9 +2,15 @@
 유틸리티 함수 모음
 """
 import os
+import time
 import uuid
+import asyncio
+import hashlib
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Any
+from app.core.file_writer import file_writer
+from app.core.metrics import stage_seconds
 
 
 def generate_unique_filename(original_filename: str) -> str:
@@ -32,48 +38,108 @@ def generate_unique_filename(original_filename: str) -> str:
     return unique_filename
 
 
-def save_uploaded_file(file_content: bytes, filename: str, upload_dir: str = "uploads") -> str:
+class FileTooLargeError(Exception):
+    """업로드 파일이 크기 제한을 초과한 경우"""
+
+
+async def save_upload_stream(
+    upload_file,
+    filename: str,
+    max_size: int,
+    chunk_size: int,
+    upload_dir: str = "uploads",
+    fsync: bool = False
+) -> Dict[str, Any]:
     """
-    업로드된 파일을 디스크에 저장
+    업로드 파일을 청크 단위로 읽으며 디스크에 바로 저장
+
+    전체 내용을 메모리에 올리지 않고, 읽는 동안 크기 제한 확인과
+    SHA-256 해시 계산을 함께 수행합니다. 디스크 작업은 스레드에서 실행되어
+    이벤트 루프를 막지 않습니다.
 
     Args:
-        file_content: 파일 바이트 내용
+        upload_file: 업로드 파일 (FastAPI UploadFile)
         filename: 저장할 파일명
+        max_size: 최대 파일 크기 (bytes)
+        chunk_size: 한 번에 읽을 청크 크기 (bytes)
         upload_dir: 업로드 디렉토리 경로
+        fsync: 저장 완료 전에 디스크 동기화(fsync)할지 여부
 
     Returns:
-        str: 저장된 파일의 전체 경로
+        Dict[str, Any]: 저장된 파일 경로, 파일 크기, 콘텐츠 해시
+
+    Raises:
+        FileTooLargeError: 크기 제한을 초과한 경우 (부분 파일은 삭제됨)
     """
-    # 업로드 디렉토리 생성 (존재하지 않는 경우)
+    # 완료 전까지는 임시 파일명으로 저장
     upload_path = Path(upload_dir)
-    upload_path.mkdir(parents=True, exist_ok=True)
-
-    # 파일 저장 경로
     file_path = upload_path / filename
+    part_path = upload_path / f"{filename}.part"
 
-    # 파일 저장
-    with open(file_path, "wb") as f:
-        f.write(file_content)
+    # 업로드 디렉토리 생성 (존재하지 않는 경우)
+    await asyncio.to_thread(upload_path.mkdir, parents=True, exist_ok=True)
+    f = await asyncio.to_thread(open, part_path, "wb")
 
-    return str(file_path)
+    hasher = hashlib.sha256()
+    file_size = 0
 
+    # 업로드 1건의 읽기/쓰기 시간을 청크마다 누적해 한 번씩 기록
+    read_seconds = 0.0
+    write_seconds = 0.0
 
-def get_file_size(file_path: str) -> int:
-    """
-    파일 크기 반환 (bytes)
+    try:
+        try:
+            while True:
+                started = time.perf_counter()
+                chunk = await upload_file.read(chunk_size)
+                read_seconds += time.perf_counter() - started
+                if not chunk:
+                    break
 
-    Args:
-        file_path: 파일 경로
+                # 제한을 넘는 첫 청크에서 즉시 중단
+                file_size += len(chunk)
+                if file_size > max_size:
+                    raise FileTooLargeError(f"파일 크기가 제한({max_size} bytes)을 초과했습니다.")
 
-    Returns:
-        int: 파일 크기 (bytes)
-    """
-    return os.path.getsize(file_path)
+                hasher.update(chunk)
+                started = time.perf_counter()
+                await asyncio.to_thread(f.write, chunk)
+                write_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            if fsync:
+                await asyncio.to_thread(_flush_and_sync, f)
+        finally:
+            await asyncio.to_thread(f.close)
+
+        await asyncio.to_thread(part_path.replace, file_path)
+        write_seconds += time.perf_counter() - started
+
+    except BaseException:
+        await asyncio.to_thread(part_path.unlink, missing_ok=True)
+        raise
+
+    stage_seconds.observe(read_seconds, component="upload", stage="read")
+    stage_seconds.observe(write_seconds, component="upload", stage="write")
 
+    return {
+        "file_path": str(file_path),
+        "file_size": file_size,
+        "content_hash": hasher.hexdigest()
+    }
 
-def save_extracted_text(text: str, pdf_filename: str, output_dir: str = "extracted") -> str:
+
+def _flush_and_sync(f) -> None:
+    """파일 버퍼를 비우고 디스크에 동기화"""
+    f.flush()
+    os.fsync(f.fileno())
+
+
+async def save_extracted_text(text: str, pdf_filename: str, output_dir: str = "extracted") -> str:
     """
-    추출된 텍스트를 파일로 저장
+    추출된 텍스트를 파일로 저장 (백그라운드 파일 저장 큐 사용)
+
+    저장 경로는 즉시 반환되며, 실제 쓰기는 응답과 무관하게 진행됩니다.
 
     Args:
         text: 추출된 텍스트
@@ -81,21 +147,16 @@ def save_extracted_text(text: str, pdf_filename: str, output_dir: str = "extract
         output_dir: 출력 디렉토리 경로
 
     Returns:
-        str: 저장된 텍스트 파일의 전체 경로
+        str: 저장될 텍스트 파일의 전체 경로
     """
-    # 출력 디렉토리 생성 (존재하지 않는 경우)
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
     # PDF 파일명에서 확장자 제거하고 .txt로 변경
     base_name = Path(pdf_filename).stem
     text_filename = f"{base_name}.txt"
 
     # 텍스트 파일 저장 경로
-    text_file_path = output_path / text_filename
+    text_file_path = Path(output_dir) / text_filename
 
-    # 텍스트 저장
-    with open(text_file_path, "w", encoding="utf-8") as f:
-        f.write(text)
+    # 텍스트 저장 (디렉토리 생성 포함)
+    await file_writer.submit(text_file_path, text)
 
     return str(text_file_path)
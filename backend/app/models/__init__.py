@@ -1,22 +1,57 @@
 """
 Models Package
 """
-from .pdf_models import PDFUploadResponse, PDFMetadata, SupportedFormatsResponse
+from .pdf_models import (
+    PDFUploadResponse,
+    PDFMetadata,
+    SupportedFormatsResponse,
+    ExtractionCacheStatsResponse,
+    FileWriterStatsResponse,
+    ScoreExtractionResponse
+)
 from .profile_models import (
     UserProfile,
+    CareerIdentity,
     ProfileAnalysisRequest,
     ProfileAnalysisResponse,
     CareerIdentityRequest,
-    CareerIdentityResponse
+    CareerIdentityResponse,
+    LLMStatsResponse
+)
+from .pipeline_models import PipelineAnalysisResponse, BatchItemResult, BatchSummary
+from .analysis_job_models import (
+    AnalysisJobSubmitResponse,
+    AnalysisJobStatusResponse,
+    AnalysisQueueStatsResponse
+)
+from .job_models import (
+    JobRecommendationRequest,
+    JobRecommendation,
+    JobRecommendationResponse,
+    JobStoreStatsResponse
 )
 
 __all__ = [
     "PDFUploadResponse",
     "PDFMetadata",
     "SupportedFormatsResponse",
+    "ExtractionCacheStatsResponse",
+    "FileWriterStatsResponse",
+    "ScoreExtractionResponse",
     "UserProfile",
     "ProfileAnalysisRequest",
     "ProfileAnalysisResponse",
     "CareerIdentityRequest",
-    "CareerIdentityResponse"
+    "CareerIdentityResponse",
+    "LLMStatsResponse",
+    "PipelineAnalysisResponse",
+    "BatchItemResult",
+    "BatchSummary",
+    "AnalysisJobSubmitResponse",
+    "AnalysisJobStatusResponse",
+    "AnalysisQueueStatsResponse",
+    "JobRecommendationRequest",
+    "JobRecommendation",
+    "JobRecommendationResponse",
+    "JobStoreStatsResponse"
 ]
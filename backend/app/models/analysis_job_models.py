@@ -0,0 +1,51 @@
+"""
+분석 작업 큐 관련 데이터 모델
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, Union
+from .profile_models import ProfileAnalysisResponse, CareerIdentityResponse
+
+
+class AnalysisJobSubmitResponse(BaseModel):
+    """분석 작업 제출 응답 모델"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류 (profile, career_identity)")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed)")
+    queue_position: Optional[int] = Field(None, description="대기열 순서 (1이면 다음 차례)")
+    queue_depth: int = Field(..., description="제출 직후 전체 대기 작업 수")
+    status_url: str = Field(..., description="상태/결과 조회 URL (?wait=초 로 long-poll)")
+
+
+class AnalysisJobStatusResponse(BaseModel):
+    """분석 작업 상태 응답 모델"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류 (profile, career_identity)")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed)")
+    queue_position: Optional[int] = Field(None, description="대기열 순서 (대기 중일 때만)")
+    attempts: int = Field(..., description="실행 횟수 (워커 중단으로 다시 실행된 경우 2 이상)")
+    created_at: float = Field(..., description="제출 시각 (Unix time)")
+    started_at: Optional[float] = Field(None, description="실행 시작 시각 (Unix time)")
+    finished_at: Optional[float] = Field(None, description="완료 시각 (Unix time)")
+    wait_time_ms: Optional[float] = Field(None, description="대기열 대기 시간 (밀리초)")
+    run_time_ms: Optional[float] = Field(None, description="실행 시간 (밀리초)")
+    result: Optional[Union[ProfileAnalysisResponse, CareerIdentityResponse]] = Field(
+        None, description="분석 결과 (succeeded일 때만, /api/analyze-profile 또는 /api/analyze-career-identity 응답과 동일)"
+    )
+    error: Optional[str] = Field(None, description="오류 메시지 (failed일 때만)")
+
+
+class AnalysisQueueStatsResponse(BaseModel):
+    """분석 작업 큐 통계 응답 모델"""
+    workers: int = Field(..., description="이 프로세스의 작업 워커 수")
+    running_in_process: int = Field(..., description="이 프로세스에서 실행 중인 작업 수")
+    queue_depth: int = Field(..., description="대기 작업 수 (전체 워커 공유)")
+    max_depth: int = Field(..., description="최대 대기 작업 수 (초과 시 제출 거절)")
+    oldest_queued_seconds: float = Field(..., description="가장 오래 기다린 대기 작업의 대기 시간 (초)")
+    jobs_by_status: Dict[str, int] = Field(..., description="상태별 작업 수 (보관 기간 내, 전체 워커 공유)")
+    submitted: int = Field(..., description="이 프로세스가 받은 작업 수")
+    rejected: int = Field(..., description="대기열이 가득 차 거절한 작업 수")
+    succeeded: int = Field(..., description="이 프로세스가 성공한 작업 수")
+    failed: int = Field(..., description="이 프로세스가 실패한 작업 수")
+    requeued: int = Field(..., description="멈춘 작업을 다시 대기열에 넣은 수")
+    wait_time_ms: Dict[str, Any] = Field(..., description="최근 작업의 대기열 대기 시간 (avg, p50, p95)")
+    run_time_ms: Dict[str, Any] = Field(..., description="최근 작업의 실행 시간 (avg, p50, p95)")
@@ -0,0 +1,52 @@
+"""
+직업 추천 관련 데이터 모델
+"""
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional
+from app.core.config import settings
+from app.models.profile_models import UserProfile
+
+
+class JobRecommendationRequest(BaseModel):
+    """직업 추천 요청 모델"""
+    profile: UserProfile = Field(..., description="사용자 프로필 (analyze-profile 결과)")
+    top_k: int = Field(3, description="추천할 직업 수", ge=1, le=settings.JOB_RECOMMEND_MAX_K)
+
+
+class JobRecommendation(BaseModel):
+    """추천 직업 모델"""
+    job_id: str = Field(..., description="직업 ID")
+    job_name: str = Field(..., description="직업명")
+    category: str = Field(..., description="직업 분야")
+    riasec: str = Field(..., description="관련 RIASEC 흥미 유형 코드")
+    description: str = Field(..., description="직업 설명")
+    required_aptitudes: List[str] = Field(..., description="필요 적성")
+    related_interests: List[str] = Field(..., description="관련 흥미 분야")
+    score: float = Field(..., description="종합 유사도 (적성/흥미 가중 코사인 유사도)")
+    aptitude_score: float = Field(..., description="강점 ↔ 필요 적성 코사인 유사도")
+    interest_score: float = Field(..., description="흥미 ↔ 관련 흥미 코사인 유사도")
+
+
+class JobRecommendationResponse(BaseModel):
+    """직업 추천 응답 모델"""
+    success: bool = Field(..., description="성공 여부")
+    recommendations: List[JobRecommendation] = Field(..., description="유사도 내림차순 추천 직업 목록")
+    total_jobs: int = Field(..., description="검색 대상 직업 수")
+    embed_time_ms: float = Field(..., description="프로필 문구 임베딩 시간 (ms)")
+    search_time_ms: float = Field(..., description="유사도 계산 및 상위 k개 선택 시간 (ms)")
+
+
+class JobStoreStatsResponse(BaseModel):
+    """직업 저장소 통계 응답 모델"""
+    total_jobs: int = Field(..., description="로드된 직업 수")
+    dim: int = Field(..., description="직업 벡터 차원")
+    embedder: Dict[str, Any] = Field(..., description="임베딩 백엔드 설정과 호출 통계 (원격 백엔드는 문구 캐시 통계 포함)")
+    matrix_bytes: int = Field(..., description="임베딩 행렬 크기 (bytes, 메모리 맵이면 공유 페이지 캐시)")
+    index: Dict[str, Any] = Field(..., description="검색 인덱스 통계 (종류, 증분 구간, IVF 클러스터 수 등)")
+    index_path: Optional[str] = Field(None, description="인덱스 저장 경로")
+    index_loaded_from_disk: bool = Field(..., description="저장된 인덱스를 재사용했는지 여부")
+    source: Optional[str] = Field(None, description="직업 데이터 파일 경로")
+    loaded_at: Optional[float] = Field(None, description="로드 시각 (epoch seconds)")
+    build_time_ms: float = Field(..., description="임베딩 행렬 구성 시간 (ms)")
+    queries: int = Field(..., description="누적 추천 요청 수")
+    avg_search_ms: float = Field(..., description="평균 검색 시간 (ms)")
@@ -2,7 +2,7 @@
 PDF 관련 데이터 모델
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict, Any, List
 
 
 class PDFMetadata(BaseModel):
@@ -26,9 +26,55 @@ class PDFUploadResponse(BaseModel):
     preview: str = Field(..., description="텍스트 미리보기 (500자)")
     extracted_text_path: str = Field(..., description="추출된 텍스트 파일 경로")
     warning: Optional[str] = Field(None, description="경고 메시지")
+    content_hash: Optional[str] = Field(None, description="PDF 내용의 SHA-256 해시")
+    cache_hit: bool = Field(False, description="추출 캐시 적중 여부")
 
 
 class SupportedFormatsResponse(BaseModel):
     """지원하는 형식 목록 응답 모델"""
     supported_formats: list[str] = Field(..., description="지원하는 적성검사 형식 목록")
     count: int = Field(..., description="지원하는 형식 개수")
+
+
+class ExtractionCacheStatsResponse(BaseModel):
+    """추출 캐시 통계 응답 모델"""
+    enabled: bool = Field(..., description="캐시 활성화 여부")
+    memory_hits: int = Field(..., description="메모리 계층 적중 횟수")
+    disk_hits: int = Field(..., description="디스크 계층 적중 횟수")
+    misses: int = Field(..., description="캐시 미스 횟수")
+    hit_rate: float = Field(..., description="전체 적중률")
+    memory_entries: int = Field(..., description="메모리 계층 항목 수")
+    max_entries: int = Field(..., description="메모리 계층 최대 항목 수")
+
+
+class FileWriterStatsResponse(BaseModel):
+    """파일 저장 큐 통계 응답 모델"""
+    background: bool = Field(..., description="백그라운드 저장 사용 여부")
+    fsync: bool = Field(..., description="저장 후 fsync 여부")
+    running: bool = Field(..., description="저장 워커 실행 여부")
+    pending: int = Field(..., description="저장 대기 중인 파일 수")
+    max_pending: int = Field(..., description="저장 대기 최대 개수")
+    writes: int = Field(..., description="저장 성공 횟수")
+    inline_writes: int = Field(..., description="큐를 거치지 않고 직접 저장한 횟수")
+    failures: int = Field(..., description="저장 실패 횟수")
+    last_error: Optional[str] = Field(None, description="마지막 저장 실패 메시지")
+    last_error_path: Optional[str] = Field(None, description="마지막으로 저장에 실패한 파일 경로")
+    last_error_at: Optional[float] = Field(None, description="마지막 저장 실패 시각 (Unix time)")
+
+
+class ScoreExtractionResponse(BaseModel):
+    """L형 결과지 점수 추출 응답 모델 (CareerIdentityRequest 필드와 동일한 구조 포함)"""
+    success: bool = Field(..., description="모든 점수 섹션 추출 성공 여부")
+    filename: str = Field(..., description="원본 파일명")
+    saved_filename: str = Field(..., description="저장된 파일명 (고유)")
+    content_hash: str = Field(..., description="PDF 내용의 SHA-256 해시")
+    riasec_scores: Dict[str, int] = Field(..., description="RIASEC 표준점수 (R, I, A, S, E, C)")
+    riasec_raw_scores: Dict[str, int] = Field(..., description="RIASEC 원점수")
+    interest_code: Optional[str] = Field(None, description="대표 흥미 코드 (예: IS)")
+    big5_scores: Dict[str, Any] = Field(..., description="성격 5요인 점수 및 하위요인")
+    life_history_scores: Dict[str, int] = Field(..., description="생활사 구성요인 점수")
+    response_reliability: Dict[str, Dict[str, int]] = Field(..., description="응답 신뢰성 점수와 기준점수")
+    missing_sections: List[str] = Field(..., description="찾지 못한 점수 섹션")
+    pages_scanned: int = Field(..., description="읽은 페이지 수 (모든 섹션을 찾으면 중단)")
+    total_pages: int = Field(..., description="총 페이지 수")
+    error: Optional[str] = Field(None, description="오류 메시지")
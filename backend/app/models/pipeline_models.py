@@ -0,0 +1,71 @@
+"""
+업로드-분석 파이프라인 관련 데이터 모델
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Dict, Any
+from .profile_models import UserProfile
+
+
+class PipelineAnalysisResponse(BaseModel):
+    """업로드-분석 파이프라인 응답 모델 (프로필 + 간단한 메타데이터)"""
+    model_config = ConfigDict(protected_namespaces=())
+
+    success: bool = Field(..., description="성공 여부")
+    filename: str = Field(..., description="원본 파일명")
+    saved_filename: str = Field(..., description="저장된 파일명 (고유)")
+    content_hash: str = Field(..., description="PDF 내용의 SHA-256 해시")
+    file_size: int = Field(..., description="파일 크기 (bytes)")
+    total_pages: int = Field(..., description="총 페이지 수")
+    pages_extracted: int = Field(..., description="분석을 위해 추출한 페이지 수")
+    extraction_truncated: bool = Field(False, description="예산 추출로 일부 페이지만 읽었는지 여부")
+    text_length: int = Field(..., description="추출된 텍스트 길이 (문자 수)")
+    format_detected: str = Field(..., description="감지된 형식")
+    is_supported_format: bool = Field(..., description="지원하는 형식 여부")
+    extraction_cache_hit: bool = Field(..., description="추출 캐시 적중 여부")
+    profile: UserProfile = Field(..., description="추출된 사용자 프로필")
+    model_used: str = Field(..., description="사용된 LLM 모델")
+    cache_status: str = Field("disabled", description="LLM 응답 캐시 상태 (hit, miss, bypass, disabled)")
+    compaction: Optional[Dict[str, Any]] = Field(None, description="분석 텍스트 압축 결과 (원본/압축 토큰 수, 절감 토큰 수)")
+    text: Optional[str] = Field(None, description="추출된 전체 텍스트 (include_text=true일 때만)")
+    warning: Optional[str] = Field(None, description="경고 메시지")
+
+
+class BatchItemResult(BaseModel):
+    """일괄 분석 파일별 결과 (NDJSON 한 줄)"""
+    model_config = ConfigDict(protected_namespaces=())
+
+    type: str = Field("result", description="줄 종류 (result)")
+    index: int = Field(..., description="요청 내 파일 순서 (ZIP 내부 파일 포함)")
+    filename: str = Field(..., description="원본 파일명 (ZIP 내부 파일은 ZIP 안의 경로)")
+    success: bool = Field(..., description="성공 여부")
+    stage: Optional[str] = Field(None, description="실패한 단계 (upload, extraction, analysis)")
+    error: Optional[str] = Field(None, description="오류 메시지")
+    content_hash: Optional[str] = Field(None, description="PDF 내용의 SHA-256 해시")
+    saved_filename: Optional[str] = Field(None, description="저장된 파일명 (고유)")
+    total_pages: Optional[int] = Field(None, description="총 페이지 수")
+    pages_extracted: Optional[int] = Field(None, description="분석을 위해 추출한 페이지 수")
+    format_detected: Optional[str] = Field(None, description="감지된 형식")
+    is_supported_format: Optional[bool] = Field(None, description="지원하는 형식 여부")
+    extraction_cache_hit: Optional[bool] = Field(None, description="추출 캐시 적중 여부")
+    profile: Optional[UserProfile] = Field(None, description="추출된 사용자 프로필")
+    model_used: Optional[str] = Field(None, description="사용된 LLM 모델")
+    cache_status: Optional[str] = Field(None, description="LLM 응답 캐시 상태 (hit, miss, bypass, disabled)")
+    warning: Optional[str] = Field(None, description="경고 메시지")
+    extract_ms: Optional[float] = Field(None, description="추출 소요 시간 (동시 실행 대기 제외, 밀리초)")
+    analyze_ms: Optional[float] = Field(None, description="프로필 분석 소요 시간 (동시 실행 대기 제외, 밀리초)")
+
+
+class BatchSummary(BaseModel):
+    """일괄 분석 처리량 요약 (NDJSON 마지막 줄)"""
+    type: str = Field("summary", description="줄 종류 (summary)")
+    total_files: int = Field(..., description="전체 파일 수")
+    succeeded: int = Field(..., description="성공한 파일 수")
+    failed: int = Field(..., description="실패한 파일 수")
+    failures_by_stage: Dict[str, int] = Field(default_factory=dict, description="단계별 실패 수")
+    concurrency: int = Field(..., description="동시 분석 수")
+    elapsed_seconds: float = Field(..., description="전체 소요 시간 (초)")
+    files_per_second: float = Field(..., description="초당 처리 파일 수")
+    extraction_cache_hits: int = Field(..., description="추출 캐시 적중 수")
+    llm_cache_hits: int = Field(..., description="LLM 응답 캐시 적중 수")
+    avg_extract_ms: float = Field(..., description="평균 추출 소요 시간 (밀리초)")
+    avg_analyze_ms: float = Field(..., description="평균 프로필 분석 소요 시간 (밀리초)")
@@ -2,7 +2,7 @@
 프로파일링 관련 데이터 모델
 """
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 
 class UserProfile(BaseModel):
@@ -12,10 +12,17 @@ class UserProfile(BaseModel):
     weakness: str = Field(..., description="보완이 필요한 약점 1가지")
 
 
+class CareerIdentity(BaseModel):
+    """직업정체성 분석 결과 모델 (LLM 응답 형태)"""
+    career_identity: str = Field(..., description="직업정체성 문단 (6-8문장)")
+    rationale: str = Field(..., description="근거 및 해석 기준 (5줄 이내)")
+
+
 class ProfileAnalysisRequest(BaseModel):
     """프로파일 분석 요청 모델"""
     text: str = Field(..., description="PDF에서 추출된 텍스트")
     format_detected: str = Field(..., description="감지된 적성검사 형식")
+    use_cache: bool = Field(True, description="LLM 응답 캐시 사용 여부 (False면 캐시 우회)")
 
 
 class ProfileAnalysisResponse(BaseModel):
@@ -26,6 +33,8 @@ class ProfileAnalysisResponse(BaseModel):
     profile: UserProfile = Field(..., description="추출된 사용자 프로필")
     raw_response: str = Field(..., description="LLM의 원본 응답")
     model_used: str = Field(..., description="사용된 LLM 모델")
+    cache_status: str = Field("disabled", description="LLM 응답 캐시 상태 (hit, miss, bypass, disabled)")
+    compaction: Optional[Dict[str, Any]] = Field(None, description="분석 텍스트 압축 결과 (원본/압축 토큰 수, 절감 토큰 수)")
 
 
 class CareerIdentityRequest(BaseModel):
@@ -33,6 +42,8 @@ class CareerIdentityRequest(BaseModel):
     riasec_scores: Dict[str, int] = Field(..., description="RIASEC 흥미검사 점수 (R, I, A, S, E, C)")
     big5_scores: Dict[str, Any] = Field(..., description="Big5 성격검사 점수 및 하위 요인")
     life_history_scores: Dict[str, int] = Field(..., description="생활사 검사 점수")
+    use_cache: bool = Field(True, description="LLM 응답 캐시 사용 여부 (False면 캐시 우회)")
+    use_template: bool = Field(False, description="LLM 호출 없이 템플릿 엔진으로 생성 (무료 등급)")
 
 
 class CareerIdentityResponse(BaseModel):
@@ -44,3 +55,20 @@ class CareerIdentityResponse(BaseModel):
     rationale: str = Field(..., description="근거 및 해석 기준 (5줄 이내)")
     raw_response: str = Field(..., description="LLM의 원본 응답")
     model_used: str = Field(..., description="사용된 LLM 모델")
+    cache_status: str = Field("disabled", description="LLM 응답 캐시 상태 (hit, semantic_hit, miss, bypass, disabled)")
+    engine: str = Field("llm", description="생성 엔진 (llm, template)")
+    degraded: bool = Field(False, description="LLM 호출 실패로 템플릿 결과를 대신 반환했는지 여부")
+
+
+class LLMStatsResponse(BaseModel):
+    """LLM 호출 계층 통계 응답 모델"""
+    response_cache: Dict[str, Any] = Field(..., description="LLM 응답 캐시 통계")
+    text_compaction: Dict[str, Any] = Field(..., description="분석 텍스트 압축 누적 통계")
+    single_flight: Dict[str, Any] = Field(..., description="동일 LLM 호출 합치기 통계 (실행 수, 합류 수, 공유된 오류 수)")
+    provider_limits: Dict[str, Any] = Field(..., description="제공자별 호출 제한 통계 (재시도, 429, 동시 호출 한도, 버킷 대기)")
+    routing: Dict[str, Any] = Field(..., description="제공자/모델 라우팅 통계 (후보별 p50/p95·오류율·선택 수, 헤지/전환 수, 최근 결정)")
+    token_usage: Dict[str, Any] = Field(..., description="제공자/모델/분석 종류별 토큰 사용량 (입력/출력/프롬프트 캐시 토큰, 캐시 적중 시 평균 지연)")
+    stream_validation: Dict[str, Any] = Field(..., description="스트리밍 응답 형태 검증 통계 (검증 통과, 조기 중단, 즉시 재요청 수, 중단 사유)")
+    structured_output: Dict[str, Any] = Field(..., description="제공자별 응답 파싱 통계 (그대로 파싱, 로컬 복구, 복구 실패, 형태 위반 수와 비율)")
+    identity_cache: Dict[str, Any] = Field(..., description="직업정체성 근사 캐시 통계 (적중률, RIASEC 상위 코드별·구간 거리별 적중)")
+    identity_template: Dict[str, Any] = Field(..., description="직업정체성 템플릿 엔진 통계 (라이브러리 버전, 생성 수, LLM 실패 대체 수, 평균 생성 시간)")
@@ -3,5 +3,27 @@ Services Package
 """
 from .pdf_service import PDFService
 from .llm_service import LLMService
+from .extraction_cache import ExtractionCache, extraction_cache
+from .llm_clients import LLMClientPool, llm_clients
+from .upload_service import UploadService
+from .batch_service import BatchService
+from .job_store import JobStore, job_store
+from .analysis_queue import AnalysisJobQueue, analysis_queue
+from .identity_template import CareerIdentityTemplateEngine, identity_templates
 
-__all__ = ["PDFService", "LLMService"]
+__all__ = [
+    "PDFService",
+    "LLMService",
+    "ExtractionCache",
+    "extraction_cache",
+    "LLMClientPool",
+    "llm_clients",
+    "UploadService",
+    "BatchService",
+    "JobStore",
+    "job_store",
+    "AnalysisJobQueue",
+    "analysis_queue",
+    "CareerIdentityTemplateEngine",
+    "identity_templates"
+]
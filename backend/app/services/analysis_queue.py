@@ -0,0 +1,523 @@
+"""
+분석 작업 큐 - SQLite 작업 테이블 + 프로세스별 워커 풀 (여러 uvicorn 워커가 공유)
+
+분석 요청은 작업 테이블에 저장된 뒤 바로 작업 ID를 반환하고,
+워커가 대기 작업을 하나씩 가져가 LLM 분석을 실행합니다.
+클라이언트는 작업 ID로 상태와 결과를 조회(또는 long-poll)합니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import statistics
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set
+from app.core.config import settings
+from app.services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisJobQueue:
+    """
+    LLM 분석 작업 큐
+
+    - 작업 테이블(SQLite, WAL)은 모든 워커 프로세스가 공유하며, 대기 작업은
+      BEGIN IMMEDIATE 트랜잭션으로 한 워커만 가져갑니다.
+    - 같은 프로세스에 제출된 작업은 즉시 워커를 깨우고, 다른 프로세스에 제출된 작업은
+      poll_interval마다 확인합니다.
+    - 실행 중 작업을 맡은 프로세스가 죽으면 제한 시간이 지난 뒤 다시 대기열에 넣습니다.
+    """
+
+    STATUSES = ("queued", "running", "succeeded", "failed")
+    MAINTENANCE_INTERVAL = 60.0  # 멈춘 작업 복구 / 보관 기간 지난 작업 삭제 주기 (초)
+
+    def __init__(
+        self,
+        db_path: str = settings.ANALYSIS_QUEUE_PATH,
+        workers: int = settings.ANALYSIS_QUEUE_WORKERS,
+        max_depth: int = settings.ANALYSIS_QUEUE_MAX_DEPTH,
+        poll_interval: float = settings.ANALYSIS_QUEUE_POLL_INTERVAL,
+        job_timeout: float = settings.ANALYSIS_JOB_TIMEOUT,
+        max_attempts: int = settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+        retention_seconds: int = settings.ANALYSIS_JOB_RETENTION_SECONDS
+    ):
+        self.db_path = Path(db_path)
+        self.workers = workers
+        self.max_depth = max_depth
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._initialized = False
+
+        # 작업 종류별 실행 함수 (payload → 분석 서비스 결과)
+        self.llm_service = LLMService()
+        self.handlers = {
+            "profile": self._run_profile,
+            "career_identity": self._run_career_identity
+        }
+
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Set[str] = set()
+        self._waiters: Dict[str, List[Any]] = {}  # job_id → [완료 이벤트, 대기 중인 long-poll 수]
+        self._last_maintenance = 0.0
+
+        # 워커 프로세스별 카운터와 최근 대기/실행 시간 (초)
+        self.submitted = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.requeued = 0
+        self._wait_times: deque = deque(maxlen=1000)
+        self._run_times: deque = deque(maxlen=1000)
+
+    async def start(self) -> None:
+        """워커 풀 시작 (startup 시 호출)"""
+        if self._tasks:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker_loop()) for _ in range(self.workers)]
+        logger.info(f"분석 작업 큐 시작 (workers={self.workers}, db={self.db_path})")
+
+    async def close(self) -> None:
+        """
+        워커 풀 종료 (shutdown 시 호출)
+
+        이 프로세스가 실행 중이던 작업은 다시 대기열에 넣어 다른 워커(또는 재시작 후)가 이어서 처리합니다.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._running:
+            try:
+                await asyncio.to_thread(self._release_sync, list(self._running))
+            except sqlite3.Error as e:
+                logger.warning(f"실행 중 작업 반환 실패: {str(e)}")
+            self._running.clear()
+
+        logger.info(f"분석 작업 큐 종료 (succeeded={self.succeeded}, failed={self.failed})")
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        분석 작업 제출
+
+        Args:
+            kind: 작업 종류 (profile, career_identity)
+            payload: 분석 서비스에 전달할 입력
+
+        Returns:
+            Dict[str, Any]: 제출 결과 (job, queue_depth) - 대기열이 가득 차면 success=False
+        """
+        if kind not in self.handlers:
+            return {"success": False, "error": f"지원하지 않는 작업 종류: {kind}"}
+
+        job_id = uuid.uuid4().hex
+
+        try:
+            depth = await asyncio.to_thread(self._insert_sync, job_id, kind, json.dumps(payload, ensure_ascii=False))
+        except sqlite3.Error as e:
+            logger.error(f"분석 작업 저장 실패: {str(e)}")
+            return {"success": False, "error": f"작업을 저장하지 못했습니다: {str(e)}"}
+
+        if depth is None:
+            self.rejected += 1
+            return {
+                "success": False,
+                "error": f"대기 중인 분석 작업이 너무 많습니다. (최대 {self.max_depth}개) 잠시 후 다시 시도해주세요."
+            }
+
+        self.submitted += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+        return {
+            "success": True,
+            "job": await self.get(job_id),
+            "queue_depth": depth
+        }
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 (없으면 None)
+        """
+        return await asyncio.to_thread(self._get_sync, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        작업이 끝나거나 timeout이 지날 때까지 기다린 뒤 상태 반환 (long-poll)
+
+        같은 프로세스에서 끝난 작업은 완료 즉시 깨어나고,
+        다른 프로세스에서 실행된 작업은 poll_interval마다 다시 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 (없으면 None)
+        """
+        deadline = time.monotonic() + timeout
+        waiter = self._waiters.setdefault(job_id, [asyncio.Event(), 0])
+        waiter[1] += 1
+
+        try:
+            while True:
+                job = await self.get(job_id)
+                remaining = deadline - time.monotonic()
+                if job is None or job["status"] in ("succeeded", "failed") or remaining <= 0:
+                    return job
+
+                try:
+                    await asyncio.wait_for(waiter[0].wait(), timeout=min(self.poll_interval, remaining))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            waiter[1] -= 1
+            if waiter[1] == 0 and self._waiters.get(job_id) is waiter:
+                del self._waiters[job_id]
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        큐 통계 반환 (상태별 작업 수 조회는 스레드에서 실행)
+
+        Returns:
+            Dict[str, Any]: 상태별 작업 수(전체 워커 공유), 이 프로세스의 처리 수와 대기/실행 시간
+        """
+        try:
+            counts, oldest_queued = await asyncio.to_thread(self._counts_sync)
+        except sqlite3.Error:
+            counts, oldest_queued = {}, None
+
+        return {
+            "workers": self.workers,
+            "running_in_process": len(self._running),
+            "queue_depth": counts.get("queued", 0),
+            "max_depth": self.max_depth,
+            "oldest_queued_seconds": round(time.time() - oldest_queued, 3) if oldest_queued else 0.0,
+            "jobs_by_status": {status: counts.get(status, 0) for status in self.STATUSES},
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "requeued": self.requeued,
+            "wait_time_ms": self._summarize(self._wait_times),
+            "run_time_ms": self._summarize(self._run_times)
+        }
+
+    @staticmethod
+    def _summarize(samples: deque) -> Dict[str, float]:
+        """최근 표본의 평균/p50/p95 (밀리초)"""
+        if not samples:
+            return {"avg": 0.0, "p50": 0.0, "p95": 0.0}
+
+        ordered = sorted(samples)
+        return {
+            "avg": round(statistics.fmean(ordered) * 1000, 1),
+            "p50": round(ordered[len(ordered) // 2] * 1000, 1),
+            "p95": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 1)
+        }
+
+    async def _worker_loop(self) -> None:
+        """대기 작업을 가져와 실행 (없으면 제출 알림 또는 poll_interval까지 대기)"""
+        while True:
+            try:
+                if time.monotonic() - self._last_maintenance > self.MAINTENANCE_INTERVAL:
+                    self._last_maintenance = time.monotonic()
+                    self.requeued += await asyncio.to_thread(self._maintain_sync)
+
+                job = await asyncio.to_thread(self._claim_sync)
+            except sqlite3.Error as e:
+                logger.warning(f"분석 작업 조회 실패: {str(e)}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            await self._execute(job)
+
+    async def _execute(self, job: Dict[str, Any]) -> None:
+        """
+        작업 1개 실행 후 결과 저장
+
+        Args:
+            job: _claim_sync가 가져온 작업
+        """
+        job_id = job["job_id"]
+        self._running.add(job_id)
+        self._wait_times.append(job["started_at"] - job["created_at"])
+        started = time.perf_counter()
+        result = None
+
+        try:
+            result = await asyncio.wait_for(
+                self.handlers[job["kind"]](job["payload"]),
+                timeout=self.job_timeout
+            )
+            error = None if result["success"] else result.get("error", "Unknown error")
+        except asyncio.TimeoutError:
+            error = f"작업 실행 시간이 제한({self.job_timeout:g}초)을 초과했습니다."
+        except Exception as e:
+            error = str(e)
+
+        run_time = time.perf_counter() - started
+        self._run_times.append(run_time)
+
+        if error is None:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            logger.warning(f"분석 작업 실패 ({job_id}, {job['kind']}): {error}")
+
+        try:
+            await asyncio.to_thread(self._finish_sync, job_id, result if error is None else None, error)
+        except sqlite3.Error as e:
+            logger.error(f"분석 작업 결과 저장 실패 ({job_id}): {str(e)}")
+        finally:
+            self._running.discard(job_id)
+
+        # 같은 프로세스에서 기다리는 long-poll 깨우기
+        waiter = self._waiters.get(job_id)
+        if waiter is not None:
+            waiter[0].set()
+
+    async def _run_profile(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """프로필 분석 작업"""
+        return await self.llm_service.analyze_profile(
+            text=payload["text"],
+            format_detected=payload["format_detected"],
+            use_cache=payload.get("use_cache", True)
+        )
+
+    async def _run_career_identity(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """직업정체성 분석 작업"""
+        return await self.llm_service.analyze_career_identity(
+            input_data={
+                "riasec_scores": payload["riasec_scores"],
+                "big5_scores": payload["big5_scores"],
+                "life_history_scores": payload["life_history_scores"]
+            },
+            use_cache=payload.get("use_cache", True),
+            use_template=payload.get("use_template", False)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 연결 시 스키마 생성, 트랜잭션은 직접 관리)"""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+
+        if not self._initialized:
+            # WAL 모드: 여러 워커 프로세스의 동시 읽기/쓰기 허용
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS analysis_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status ON analysis_jobs (status, created_at)")
+            self._initialized = True
+
+        return conn
+
+    def _insert_sync(self, job_id: str, kind: str, payload: str) -> Optional[int]:
+        """대기열 깊이를 확인하고 작업 저장 (가득 찼으면 None, 저장했으면 저장 후 깊이)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            depth = conn.execute("SELECT COUNT(*) FROM analysis_jobs WHERE status = 'queued'").fetchone()[0]
+            if depth >= self.max_depth:
+                conn.execute("ROLLBACK")
+                return None
+
+            conn.execute(
+                "INSERT INTO analysis_jobs (job_id, kind, status, payload, created_at) VALUES (?, ?, 'queued', ?, ?)",
+                (job_id, kind, payload, time.time())
+            )
+            conn.execute("COMMIT")
+            return depth + 1
+        finally:
+            conn.close()
+
+    def _claim_sync(self) -> Optional[Dict[str, Any]]:
+        """가장 오래된 대기 작업을 실행 중으로 바꾸고 반환 (한 워커만 가져감)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                """
+                UPDATE analysis_jobs
+                SET status = 'running', started_at = ?, worker = ?, attempts = attempts + 1
+                WHERE job_id = (
+                    SELECT job_id FROM analysis_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1
+                )
+                RETURNING job_id, kind, payload, created_at, started_at
+                """,
+                (time.time(), self.worker_id)
+            ).fetchone()
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+
+        return {**dict(row), "payload": json.loads(row["payload"])}
+
+    def _finish_sync(self, job_id: str, result: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+        """실행 결과 저장 (이 워커가 실행 중인 작업만 갱신)"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                UPDATE analysis_jobs SET status = ?, result = ?, error = ?, finished_at = ?
+                WHERE job_id = ? AND status = 'running' AND worker = ?
+                """,
+                (
+                    "succeeded" if error is None else "failed",
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                    self.worker_id
+                )
+            )
+        finally:
+            conn.close()
+
+    def _release_sync(self, job_ids: List[str]) -> None:
+        """이 워커가 실행 중이던 작업을 다시 대기열로 (종료 시)"""
+        conn = self._connect()
+        try:
+            conn.executemany(
+                """
+                UPDATE analysis_jobs SET status = 'queued', started_at = NULL, worker = NULL,
+                    attempts = MAX(attempts - 1, 0)
+                WHERE job_id = ? AND status = 'running' AND worker = ?
+                """,
+                [(job_id, self.worker_id) for job_id in job_ids]
+            )
+        finally:
+            conn.close()
+
+    def _maintain_sync(self) -> int:
+        """
+        멈춘 실행 중 작업 복구와 보관 기간 지난 작업 삭제
+
+        실행 제한 시간의 2배가 지나도 끝나지 않은 작업은 맡은 프로세스가 죽은 것으로 보고
+        다시 대기열에 넣습니다. (최대 실행 횟수를 넘으면 실패 처리)
+
+        Returns:
+            int: 다시 대기열에 넣은 작업 수
+        """
+        now = time.time()
+        stale_before = now - self.job_timeout * 2
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            requeued = conn.execute(
+                """
+                UPDATE analysis_jobs SET status = 'queued', started_at = NULL, worker = NULL
+                WHERE status = 'running' AND started_at < ? AND attempts < ?
+                """,
+                (stale_before, self.max_attempts)
+            ).rowcount
+            conn.execute(
+                """
+                UPDATE analysis_jobs SET status = 'failed', finished_at = ?,
+                    error = '작업을 처리하던 워커가 응답하지 않아 중단되었습니다.'
+                WHERE status = 'running' AND started_at < ?
+                """,
+                (now, stale_before)
+            )
+            conn.execute(
+                "DELETE FROM analysis_jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?",
+                (now - self.retention_seconds,)
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        if requeued:
+            logger.warning(f"멈춘 분석 작업 {requeued}개를 다시 대기열에 넣었습니다.")
+
+        return requeued
+
+    def _get_sync(self, job_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT job_id, kind, status, result, error, attempts, created_at, started_at, finished_at
+                FROM analysis_jobs WHERE job_id = ?
+                """,
+                (job_id,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            job = dict(row)
+            job["result"] = json.loads(job["result"]) if job["result"] else None
+
+            # 대기 중이면 앞에 남은 작업 수
+            job["queue_position"] = None
+            if job["status"] == "queued":
+                job["queue_position"] = conn.execute(
+                    "SELECT COUNT(*) FROM analysis_jobs WHERE status = 'queued' AND created_at < ?",
+                    (job["created_at"],)
+                ).fetchone()[0] + 1
+
+            return job
+        finally:
+            conn.close()
+
+    def _counts_sync(self):
+        conn = self._connect()
+        try:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM analysis_jobs GROUP BY status").fetchall())
+            oldest_queued = conn.execute(
+                "SELECT MIN(created_at) FROM analysis_jobs WHERE status = 'queued'"
+            ).fetchone()[0]
+            return counts, oldest_queued
+        finally:
+            conn.close()
+
+
+# 애플리케이션 전역 분석 작업 큐
+analysis_queue = AnalysisJobQueue()
@@ -0,0 +1,433 @@
+"""
+일괄 분석 서비스 - 여러 PDF(또는 ZIP)를 추출·프로필 분석하고 완료되는 순서대로 결과 반환
+"""
+import asyncio
+import hashlib
+import logging
+import time
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import Dict, Any, List, Optional, AsyncIterator
+from app.core.config import settings
+from app.core.executor import get_extraction_workers
+from app.core.utils import generate_unique_filename, save_upload_stream, FileTooLargeError
+from app.services.upload_service import UploadService
+from app.services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+class TooManyFilesError(Exception):
+    """일괄 요청의 PDF 수가 제한을 초과한 경우"""
+
+
+class BatchService:
+    """
+    일괄 분석 서비스
+
+    업로드된 PDF(ZIP 내부 PDF 포함)를 먼저 모두 디스크에 저장한 뒤,
+    파일별로 텍스트 추출 → 프로필 분석을 진행합니다.
+
+    - 추출: 추출 프로세스 풀 워커 수만큼만 동시에 제출합니다.
+      (수백 개를 한꺼번에 풀 대기열에 넣으면 다른 사용자의 단건 업로드가 그 뒤에 밀림)
+    - 분석: 요청의 concurrency만큼만 LLM을 동시에 호출합니다.
+
+    두 단계는 파일 단위로 겹쳐 실행되므로, 한 파일을 분석하는 동안 다음 파일 추출이 진행됩니다.
+    """
+
+    def __init__(self):
+        self.upload_service = UploadService()
+        self.llm_service = LLMService()
+
+    @staticmethod
+    def validate_filename(filename: Optional[str]) -> Optional[str]:
+        """
+        일괄 업로드 파일 확장자 확인
+
+        Args:
+            filename: 원본 파일명
+
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if not filename or not filename.lower().endswith(('.pdf', '.zip')):
+            return "PDF 또는 ZIP 파일만 업로드 가능합니다."
+        return None
+
+    async def receive_files(self, files: List[Any]) -> Dict[str, Any]:
+        """
+        업로드된 PDF/ZIP 파일을 저장하고 분석할 항목 목록을 만듭니다.
+
+        크기 제한 초과, 지원하지 않는 확장자처럼 파일 하나의 문제는 해당 항목의 오류로 기록하고,
+        PDF 수 제한 초과처럼 요청 전체의 문제만 실패로 반환합니다.
+
+        Args:
+            files: 업로드 파일 목록 (FastAPI UploadFile)
+
+        Returns:
+            Dict[str, Any]: 저장 결과 (items: 파일별 {"filename", "upload"} 또는 {"filename", "error"})
+        """
+        items: List[Dict[str, Any]] = []
+
+        try:
+            for upload_file in files:
+                if len(items) >= settings.BATCH_MAX_FILES:
+                    raise TooManyFilesError()
+
+                error = self.validate_filename(upload_file.filename)
+                if error:
+                    items.append({"filename": upload_file.filename or "", "error": error})
+                elif upload_file.filename.lower().endswith('.zip'):
+                    items.extend(await self._receive_zip(upload_file, settings.BATCH_MAX_FILES - len(items)))
+                else:
+                    upload = await self.upload_service.receive_upload(upload_file)
+                    if upload["success"]:
+                        items.append({"filename": upload_file.filename, "upload": upload})
+                    else:
+                        items.append({"filename": upload_file.filename, "error": upload["error"]})
+
+        except TooManyFilesError:
+            await self.discard(items)
+            return {
+                "success": False,
+                "error": f"한 번에 분석할 수 있는 PDF는 최대 {settings.BATCH_MAX_FILES}개입니다."
+            }
+
+        if not items:
+            return {"success": False, "error": "분석할 PDF 파일이 없습니다."}
+
+        logger.info(f"일괄 분석 파일 저장 완료 - {len(items)}개 (오류 {sum('error' in item for item in items)}개)")
+
+        return {"success": True, "items": items}
+
+    async def _receive_zip(self, upload_file, max_files: int) -> List[Dict[str, Any]]:
+        """
+        ZIP 파일을 저장하고 내부 PDF를 각각 uploads 디렉토리에 풀어 항목 목록으로 반환
+
+        Args:
+            upload_file: 업로드된 ZIP 파일
+            max_files: 이 ZIP에서 받을 수 있는 최대 PDF 수
+
+        Returns:
+            List[Dict[str, Any]]: 내부 PDF별 항목
+
+        Raises:
+            TooManyFilesError: 내부 PDF 수가 max_files를 초과한 경우 (풀어 둔 파일은 삭제됨)
+        """
+        try:
+            saved = await save_upload_stream(
+                upload_file,
+                generate_unique_filename(upload_file.filename),
+                max_size=settings.BATCH_MAX_BODY_SIZE,
+                chunk_size=settings.UPLOAD_CHUNK_SIZE
+            )
+        except FileTooLargeError:
+            return [{"filename": upload_file.filename, "error": "ZIP 파일 크기가 제한을 초과했습니다."}]
+
+        try:
+            return await asyncio.to_thread(
+                _extract_zip_pdfs,
+                saved["file_path"],
+                "uploads",
+                settings.MAX_FILE_SIZE,
+                max_files,
+                settings.UPLOAD_CHUNK_SIZE
+            )
+        except zipfile.BadZipFile:
+            return [{"filename": upload_file.filename, "error": "손상되었거나 올바르지 않은 ZIP 파일입니다."}]
+        finally:
+            # 내부 PDF를 풀었으므로 ZIP 원본은 보관하지 않음
+            await asyncio.to_thread(Path(saved["file_path"]).unlink, missing_ok=True)
+
+    async def discard(self, items: List[Dict[str, Any]]) -> None:
+        """
+        저장해 둔 항목 파일 삭제 (요청이 거절된 경우)
+
+        Args:
+            items: receive_files 항목 목록
+        """
+        for item in items:
+            if "upload" in item:
+                await asyncio.to_thread(Path(item["upload"]["file_path"]).unlink, missing_ok=True)
+
+    async def analyze(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int,
+        use_cache: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        항목별 추출·분석을 동시에 진행하고 완료되는 순서대로 결과를 반환합니다.
+        모든 항목이 끝나면 마지막으로 처리량 요약을 반환합니다.
+
+        호출 측이 중간에 반복을 멈추면(클라이언트 연결 종료 등) 남은 작업은 취소됩니다.
+
+        Args:
+            items: receive_files 항목 목록
+            concurrency: 동시에 진행할 프로필 분석 수
+            use_cache: LLM 응답 캐시 사용 여부
+
+        Yields:
+            Dict[str, Any]: 파일별 결과 (type="result"), 마지막에 요약 (type="summary")
+        """
+        started = time.perf_counter()
+        extraction_slots = asyncio.Semaphore(get_extraction_workers())
+        llm_slots = asyncio.Semaphore(concurrency)
+
+        tasks = [
+            asyncio.create_task(self._analyze_item(index, item, extraction_slots, llm_slots, use_cache))
+            for index, item in enumerate(items)
+        ]
+        results: List[Dict[str, Any]] = []
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                results.append(result)
+                yield result
+
+            summary = self._summarize(results, concurrency, time.perf_counter() - started)
+            logger.info(
+                f"일괄 분석 완료 - {summary['succeeded']}/{summary['total_files']}개 성공, "
+                f"{summary['elapsed_seconds']}초 ({summary['files_per_second']}개/초, 동시 분석 {concurrency})"
+            )
+            yield summary
+
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"일괄 분석 중단 - 남은 {len(pending)}개 작업 취소")
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _analyze_item(
+        self,
+        index: int,
+        item: Dict[str, Any],
+        extraction_slots: asyncio.Semaphore,
+        llm_slots: asyncio.Semaphore,
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """
+        항목 하나를 추출 → 프로필 분석 (실패해도 예외 대신 오류 결과를 반환)
+
+        Args:
+            index: 요청 내 항목 순서
+            item: receive_files 항목
+            extraction_slots: 추출 동시 실행 제한
+            llm_slots: 분석 동시 실행 제한
+            use_cache: LLM 응답 캐시 사용 여부
+
+        Returns:
+            Dict[str, Any]: 파일별 결과
+        """
+        result: Dict[str, Any] = {"type": "result", "index": index, "filename": item["filename"]}
+
+        if "error" in item:
+            return {**result, "success": False, "stage": "upload", "error": item["error"]}
+
+        upload = item["upload"]
+        result["content_hash"] = upload["content_hash"]
+        stage = "extraction"
+
+        try:
+            # 1. 텍스트 추출 (분석 예산만큼만 추출, 압축 사용 시 문자 예산 없음)
+            char_budget, page_budget = self.upload_service.get_analysis_budget()
+            async with extraction_slots:
+                stage_started = time.perf_counter()
+                extracted = await self.upload_service.process_upload(
+                    item["filename"],
+                    upload,
+                    char_budget=char_budget,
+                    page_budget=page_budget
+                )
+                result["extract_ms"] = round((time.perf_counter() - stage_started) * 1000, 1)
+
+            if not extracted["success"]:
+                return {**result, "success": False, "stage": stage, "error": extracted.get("error", "Unknown error")}
+
+            entry = extracted["entry"]
+            format_detected = entry["format_detected"]
+
+            # 2. LLM 프로필 분석
+            stage = "analysis"
+            async with llm_slots:
+                stage_started = time.perf_counter()
+                analyzed = await self.llm_service.analyze_profile(
+                    text=entry["text"],
+                    format_detected=format_detected,
+                    use_cache=use_cache
+                )
+                result["analyze_ms"] = round((time.perf_counter() - stage_started) * 1000, 1)
+
+            if not analyzed["success"]:
+                return {**result, "success": False, "stage": stage, "error": analyzed.get("error", "Unknown error")}
+
+            return {
+                **result,
+                "success": True,
+                "saved_filename": entry["saved_filename"],
+                "total_pages": entry["total_pages"],
+                "pages_extracted": entry.get("pages_extracted", entry["total_pages"]),
+                "format_detected": format_detected,
+                "is_supported_format": self.upload_service.pdf_service.is_supported_format(format_detected),
+                "extraction_cache_hit": extracted["cache_hit"],
+                "profile": analyzed["profile"],
+                "model_used": analyzed["model_used"],
+                "cache_status": analyzed.get("cache_status", "disabled"),
+                "warning": self.upload_service.get_format_warning(format_detected)
+            }
+
+        except Exception as e:
+            logger.error(f"일괄 분석 항목 실패 ({item['filename']}, {stage}): {str(e)}")
+            return {**result, "success": False, "stage": stage, "error": str(e)}
+
+    @staticmethod
+    def _summarize(results: List[Dict[str, Any]], concurrency: int, elapsed: float) -> Dict[str, Any]:
+        """
+        파일별 결과로 처리량 요약 계산
+
+        Args:
+            results: 파일별 결과 목록
+            concurrency: 동시 분석 수
+            elapsed: 전체 소요 시간 (초)
+
+        Returns:
+            Dict[str, Any]: 요약 (type="summary")
+        """
+        succeeded = [result for result in results if result["success"]]
+        failures_by_stage: Dict[str, int] = {}
+        for result in results:
+            if not result["success"]:
+                failures_by_stage[result["stage"]] = failures_by_stage.get(result["stage"], 0) + 1
+
+        extract_ms = [result["extract_ms"] for result in results if "extract_ms" in result]
+        analyze_ms = [result["analyze_ms"] for result in results if "analyze_ms" in result]
+
+        return {
+            "type": "summary",
+            "total_files": len(results),
+            "succeeded": len(succeeded),
+            "failed": len(results) - len(succeeded),
+            "failures_by_stage": failures_by_stage,
+            "concurrency": concurrency,
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(len(results) / elapsed, 2) if elapsed > 0 else 0.0,
+            "extraction_cache_hits": sum(1 for result in succeeded if result["extraction_cache_hit"]),
+            "llm_cache_hits": sum(1 for result in succeeded if result["cache_status"] == "hit"),
+            "avg_extract_ms": round(sum(extract_ms) / len(extract_ms), 1) if extract_ms else 0.0,
+            "avg_analyze_ms": round(sum(analyze_ms) / len(analyze_ms), 1) if analyze_ms else 0.0
+        }
+
+
+def _decode_member_name(info: zipfile.ZipInfo) -> str:
+    """
+    ZIP 내부 파일명 복원
+
+    UTF-8 플래그가 없는 항목은 zipfile이 cp437로 해석하므로,
+    한국어 Windows에서 만든 ZIP(cp949 파일명)은 원래 이름으로 되돌립니다.
+    """
+    if info.flag_bits & 0x800:
+        return info.filename
+    try:
+        return info.filename.encode("cp437").decode("cp949")
+    except UnicodeError:
+        return info.filename
+
+
+def _extract_zip_pdfs(
+    zip_path: str,
+    upload_dir: str,
+    max_size: int,
+    max_files: int,
+    chunk_size: int
+) -> List[Dict[str, Any]]:
+    """
+    ZIP 내부 PDF를 업로드 디렉토리에 풀어 저장 (스레드에서 실행)
+
+    receive_upload와 같은 형식의 저장 결과를 만들며, 선언된 크기를 믿지 않고
+    실제로 푼 바이트 수로 크기 제한을 확인합니다. (압축 폭탄 방지)
+
+    Args:
+        zip_path: 저장된 ZIP 파일 경로
+        upload_dir: PDF를 풀어 둘 디렉토리
+        max_size: PDF 하나의 최대 크기 (bytes)
+        max_files: 최대 PDF 수
+        chunk_size: 한 번에 풀 청크 크기 (bytes)
+
+    Returns:
+        List[Dict[str, Any]]: 내부 PDF별 항목 ({"filename", "upload"} 또는 {"filename", "error"})
+
+    Raises:
+        TooManyFilesError: 내부 PDF 수가 max_files를 초과한 경우 (풀어 둔 파일은 삭제됨)
+        zipfile.BadZipFile: ZIP 파일이 아닌 경우
+    """
+    items: List[Dict[str, Any]] = []
+    upload_path = Path(upload_dir)
+    upload_path.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with zipfile.ZipFile(zip_path) as archive:
+            for info in archive.infolist():
+                name = _decode_member_name(info)
+                basename = PurePosixPath(name).name
+
+                # 디렉토리, macOS 메타데이터, PDF가 아닌 파일은 건너뜀
+                if info.is_dir() or name.startswith("__MACOSX/") or basename.startswith("."):
+                    continue
+                if not basename.lower().endswith(".pdf"):
+                    continue
+
+                if len(items) >= max_files:
+                    raise TooManyFilesError()
+
+                if info.file_size > max_size:
+                    items.append({"filename": name, "error": f"파일 크기는 {max_size // (1024 * 1024)}MB를 초과할 수 없습니다."})
+                    continue
+
+                unique_filename = generate_unique_filename(basename)
+                file_path = upload_path / unique_filename
+                part_path = upload_path / f"{unique_filename}.part"
+                hasher = hashlib.sha256()
+                file_size = 0
+
+                try:
+                    with archive.open(info) as source, open(part_path, "wb") as target:
+                        while chunk := source.read(chunk_size):
+                            file_size += len(chunk)
+                            if file_size > max_size:
+                                raise FileTooLargeError()
+                            hasher.update(chunk)
+                            target.write(chunk)
+                    part_path.replace(file_path)
+
+                except FileTooLargeError:
+                    part_path.unlink(missing_ok=True)
+                    items.append({"filename": name, "error": f"파일 크기는 {max_size // (1024 * 1024)}MB를 초과할 수 없습니다."})
+                    continue
+                except (zipfile.BadZipFile, zlib.error, RuntimeError, OSError, EOFError) as e:
+                    # 손상된 항목, 암호화된 항목 등
+                    part_path.unlink(missing_ok=True)
+                    items.append({"filename": name, "error": f"ZIP 항목을 풀 수 없습니다: {str(e)}"})
+                    continue
+
+                items.append({
+                    "filename": name,
+                    "upload": {
+                        "success": True,
+                        "saved_filename": unique_filename,
+                        "file_path": str(file_path),
+                        "file_size": file_size,
+                        "content_hash": hasher.hexdigest()
+                    }
+                })
+
+    except BaseException:
+        for item in items:
+            if "upload" in item:
+                Path(item["upload"]["file_path"]).unlink(missing_ok=True)
+        raise
+
+    return items
@@ -0,0 +1,516 @@
+"""
+문구 임베딩 - 적성/흥미 문구를 고정 길이 벡터로 변환
+
+모든 임베딩 백엔드는 같은 인터페이스(Embedder.embed)를 제공하며 결과 벡터는 L2 정규화되어
+내적이 곧 코사인 유사도입니다.
+
+- HashingEmbedder (local): 문자 n-gram 해싱 + TF-IDF 가중치. 네트워크 없이 NumPy로 일괄 계산하며,
+  "논리적 사고력"과 "논리력"처럼 표현이 조금 다른 문구도 가까운 벡터가 됩니다.
+- OpenAIEmbedder (openai): OpenAI Embeddings API. 같은 문구가 사용자마다 반복되므로
+  문구 단위 임베딩 캐시(메모리 LRU + SQLite)를 거쳐 처음 보는 문구만 API로 요청합니다.
+"""
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_PATTERN = re.compile(r"[^0-9A-Za-z가-힣]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# n-gram 롤링 해시용 상수 (FNV-1a 소수, splitmix64 마무리 상수)
+_FNV_PRIME = np.uint64(1099511628211)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    행렬의 각 행을 L2 정규화 (0 벡터는 그대로 유지)
+
+    Args:
+        matrix: 2차원 행렬
+
+    Returns:
+        np.ndarray: 정규화된 행렬 (float32)
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def _mix(hashes: np.ndarray) -> np.ndarray:
+    """해시 비트 섞기 (splitmix64 마무리 단계, uint64 곱셈은 2^64로 순환)"""
+    hashes = hashes ^ (hashes >> np.uint64(30))
+    hashes = hashes * _MIX_1
+    hashes = hashes ^ (hashes >> np.uint64(27))
+    hashes = hashes * _MIX_2
+    return hashes ^ (hashes >> np.uint64(31))
+
+
+class Embedder:
+    """임베딩 백엔드 공통 인터페이스"""
+
+    name = "base"
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        문구 목록을 임베딩 행렬로 변환
+
+        Args:
+            texts: 문구 목록
+
+        Returns:
+            np.ndarray: (문구 수, dim) float32 행렬 (각 행 L2 정규화, 빈 문구는 0 벡터)
+        """
+        raise NotImplementedError
+
+    def fit(self, texts: List[str]) -> None:
+        """
+        말뭉치로 가중치 학습 (필요한 백엔드만 구현)
+
+        Args:
+            texts: 말뭉치 문구 목록
+        """
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        임베딩 결과를 결정하는 설정 (저장된 인덱스 재사용 여부 판단에 사용)
+
+        Returns:
+            Dict[str, Any]: 백엔드 설정
+        """
+        return {"backend": self.name, "dim": self.dim}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        임베딩 통계 반환
+
+        Returns:
+            Dict[str, Any]: 백엔드 설정과 호출 통계
+        """
+        return self.describe()
+
+
+class HashingEmbedder(Embedder):
+    """
+    문자 n-gram 해싱 + TF-IDF 임베딩 (부호 해싱으로 충돌 편향 완화)
+
+    문구들을 한 줄로 이어 붙인 코드포인트 배열에서 n-gram 해시를 NumPy로 한 번에 계산하고
+    (문구 경계를 넘는 n-gram 제외), 해시 버킷별 TF에 fit으로 학습한 IDF를 곱합니다.
+    "능력", "관리"처럼 여러 문구에 흔한 n-gram은 IDF가 낮아 유사도에 덜 기여합니다.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        dim: int = settings.EMBEDDING_DIM,
+        ngram_range: Tuple[int, int] = (2, 3)
+    ):
+        super().__init__(dim)
+        self.ngram_range = ngram_range
+        self.idf = np.ones(dim, dtype=np.float32)
+        self.fitted_documents = 0
+
+        # 호출 통계
+        self.calls = 0
+        self.texts = 0
+        self.total_ms = 0.0
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        return self.embed_sync(texts)
+
+    def embed_sync(self, texts: List[str]) -> np.ndarray:
+        """
+        문구 목록을 임베딩 행렬로 변환 (동기, 네트워크 없음)
+
+        Args:
+            texts: 문구 목록
+
+        Returns:
+            np.ndarray: (문구 수, dim) float32 행렬
+        """
+        started = time.perf_counter()
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        rows, hashes = self._hash_features(texts)
+        if len(rows):
+            buckets = (hashes % np.uint64(self.dim)).astype(np.int64)
+            signs = np.where(hashes >> np.uint64(63), 1.0, -1.0).astype(np.float32)
+            np.add.at(matrix, (rows, buckets), signs)
+            matrix *= self.idf
+
+        self.calls += 1
+        self.texts += len(texts)
+        self.total_ms += (time.perf_counter() - started) * 1000
+
+        return normalize_rows(matrix)
+
+    def fit(self, texts: List[str]) -> None:
+        """
+        문구 말뭉치로 해시 버킷별 IDF 학습 (문구 하나를 문서 하나로 취급)
+
+        Args:
+            texts: 말뭉치 문구 목록 (중복 문구는 한 번만 계산)
+        """
+        unique = list(dict.fromkeys(texts))
+        rows, hashes = self._hash_features(unique)
+        buckets = (hashes % np.uint64(self.dim)).astype(np.int64)
+
+        # 문구별로 등장한 버킷을 한 번씩만 세어 문서 빈도 계산
+        pairs = np.unique(rows * self.dim + buckets)
+        df = np.bincount(pairs % self.dim, minlength=self.dim)
+
+        documents = len(unique)
+        self.idf = (np.log((1 + documents) / (1 + df)) + 1).astype(np.float32)
+        self.fitted_documents = documents
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "dim": self.dim,
+            "ngram_range": list(self.ngram_range),
+            "fitted_documents": self.fitted_documents
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.describe(),
+            "calls": self.calls,
+            "texts": self.texts,
+            "avg_call_us": round(self.total_ms * 1000 / self.calls, 1) if self.calls else 0.0
+        }
+
+    def _hash_features(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        문구 목록의 특징 해시 계산
+
+        공백/기호를 제거한 뒤 앞뒤 경계 표시(<, >)를 붙여 n-gram을 만들고,
+        정확히 같은 문구끼리 더 가깝도록 문구 전체도 특징 하나로 포함합니다.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (문구 번호, 64비트 해시) 배열
+        """
+        padded = [f"<{text}>" if text else "" for text in map(self._normalize, texts)]
+        lengths = np.array([len(text) for text in padded], dtype=np.int64)
+        if not lengths.sum():
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64)
+
+        codes = np.frombuffer("".join(padded).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        row_of = np.repeat(np.arange(len(padded)), lengths)
+
+        rows, hashes = [], []
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            count = len(codes) - n + 1
+            if count <= 0:
+                continue
+
+            # FNV-1a 방식 롤링 해시 (n마다 다른 시작값)
+            hashed = np.full(count, n, dtype=np.uint64)
+            for offset in range(n):
+                hashed = (hashed ^ codes[offset:offset + count]) * _FNV_PRIME
+
+            # 문구 경계를 넘는 n-gram 제외
+            valid = row_of[:count] == row_of[n - 1:n - 1 + count]
+            rows.append(row_of[:count][valid])
+            hashes.append(hashed[valid])
+
+        # 문구 전체 특징
+        whole = [row for row, text in enumerate(padded) if text]
+        rows.append(np.array(whole, dtype=np.int64))
+        hashes.append(np.array(
+            [zlib.crc32(padded[row].encode("utf-8")) | (1 << 40) for row in whole],
+            dtype=np.uint64
+        ))
+
+        return np.concatenate(rows), _mix(np.concatenate(hashes))
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """소문자 변환 후 공백/기호 제거"""
+        return _NON_WORD_PATTERN.sub("", (text or "").lower())
+
+
+class EmbeddingCache:
+    """
+    문구 단위 임베딩 캐시 (메모리 LRU + SQLite, 모델·차원별 구분)
+
+    SQLite 계층은 여러 uvicorn 워커가 공유하므로 한 워커가 받은 임베딩을 다른 워커도 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = settings.EMBEDDING_CACHE_PATH,
+        max_memory_entries: int = settings.EMBEDDING_CACHE_MAX_ENTRIES
+    ):
+        self.db_path = Path(db_path) if db_path else None
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._initialized = False
+
+        # 워커 프로세스별 적중/미스 카운터
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, dim: int, phrase: str) -> str:
+        """
+        캐시 키 생성 (모델, 차원, 공백 정리된 문구의 해시)
+
+        Args:
+            model: 임베딩 모델명
+            dim: 임베딩 차원
+            phrase: 문구
+
+        Returns:
+            str: SHA-256 해시 키
+        """
+        normalized = _WHITESPACE_PATTERN.sub(" ", phrase.strip())
+        return hashlib.sha256(f"{model}\x00{dim}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    async def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        여러 키 조회 (메모리 → SQLite 순)
+
+        Args:
+            keys: 캐시 키 목록
+
+        Returns:
+            Dict[str, np.ndarray]: 찾은 키의 벡터
+        """
+        found: Dict[str, np.ndarray] = {}
+        remaining = []
+        for key in keys:
+            vector = self._memory.get(key)
+            if vector is None:
+                remaining.append(key)
+            else:
+                self._memory.move_to_end(key)
+                found[key] = vector
+        self.memory_hits += len(found)
+
+        if remaining and self.db_path is not None:
+            try:
+                stored = await asyncio.to_thread(self._get_many_sync, remaining)
+            except sqlite3.Error as e:
+                logger.warning(f"임베딩 캐시 조회 실패: {str(e)}")
+                stored = {}
+
+            self.disk_hits += len(stored)
+            for key, vector in stored.items():
+                self._remember(key, vector)
+            found.update(stored)
+
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """
+        여러 벡터 저장
+
+        Args:
+            vectors: 캐시 키 → 벡터
+        """
+        for key, vector in vectors.items():
+            self._remember(key, vector)
+
+        if vectors and self.db_path is not None:
+            try:
+                await asyncio.to_thread(self._put_many_sync, vectors)
+            except sqlite3.Error as e:
+                logger.warning(f"임베딩 캐시 저장 실패: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 계층별 적중/미스 횟수
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "max_memory_entries": self.max_memory_entries,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "path": str(self.db_path) if self.db_path else None
+        }
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """메모리 LRU 계층에 저장"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 연결 시 스키마 생성)"""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+
+        if not self._initialized:
+            # WAL 모드: 여러 워커 프로세스의 동시 읽기/쓰기 허용
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+            self._initialized = True
+
+        return conn
+
+    def _get_many_sync(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        conn = self._connect()
+        try:
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})",
+                keys
+            ).fetchall()
+            return {key: np.frombuffer(blob, dtype=np.float32) for key, blob in rows}
+        finally:
+            conn.close()
+
+    def _put_many_sync(self, vectors: Dict[str, np.ndarray]) -> None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, vector, created_at) VALUES (?, ?, ?)",
+                [(key, np.asarray(vector, dtype=np.float32).tobytes(), now) for key, vector in vectors.items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+class OpenAIEmbedder(Embedder):
+    """OpenAI Embeddings API 백엔드 (문구 캐시에 없는 문구만 배치로 요청)"""
+
+    name = "openai"
+
+    def __init__(
+        self,
+        model: str = settings.OPENAI_EMBEDDING_MODEL,
+        dim: int = settings.OPENAI_EMBEDDING_DIM,
+        batch_size: int = settings.OPENAI_EMBEDDING_BATCH_SIZE,
+        cache: Optional[EmbeddingCache] = None
+    ):
+        super().__init__(dim)
+        self.model = model
+        self.batch_size = batch_size
+        self.cache = cache if cache is not None else EmbeddingCache()
+
+        # 호출 통계
+        self.api_calls = 0
+        self.api_texts = 0
+        self.api_ms = 0.0
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+
+        # 빈 문구는 0 벡터, 같은 문구는 한 번만 조회/요청
+        keys = {
+            text: self.cache.make_key(self.model, self.dim, text)
+            for text in texts if text and text.strip()
+        }
+        cached = await self.cache.get_many(list(set(keys.values())))
+        missing = [text for text, key in keys.items() if key not in cached]
+
+        if missing:
+            fetched = await self._request(missing)
+            new_vectors = {keys[text]: vector for text, vector in zip(missing, fetched)}
+            await self.cache.put_many(new_vectors)
+            cached.update(new_vectors)
+
+        for row, text in enumerate(texts):
+            key = keys.get(text)
+            if key is not None:
+                matrix[row] = cached[key]
+
+        return normalize_rows(matrix)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "dim": self.dim, "model": self.model}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.describe(),
+            "api_calls": self.api_calls,
+            "api_texts": self.api_texts,
+            "avg_api_ms": round(self.api_ms / self.api_calls, 2) if self.api_calls else 0.0,
+            "cache": self.cache.get_stats()
+        }
+
+    async def _request(self, texts: List[str]) -> np.ndarray:
+        """캐시에 없는 문구를 배치 단위로 API에 요청"""
+        from app.services.llm_clients import llm_clients
+        from app.services.provider_limiter import provider_limiters
+        from app.services.text_compactor import estimate_tokens
+
+        client = llm_clients.get_openai()
+        limiter = provider_limiters.get("openai_embedding")  # 임베딩 모델은 채팅 모델과 한도가 별도
+        vectors = []
+
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            started = time.perf_counter()
+            response = await limiter.call(
+                lambda: client.embeddings.create(model=self.model, input=batch, dimensions=self.dim),
+                sum(estimate_tokens(text) for text in batch)
+            )
+            self.api_calls += 1
+            self.api_texts += len(batch)
+            self.api_ms += (time.perf_counter() - started) * 1000
+
+            ordered = sorted(response.data, key=lambda item: item.index)
+            vectors.extend(np.asarray(item.embedding, dtype=np.float32) for item in ordered)
+
+        return normalize_rows(np.stack(vectors))
+
+
+def create_embedder(backend: str = settings.EMBEDDING_BACKEND) -> Embedder:
+    """
+    설정된 임베딩 백엔드 생성
+
+    openai 백엔드는 OPENAI_API_KEY가 없으면 local 백엔드로 대체합니다.
+
+    Args:
+        backend: local 또는 openai
+
+    Returns:
+        Embedder: 임베딩 백엔드
+    """
+    if backend == OpenAIEmbedder.name:
+        if settings.OPENAI_API_KEY:
+            return OpenAIEmbedder()
+        logger.warning("OPENAI_API_KEY가 없어 로컬 임베딩 백엔드를 사용합니다.")
+    elif backend != HashingEmbedder.name:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드입니다: {backend} (가능: local, openai)")
+
+    return HashingEmbedder()
@@ -0,0 +1,132 @@
+"""
+PDF 추출 결과 캐시 - 콘텐츠 해시(SHA-256) 기반
+"""
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional
+from app.core.config import settings
+from app.core.file_writer import file_writer
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """PDF 추출 결과 캐시 (메모리 LRU 계층 + 디스크 계층)"""
+
+    def __init__(
+        self,
+        max_entries: int = settings.EXTRACTION_CACHE_MAX_ENTRIES,
+        cache_dir: str = settings.EXTRACTION_CACHE_DIR
+    ):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir)
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # 캐시 크기 산정용 카운터
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    async def get(self, content_hash: str, allow_partial: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        캐시에서 추출 결과 조회 (메모리 → 디스크 순, 디스크 읽기는 스레드에서 실행)
+
+        Args:
+            content_hash: PDF 내용의 SHA-256 해시
+            allow_partial: 예산 추출로 일부 페이지만 담긴 항목도 허용할지 여부
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시된 추출 결과 (없으면 None)
+        """
+        # 1. 메모리 계층
+        entry = self._memory.get(content_hash)
+        if entry is not None and (allow_partial or not entry.get("truncated")):
+            self._memory.move_to_end(content_hash)
+            self.memory_hits += 1
+            return entry
+
+        # 2. 디스크 계층
+        if entry is None:
+            entry = await asyncio.to_thread(self._read_disk, content_hash)
+            if entry is not None and (allow_partial or not entry.get("truncated")):
+                self._remember(content_hash, entry)
+                self.disk_hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    async def put(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        """
+        추출 결과를 캐시에 저장 (메모리 + 디스크)
+
+        디스크 계층은 파일 저장 큐를 통해 백그라운드로 기록됩니다.
+
+        Args:
+            content_hash: PDF 내용의 SHA-256 해시
+            entry: 저장할 추출 결과
+        """
+        self._remember(content_hash, entry)
+        await self._write_disk(content_hash, entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중/미스 통계 반환
+
+        Returns:
+            Dict[str, Any]: 캐시 통계
+        """
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries
+        }
+
+    def _remember(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        """메모리 계층에 저장하고 LRU 크기 제한 적용"""
+        self._memory[content_hash] = entry
+        self._memory.move_to_end(content_hash)
+
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, content_hash: str) -> Path:
+        """해시에 대응하는 디스크 캐시 파일 경로"""
+        return self.cache_dir / f"{content_hash}.json"
+
+    def _read_disk(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """디스크 계층에서 조회"""
+        path = self._disk_path(content_hash)
+
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"추출 캐시 파일 읽기 실패 ({path}): {str(e)}")
+            return None
+
+    async def _write_disk(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        """디스크 계층에 저장 (파일 저장기가 임시 파일 작성 후 교체)"""
+        try:
+            await file_writer.submit(
+                self._disk_path(content_hash),
+                json.dumps(entry, ensure_ascii=False)
+            )
+        except OSError as e:
+            logger.warning(f"추출 캐시 파일 저장 실패: {str(e)}")
+
+
+# 애플리케이션 전역 추출 캐시 (업로드 API와 파이프라인 API가 공유)
+extraction_cache = ExtractionCache()
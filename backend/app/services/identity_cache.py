@@ -0,0 +1,371 @@
+"""
+직업정체성 근사 캐시 - 점수를 구간으로 양자화한 서명으로 비슷한 입력의 직업정체성 문단을 재사용 (SQLite, 여러 워커가 공유)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.services.llm_cache import add_missing_columns
+from app.services.vector_index import ExactIndex
+
+logger = logging.getLogger(__name__)
+
+RIASEC_ORDER = "RIASEC"
+
+
+@dataclass
+class ScoreSignature:
+    """양자화한 점수 서명"""
+    partition: str  # RIASEC 상위 코드 순서 + 필드 구성 (같아야 근사 비교)
+    rank_code: str  # RIASEC 상위 코드 (예: "ICS")
+    bins: np.ndarray  # 필드별 구간 번호
+    key: str  # 서명 전체 해시 (같은 구간 조합이면 같은 값)
+
+
+def score_signature(
+    input_data: Dict[str, Any],
+    bin_width: float = settings.IDENTITY_CACHE_BIN_WIDTH,
+    bin_widths: Optional[Dict[str, float]] = None,
+    rank_codes: int = settings.IDENTITY_CACHE_RANK_CODES
+) -> ScoreSignature:
+    """
+    입력 점수를 양자화한 서명 생성
+
+    숫자 값은 최상위 구역(riasec_scores 등)별 구간 폭으로 나눈 구간 번호가 되고,
+    RIASEC 점수 상위 rank_codes개의 순서와 숫자가 아닌 값(문자열 등)은 구획(partition)에 들어가 정확히 일치해야 합니다.
+
+    Args:
+        input_data: 직업정체성 입력 (riasec_scores, big5_scores, life_history_scores)
+        bin_width: 기본 구간 폭 (점)
+        bin_widths: 구역별 구간 폭 (예: {"life_history_scores": 10})
+        rank_codes: 서명에 넣을 RIASEC 상위 코드 수
+
+    Returns:
+        ScoreSignature: 점수 서명
+    """
+    widths = settings.IDENTITY_CACHE_BIN_WIDTHS if bin_widths is None else bin_widths
+
+    numeric: List[Tuple[str, float]] = []
+    other: List[Tuple[str, Any]] = []
+    _flatten("", input_data, numeric, other)
+
+    bins = np.array([
+        math.floor(value / widths.get(path.split(".", 1)[0], bin_width))
+        for path, value in numeric
+    ], dtype=np.float32)
+
+    riasec = input_data.get("riasec_scores") or {}
+    ranked = sorted(
+        (code for code, value in riasec.items() if _is_number(value)),
+        key=lambda code: (-riasec[code], RIASEC_ORDER.find(code) if code in RIASEC_ORDER else len(RIASEC_ORDER), code)
+    )
+    rank_code = "".join(ranked[:rank_codes])
+
+    layout = json.dumps([[path for path, _ in numeric], other], ensure_ascii=False, sort_keys=True)
+    partition = f"{rank_code}:{hashlib.sha256(layout.encode('utf-8')).hexdigest()[:16]}"
+    key = hashlib.sha256(f"{partition}:{bins.tobytes().hex()}".encode("utf-8")).hexdigest()
+
+    return ScoreSignature(partition=partition, rank_code=rank_code, bins=bins, key=key)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _flatten(prefix: str, value: Any, numeric: List[Tuple[str, float]], other: List[Tuple[str, Any]]) -> None:
+    """중첩된 점수 딕셔너리를 경로별 숫자/기타 값으로 펼침 (키 순서 무관)"""
+    if isinstance(value, dict):
+        for key in sorted(value, key=str):
+            _flatten(f"{prefix}.{key}" if prefix else str(key), value[key], numeric, other)
+    elif _is_number(value):
+        numeric.append((prefix, float(value)))
+    else:
+        other.append((prefix, value))
+
+
+class CareerIdentityCache:
+    """
+    양자화 점수 서명 → 직업정체성 응답 근사 캐시
+
+    응답은 SQLite에 저장해 워커가 공유하고, 각 워커는 구획(RIASEC 상위 코드 순서 + 필드 구성)별
+    ExactIndex에 서명 벡터를 올려 가장 가까운 서명을 찾습니다. 구간 번호 사이의 유클리드 거리가
+    max_distance 이하이면 저장된 문단을 그대로 반환합니다. (0이면 모든 점수가 같은 구간)
+
+    내적 검색으로 최근접 거리를 구하도록 서명 x는 [x, -|x|²/2], 검색 벡터 q는 [q, 1]로 저장/검색합니다.
+    (q·x - |x|²/2가 클수록 |q - x|가 작음)
+    """
+
+    def __init__(
+        self,
+        db_path: str = settings.IDENTITY_CACHE_PATH,
+        max_distance: float = settings.IDENTITY_CACHE_MAX_DISTANCE,
+        ttl_seconds: int = settings.IDENTITY_CACHE_TTL_SECONDS,
+        max_entries: int = settings.IDENTITY_CACHE_MAX_ENTRIES
+    ):
+        self.db_path = Path(db_path)
+        self.max_distance = max_distance
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._initialized = False
+
+        # 워커 프로세스별 인덱스 (SQLite의 새 행을 조회 시점에 반영)
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, ExactIndex] = {}
+        self._row_ids: Dict[str, List[int]] = {}
+        self._last_row_id = 0
+        self._missing = 0  # 인덱스에는 있지만 만료/정리된 항목을 만난 횟수
+
+        # 워커 프로세스별 카운터
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+        self._by_rank_code: Dict[str, Dict[str, int]] = {}
+        self._by_distance: Dict[str, int] = {}
+
+    async def get(self, input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        가장 가까운 서명의 응답 조회
+
+        Args:
+            input_data: 직업정체성 입력
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 항목 (response, 구간 distance, 응답한 provider/model - 이전 항목은 None),
+            허용 거리 안에 없으면 None
+        """
+        signature = score_signature(input_data)
+
+        try:
+            found = await asyncio.to_thread(self._get_sync, signature)
+        except sqlite3.Error as e:
+            logger.warning(f"직업정체성 근사 캐시 조회 실패: {str(e)}")
+            found = None
+
+        entry = self._by_rank_code.setdefault(signature.rank_code, {"lookups": 0, "hits": 0})
+        entry["lookups"] += 1
+
+        if found is None:
+            self.misses += 1
+            return None
+
+        distance = found["distance"]
+        self.hits += 1
+        entry["hits"] += 1
+        bucket = "exact" if distance == 0 else f"<={math.ceil(distance * 2) / 2:g}"
+        self._by_distance[bucket] = self._by_distance.get(bucket, 0) + 1
+        logger.info(f"직업정체성 근사 캐시 적중 - {signature.rank_code}, 구간 거리 {distance:.2f}")
+        return found
+
+    async def set(
+        self,
+        input_data: Dict[str, Any],
+        response: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> None:
+        """
+        응답 저장 (같은 서명이 이미 있으면 유지)
+
+        Args:
+            input_data: 직업정체성 입력
+            response: LLM 원본 응답
+            provider: 응답한 제공자
+            model: 응답한 모델
+        """
+        signature = score_signature(input_data)
+
+        try:
+            stored = await asyncio.to_thread(self._set_sync, signature, response, provider, model)
+        except sqlite3.Error as e:
+            logger.warning(f"직업정체성 근사 캐시 저장 실패: {str(e)}")
+            return
+
+        self.stores += stored
+
+    def record_bypass(self) -> None:
+        """요청 단위 캐시 우회 기록"""
+        self.bypasses += 1
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환 (저장 항목 수 조회는 스레드에서 실행)
+
+        Returns:
+            Dict[str, Any]: 적중/미스/우회 횟수, RIASEC 상위 코드별·구간 거리별 적중, 저장 항목 수
+        """
+        lookups = self.hits + self.misses
+
+        try:
+            entries = await asyncio.to_thread(self._count_sync)
+        except sqlite3.Error:
+            entries = None
+
+        return {
+            "enabled": settings.IDENTITY_CACHE_ENABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "by_rank_code": {
+                code: {**entry, "hit_rate": round(entry["hits"] / entry["lookups"], 4)}
+                for code, entry in sorted(self._by_rank_code.items(), key=lambda item: -item[1]["lookups"])
+            },
+            "hits_by_distance": dict(sorted(self._by_distance.items())),
+            "entries": entries,
+            "indexed": sum(len(rows) for rows in self._row_ids.values()),
+            "partitions": len(self._indexes),
+            "max_distance": self.max_distance,
+            "bin_width": settings.IDENTITY_CACHE_BIN_WIDTH,
+            "bin_widths": settings.IDENTITY_CACHE_BIN_WIDTHS,
+            "rank_codes": settings.IDENTITY_CACHE_RANK_CODES
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 연결 시 스키마 생성)"""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+
+        if not self._initialized:
+            # WAL 모드: 여러 워커 프로세스의 동시 읽기/쓰기 허용
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS identity_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    signature TEXT NOT NULL UNIQUE,
+                    partition TEXT NOT NULL,
+                    bins BLOB NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    provider TEXT,
+                    model TEXT
+                )
+                """
+            )
+            add_missing_columns(conn, "identity_cache", ("provider", "model"))
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_identity_cache_accessed ON identity_cache (accessed_at)")
+            conn.commit()
+            self._initialized = True
+
+        return conn
+
+    def _get_sync(self, signature: ScoreSignature) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            with self._lock:
+                self._refresh(conn)
+                candidates = self._nearest(signature)
+
+            for row_id, distance in candidates:
+                row = conn.execute(
+                    "SELECT response, created_at, provider, model FROM identity_cache WHERE id = ?",
+                    (row_id,)
+                ).fetchone()
+
+                if row is None or now - row[1] > self.ttl_seconds:
+                    self._missing += 1
+                    continue
+
+                conn.execute("UPDATE identity_cache SET accessed_at = ? WHERE id = ?", (now, row_id))
+                conn.commit()
+                return {"response": row[0], "distance": distance, "provider": row[2], "model": row[3]}
+
+            return None
+        finally:
+            conn.close()
+
+    def _set_sync(self, signature: ScoreSignature, response: str, provider: Optional[str], model: Optional[str]) -> int:
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO identity_cache (signature, partition, bins, response, created_at, accessed_at, provider, model)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (signature.key, signature.partition, signature.bins.tobytes(), response, now, now, provider, model)
+            )
+
+            # 만료 항목 삭제
+            conn.execute("DELETE FROM identity_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+            # 크기 제한 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+            conn.execute(
+                """
+                DELETE FROM identity_cache WHERE id IN (
+                    SELECT id FROM identity_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,)
+            )
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def _count_sync(self) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM identity_cache").fetchone()[0]
+        finally:
+            conn.close()
+
+    def _refresh(self, conn: sqlite3.Connection) -> None:
+        """다른 워커가 저장한 행까지 인덱스에 반영 (정리된 항목이 많이 쌓이면 인덱스를 다시 구성)"""
+        if self._missing > max(16, self.max_entries // 10):
+            self._indexes.clear()
+            self._row_ids.clear()
+            self._last_row_id = 0
+            self._missing = 0
+
+        rows = conn.execute(
+            "SELECT id, partition, bins FROM identity_cache WHERE id > ? ORDER BY id",
+            (self._last_row_id,)
+        ).fetchall()
+
+        for row_id, partition, blob in rows:
+            bins = np.frombuffer(blob, dtype=np.float32)
+            index = self._indexes.get(partition)
+            if index is None:
+                index = self._indexes[partition] = ExactIndex(len(bins) + 1)
+                self._row_ids[partition] = []
+            index.add(np.append(bins, -0.5 * float(bins @ bins)))
+            self._row_ids[partition].append(row_id)
+            self._last_row_id = row_id
+
+    def _nearest(self, signature: ScoreSignature, top_k: int = 4) -> List[Tuple[int, float]]:
+        """같은 구획에서 허용 거리 안의 가까운 서명 (행 번호, 거리) - 가까운 순"""
+        index = self._indexes.get(signature.partition)
+        if index is None:
+            return []
+
+        query = signature.bins
+        positions, scores = index.search(np.append(query, 1.0).astype(np.float32), top_k)
+        norm = float(query @ query)
+        rows = self._row_ids[signature.partition]
+
+        candidates = []
+        for position, score in zip(positions, scores):
+            distance = math.sqrt(max(0.0, norm - 2.0 * float(score)))
+            if distance <= self.max_distance + 1e-6:
+                candidates.append((rows[position], round(distance, 4)))
+        return candidates
+
+
+# 애플리케이션 전역 직업정체성 근사 캐시
+career_identity_cache = CareerIdentityCache()
@@ -0,0 +1,334 @@
+"""
+직업정체성 템플릿 엔진 - LLM 호출 없이 사전 작성된 문장 조각 라이브러리로 직업정체성 문단과 근거 블록 생성
+
+startup 시 조각 라이브러리(JSON)를 한 번 읽어 RIASEC 상위 코드 조합과 Big5 요인 구간(높음/보통/낮음)별로
+문장을 미리 만들어 두고, 요청마다 점수만 채워 넣습니다. (프롬프트의 6단계 구성 순서를 그대로 따름)
+무료 등급 요청(use_template)과 LLM 호출 실패 시의 대체 응답(IDENTITY_TEMPLATE_FALLBACK)에 사용합니다.
+"""
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RIASEC_ORDER = "RIASEC"
+
+# 조각 안의 "{변수}{조사}" 표기 (앞 단어의 받침에 따라 조사 선택)
+_PARTICLE_FIELD = re.compile(r"\{(\w+)\}\{(이|은|을|과)\}")
+_PARTICLES = {"이": ("이", "가"), "은": ("은", "는"), "을": ("을", "를"), "과": ("과", "와")}
+
+
+def _particle(word: str, particle: str) -> str:
+    """앞 단어의 마지막 한글 글자 받침에 맞는 조사 (괄호 안 점수는 건너뜀, 한글이 없으면 받침 있는 형태)"""
+    with_final, without_final = _PARTICLES[particle]
+    head = word.rsplit("(", 1)[0] if word.endswith(")") else word
+    for char in reversed(head):
+        if "가" <= char <= "힣":
+            return with_final if (ord(char) - 0xAC00) % 28 else without_final
+        if not char.isspace():
+            break
+    return with_final
+
+
+def _format_score(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.1f}"
+
+
+class Fragment:
+    """조사 표기를 포함한 문장 조각 (로드 시 한 번 해석)"""
+
+    def __init__(self, template: str):
+        self.particles: List[Tuple[str, str]] = _PARTICLE_FIELD.findall(template)
+        self.template = _PARTICLE_FIELD.sub(r"{\1}{\1_\2}", template)
+
+    def render(self, **values: Any) -> str:
+        for name, particle in self.particles:
+            values[f"{name}_{particle}"] = _particle(str(values[name]), particle)
+        return self.template.format(**values)
+
+
+class CareerIdentityTemplateEngine:
+    """
+    사전 계산된 문장 조각으로 직업정체성 결과를 만드는 엔진
+
+    - 흥미 패턴: 상위 1·2순위 RIASEC 코드별 문장 (점수만 채움)
+    - 성격·정서·개방성: Big5 요인과 구간별 문장 (하위 요인이 있으면 구간을 대표하는 하위 요인 인용,
+      결과지 요인명(호감성 등)은 라이브러리의 aliases로 기준 요인명(우호성 등)에 대응)
+    - 생활사: 가장 높은 항목의 구간별 문장
+    - 종합 정의: 상위 코드 조합(30가지 + 단일 코드 6가지)별로 로드 시 완성해 둔 문장
+    """
+
+    _BAND_NAMES = {"high": "높음", "mid": "보통", "low": "낮음"}
+
+    def __init__(self, path: str = settings.IDENTITY_TEMPLATE_PATH):
+        self.path = path
+        self.version: Optional[int] = None
+        self.loaded_at: Optional[float] = None
+        self.load_time_ms = 0.0
+
+        self._high = 65.0
+        self._low = 40.0
+        self._names: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}
+        self._interest: Dict[str, Tuple[str, str]] = {}
+        self._synthesis: Dict[Tuple[str, str], str] = {}
+        self._parts: Dict[str, Dict[str, Any]] = {}
+        self._rationale: Dict[str, Fragment] = {}
+
+        # 워커 프로세스별 통계
+        self.renders = 0
+        self.fallbacks = 0
+        self.total_render_us = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    @property
+    def model_name(self) -> str:
+        return f"template-v{self.version}"
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """
+        조각 라이브러리를 읽어 코드 조합·요인 구간별 문장 구성 (startup 시 호출)
+
+        Args:
+            path: 조각 라이브러리 JSON 경로
+
+        Returns:
+            bool: 로드 성공 여부 (실패 시 이전 라이브러리 유지)
+        """
+        path = path or self.path
+        started = time.perf_counter()
+
+        try:
+            library = json.loads(Path(path).read_text(encoding="utf-8"))
+            self._build(library)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"직업정체성 조각 라이브러리 로드 실패 ({path}): {str(e)}")
+            return False
+
+        self.path = path
+        self.version = library.get("version", 1)
+        self.loaded_at = time.time()
+        self.load_time_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"직업정체성 조각 라이브러리 로드 - v{self.version}, 코드 조합 {len(self._synthesis)}개 "
+            f"({self.load_time_ms:.1f}ms)"
+        )
+        return True
+
+    def _build(self, library: Dict[str, Any]) -> None:
+        codes = library["riasec"]
+        interest = library["interest"]
+        synthesis = library["synthesis"]
+
+        # 흥미 패턴: 점수({score})만 남기고 코드별로 채움
+        built_interest = {}
+        for code, entry in codes.items():
+            fields = {**entry, "code": code, "score": "{score}"}
+            built_interest[code] = (interest["primary"].format(**fields), interest["secondary"].format(**fields))
+
+        # 종합 정의: 모든 상위 코드 조합을 미리 완성
+        pair, single = Fragment(synthesis["pair"]), Fragment(synthesis["single"])
+        closing_pair, closing_single = Fragment(synthesis["closing_pair"]), Fragment(synthesis["closing_single"])
+        built_synthesis = {}
+        for primary, first in codes.items():
+            built_synthesis[(primary, "")] = " ".join([
+                single.render(examples=", ".join(first["examples"]), primary_domain=first["domain"]),
+                closing_single.render(primary_identity=first["identity"])
+            ])
+            for secondary, second in codes.items():
+                if secondary == primary:
+                    continue
+                examples = list(dict.fromkeys(first["examples"] + second["examples"][:2]))
+                built_synthesis[(primary, secondary)] = " ".join([
+                    pair.render(
+                        examples=", ".join(examples),
+                        primary_domain=first["domain"],
+                        secondary_domain=second["domain"]
+                    ),
+                    closing_pair.render(primary_identity=first["identity"], secondary_trait=second["trait"])
+                ])
+
+        # 성격·정서·개방성·생활사: 요인 구간별 조각
+        parts = {}
+        for part in ("personality", "emotion", "openness"):
+            entry = library[part]
+            parts[part] = {
+                "factors": entry["factors"],
+                "bands": {
+                    factor: {band: Fragment(text) for band, text in entry[factor].items()}
+                    for factor in entry["factors"]
+                },
+                "none": entry["none"]
+            }
+        life = library["life_history"]
+        parts["life_history"] = {
+            "bands": {band: Fragment(life[band]) for band in ("high", "mid", "low")},
+            "none": life["none"]
+        }
+
+        self._high = float(library["bands"]["high"])
+        self._low = float(library["bands"]["low"])
+        self._names = {code: entry["name"] for code, entry in codes.items()}
+        self._aliases = dict(library.get("aliases") or {})
+        self._interest = built_interest
+        self._synthesis = built_synthesis
+        self._parts = parts
+        self._rationale = {name: Fragment(text) for name, text in library["rationale"].items()}
+
+    def render(self, input_data: Dict[str, Any], degraded: bool = False) -> Dict[str, str]:
+        """
+        직업정체성 문단과 근거 블록 생성
+
+        Args:
+            input_data: 흥미, 성격, 생활사 데이터 (riasec_scores, big5_scores, life_history_scores)
+            degraded: LLM 호출 실패를 대신하는 응답인지 여부 (통계용)
+
+        Returns:
+            Dict[str, str]: {"career_identity": 문단, "rationale": 근거 및 해석 기준}
+        """
+        if not self.loaded and not self.load():
+            raise RuntimeError("직업정체성 조각 라이브러리가 로드되지 않았습니다")
+
+        started = time.perf_counter()
+
+        riasec = input_data.get("riasec_scores") or {}
+        ranked = sorted(
+            (code for code, value in riasec.items() if code in self._interest and isinstance(value, (int, float))),
+            key=lambda code: (-riasec[code], RIASEC_ORDER.find(code))
+        )
+        if not ranked:
+            raise ValueError("RIASEC 점수가 없어 직업정체성을 생성할 수 없습니다")
+        primary = ranked[0]
+        secondary = ranked[1] if len(ranked) > 1 else ""
+
+        # 결과지 요인명은 기준 요인명으로 대응하고, 문장에는 입력된 요인명을 그대로 인용
+        big5: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        labels: Dict[str, str] = {}
+        for name, value in (input_data.get("big5_scores") or {}).items():
+            scored = self._factor_score(value)
+            if scored is None:
+                continue
+            factor = self._aliases.get(name, name)
+            big5[factor] = scored
+            labels[factor] = name
+
+        # (1) 흥미 패턴
+        sentences = [self._interest[primary][0].format(score=_format_score(riasec[primary]))]
+        if secondary:
+            sentences.append(self._interest[secondary][1].format(score=_format_score(riasec[secondary])))
+
+        # (2) 성격의 작동 방식 - 중간(50점)에서 가장 멀리 떨어진 요인, (3) 정서·스트레스 반응, (4) 개방성
+        bands_used = []
+        for part in ("personality", "emotion", "openness"):
+            entry = self._parts[part]
+            present = [factor for factor in entry["factors"] if factor in big5]
+            if not present:
+                sentences.append(entry["none"])
+                continue
+            factor = max(present, key=lambda name: abs(big5[name][0] - 50))
+            band = self._band(big5[factor][0])
+            bands_used.append(f"{labels[factor]} {self._BAND_NAMES[band]}")
+            sentences.append(entry["bands"][factor][band].render(ref=self._factor_ref(labels[factor], big5[factor], band)))
+
+        # (5) 생활사·동기 요소 - 가장 높은 항목
+        life = {
+            name: value for name, value in (input_data.get("life_history_scores") or {}).items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        life_ref = None
+        if life:
+            name = max(life, key=lambda key: life[key])
+            life_ref = f"{name}({_format_score(life[name])}점)"
+            sentences.append(self._parts["life_history"]["bands"][self._band(life[name])].render(ref=life_ref))
+        else:
+            sentences.append(self._parts["life_history"]["none"])
+
+        # (6) 종합적 직업정체성 정의와 예시 직업군
+        sentences.append(self._synthesis[(primary, secondary)])
+
+        # 근거 및 해석 기준
+        codes = ", ".join(
+            f"{self._names[code]}({code}) {_format_score(riasec[code])}점" for code in ranked[:2]
+        )
+        rationale = [self._rationale["riasec"].render(codes=codes)]
+        rationale.append(
+            self._rationale["big5"].render(factors=", ".join(bands_used)) if bands_used
+            else self._rationale["big5_none"].render()
+        )
+        rationale.append(
+            self._rationale["life_history"].render(ref=life_ref) if life_ref
+            else self._rationale["life_history_none"].render()
+        )
+        rationale.append(self._rationale["principle"].render())
+
+        self.renders += 1
+        self.fallbacks += degraded
+        self.total_render_us += (time.perf_counter() - started) * 1_000_000
+
+        return {"career_identity": " ".join(sentences), "rationale": "\n".join(rationale)}
+
+    def _band(self, score: float) -> str:
+        if score >= self._high:
+            return "high"
+        if score < self._low:
+            return "low"
+        return "mid"
+
+    @staticmethod
+    def _factor_score(value: Any) -> Optional[Tuple[float, Dict[str, float]]]:
+        """Big5 요인 값((점수, 하위 요인) 또는 점수만)을 정리 (요인 점수가 없으면 하위 요인 평균)"""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value), {}
+        if not isinstance(value, dict):
+            return None
+
+        subs = {
+            name: float(score) for name, score in (value.get("subFactors") or {}).items()
+            if isinstance(score, (int, float)) and not isinstance(score, bool)
+        }
+        score = value.get("score")
+        if isinstance(score, (int, float)) and not isinstance(score, bool):
+            return float(score), subs
+        if subs:
+            return sum(subs.values()) / len(subs), subs
+        return None
+
+    @staticmethod
+    def _factor_ref(factor: str, scored: Tuple[float, Dict[str, float]], band: str) -> str:
+        """문장에 인용할 요인 표기 (높음/낮음 구간은 가장 두드러진 하위 요인)"""
+        score, subs = scored
+        if subs and band != "mid":
+            pick = max if band == "high" else min
+            name = pick(subs, key=lambda key: subs[key])
+            return f"{factor}의 {name}({_format_score(subs[name])}점)"
+        return f"{factor}({_format_score(score)}점)"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        엔진 통계 반환
+
+        Returns:
+            Dict[str, Any]: 라이브러리 버전·로드 시각, 생성 수, LLM 실패 대체 수, 평균 생성 시간(µs)
+        """
+        return {
+            "loaded": self.loaded,
+            "version": self.version,
+            "path": self.path,
+            "load_time_ms": round(self.load_time_ms, 2),
+            "code_combinations": len(self._synthesis),
+            "renders": self.renders,
+            "fallbacks": self.fallbacks,
+            "avg_render_us": round(self.total_render_us / self.renders, 1) if self.renders else 0.0,
+            "fallback_enabled": settings.IDENTITY_TEMPLATE_FALLBACK
+        }
+
+
+# 애플리케이션 전역 직업정체성 템플릿 엔진
+identity_templates = CareerIdentityTemplateEngine()
@@ -0,0 +1,369 @@
+"""
+직업 Mini-DB 저장소 - 사용자 프로필과 직업 간 벡터 매칭
+
+startup 시 직업 데이터(JSON)를 읽어 각 직업의 필요 적성/관련 흥미를 임베딩하고 (embedder.py),
+L2 정규화된 float32 행렬 하나로 미리 계산해 둡니다.
+추천 요청은 프로필 벡터와 행렬의 곱(행렬-벡터 곱 1회)으로 모든 직업의
+코사인 유사도를 구한 뒤 argpartition으로 상위 k개만 정렬합니다.
+직업 수가 많으면 IVF 근사 인덱스로 일부 클러스터만 검사합니다. (vector_index.py)
+
+구성한 인덱스는 데이터 지문별 디렉토리(JOB_INDEX_DIR)에 저장되고 메모리 맵으로 다시 열리므로,
+같은 데이터를 로드하는 다른 워커는 임베딩 계산 없이 같은 파일(페이지 캐시)을 공유합니다.
+
+행 벡터 구성: [적성 블록 × √w_apt, 흥미 블록 × √w_int] / √(w_apt + w_int)
+→ 내적 = (w_apt × 적성 코사인 + w_int × 흥미 코사인) / (w_apt + w_int)
+"""
+import hashlib
+import json
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.services.embedder import Embedder, create_embedder, normalize_rows
+from app.services.vector_index import VectorIndex, create_index, resolve_index_kind
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore:
+    """직업 Mini-DB 메모리 저장소 (사전 계산된 임베딩 행렬로 상위 k개 검색)"""
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        aptitude_weight: float = settings.JOB_APTITUDE_WEIGHT,
+        interest_weight: float = settings.JOB_INTEREST_WEIGHT,
+        weakness_penalty: float = settings.JOB_WEAKNESS_PENALTY,
+        index_kind: str = settings.JOB_INDEX_TYPE,
+        index_dir: Optional[str] = settings.JOB_INDEX_DIR
+    ):
+        # 가중치 0은 해당 블록을 매칭에서 제외, 음수이거나 합이 0이면 벡터를 만들 수 없음
+        if aptitude_weight < 0 or interest_weight < 0 or aptitude_weight + interest_weight <= 0:
+            raise ValueError(
+                f"직업 추천 가중치는 0 이상이고 합이 0보다 커야 합니다. "
+                f"(적성 {aptitude_weight}, 흥미 {interest_weight})"
+            )
+
+        self.embedder = embedder or create_embedder()
+        self.aptitude_weight = aptitude_weight
+        self.interest_weight = interest_weight
+        self.weakness_penalty = weakness_penalty
+        self.index_kind = index_kind
+        self.index_dir = index_dir
+
+        self.jobs: List[Dict[str, Any]] = []
+        self.index: VectorIndex = create_index("exact", 2 * self.embedder.dim)
+        self.index_path: Optional[str] = None
+        self.index_loaded_from_disk = False
+        self.source: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+        self.build_time_ms = 0.0
+
+        # 검색 통계
+        self.queries = 0
+        self.total_search_ms = 0.0
+
+    @property
+    def dim(self) -> int:
+        """행 벡터 차원 (적성 블록 + 흥미 블록)"""
+        return 2 * self.embedder.dim
+
+    async def load(self, path: str = settings.JOB_DB_PATH) -> bool:
+        """
+        직업 데이터 파일을 읽어 임베딩 행렬 구성 (startup 시 호출)
+
+        Args:
+            path: 직업 데이터 JSON 경로 (직업 객체 배열)
+
+        Returns:
+            bool: 로드 성공 여부 (실패 시 빈 저장소로 유지)
+        """
+        try:
+            raw = Path(path).read_bytes()
+            jobs = json.loads(raw)
+        except (OSError, ValueError) as e:
+            logger.warning(f"직업 데이터 로드 실패 ({path}): {str(e)}")
+            return False
+
+        await self.build(jobs, fingerprint=hashlib.sha256(raw).hexdigest())
+        self.source = str(Path(path))
+        logger.info(
+            f"직업 데이터 로드 완료 - {len(self.jobs)}개 직업, {self.index.kind} 인덱스 "
+            f"({'저장된 인덱스 사용' if self.index_loaded_from_disk else '새로 구성'}, {self.build_time_ms:.1f}ms)"
+        )
+        return True
+
+    async def build(self, jobs: List[Dict[str, Any]], fingerprint: Optional[str] = None) -> None:
+        """
+        직업 목록으로 검색 인덱스를 새로 구성
+
+        임베딩 가중치(로컬 백엔드의 IDF)는 직업 문구로 먼저 학습하며,
+        데이터 지문이 주어지고 같은 지문의 인덱스가 이미 저장되어 있으면
+        직업 임베딩 계산 없이 저장된 파일을 메모리 맵으로 엽니다.
+
+        Args:
+            jobs: 직업 목록 (job_name, required_aptitudes, related_interests 포함)
+            fingerprint: 직업 데이터 지문 (None이면 인덱스를 저장하지 않음)
+        """
+        started = time.perf_counter()
+        self.embedder.fit([
+            phrase for job in jobs
+            for phrase in job.get("required_aptitudes", []) + job.get("related_interests", [])
+        ])
+
+        kind = resolve_index_kind(self.index_kind, len(jobs))
+        index = self._create_index(kind)
+
+        directory = self._index_directory(kind, fingerprint)
+        loaded = directory is not None and self._load_index(index, directory)
+
+        if not loaded:
+            index.build(await self._job_vectors(jobs))
+
+            if directory is not None:
+                self._save_index(index, directory, fingerprint)
+
+        # 검색 중인 요청이 있어도 일관된 상태를 보도록 한 번에 교체
+        self.jobs, self.index = list(jobs), index
+        self.index_path = str(directory) if directory is not None else None
+        self.index_loaded_from_disk = loaded
+        self.loaded_at = time.time()
+        self.build_time_ms = (time.perf_counter() - started) * 1000
+
+    async def add_jobs(self, jobs: List[Dict[str, Any]]) -> None:
+        """
+        직업 증분 추가 (기존 인덱스를 다시 구성하지 않음)
+
+        추가된 직업은 이 프로세스의 인덱스에만 반영됩니다.
+        모든 워커에 반영하려면 직업 데이터 파일에 추가한 뒤 다시 시작하세요.
+
+        Args:
+            jobs: 추가할 직업 목록
+        """
+        if not jobs:
+            return
+
+        # 임베딩 가중치는 다시 학습하지 않음 (기존 벡터와 같은 공간 유지)
+        vectors = await self._job_vectors(jobs)
+
+        # 검색 결과 인덱스가 항상 직업 목록 안에 있도록 목록을 먼저 늘림
+        self.jobs = self.jobs + list(jobs)
+        self.index.add(vectors)
+        logger.info(f"직업 {len(jobs)}개 추가 - 전체 {len(self.jobs)}개")
+
+    async def profile_vector(self, profile: Dict[str, Any]) -> np.ndarray:
+        """
+        사용자 프로필을 검색 벡터로 변환
+
+        강점은 적성 블록, 흥미는 흥미 블록에 대응하며,
+        약점은 적성 블록에서 빼서 해당 적성을 요구하는 직업의 순위를 낮춥니다.
+
+        Args:
+            profile: UserProfile 형식 딕셔너리 (strengths, interests, weakness)
+
+        Returns:
+            np.ndarray: (dim,) float32 정규화 벡터
+        """
+        strengths = list(profile.get("strengths", []))
+        interests = list(profile.get("interests", []))
+        weakness = profile.get("weakness") or ""
+
+        # 모든 문구를 한 번에 임베딩 (원격 백엔드도 요청 1회)
+        vectors = await self.embedder.embed(strengths + interests + [weakness])
+        strength_vectors = vectors[:len(strengths)]
+        interest_vectors = vectors[len(strengths):len(strengths) + len(interests)]
+        weakness_vector = vectors[-1]
+
+        aptitude = normalize_rows(strength_vectors.sum(axis=0, keepdims=True))
+        if self.weakness_penalty > 0:
+            aptitude = aptitude - self.weakness_penalty * weakness_vector
+
+        interest = normalize_rows(interest_vectors.sum(axis=0, keepdims=True))
+        return self._combine(normalize_rows(aptitude), interest)[0]
+
+    def search(self, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        코사인 유사도 상위 k개 직업 검색
+
+        Args:
+            query: 정규화된 검색 벡터 (dim,)
+            top_k: 반환할 직업 수
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (직업 인덱스, 유사도) - 유사도 내림차순
+        """
+        return self.index.search(query, top_k)
+
+    async def recommend(self, profile: Dict[str, Any], top_k: int = 3) -> Dict[str, Any]:
+        """
+        사용자 프로필에 맞는 상위 k개 직업 추천
+
+        Args:
+            profile: UserProfile 형식 딕셔너리
+            top_k: 추천할 직업 수
+
+        Returns:
+            Dict[str, Any]: 추천 결과 (recommendations, total_jobs, embed_time_ms, search_time_ms)
+        """
+        if not self.jobs:
+            return {
+                "success": False,
+                "error": "직업 데이터가 로드되지 않았습니다."
+            }
+
+        started = time.perf_counter()
+        query = await self.profile_vector(profile)
+        embed_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        indices, scores = self.search(query, top_k)
+        search_ms = (time.perf_counter() - started) * 1000
+
+        self.queries += 1
+        self.total_search_ms += search_ms
+
+        # 적성/흥미 항목별 유사도 (상위 k개 행만 계산)
+        block = self.embedder.dim
+        rows = self.index.reconstruct(indices)
+        aptitude_scores = self._block_similarity(rows[:, :block], query[:block], self.aptitude_weight)
+        interest_scores = self._block_similarity(rows[:, block:], query[block:], self.interest_weight)
+
+        recommendations = []
+        for rank, index in enumerate(indices):
+            job = self.jobs[int(index)]
+            recommendations.append({
+                **job,
+                "score": round(float(scores[rank]), 4),
+                "aptitude_score": round(float(aptitude_scores[rank]), 4),
+                "interest_score": round(float(interest_scores[rank]), 4)
+            })
+
+        return {
+            "success": True,
+            "recommendations": recommendations,
+            "total_jobs": len(self.jobs),
+            "embed_time_ms": round(embed_ms, 4),
+            "search_time_ms": round(search_ms, 4)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        저장소 통계 반환
+
+        Returns:
+            Dict[str, Any]: 저장소 통계
+        """
+        return {
+            "total_jobs": len(self.jobs),
+            "dim": self.dim,
+            "embedder": self.embedder.get_stats(),
+            "matrix_bytes": int(self.index.base.nbytes + self.index.delta.nbytes),
+            "index": self.index.get_stats(),
+            "index_path": self.index_path,
+            "index_loaded_from_disk": self.index_loaded_from_disk,
+            "source": self.source,
+            "loaded_at": self.loaded_at,
+            "build_time_ms": round(self.build_time_ms, 2),
+            "queries": self.queries,
+            "avg_search_ms": round(self.total_search_ms / self.queries, 4) if self.queries else 0.0
+        }
+
+    async def _job_vectors(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """직업 목록의 행 벡터 (적성/흥미 블록 결합)"""
+        aptitudes = await self._embed_sets([job.get("required_aptitudes", []) for job in jobs])
+        interests = await self._embed_sets([job.get("related_interests", []) for job in jobs])
+        return self._combine(aptitudes, interests)
+
+    async def _embed_sets(self, phrase_sets: List[List[str]]) -> np.ndarray:
+        """
+        문구 묶음 목록을 한 번에 임베딩 (중복 문구는 한 번만 계산)
+
+        직업 데이터는 같은 적성/흥미 문구가 반복되므로 고유 문구만 임베딩한 뒤
+        묶음별로 행을 더해 정규화합니다.
+
+        Args:
+            phrase_sets: 문구 묶음 목록
+
+        Returns:
+            np.ndarray: (묶음 수, 블록 차원) float32 행렬
+        """
+        vocabulary: Dict[str, int] = {}
+        set_ids, phrase_ids = [], []
+        for set_index, phrases in enumerate(phrase_sets):
+            for phrase in phrases:
+                set_ids.append(set_index)
+                phrase_ids.append(vocabulary.setdefault(phrase, len(vocabulary)))
+
+        phrase_vectors = await self.embedder.embed(list(vocabulary))
+        sums = np.zeros((len(phrase_sets), self.embedder.dim), dtype=np.float32)
+        if phrase_ids:
+            np.add.at(sums, np.asarray(set_ids), phrase_vectors[np.asarray(phrase_ids)])
+
+        return normalize_rows(sums)
+
+    def _create_index(self, kind: str) -> VectorIndex:
+        """설정에 맞는 빈 인덱스 생성"""
+        options = {}
+        if kind == "ivf":
+            options = {"nlist": settings.JOB_INDEX_NLIST, "nprobe": settings.JOB_INDEX_NPROBE}
+        return create_index(kind, self.dim, **options)
+
+    def _index_directory(self, kind: str, fingerprint: Optional[str]) -> Optional[Path]:
+        """
+        인덱스 저장 디렉토리 (데이터 지문과 임베딩/인덱스 설정이 같으면 같은 경로)
+        """
+        if not fingerprint or not self.index_dir:
+            return None
+
+        config = json.dumps({
+            "data": fingerprint,
+            "embedder": self.embedder.describe(),
+            "weights": [self.aptitude_weight, self.interest_weight],
+            "kind": kind,
+            "nlist": settings.JOB_INDEX_NLIST if kind == "ivf" else None
+        }, sort_keys=True)
+        key = hashlib.sha256(config.encode("utf-8")).hexdigest()[:16]
+        return Path(self.index_dir) / f"{kind}-{key}"
+
+    def _load_index(self, index: VectorIndex, directory: Path) -> bool:
+        """저장된 인덱스 로드 (없거나 손상되었으면 False)"""
+        if not (directory / "meta.json").exists():
+            return False
+        try:
+            index.load(directory, mmap=settings.JOB_INDEX_MMAP)
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"저장된 직업 인덱스 로드 실패 ({directory}): {str(e)}")
+            return False
+
+    def _save_index(self, index: VectorIndex, directory: Path, fingerprint: str) -> None:
+        """인덱스를 저장하고 메모리 맵으로 다시 열기 (실패 시 메모리 인덱스 유지)"""
+        try:
+            directory.parent.mkdir(parents=True, exist_ok=True)
+            index.save(directory, meta={"fingerprint": fingerprint, "jobs": len(index)})
+            index.load(directory, mmap=settings.JOB_INDEX_MMAP)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"직업 인덱스 저장 실패 ({directory}): {str(e)}")
+
+    def _block_similarity(self, rows: np.ndarray, query: np.ndarray, weight: float) -> np.ndarray:
+        """블록별 코사인 유사도 (가중치 스케일을 되돌림, 가중치 0인 블록은 비교하지 않으므로 0)"""
+        if weight == 0:
+            return np.zeros(len(rows), dtype=np.float32)
+        total = self.aptitude_weight + self.interest_weight
+        return rows @ query * (total / weight)
+
+    def _combine(self, aptitudes: np.ndarray, interests: np.ndarray) -> np.ndarray:
+        """적성/흥미 블록을 가중치에 맞춰 이어 붙이고 정규화"""
+        total = self.aptitude_weight + self.interest_weight
+        combined = np.hstack([
+            aptitudes * math.sqrt(self.aptitude_weight / total),
+            interests * math.sqrt(self.interest_weight / total)
+        ])
+        return np.ascontiguousarray(combined, dtype=np.float32)
+
+
+# 애플리케이션 전역 직업 저장소 (startup 시 로드)
+job_store = JobStore()
@@ -0,0 +1,244 @@
+"""
+LLM 응답 캐시 - SQLite 기반 (여러 uvicorn 워커가 공유)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """프롬프트·모델·temperature 해시를 키로 하는 LLM 응답 캐시 (TTL + 크기 제한)"""
+
+    def __init__(
+        self,
+        db_path: str = settings.LLM_CACHE_PATH,
+        ttl_seconds: int = settings.LLM_CACHE_TTL_SECONDS,
+        max_entries: int = settings.LLM_CACHE_MAX_ENTRIES
+    ):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._initialized = False
+
+        # 워커 프로세스별 적중/미스 카운터
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        provider: str,
+        model: str,
+        temperature: float,
+        system: str,
+        prompt: str
+    ) -> str:
+        """
+        캐시 키 생성 (렌더링된 프롬프트, 모델, temperature 해시)
+
+        Args:
+            kind: 분석 종류 (profile, career_identity)
+            provider: LLM 제공자
+            model: 모델명
+            temperature: 샘플링 temperature
+            system: 시스템 메시지
+            prompt: 렌더링된 사용자 프롬프트
+
+        Returns:
+            str: SHA-256 해시 키
+        """
+        payload = json.dumps(
+            [kind, provider, model, temperature, system, prompt],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회 (만료된 항목은 미스로 처리)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 항목 (response, 응답한 provider/model - 이전 항목은 None)
+        """
+        try:
+            entry = await asyncio.to_thread(self._get_sync, key)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 조회 실패: {str(e)}")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return entry
+
+    async def set(
+        self,
+        key: str,
+        response: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> None:
+        """
+        응답을 캐시에 저장하고 만료/크기 제한에 따라 정리
+
+        키는 요청한 기본 제공자/모델 기준이므로, 라우터가 다른 후보로 응답한 경우를 위해
+        실제로 응답한 제공자/모델을 함께 저장합니다.
+
+        Args:
+            key: 캐시 키
+            response: LLM 원본 응답
+            provider: 응답한 제공자
+            model: 응답한 모델
+        """
+        try:
+            await asyncio.to_thread(self._set_sync, key, response, provider, model)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 저장 실패: {str(e)}")
+
+    def record_bypass(self) -> None:
+        """요청 단위 캐시 우회 기록"""
+        self.bypasses += 1
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환 (저장 항목 수 조회는 스레드에서 실행)
+
+        Returns:
+            Dict[str, Any]: 적중/미스/우회 횟수 및 저장 항목 수
+        """
+        lookups = self.hits + self.misses
+
+        try:
+            entries = await asyncio.to_thread(self._count_sync)
+        except sqlite3.Error:
+            entries = None
+
+        return {
+            "enabled": settings.LLM_CACHE_ENABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 연결 시 스키마 생성)"""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+
+        if not self._initialized:
+            # WAL 모드: 여러 워커 프로세스의 동시 읽기/쓰기 허용
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    provider TEXT,
+                    model TEXT
+                )
+                """
+            )
+            add_missing_columns(conn, "llm_cache", ("provider", "model"))
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)")
+            conn.commit()
+            self._initialized = True
+
+        return conn
+
+    def _get_sync(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT response, created_at, provider, model FROM llm_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            response, created_at, provider, model = row
+            if now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return {"response": response, "provider": provider, "model": model}
+        finally:
+            conn.close()
+
+    def _set_sync(self, key: str, response: str, provider: Optional[str], model: Optional[str]) -> None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, response, created_at, accessed_at, provider, model)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, response, now, now, provider, model)
+            )
+
+            # 만료 항목 삭제
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+            # 크기 제한 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+            conn.execute(
+                """
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _count_sync(self) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        finally:
+            conn.close()
+
+
+def add_missing_columns(conn: sqlite3.Connection, table: str, columns: Tuple[str, ...]) -> None:
+    """이전 버전 스키마에 없는 TEXT 열 추가 (다른 워커가 먼저 추가했으면 무시)"""
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for column in columns:
+        if column in existing:
+            continue
+        try:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+        except sqlite3.OperationalError as e:
+            if "duplicate column" not in str(e):
+                raise
+
+
+# 애플리케이션 전역 LLM 응답 캐시
+llm_response_cache = LLMResponseCache()
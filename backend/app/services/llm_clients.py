@@ -0,0 +1,103 @@
+"""
+LLM 제공자 클라이언트 풀 - 애플리케이션 수명주기 동안 재사용
+"""
+import logging
+from typing import Optional
+import httpx
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMClientPool:
+    """OpenAI/Anthropic 클라이언트를 한 번만 생성하여 모든 호출이 공유하도록 관리"""
+
+    def __init__(self):
+        self._openai_client = None
+        self._anthropic_client = None
+        self._http_clients: list[httpx.AsyncClient] = []
+
+    async def start(self) -> None:
+        """
+        API 키가 설정된 제공자의 클라이언트를 미리 생성 (startup 시 호출)
+        """
+        if settings.OPENAI_API_KEY:
+            self.get_openai()
+        if settings.ANTHROPIC_API_KEY:
+            self.get_anthropic()
+
+        logger.info(
+            f"LLM 클라이언트 풀 시작 (max_connections={settings.LLM_HTTP_MAX_CONNECTIONS}, "
+            f"keepalive={settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS})"
+        )
+
+    async def close(self) -> None:
+        """
+        모든 클라이언트와 커넥션 풀 종료 (shutdown 시 호출)
+        """
+        for http_client in self._http_clients:
+            await http_client.aclose()
+
+        self._http_clients = []
+        self._openai_client = None
+        self._anthropic_client = None
+        logger.info("LLM 클라이언트 풀 종료")
+
+    def get_openai(self):
+        """
+        공유 AsyncOpenAI 클라이언트 반환 (없으면 생성)
+
+        Returns:
+            AsyncOpenAI: OpenAI 클라이언트
+        """
+        if self._openai_client is None:
+            from openai import AsyncOpenAI
+
+            # httpx 0.28+ 버전과의 호환성을 위해 http_client 명시적으로 설정
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL or None,
+                max_retries=0,  # 재시도는 provider_limiter에서 관리
+                http_client=self._create_http_client()
+            )
+
+        return self._openai_client
+
+    def get_anthropic(self):
+        """
+        공유 AsyncAnthropic 클라이언트 반환 (없으면 생성)
+
+        Returns:
+            AsyncAnthropic: Anthropic 클라이언트
+        """
+        if self._anthropic_client is None:
+            from anthropic import AsyncAnthropic
+
+            self._anthropic_client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                base_url=settings.ANTHROPIC_BASE_URL or None,
+                max_retries=0,
+                http_client=self._create_http_client()
+            )
+
+        return self._anthropic_client
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """커넥션 풀 한도, keep-alive, 타임아웃이 적용된 httpx 클라이언트 생성"""
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY
+            ),
+            timeout=httpx.Timeout(
+                settings.LLM_HTTP_TIMEOUT,
+                connect=settings.LLM_HTTP_CONNECT_TIMEOUT
+            )
+        )
+        self._http_clients.append(http_client)
+        return http_client
+
+
+# 애플리케이션 전역 클라이언트 풀
+llm_clients = LLMClientPool()
@@ -2,10 +2,37 @@
 LLM 서비스 - OpenAI/Anthropic API 통합
 """
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
 from app.core.config import settings
-from app.core.prompts import PROFILE_ANALYSIS_PROMPT, CAREER_IDENTITY_PROMPT
+from app.core.metrics import stage_seconds
+from app.core.prompts import (
+    PROFILE_ANALYSIS_SYSTEM_PROMPT,
+    PROFILE_ANALYSIS_INPUT,
+    CAREER_IDENTITY_SYSTEM_PROMPT,
+    CAREER_IDENTITY_INPUT
+)
+from app.services.llm_clients import llm_clients
+from app.services.llm_cache import LLMResponseCache, llm_response_cache
+from app.services.identity_cache import career_identity_cache
+from app.services.identity_template import identity_templates
+from app.services.text_compactor import text_compactor, estimate_tokens
+from app.services.single_flight import llm_single_flight
+from app.services.provider_limiter import provider_limiters
+from app.services.provider_router import llm_router
+from app.services.llm_usage import llm_usage
+from app.services.stream_json import (
+    FieldSpec,
+    SchemaViolation,
+    StreamingJSONParser,
+    fields_from_model,
+    parse_json_object,
+    stream_validation
+)
+from app.services.structured_output import REPAIRABLE_REASONS, json_schema, repair_json, structured_output
+from app.models.profile_models import UserProfile, CareerIdentity
 
 logger = logging.getLogger(__name__)
 
@@ -13,49 +40,108 @@ logger = logging.getLogger(__name__)
 class LLMService:
     """LLM API 호출 서비스"""
 
+    # 분석 종류별 시스템 메시지와 temperature (캐시 키에도 포함)
+    # 시스템 메시지는 요청마다 같은 정적 지침이라 제공자 프롬프트 캐시의 prefix가 됨
+    PROFILE_SYSTEM_MESSAGE = PROFILE_ANALYSIS_SYSTEM_PROMPT
+    PROFILE_TEMPERATURE = 0.3
+    CAREER_IDENTITY_SYSTEM_MESSAGE = CAREER_IDENTITY_SYSTEM_PROMPT
+    CAREER_IDENTITY_TEMPERATURE = 0.7  # 창의적인 문장 생성을 위해 temperature 높임
+
+    # 분석 종류별 최대 출력 토큰 (토큰 버킷 차감량 추정에도 사용)
+    PROFILE_MAX_TOKENS = 1000
+    CAREER_IDENTITY_MAX_TOKENS = 2000  # 더 긴 응답을 위해 토큰 수 증가
+
+    # 응답 형태 (스트리밍 검증과 최종 파싱에 공통 사용)
+    PROFILE_FIELDS = fields_from_model(UserProfile)
+    CAREER_IDENTITY_FIELDS = fields_from_model(CareerIdentity)
+
+    # 제공자 구조화 출력 스키마 (OpenAI json_schema, Anthropic 도구 입력 스키마)
+    PROFILE_SCHEMA = json_schema(UserProfile)
+    CAREER_IDENTITY_SCHEMA = json_schema(CareerIdentity)
+
     def __init__(self):
         self.provider = settings.LLM_PROVIDER
         self.model = settings.LLM_MODEL
 
-    async def analyze_profile(self, text: str, format_detected: str) -> Dict[str, Any]:
+    async def analyze_profile(
+        self,
+        text: str,
+        format_detected: str,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
         """
         적성검사 텍스트를 분석하여 프로필 추출
 
         Args:
             text: PDF에서 추출된 텍스트
             format_detected: 감지된 적성검사 형식
+            use_cache: LLM 응답 캐시 사용 여부 (False면 캐시 우회)
 
         Returns:
             Dict[str, Any]: 분석 결과
         """
+        compaction = None
+
         try:
+            # 토큰 예산 안에서 점수표/결과 구간 위주로 텍스트 압축
+            if settings.TEXT_COMPACTION_ENABLED:
+                compacted = text_compactor.compact(text, format_detected, settings.ANALYSIS_TOKEN_BUDGET)
+                analysis_text = compacted.pop("text")
+                compaction = compacted
+            else:
+                analysis_text = text[:settings.ANALYSIS_CHAR_BUDGET]  # 토큰 제한을 위해 앞부분만 사용
+
             # API 키가 없으면 Mock 데이터 반환 (개발/테스트용)
             if not settings.OPENAI_API_KEY and not settings.ANTHROPIC_API_KEY:
                 logger.warning("API 키가 설정되지 않음 - Mock 데이터 반환")
-                return self._get_mock_profile(format_detected)
+                return {**self._get_mock_profile(format_detected), "compaction": compaction}
 
-            # 프롬프트 생성
-            prompt = PROFILE_ANALYSIS_PROMPT.format(
+            # 사용자 메시지 생성 (정적 지침은 시스템 메시지)
+            prompt = PROFILE_ANALYSIS_INPUT.format(
                 format_detected=format_detected,
-                text=text[:3000]  # 토큰 제한을 위해 처음 3000자만 사용
+                text=analysis_text
             )
 
-            # LLM 호출
-            if self.provider == "openai":
-                response = await self._call_openai(prompt)
-            elif self.provider == "anthropic":
-                response = await self._call_anthropic(prompt)
-            else:
-                raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+            # 캐시 조회 (동일 프롬프트·모델·temperature면 재사용)
+            cache_key, cache_status, cached = await self._lookup_cache(
+                "profile", self.PROFILE_SYSTEM_MESSAGE, self.PROFILE_TEMPERATURE, prompt, use_cache
+            )
 
-            # JSON 파싱
-            profile_data = self._parse_json_response(response)
+            if cached is not None:
+                return {
+                    "success": True,
+                    "profile": self._parse_json_response(cached["response"]),
+                    "raw_response": cached["response"],
+                    "model_used": cached["model"] or self.model,
+                    "cache_status": cache_status,
+                    "compaction": compaction
+                }
+
+            # LLM 호출 (동시에 들어온 같은 프롬프트는 한 번만 호출)
+            response, profile_data, coalesced, (_, model_used) = await self._call_single_flight(
+                "profile",
+                self.PROFILE_SYSTEM_MESSAGE,
+                self.PROFILE_TEMPERATURE,
+                prompt,
+                self._provider_calls(
+                    {"openai": self._call_openai, "anthropic": self._call_anthropic},
+                    {"openai": self._stream_openai, "anthropic": self._stream_anthropic},
+                    self.PROFILE_FIELDS,
+                    "프로필"
+                ),
+                self._parse_json_response,
+                cache_key,
+                self.PROFILE_MAX_TOKENS
+            )
 
             return {
                 "success": True,
                 "profile": profile_data,
                 "raw_response": response,
-                "model_used": self.model
+                "model_used": model_used,
+                "cache_status": cache_status,
+                "coalesced": coalesced,
+                "compaction": compaction
             }
 
         except Exception as e:
@@ -68,114 +154,529 @@ class LLMService:
                 "model_used": self.model
             }
 
-    async def _call_openai(self, prompt: str) -> str:
+    async def _lookup_cache(
+        self,
+        kind: str,
+        system: str,
+        temperature: float,
+        prompt: str,
+        use_cache: bool
+    ) -> Tuple[Optional[str], str, Optional[Dict[str, Any]]]:
+        """
+        LLM 응답 캐시 조회
+
+        Args:
+            kind: 분석 종류 (profile, career_identity)
+            system: 시스템 메시지
+            temperature: 샘플링 temperature
+            prompt: 렌더링된 사용자 프롬프트
+            use_cache: 요청 단위 캐시 사용 여부
+
+        Returns:
+            Tuple: (저장용 캐시 키 또는 None, 캐시 상태, 캐시 항목(response, 응답한 provider/model) 또는 None)
+        """
+        if not settings.LLM_CACHE_ENABLED:
+            return None, "disabled", None
+
+        if not use_cache:
+            llm_response_cache.record_bypass()
+            return None, "bypass", None
+
+        cache_key = LLMResponseCache.make_key(
+            kind, self.provider, self.model, temperature, system, prompt
+        )
+        with stage_seconds.time(component="llm_service", stage="cache_lookup"):
+            cached = await llm_response_cache.get(cache_key)
+
+        if cached is not None:
+            logger.info(f"LLM 캐시 적중 - {kind} ({cache_key[:12]})")
+            return cache_key, "hit", cached
+
+        return cache_key, "miss", None
+
+    async def _lookup_identity_cache(self, input_data: Dict[str, Any], use_cache: bool) -> Optional[Dict[str, Any]]:
+        """
+        직업정체성 근사 캐시 조회 (정확 캐시 미스 후, 점수 구간 서명이 가까운 저장 응답)
+
+        Args:
+            input_data: 흥미, 성격, 생활사 데이터
+            use_cache: 요청 단위 캐시 사용 여부
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 항목 (response, 응답한 provider/model), 허용 거리 안에 없으면 None
+        """
+        if not settings.IDENTITY_CACHE_ENABLED:
+            return None
+
+        if not use_cache:
+            career_identity_cache.record_bypass()
+            return None
+
+        with stage_seconds.time(component="llm_service", stage="identity_cache_lookup"):
+            return await career_identity_cache.get(input_data)
+
+    async def _store_identity_cache(
+        self,
+        input_data: Dict[str, Any],
+        use_cache: bool,
+        response: str,
+        provider: str,
+        model: str
+    ) -> None:
+        """파싱에 성공한 직업정체성 응답을 응답한 제공자/모델과 함께 근사 캐시에 저장"""
+        if settings.IDENTITY_CACHE_ENABLED and use_cache:
+            await career_identity_cache.set(input_data, response, provider, model)
+
+    async def _call_single_flight(
+        self,
+        kind: str,
+        system: str,
+        temperature: float,
+        prompt: str,
+        calls: Dict[str, Callable[[str, str], Awaitable[str]]],
+        parse: Callable[[str], Dict[str, Any]],
+        cache_key: Optional[str],
+        max_tokens: int
+    ) -> Tuple[str, Dict[str, Any], bool, Tuple[str, str]]:
+        """
+        LLM 호출 → 파싱 → 캐시 저장을 단일 비행으로 실행
+
+        렌더링된 프롬프트·모델·temperature가 같은 호출이 진행 중이면 제공자를 다시 호출하지 않고
+        그 결과를 함께 받습니다. (중복 제출, 같은 결과지를 여러 명이 동시에 올린 경우)
+        호출이나 파싱이 실패하면 합류한 모든 요청이 같은 예외를 받습니다.
+        제공자/모델은 라우터가 지연·오류율을 보고 고르며(LLM_ROUTING_CANDIDATES가 비어 있으면 self.provider/self.model),
+        각 호출은 provider_limiter의 요청/토큰 한도와 재시도를 거칩니다.
+        JSON 형식 오류나 잘린 출력은 먼저 로컬에서 복구하고(repair_json),
+        복구해도 형태를 만족하지 않으면(SchemaViolation) 같은 후보로 LLM_SCHEMA_RETRY_ATTEMPTS회까지 즉시 재요청하고,
+        그래도 실패하면 라우터가 다음 후보로 넘깁니다.
+        캐시와 단일 비행 키는 실제로 응답한 후보가 아니라 self.provider/self.model 기준이므로,
+        캐시 항목에는 응답한 제공자/모델을 함께 저장해 적중 시 model_used로 보고합니다.
+
+        Args:
+            kind: 분석 종류 (profile, career_identity)
+            system: 시스템 메시지
+            temperature: 샘플링 temperature
+            prompt: 렌더링된 사용자 프롬프트
+            calls: 제공자별 호출 함수 (프롬프트, 모델) → 응답
+            parse: 응답 파싱 함수
+            cache_key: 저장용 캐시 키 (None이면 저장 안 함)
+            max_tokens: 최대 출력 토큰 (토큰 버킷 차감량 = 프롬프트 추정치 + max_tokens)
+
+        Returns:
+            Tuple: (LLM 원본 응답, 파싱 결과, 다른 요청의 호출을 공유했는지 여부, 응답한 후보 (제공자, 모델))
+        """
+        flight_key = LLMResponseCache.make_key(
+            kind, self.provider, self.model, temperature, system, prompt
+        )
+
+        if self.provider not in calls:
+            raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+
+        estimated_tokens = estimate_tokens(system) + estimate_tokens(prompt) + max_tokens
+        # 스트리밍 검증 호출은 시도 전체 제한 시간 대신 조각 간 제한 시간 적용 (_validated_call)
+        streaming = settings.LLM_STREAM_VALIDATION_ENABLED
+
+        async def run(provider: str, model: str) -> Tuple[str, Dict[str, Any]]:
+            if provider not in calls:
+                raise ValueError(f"지원하지 않는 LLM 제공자: {provider}")
+
+            attempts = settings.LLM_SCHEMA_RETRY_ATTEMPTS + 1
+            for attempt in range(1, attempts + 1):
+                try:
+                    with stage_seconds.time(component="llm_service", stage="provider_call"):
+                        response = await provider_limiters.get(provider).call(
+                            lambda: calls[provider](prompt, model), estimated_tokens, streaming=streaming
+                        )
+                    with stage_seconds.time(component="llm_service", stage="parse"):
+                        return self._parse_structured(parse, response, provider)
+                except SchemaViolation as e:
+                    if attempt >= attempts:
+                        raise
+                    stream_validation.record_retry()
+                    logger.warning(f"{kind} 응답 형태 위반 ({e.reason}) - {provider}/{model}에 즉시 재요청 ({attempt}/{attempts - 1})")
+
+        async def flight() -> Tuple[str, Dict[str, Any], Tuple[str, str]]:
+            (response, parsed), candidate = await llm_router.call((self.provider, self.model), run)
+
+            # 파싱에 성공한 응답만 캐시에 저장 (응답한 후보 기록)
+            if cache_key is not None:
+                await llm_response_cache.set(cache_key, response, *candidate)
+
+            return response, parsed, candidate
+
+        (response, parsed, candidate), coalesced = await llm_single_flight.do(flight_key, flight)
+        return response, parsed, coalesced, candidate
+
+    def _parse_structured(
+        self,
+        parse: Callable[[str], Dict[str, Any]],
+        response: str,
+        provider: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        응답 파싱 (형식 오류·잘린 출력은 로컬 복구 후 다시 파싱, 결과는 제공자별로 집계)
+
+        Args:
+            parse: 응답 파싱 함수
+            response: LLM 응답
+            provider: 응답한 제공자
+
+        Returns:
+            Tuple: (캐시에 저장할 응답 - 복구했으면 복구한 텍스트, 파싱 결과)
+
+        Raises:
+            SchemaViolation: 복구해도 형태를 만족하지 않는 경우
+        """
+        try:
+            parsed = parse(response)
+        except SchemaViolation as e:
+            if e.reason not in REPAIRABLE_REASONS:
+                structured_output.record(provider, "schema_failures")
+                raise
+
+            try:
+                repaired = repair_json(response)
+                parsed = parse(repaired)
+            except SchemaViolation:
+                structured_output.record(provider, "repair_failed")
+                raise
+
+            structured_output.record(provider, "repaired")
+            logger.info(f"{provider} 응답 JSON 로컬 복구 ({e.reason}) - 재요청 없이 사용")
+            return repaired, parsed
+
+        structured_output.record(provider, "parsed")
+        return response, parsed
+
+    def _provider_calls(
+        self,
+        calls: Dict[str, Callable[[str, str], Awaitable[str]]],
+        streams: Dict[str, Callable[[str, str], AsyncIterator[str]]],
+        fields: Dict[str, FieldSpec],
+        name: str
+    ) -> Dict[str, Callable[[str, str], Awaitable[str]]]:
+        """
+        제공자별 호출 함수 선택 (스트리밍 검증을 켜면 스트리밍 호출 + 조각 단위 검증)
+
+        Args:
+            calls: 제공자별 일반 호출 함수
+            streams: 제공자별 스트리밍 호출 함수
+            fields: 응답 형태
+            name: 오류 메시지에 쓸 응답 이름
+
+        Returns:
+            Dict: 제공자별 (프롬프트, 모델) → 응답 함수
+        """
+        if not settings.LLM_STREAM_VALIDATION_ENABLED:
+            return calls
+
+        return {
+            provider: self._validated_call(provider, stream, fields, name)
+            for provider, stream in streams.items()
+        }
+
+    def _validated_call(
+        self,
+        provider: str,
+        make_stream: Callable[[str, str], AsyncIterator[str]],
+        fields: Dict[str, FieldSpec],
+        name: str
+    ) -> Callable[[str, str], Awaitable[str]]:
+        """
+        스트리밍 응답을 받는 대로 검증하는 호출 함수 생성
+
+        조각마다 StreamingJSONParser에 넣어, 출력이 형태를 만족할 수 없게 되는 순간
+        (예: strengths의 네 번째 항목) 나머지 출력을 기다리지 않고 스트림을 닫고 SchemaViolation을 발생시킵니다.
+        JSON 형식 오류와 잘린 출력은 로컬 복구 대상이라 중단하지 않고 끝까지 받습니다.
+        객체가 닫힌 뒤에도 스트림 끝까지 읽어 usage를 기록합니다.
+        응답 전체 길이에는 제한 시간을 두지 않고, 조각 사이(첫 조각 포함)가
+        LLM_STREAM_IDLE_TIMEOUT보다 길어지면 멈춘 스트림으로 보고 TimeoutError를 발생시킵니다. (재시도 대상)
+
+        Args:
+            provider: 제공자 (파싱 결과 집계용)
+            make_stream: 제공자 스트리밍 호출 함수
+            fields: 응답 형태
+            name: 오류 메시지에 쓸 응답 이름
+
+        Returns:
+            Callable: (프롬프트, 모델) → 응답 전체
+        """
+        async def call(prompt: str, model: str) -> str:
+            parser = StreamingJSONParser(fields, name)
+            validating = True
+            chunks = []
+            stream = make_stream(prompt, model)
+            try:
+                while True:
+                    try:
+                        text = await asyncio.wait_for(stream.__anext__(), timeout=settings.LLM_STREAM_IDLE_TIMEOUT)
+                    except StopAsyncIteration:
+                        break
+                    chunks.append(text)
+                    if validating:
+                        validating = self._feed(parser, text)
+            except SchemaViolation as e:
+                stream_validation.record_abort(e, parser.received)
+                structured_output.record(provider, "schema_failures")
+                logger.warning(f"{name} 스트림 중단 - {model}: {str(e)} ({parser.received}자 수신)")
+                raise
+            finally:
+                await stream.aclose()
+
+            if parser.done:
+                stream_validation.record_success()
+            return "".join(chunks)
+
+        return call
+
+    def _feed(self, parser: StreamingJSONParser, text: str) -> bool:
+        """
+        파서에 조각 입력 (형식 오류는 로컬 복구로 넘기고 검증만 멈춤)
+
+        Returns:
+            bool: 이후 조각도 검증할지 여부
+
+        Raises:
+            SchemaViolation: 복구 대상이 아닌 형태 위반
+        """
+        try:
+            parser.feed(text)
+        except SchemaViolation as e:
+            if e.reason not in REPAIRABLE_REASONS:
+                raise
+            return False
+        return True
+
+    async def _call_openai(self, prompt: str, model: str) -> str:
         """
         OpenAI API 호출
 
         Args:
             prompt: 프롬프트
+            model: 모델 (라우터가 선택)
 
         Returns:
             str: LLM 응답
         """
         try:
-            from openai import AsyncOpenAI
-            import httpx
-
-            # httpx 0.28+ 버전과의 호환성을 위해 http_client 명시적으로 설정
-            http_client = httpx.AsyncClient()
-            client = AsyncOpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                http_client=http_client
-            )
+            client = llm_clients.get_openai()
 
+            started = time.perf_counter()
             response = await client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=[
-                    {"role": "system", "content": "너는 전문 커리어 카운슬러야. JSON 형식으로만 응답해."},
+                    {"role": "system", "content": self.PROFILE_SYSTEM_MESSAGE},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3,
-                max_completion_tokens=1000
+                temperature=self.PROFILE_TEMPERATURE,
+                max_completion_tokens=self.PROFILE_MAX_TOKENS,
+                **self._openai_output_format("user_profile", self.PROFILE_SCHEMA)
             )
+            llm_usage.record_openai("profile", model, response.usage, (time.perf_counter() - started) * 1000)
 
-            await http_client.aclose()
-            return response.choices[0].message.content
+            return response.choices[0].message.content or ""  # 거절(refusal)이면 내용 없음
 
         except Exception as e:
             logger.error(f"OpenAI API 호출 실패: {str(e)}")
             raise
 
-    async def _call_anthropic(self, prompt: str) -> str:
+    async def _call_anthropic(self, prompt: str, model: str) -> str:
         """
         Anthropic API 호출
 
         Args:
             prompt: 프롬프트
+            model: 모델 (라우터가 선택)
 
         Returns:
             str: LLM 응답
         """
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+            client = llm_clients.get_anthropic()
 
+            started = time.perf_counter()
             response = await client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                temperature=0.3,
-                system="너는 전문 커리어 카운슬러야. JSON 형식으로만 응답해.",
+                model=model,
+                max_tokens=self.PROFILE_MAX_TOKENS,
+                temperature=self.PROFILE_TEMPERATURE,
+                system=self._anthropic_system(self.PROFILE_SYSTEM_MESSAGE),
                 messages=[
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                **self._anthropic_output_tool("user_profile", "적성 프로필 분석 결과 기록", self.PROFILE_SCHEMA)
             )
+            llm_usage.record_anthropic("profile", model, response.usage, (time.perf_counter() - started) * 1000)
 
-            return response.content[0].text
+            return self._anthropic_output(response)
 
         except Exception as e:
             logger.error(f"Anthropic API 호출 실패: {str(e)}")
             raise
 
-    def _parse_json_response(self, response: str) -> Dict[str, Any]:
+    async def _stream_openai(self, prompt: str, model: str) -> AsyncIterator[str]:
         """
-        LLM 응답에서 JSON 추출 및 파싱
+        OpenAI API 스트리밍 호출
 
         Args:
-            response: LLM 응답
+            prompt: 프롬프트
+            model: 모델 (라우터가 선택)
 
-        Returns:
-            Dict[str, Any]: 파싱된 JSON 데이터
+        Yields:
+            str: 응답 텍스트 조각
         """
         try:
-            # JSON 블록 찾기 (```json ... ``` 형식도 처리)
-            response = response.strip()
+            client = llm_clients.get_openai()
 
-            # 코드 블록 제거
-            if response.startswith("```"):
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1])
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": self.PROFILE_SYSTEM_MESSAGE},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self.PROFILE_TEMPERATURE,
+                max_completion_tokens=self.PROFILE_MAX_TOKENS,
+                stream=True,
+                **self._openai_output_format("user_profile", self.PROFILE_SCHEMA),
+                stream_options={"include_usage": True}  # 마지막 청크에 usage 포함
+            )
+
+            try:
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        llm_usage.record_openai("profile", model, chunk.usage)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()  # 중간에 닫히면 응답 연결도 닫음
+
+        except Exception as e:
+            logger.error(f"OpenAI 스트리밍 호출 실패: {str(e)}")
+            raise
 
-            # JSON 파싱
-            data = json.loads(response)
+    async def _stream_anthropic(self, prompt: str, model: str) -> AsyncIterator[str]:
+        """
+        Anthropic API 스트리밍 호출
 
-            # 유효성 검증
-            if "strengths" not in data or "interests" not in data or "weakness" not in data:
-                raise ValueError("필수 필드가 누락되었습니다")
+        Args:
+            prompt: 프롬프트
+            model: 모델 (라우터가 선택)
 
-            if len(data["strengths"]) != 3:
-                raise ValueError("strengths는 정확히 3개여야 합니다")
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        try:
+            client = llm_clients.get_anthropic()
 
-            if len(data["interests"]) != 2:
-                raise ValueError("interests는 정확히 2개여야 합니다")
+            async with client.messages.stream(
+                model=model,
+                max_tokens=self.PROFILE_MAX_TOKENS,
+                temperature=self.PROFILE_TEMPERATURE,
+                system=self._anthropic_system(self.PROFILE_SYSTEM_MESSAGE),
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                **self._anthropic_output_tool("user_profile", "적성 프로필 분석 결과 기록", self.PROFILE_SCHEMA)
+            ) as stream:
+                async for text in self._anthropic_stream_output(stream):
+                    yield text
 
-            return data
+                message = await stream.get_final_message()
+                llm_usage.record_anthropic("profile", model, message.usage)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {str(e)}\n응답: {response}")
-            raise ValueError(f"LLM 응답을 JSON으로 파싱할 수 없습니다: {str(e)}")
         except Exception as e:
-            logger.error(f"응답 처리 실패: {str(e)}")
+            logger.error(f"Anthropic 스트리밍 호출 실패: {str(e)}")
+            raise
+
+    def _anthropic_system(self, system: str) -> Any:
+        """
+        Anthropic 시스템 프롬프트 (프롬프트 캐시 사용 시 cache_control 블록)
+
+        시스템 프롬프트 끝에 캐시 경계를 두어, 같은 지침으로 보내는 이후 요청은 캐시된 prefix를 읽습니다.
+        prefix가 모델별 최소 길이(1024토큰 등)보다 짧으면 제공자가 캐시하지 않고 일반 요청으로 처리합니다.
+
+        Args:
+            system: 시스템 프롬프트
+
+        Returns:
+            Any: 문자열 또는 텍스트 블록 목록
+        """
+        if not settings.LLM_PROMPT_CACHE_ENABLED:
+            return system
+
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+    def _openai_output_format(self, name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        OpenAI 구조화 출력 인자 (json_schema strict 모드, 끄면 빈 dict)
+
+        Args:
+            name: 스키마 이름
+            schema: 응답 JSON 스키마
+
+        Returns:
+            Dict[str, Any]: chat.completions.create에 넘길 response_format
+        """
+        if not settings.LLM_STRUCTURED_OUTPUT_ENABLED:
+            return {}
+
+        return {"response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": name, "schema": schema, "strict": True}
+        }}
+
+    def _anthropic_output_tool(self, name: str, description: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Anthropic 구조화 출력 인자 (응답 스키마를 입력으로 받는 도구 하나를 강제 호출, 끄면 빈 dict)
+
+        Args:
+            name: 도구 이름
+            description: 도구 설명
+            schema: 응답 JSON 스키마 (도구 input_schema)
+
+        Returns:
+            Dict[str, Any]: messages.create/stream에 넘길 tools, tool_choice
+        """
+        if not settings.LLM_STRUCTURED_OUTPUT_ENABLED:
+            return {}
+
+        return {
+            "tools": [{"name": name, "description": description, "input_schema": schema}],
+            "tool_choice": {"type": "tool", "name": name}
+        }
+
+    def _anthropic_output(self, response: Any) -> str:
+        """Anthropic 응답 본문 (도구 호출이면 입력을 JSON 텍스트로)"""
+        for block in response.content:
+            if block.type == "tool_use":
+                return json.dumps(block.input, ensure_ascii=False)
+        return "".join(block.text for block in response.content if block.type == "text")
+
+    async def _anthropic_stream_output(self, stream: Any) -> AsyncIterator[str]:
+        """Anthropic 스트림의 텍스트 조각 (도구 호출이면 입력 JSON 조각)"""
+        async for event in stream:
+            if event.type != "content_block_delta":
+                continue
+            if event.delta.type == "text_delta":
+                yield event.delta.text
+            elif event.delta.type == "input_json_delta":
+                yield event.delta.partial_json
+
+    def _parse_json_response(self, response: str) -> Dict[str, Any]:
+        """
+        LLM 응답에서 JSON 추출 및 파싱
+
+        Args:
+            response: LLM 응답
+
+        Returns:
+            Dict[str, Any]: 파싱된 JSON 데이터
+        """
+        try:
+            # 앞뒤 설명 문장과 코드 펜스(```json)는 건너뛰고 UserProfile 형태(항목 수 포함) 검증
+            return parse_json_object(response, self.PROFILE_FIELDS, "프로필")
+
+        except SchemaViolation as e:
+            logger.warning(f"응답 처리 실패 ({e.reason}): {str(e)}\n응답: {response}")
             raise
 
     def _get_mock_profile(self, format_detected: str) -> Dict[str, Any]:
@@ -223,16 +724,37 @@ class LLMService:
             "model_used": "mock-model (테스트용)"
         }
 
-    async def analyze_career_identity(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze_career_identity(
+        self,
+        input_data: Dict[str, Any],
+        use_cache: bool = True,
+        use_template: bool = False
+    ) -> Dict[str, Any]:
         """
         흥미·성격·생활사 데이터를 분석하여 직업정체성 추출
 
         Args:
             input_data: 흥미, 성격, 생활사 데이터
+            use_cache: LLM 응답 캐시 사용 여부 (False면 캐시 우회)
+            use_template: LLM 호출 없이 템플릿 엔진으로 생성 (무료 등급)
 
         Returns:
             Dict[str, Any]: 직업정체성 분석 결과
         """
+        if use_template:
+            try:
+                return self._template_career_identity(input_data)
+            except Exception as e:
+                logger.error(f"직업정체성 템플릿 생성 실패: {str(e)}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "career_identity": None,
+                    "rationale": None,
+                    "raw_response": "",
+                    "model_used": identity_templates.model_name
+                }
+
         try:
             # API 키가 없으면 Mock 데이터 반환 (개발/테스트용)
             if not settings.OPENAI_API_KEY and not settings.ANTHROPIC_API_KEY:
@@ -242,30 +764,81 @@ class LLMService:
             # 입력 데이터를 텍스트로 변환
             input_text = json.dumps(input_data, ensure_ascii=False, indent=2)
 
-            # 프롬프트 생성
-            prompt = CAREER_IDENTITY_PROMPT.format(input_data=input_text)
+            # 사용자 메시지 생성 (정적 지침은 시스템 메시지)
+            prompt = CAREER_IDENTITY_INPUT.format(input_data=input_text)
 
-            # LLM 호출
-            if self.provider == "openai":
-                response = await self._call_openai_career_identity(prompt)
-            elif self.provider == "anthropic":
-                response = await self._call_anthropic_career_identity(prompt)
-            else:
-                raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+            # 캐시 조회 (동일 프롬프트·모델·temperature면 재사용)
+            cache_key, cache_status, cached = await self._lookup_cache(
+                "career_identity",
+                self.CAREER_IDENTITY_SYSTEM_MESSAGE,
+                self.CAREER_IDENTITY_TEMPERATURE,
+                prompt,
+                use_cache
+            )
 
-            # JSON 파싱
-            career_identity_data = self._parse_career_identity_response(response)
+            if cached is not None:
+                career_identity_data = self._parse_career_identity_response(cached["response"])
+                return {
+                    "success": True,
+                    "career_identity": career_identity_data["career_identity"],
+                    "rationale": career_identity_data["rationale"],
+                    "raw_response": cached["response"],
+                    "model_used": cached["model"] or self.model,
+                    "cache_status": cache_status
+                }
+
+            # 근사 캐시 조회 (점수 구간이 가까운 입력의 응답 재사용)
+            cached = await self._lookup_identity_cache(input_data, use_cache)
+
+            if cached is not None:
+                career_identity_data = self._parse_career_identity_response(cached["response"])
+                return {
+                    "success": True,
+                    "career_identity": career_identity_data["career_identity"],
+                    "rationale": career_identity_data["rationale"],
+                    "raw_response": cached["response"],
+                    "model_used": cached["model"] or self.model,
+                    "cache_status": "semantic_hit"
+                }
+
+            # LLM 호출 (동시에 들어온 같은 프롬프트는 한 번만 호출)
+            response, career_identity_data, coalesced, (provider, model_used) = await self._call_single_flight(
+                "career_identity",
+                self.CAREER_IDENTITY_SYSTEM_MESSAGE,
+                self.CAREER_IDENTITY_TEMPERATURE,
+                prompt,
+                self._provider_calls(
+                    {"openai": self._call_openai_career_identity, "anthropic": self._call_anthropic_career_identity},
+                    {"openai": self._stream_openai_career_identity, "anthropic": self._stream_anthropic_career_identity},
+                    self.CAREER_IDENTITY_FIELDS,
+                    "직업정체성"
+                ),
+                self._parse_career_identity_response,
+                cache_key,
+                self.CAREER_IDENTITY_MAX_TOKENS
+            )
+            await self._store_identity_cache(input_data, use_cache, response, provider, model_used)
 
             return {
                 "success": True,
                 "career_identity": career_identity_data["career_identity"],
                 "rationale": career_identity_data["rationale"],
                 "raw_response": response,
-                "model_used": self.model
+                "model_used": model_used,
+                "cache_status": cache_status,
+                "coalesced": coalesced
             }
 
         except Exception as e:
             logger.error(f"직업정체성 분석 실패: {str(e)}")
+
+            # 템플릿 결과로 대체 (degraded 모드)
+            if settings.IDENTITY_TEMPLATE_FALLBACK:
+                try:
+                    return self._template_career_identity(input_data, degraded=True)
+                except Exception as template_error:
+                    logger.error(f"직업정체성 템플릿 대체 실패: {str(template_error)}")
+
             return {
                 "success": False,
                 "error": str(e),
@@ -275,74 +848,299 @@ class LLMService:
                 "model_used": self.model
             }
 
-    async def _call_openai_career_identity(self, prompt: str) -> str:
+    async def stream_career_identity(
+        self,
+        input_data: Dict[str, Any],
+        use_cache: bool = True,
+        use_template: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        직업정체성 분석 (스트리밍)
+
+        제공자의 토큰 스트림을 delta 이벤트로 전달한 뒤,
+        파싱된 career_identity와 rationale을 result 이벤트로 전달합니다.
+        템플릿 엔진 결과는 delta 없이 result 이벤트 하나로 전달합니다.
+
+        Args:
+            input_data: 흥미, 성격, 생활사 데이터
+            use_cache: LLM 응답 캐시 사용 여부 (False면 캐시 우회)
+            use_template: LLM 호출 없이 템플릿 엔진으로 생성 (무료 등급)
+
+        Yields:
+            Dict[str, Any]: {"event": "delta" | "result" | "error", "data": {...}}
+        """
+        if use_template:
+            try:
+                yield {"event": "result", "data": self._template_career_identity(input_data)}
+            except Exception as e:
+                logger.error(f"직업정체성 템플릿 생성 실패: {str(e)}")
+                yield {"event": "error", "data": {"success": False, "error": str(e)}}
+            return
+
+        try:
+            # API 키가 없으면 Mock 데이터 반환 (개발/테스트용)
+            if not settings.OPENAI_API_KEY and not settings.ANTHROPIC_API_KEY:
+                logger.warning("API 키가 설정되지 않음 - Mock 데이터 반환")
+                yield {"event": "result", "data": self._get_mock_career_identity()}
+                return
+
+            # 입력 데이터를 텍스트로 변환
+            input_text = json.dumps(input_data, ensure_ascii=False, indent=2)
+
+            # 사용자 메시지 생성 (정적 지침은 시스템 메시지)
+            prompt = CAREER_IDENTITY_INPUT.format(input_data=input_text)
+
+            # 캐시 조회 (적중 시 스트리밍 없이 바로 결과 전달)
+            cache_key, cache_status, cached = await self._lookup_cache(
+                "career_identity",
+                self.CAREER_IDENTITY_SYSTEM_MESSAGE,
+                self.CAREER_IDENTITY_TEMPERATURE,
+                prompt,
+                use_cache
+            )
+
+            if cached is not None:
+                career_identity_data = self._parse_career_identity_response(cached["response"])
+                yield {"event": "result", "data": {
+                    "success": True,
+                    "career_identity": career_identity_data["career_identity"],
+                    "rationale": career_identity_data["rationale"],
+                    "raw_response": cached["response"],
+                    "model_used": cached["model"] or self.model,
+                    "cache_status": cache_status
+                }}
+                return
+
+            # 근사 캐시 조회 (점수 구간이 가까운 입력의 응답을 스트리밍 없이 전달)
+            cached = await self._lookup_identity_cache(input_data, use_cache)
+
+            if cached is not None:
+                career_identity_data = self._parse_career_identity_response(cached["response"])
+                yield {"event": "result", "data": {
+                    "success": True,
+                    "career_identity": career_identity_data["career_identity"],
+                    "rationale": career_identity_data["rationale"],
+                    "raw_response": cached["response"],
+                    "model_used": cached["model"] or self.model,
+                    "cache_status": "semantic_hit"
+                }}
+                return
+
+            # LLM 스트리밍 호출 (라우터가 고른 후보 하나, 첫 조각을 받기 전의 실패만 재시도)
+            streams = {
+                "openai": self._stream_openai_career_identity,
+                "anthropic": self._stream_anthropic_career_identity
+            }
+            if self.provider not in streams:
+                raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+
+            provider, model = llm_router.choose((self.provider, self.model))[0]
+            stream = provider_limiters.get(provider).stream(
+                lambda: streams[provider](prompt, model),
+                estimate_tokens(self.CAREER_IDENTITY_SYSTEM_MESSAGE) + estimate_tokens(prompt) + self.CAREER_IDENTITY_MAX_TOKENS
+            )
+
+            # 형태 검증 (위반한 조각은 전달하지 않고 스트림을 닫음, 이미 보낸 delta가 있어 재요청하지 않음)
+            parser = StreamingJSONParser(self.CAREER_IDENTITY_FIELDS, "직업정체성") if settings.LLM_STREAM_VALIDATION_ENABLED else None
+
+            validating = parser is not None
+            chunks = []
+            started = time.perf_counter()
+            try:
+                async for text in stream:
+                    if validating:
+                        validating = self._feed(parser, text)
+                    chunks.append(text)
+                    yield {"event": "delta", "data": {"text": text}}
+            except SchemaViolation as e:
+                stream_validation.record_abort(e, parser.received)
+                structured_output.record(provider, "schema_failures")
+                llm_router.record((provider, model), None)
+                raise
+            except Exception:
+                llm_router.record((provider, model), None)
+                raise
+            finally:
+                await stream.aclose()
+            elapsed = time.perf_counter() - started
+            llm_router.record((provider, model), elapsed * 1000)
+            stage_seconds.observe(elapsed, component="llm_service", stage="provider_stream")
+
+            # JSON 파싱 (형식 오류·잘린 출력은 로컬 복구)
+            with stage_seconds.time(component="llm_service", stage="parse"):
+                response, career_identity_data = self._parse_structured(
+                    self._parse_career_identity_response, "".join(chunks), provider
+                )
+            if parser is not None and parser.done:
+                stream_validation.record_success()
+
+            # 파싱에 성공한 응답만 캐시에 저장
+            if cache_key is not None:
+                await llm_response_cache.set(cache_key, response, provider, model)
+            await self._store_identity_cache(input_data, use_cache, response, provider, model)
+
+            yield {"event": "result", "data": {
+                "success": True,
+                "career_identity": career_identity_data["career_identity"],
+                "rationale": career_identity_data["rationale"],
+                "raw_response": response,
+                "model_used": model,
+                "cache_status": cache_status
+            }}
+
+        except Exception as e:
+            logger.error(f"직업정체성 스트리밍 분석 실패: {str(e)}")
+
+            # 템플릿 결과로 대체 (이미 보낸 delta가 있어도 result 이벤트가 최종 결과)
+            if settings.IDENTITY_TEMPLATE_FALLBACK:
+                try:
+                    yield {"event": "result", "data": self._template_career_identity(input_data, degraded=True)}
+                    return
+                except Exception as template_error:
+                    logger.error(f"직업정체성 템플릿 대체 실패: {str(template_error)}")
+
+            yield {"event": "error", "data": {"success": False, "error": str(e)}}
+
+    async def _call_openai_career_identity(self, prompt: str, model: str) -> str:
         """
         OpenAI API 호출 (직업정체성 분석용)
 
         Args:
             prompt: 프롬프트
+            model: 모델 (라우터가 선택)
 
         Returns:
             str: LLM 응답
         """
         try:
-            from openai import AsyncOpenAI
-            import httpx
-
-            http_client = httpx.AsyncClient()
-            client = AsyncOpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                http_client=http_client
-            )
+            client = llm_clients.get_openai()
 
+            started = time.perf_counter()
             response = await client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=[
-                    {"role": "system", "content": "너는 전문 커리어심리 분석가야. JSON 형식으로만 응답해."},
+                    {"role": "system", "content": self.CAREER_IDENTITY_SYSTEM_MESSAGE},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,  # 창의적인 문장 생성을 위해 temperature 높임
-                max_completion_tokens=2000   # 더 긴 응답을 위해 토큰 수 증가
+                temperature=self.CAREER_IDENTITY_TEMPERATURE,
+                max_completion_tokens=self.CAREER_IDENTITY_MAX_TOKENS,
+                **self._openai_output_format("career_identity", self.CAREER_IDENTITY_SCHEMA)
             )
+            llm_usage.record_openai("career_identity", model, response.usage, (time.perf_counter() - started) * 1000)
 
-            await http_client.aclose()
-            return response.choices[0].message.content
+            return response.choices[0].message.content or ""  # 거절(refusal)이면 내용 없음
 
         except Exception as e:
             logger.error(f"OpenAI API 호출 실패: {str(e)}")
             raise
 
-    async def _call_anthropic_career_identity(self, prompt: str) -> str:
+    async def _call_anthropic_career_identity(self, prompt: str, model: str) -> str:
         """
         Anthropic API 호출 (직업정체성 분석용)
 
         Args:
             prompt: 프롬프트
+            model: 모델 (라우터가 선택)
 
         Returns:
             str: LLM 응답
         """
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+            client = llm_clients.get_anthropic()
 
+            started = time.perf_counter()
             response = await client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system="너는 전문 커리어심리 분석가야. JSON 형식으로만 응답해.",
+                model=model,
+                max_tokens=self.CAREER_IDENTITY_MAX_TOKENS,
+                temperature=self.CAREER_IDENTITY_TEMPERATURE,
+                system=self._anthropic_system(self.CAREER_IDENTITY_SYSTEM_MESSAGE),
                 messages=[
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                **self._anthropic_output_tool("career_identity", "직업정체성 분석 결과 기록", self.CAREER_IDENTITY_SCHEMA)
             )
+            llm_usage.record_anthropic("career_identity", model, response.usage, (time.perf_counter() - started) * 1000)
 
-            return response.content[0].text
+            return self._anthropic_output(response)
 
         except Exception as e:
             logger.error(f"Anthropic API 호출 실패: {str(e)}")
             raise
 
+    async def _stream_openai_career_identity(self, prompt: str, model: str) -> AsyncIterator[str]:
+        """
+        OpenAI API 스트리밍 호출 (직업정체성 분석용)
+
+        Args:
+            prompt: 프롬프트
+            model: 모델 (라우터가 선택)
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        try:
+            client = llm_clients.get_openai()
+
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": self.CAREER_IDENTITY_SYSTEM_MESSAGE},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self.CAREER_IDENTITY_TEMPERATURE,
+                max_completion_tokens=self.CAREER_IDENTITY_MAX_TOKENS,
+                stream=True,
+                **self._openai_output_format("career_identity", self.CAREER_IDENTITY_SCHEMA),
+                stream_options={"include_usage": True}  # 마지막 청크에 usage 포함
+            )
+
+            try:
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        llm_usage.record_openai("career_identity", model, chunk.usage)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()  # 중간에 닫히면 응답 연결도 닫음
+
+        except Exception as e:
+            logger.error(f"OpenAI 스트리밍 호출 실패: {str(e)}")
+            raise
+
+    async def _stream_anthropic_career_identity(self, prompt: str, model: str) -> AsyncIterator[str]:
+        """
+        Anthropic API 스트리밍 호출 (직업정체성 분석용)
+
+        Args:
+            prompt: 프롬프트
+            model: 모델 (라우터가 선택)
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        try:
+            client = llm_clients.get_anthropic()
+
+            async with client.messages.stream(
+                model=model,
+                max_tokens=self.CAREER_IDENTITY_MAX_TOKENS,
+                temperature=self.CAREER_IDENTITY_TEMPERATURE,
+                system=self._anthropic_system(self.CAREER_IDENTITY_SYSTEM_MESSAGE),
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                **self._anthropic_output_tool("career_identity", "직업정체성 분석 결과 기록", self.CAREER_IDENTITY_SCHEMA)
+            ) as stream:
+                async for text in self._anthropic_stream_output(stream):
+                    yield text
+
+                message = await stream.get_final_message()
+                llm_usage.record_anthropic("career_identity", model, message.usage)
+
+        except Exception as e:
+            logger.error(f"Anthropic 스트리밍 호출 실패: {str(e)}")
+            raise
+
     def _parse_career_identity_response(self, response: str) -> Dict[str, Any]:
         """
         LLM 응답에서 직업정체성 JSON 추출 및 파싱
@@ -354,29 +1152,35 @@ class LLMService:
             Dict[str, Any]: 파싱된 JSON 데이터
         """
         try:
-            # JSON 블록 찾기 (```json ... ``` 형식도 처리)
-            response = response.strip()
+            # 앞뒤 설명 문장과 코드 펜스(```json)는 건너뛰고 CareerIdentity 형태 검증
+            return parse_json_object(response, self.CAREER_IDENTITY_FIELDS, "직업정체성")
 
-            # 코드 블록 제거
-            if response.startswith("```"):
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1])
+        except SchemaViolation as e:
+            logger.warning(f"응답 처리 실패 ({e.reason}): {str(e)}\n응답: {response}")
+            raise
 
-            # JSON 파싱
-            data = json.loads(response)
+    def _template_career_identity(self, input_data: Dict[str, Any], degraded: bool = False) -> Dict[str, Any]:
+        """
+        템플릿 엔진으로 직업정체성 결과 생성 (LLM 호출 없음)
 
-            # 유효성 검증
-            if "career_identity" not in data or "rationale" not in data:
-                raise ValueError("필수 필드가 누락되었습니다")
+        Args:
+            input_data: 흥미, 성격, 생활사 데이터
+            degraded: LLM 호출 실패를 대신하는 응답인지 여부
 
-            return data
+        Returns:
+            Dict[str, Any]: 직업정체성 분석 결과 (engine="template")
+        """
+        career_identity_data = identity_templates.render(input_data, degraded=degraded)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {str(e)}\n응답: {response}")
-            raise ValueError(f"LLM 응답을 JSON으로 파싱할 수 없습니다: {str(e)}")
-        except Exception as e:
-            logger.error(f"응답 처리 실패: {str(e)}")
-            raise
+        return {
+            "success": True,
+            "career_identity": career_identity_data["career_identity"],
+            "rationale": career_identity_data["rationale"],
+            "raw_response": json.dumps(career_identity_data, ensure_ascii=False),
+            "model_used": identity_templates.model_name,
+            "engine": "template",
+            "degraded": degraded
+        }
 
     def _get_mock_career_identity(self) -> Dict[str, Any]:
         """
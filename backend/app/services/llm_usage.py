@@ -0,0 +1,142 @@
+"""
+LLM 토큰 사용량 집계 - 제공자 usage 필드의 입력/출력/캐시 토큰 수 기록
+"""
+import logging
+from typing import Any, Dict, Optional
+from app.core.metrics import llm_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class LLMUsageTracker:
+    """
+    제공자·분석 종류별 토큰 사용량과 프롬프트 캐시 적중 집계
+
+    제공자마다 usage 형식이 달라 기록 시 정규화합니다.
+    - OpenAI: prompt_tokens(캐시 포함), prompt_tokens_details.cached_tokens
+    - Anthropic: input_tokens(캐시 제외), cache_read_input_tokens, cache_creation_input_tokens
+    캐시 적중 호출과 미적중 호출의 평균 지연을 따로 집계하여 캐시로 줄어든 지연을 비교할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._usage: Dict[str, Dict[str, float]] = {}
+
+    def record_openai(self, kind: str, model: str, usage: Any, latency_ms: Optional[float] = None) -> None:
+        """
+        OpenAI 응답 usage 기록
+
+        Args:
+            kind: 분석 종류 (profile, career_identity, embedding)
+            model: 응답한 모델
+            usage: CompletionUsage (없으면 무시)
+            latency_ms: 호출 지연 (스트리밍이면 None)
+        """
+        if usage is None:
+            return
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", None) or 0) if details is not None else 0
+        self._record(
+            "openai", kind, model,
+            input_tokens=usage.prompt_tokens or 0,
+            cached_tokens=cached,
+            cache_write_tokens=0,
+            output_tokens=getattr(usage, "completion_tokens", None) or 0,
+            latency_ms=latency_ms
+        )
+
+    def record_anthropic(self, kind: str, model: str, usage: Any, latency_ms: Optional[float] = None) -> None:
+        """
+        Anthropic 응답 usage 기록 (입력 토큰은 캐시 읽기/쓰기 토큰을 더한 전체 입력으로 정규화)
+
+        Args:
+            kind: 분석 종류
+            model: 응답한 모델
+            usage: Usage (없으면 무시)
+            latency_ms: 호출 지연 (스트리밍이면 None)
+        """
+        if usage is None:
+            return
+
+        cached = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        self._record(
+            "anthropic", kind, model,
+            input_tokens=(usage.input_tokens or 0) + cached + written,
+            cached_tokens=cached,
+            cache_write_tokens=written,
+            output_tokens=usage.output_tokens or 0,
+            latency_ms=latency_ms
+        )
+
+    def _record(
+        self,
+        provider: str,
+        kind: str,
+        model: str,
+        input_tokens: int,
+        cached_tokens: int,
+        cache_write_tokens: int,
+        output_tokens: int,
+        latency_ms: Optional[float]
+    ) -> None:
+        key = f"{provider}/{model}/{kind}"
+        entry = self._usage.setdefault(key, {
+            "calls": 0,
+            "input_tokens": 0,
+            "cached_tokens": 0,
+            "cache_write_tokens": 0,
+            "output_tokens": 0,
+            "cache_hit_calls": 0,
+            "hit_latency_ms": 0.0,
+            "hit_timed_calls": 0,
+            "miss_latency_ms": 0.0,
+            "miss_timed_calls": 0
+        })
+
+        hit = cached_tokens > 0
+        entry["calls"] += 1
+        entry["input_tokens"] += input_tokens
+        entry["cached_tokens"] += cached_tokens
+        entry["cache_write_tokens"] += cache_write_tokens
+        entry["output_tokens"] += output_tokens
+        entry["cache_hit_calls"] += hit
+
+        llm_tokens.inc(input_tokens, provider=provider, model=model, type="input")
+        llm_tokens.inc(output_tokens, provider=provider, model=model, type="output")
+        llm_tokens.inc(cached_tokens, provider=provider, model=model, type="cached")
+        llm_tokens.inc(cache_write_tokens, provider=provider, model=model, type="cache_write")
+
+        if latency_ms is not None:
+            prefix = "hit" if hit else "miss"
+            entry[f"{prefix}_latency_ms"] += latency_ms
+            entry[f"{prefix}_timed_calls"] += 1
+
+        if hit:
+            logger.debug(f"프롬프트 캐시 적중 - {key}: {cached_tokens}/{input_tokens} 토큰")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        토큰 사용량 통계 반환
+
+        Returns:
+            Dict[str, Any]: 제공자/모델/분석 종류별 토큰 수, 캐시된 입력 비율, 캐시 적중/미적중 평균 지연
+        """
+        stats = {}
+        for key, entry in self._usage.items():
+            stats[key] = {
+                "calls": entry["calls"],
+                "input_tokens": entry["input_tokens"],
+                "cached_tokens": entry["cached_tokens"],
+                "cache_write_tokens": entry["cache_write_tokens"],
+                "output_tokens": entry["output_tokens"],
+                "cached_input_ratio": round(entry["cached_tokens"] / entry["input_tokens"], 4) if entry["input_tokens"] else 0.0,
+                "cache_hit_calls": entry["cache_hit_calls"],
+                "avg_hit_latency_ms": round(entry["hit_latency_ms"] / entry["hit_timed_calls"], 1) if entry["hit_timed_calls"] else None,
+                "avg_miss_latency_ms": round(entry["miss_latency_ms"] / entry["miss_timed_calls"], 1) if entry["miss_timed_calls"] else None
+            }
+        return stats
+
+
+# 애플리케이션 전역 토큰 사용량 집계
+llm_usage = LLMUsageTracker()
@@ -2,9 +2,15 @@
 PDF 처리 서비스 - 비즈니스 로직 레이어
 """
 import pdfplumber
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Union
+import asyncio
 import io
 import logging
+import time
+from concurrent.futures.process import BrokenProcessPool
+from app.core.executor import get_extraction_executor, restart_extraction_executor
+from app.core.metrics import stage_seconds, executor_tasks
+from app.services.score_extractor import extract_scores_sync, failed_scores_result
 
 logger = logging.getLogger(__name__)
 
@@ -21,69 +27,89 @@ class PDFService:
     def __init__(self):
         pass
 
-    async def extract_text_from_pdf(self, pdf_file: bytes) -> Dict[str, Any]:
+    async def extract_text_from_pdf(
+        self,
+        pdf_file: Union[bytes, str],
+        char_budget: Optional[int] = None,
+        page_budget: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         PDF 파일에서 텍스트를 추출합니다.
 
+        pdfplumber 작업은 추출 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+        예산(char_budget/page_budget)이 주어지면 페이지를 앞에서부터 하나씩 읽다가
+        예산을 채우는 즉시 중단합니다.
+
         Args:
-            pdf_file: PDF 파일 바이트 데이터
+            pdf_file: PDF 파일 바이트 데이터 또는 저장된 PDF 파일 경로
+            char_budget: 추출할 최대 문자 수 (None이면 전체 추출)
+            page_budget: 추출할 최대 페이지 수 (None이면 제한 없음)
 
         Returns:
             Dict[str, Any]: 추출된 텍스트와 메타데이터
         """
         try:
-            # PDF 파일을 메모리에서 읽기
-            pdf_stream = io.BytesIO(pdf_file)
-
-            extracted_text = []
-            metadata = {
-                "total_pages": 0,
-                "success": True,
-                "format_detected": None
-            }
-
-            # pdfplumber를 사용하여 텍스트 추출
-            with pdfplumber.open(pdf_stream) as pdf:
-                metadata["total_pages"] = len(pdf.pages)
-
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    text = page.extract_text()
-                    if text:
-                        extracted_text.append({
-                            "page": page_num,
-                            "text": text.strip()
-                        })
-
-                # 첫 페이지에서 지원하는 형식인지 확인
-                if extracted_text:
-                    first_page_text = extracted_text[0]["text"]
-                    metadata["format_detected"] = self._detect_format(first_page_text)
-
-            # 전체 텍스트 조합
-            full_text = "\n\n".join([page["text"] for page in extracted_text])
-
-            return {
-                "success": True,
-                "text": full_text,
-                "pages": extracted_text,
-                "metadata": metadata
-            }
+            return await self._run_in_executor("extract_text", _extract_text_sync, pdf_file, char_budget, page_budget)
+
+        except Exception as e:
+            logger.error(f"PDF 추출 작업 실행 실패: {str(e)}")
+            return _failed_result(e)
+
+    async def extract_scores(self, pdf_file: Union[bytes, str]) -> Dict[str, Any]:
+        """
+        직업선호도검사 (L형) 결과지에서 점수를 직접 추출합니다. (LLM 호출 없음)
+
+        표 위치와 단어 위치를 이용해 RIASEC, Big5(하위요인 포함), 생활사 점수를
+        CareerIdentityRequest에 바로 넣을 수 있는 형태로 반환합니다.
+
+        Args:
+            pdf_file: PDF 파일 바이트 데이터 또는 저장된 PDF 파일 경로
+
+        Returns:
+            Dict[str, Any]: 섹션별 점수와 누락된 섹션 목록
+        """
+        try:
+            return await self._run_in_executor("extract_scores", extract_scores_sync, pdf_file)
 
         except Exception as e:
-            logger.error(f"PDF 텍스트 추출 실패: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "text": "",
-                "pages": [],
-                "metadata": {
-                    "total_pages": 0,
-                    "success": False,
-                    "format_detected": None
-                }
-            }
-
-    def _detect_format(self, first_page_text: str) -> str:
+            logger.error(f"점수 추출 작업 실행 실패: {str(e)}")
+            return failed_scores_result(e)
+
+    @staticmethod
+    async def _run_in_executor(stage: str, func, *args) -> Dict[str, Any]:
+        """
+        추출 프로세스 풀에서 실행하고 대기 시간과 실행 시간을 나누어 기록
+
+        워커 프로세스가 비정상 종료되어 풀이 망가지면(BrokenProcessPool)
+        풀을 한 번 다시 만들고 재시도합니다.
+
+        Args:
+            stage: 메트릭 단계 이름
+            func: 워커 프로세스에서 실행할 함수 (모듈 수준 함수)
+            *args: 함수 인자
+
+        Returns:
+            Dict[str, Any]: 함수 결과
+        """
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        executor = get_extraction_executor()
+
+        with executor_tasks.track():
+            try:
+                result, started_at, duration = await loop.run_in_executor(executor, _timed_call, func, *args)
+            except BrokenProcessPool:
+                logger.warning(f"추출 프로세스 풀 손상 - 풀 재시작 후 재시도 ({stage})")
+                executor = restart_extraction_executor(executor)
+                result, started_at, duration = await loop.run_in_executor(executor, _timed_call, func, *args)
+
+        # 워커 프로세스에서 잰 시작 시각과 비교 (같은 호스트의 벽시계)
+        stage_seconds.observe(max(0.0, started_at - submitted_at), component="pdf_service", stage="executor_wait")
+        stage_seconds.observe(duration, component="pdf_service", stage=stage)
+        return result
+
+    @staticmethod
+    def _detect_format(first_page_text: str) -> str:
         """
         첫 페이지 텍스트를 기반으로 적성검사 형식을 감지합니다.
 
@@ -124,3 +150,118 @@ class PDFService:
             list[str]: 지원하는 형식 목록
         """
         return self.SUPPORTED_FORMATS
+
+
+def _timed_call(func, *args) -> Tuple[Any, float, float]:
+    """
+    함수 실행 시작 시각과 소요 시간을 함께 반환 (동기, 워커 프로세스에서 실행)
+
+    Returns:
+        Tuple[Any, float, float]: 결과, 시작 시각 (epoch 초), 소요 시간 (초)
+    """
+    started_at = time.time()
+    started = time.perf_counter()
+    result = func(*args)
+    return result, started_at, time.perf_counter() - started
+
+
+def _extract_text_sync(
+    pdf_file: Union[bytes, str],
+    char_budget: Optional[int] = None,
+    page_budget: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    PDF 텍스트 추출 (동기, 워커 프로세스에서 실행)
+
+    Args:
+        pdf_file: PDF 파일 바이트 데이터 또는 저장된 PDF 파일 경로
+        char_budget: 추출할 최대 문자 수 (None이면 전체 추출)
+        page_budget: 추출할 최대 페이지 수 (None이면 제한 없음)
+
+    Returns:
+        Dict[str, Any]: 추출된 텍스트와 메타데이터
+    """
+    try:
+        # 경로가 주어지면 워커가 디스크에서 직접 읽음 (프로세스 간 바이트 복사 없음)
+        pdf_stream = io.BytesIO(pdf_file) if isinstance(pdf_file, bytes) else pdf_file
+
+        extracted_text = []
+        metadata = {
+            "total_pages": 0,
+            "success": True,
+            "format_detected": None,
+            "pages_extracted": 0,
+            "truncated": False
+        }
+
+        # pdfplumber를 사용하여 텍스트 추출
+        with pdfplumber.open(pdf_stream) as pdf:
+            metadata["total_pages"] = len(pdf.pages)
+            extracted_chars = 0
+
+            for page_num, page in enumerate(pdf.pages, start=1):
+                # 예산을 채웠으면 남은 페이지는 읽지 않음
+                budget_met = (
+                    (char_budget is not None and extracted_chars >= char_budget)
+                    or (page_budget is not None and page_num > page_budget)
+                )
+                if budget_met:
+                    metadata["truncated"] = True
+                    break
+
+                text = page.extract_text()
+                metadata["pages_extracted"] = page_num
+
+                # 페이지 파싱 캐시 해제 (메모리 사용량 제한)
+                page.flush_cache()
+
+                if text:
+                    extracted_text.append({
+                        "page": page_num,
+                        "text": text.strip()
+                    })
+                    extracted_chars += len(text.strip())
+
+            # 첫 페이지에서 지원하는 형식인지 확인
+            if extracted_text:
+                first_page_text = extracted_text[0]["text"]
+                metadata["format_detected"] = PDFService._detect_format(first_page_text)
+
+        # 전체 텍스트 조합
+        full_text = "\n\n".join([page["text"] for page in extracted_text])
+
+        return {
+            "success": True,
+            "text": full_text,
+            "pages": extracted_text,
+            "metadata": metadata
+        }
+
+    except Exception as e:
+        logger.error(f"PDF 텍스트 추출 실패: {str(e)}")
+        return _failed_result(e)
+
+
+def _failed_result(error: Exception) -> Dict[str, Any]:
+    """
+    추출 실패 결과 생성
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        Dict[str, Any]: 실패 결과
+    """
+    return {
+        "success": False,
+        "error": str(error),
+        "text": "",
+        "pages": [],
+        "metadata": {
+            "total_pages": 0,
+            "success": False,
+            "format_detected": None,
+            "pages_extracted": 0,
+            "truncated": False
+        }
+    }
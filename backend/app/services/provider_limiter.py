@@ -0,0 +1,447 @@
+"""
+LLM 제공자 호출 제한 계층 - 요청/토큰 버킷, 적응형 동시 호출 제한, 지수 백오프 재시도
+
+제공자 SDK의 자체 재시도는 끄고(max_retries=0) 이 계층에서 재시도를 관리합니다.
+제한은 워커 프로세스 단위이므로 여러 워커로 실행할 때는 제공자 한도를 워커 수로 나누어 설정합니다.
+"""
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+import httpx
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (분당 한도를 초당 보충 속도로 환산)
+
+    대기자는 도착 순서대로 처리되며, 제공자가 Retry-After로 대기를 요구하면
+    pause()로 버킷 전체를 멈춰 다른 호출도 그 시간 동안 보내지 않습니다.
+    용량보다 큰 요청은 버킷이 가득 찰 때까지 기다린 뒤 전체를 차감하고(잔량이 음수),
+    다음 호출이 그 부족분이 보충될 때까지 기다리므로 분당 한도를 넘지 않습니다.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float = 1.0):
+        """
+        Args:
+            per_minute: 분당 한도 (0 이하면 제한 없음, pause()는 그래도 적용)
+            burst_seconds: 버킷 용량 (몇 초 분량까지 한 번에 보낼 수 있는지)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = max(self.rate * burst_seconds, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.waited_seconds = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        amount만큼 토큰을 꺼냄 (부족하면 보충될 때까지 대기)
+
+        Args:
+            amount: 필요한 토큰 수 (용량보다 크면 가득 찰 때까지 기다린 뒤 전체 차감)
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        if not self.enabled and time.monotonic() >= self.paused_until:
+            return 0.0
+
+        # 용량보다 큰 요청은 가득 찬 버킷에서 시작해 초과분을 빚으로 남김
+        needed = min(amount, self.capacity)
+        started = time.monotonic()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                if not self.enabled:
+                    break
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= needed:
+                    self.tokens -= amount
+                    break
+
+                await asyncio.sleep((needed - self.tokens) / self.rate)
+
+        waited = time.monotonic() - started
+        self.waited_seconds += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """seconds 동안 새 요청을 보내지 않음 (제공자의 Retry-After)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        available = min(self.capacity, self.tokens + (now - self.updated) * self.rate) if self.enabled else None
+        return {
+            "per_minute": round(self.rate * 60),
+            "available": round(available, 1) if available is not None else None,
+            "paused_seconds": round(max(self.paused_until - now, 0.0), 3),
+            "waited_seconds": round(self.waited_seconds, 3)
+        }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    적응형 동시 호출 제한 (AIMD)
+
+    성공할 때마다 한도를 1/한도씩 늘리고(한도만큼 성공하면 +1),
+    429를 받으면 한도를 절반으로 줄입니다. 같은 혼잡으로 연속된 429에 여러 번 줄이지 않도록
+    감소 후 decrease_interval 동안은 다시 줄이지 않습니다.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        decrease_interval: float = 1.0,
+        window: int = 200
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.decrease_interval = decrease_interval
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._outcomes: deque = deque(maxlen=window)  # 최근 결과 (True면 429)
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """동시 호출 슬롯 획득 (한도까지 찼으면 대기)"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """슬롯 반환"""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        """성공 시 한도 증가 (가산)"""
+        self._outcomes.append(False)
+        if self.limit < self.maximum:
+            previous = int(self.limit)
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            if int(self.limit) > previous:
+                self.increases += 1
+
+    def on_throttled(self) -> None:
+        """429 시 한도 감소 (승산)"""
+        self._outcomes.append(True)
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_interval:
+            return
+
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(float(self.minimum), self.limit / 2)
+        self.decreases += 1
+        logger.warning(f"LLM 제공자 429 - 동시 호출 한도 {previous:.1f} → {self.limit:.1f}")
+
+    def on_other(self) -> None:
+        """429가 아닌 실패 (한도는 그대로, 429 비율 계산에만 포함)"""
+        self._outcomes.append(False)
+
+    @property
+    def throttle_rate(self) -> float:
+        """최근 결과 중 429 비율"""
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "min": self.minimum,
+            "max": self.maximum,
+            "in_flight": self.in_flight,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "recent_throttle_rate": round(self.throttle_rate, 4)
+        }
+
+
+class RetryableError(Exception):
+    """재시도 가능한 실패 분류 결과"""
+
+    def __init__(self, reason: str, retry_after: Optional[float]):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def classify_error(error: BaseException) -> Optional[RetryableError]:
+    """
+    제공자 호출 예외를 재시도 여부로 분류 (OpenAI/Anthropic SDK 공통)
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        Optional[RetryableError]: 재시도할 수 있으면 사유와 Retry-After, 아니면 None
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        return RetryableError("timeout", None)
+
+    status = getattr(error, "status_code", None)
+    if status is None:
+        # 연결 실패/타임아웃 (SDK의 APIConnectionError, APITimeoutError는 httpx 예외를 감쌈)
+        if isinstance(error, httpx.TransportError) or type(error).__name__ in ("APIConnectionError", "APITimeoutError"):
+            return RetryableError("connection", None)
+        return None
+
+    response = getattr(error, "response", None)
+    retry_after = parse_retry_after(response.headers) if response is not None else None
+
+    if status == 429:
+        return RetryableError("throttled", retry_after)
+    if status in (408, 409) or status >= 500:  # 529: Anthropic 과부하
+        return RetryableError("server_error", retry_after)
+    return None
+
+
+def parse_retry_after(headers: httpx.Headers) -> Optional[float]:
+    """
+    Retry-After 헤더 해석 (retry-after-ms, 초 단위, HTTP 날짜 형식 지원)
+
+    Args:
+        headers: 응답 헤더
+
+    Returns:
+        Optional[float]: 대기 시간 (초)
+    """
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(float(value) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+        return max(parsed.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderLimiter:
+    """
+    제공자별 호출 제한 (요청 버킷 + 토큰 버킷 + 적응형 동시 호출 제한 + 재시도)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = settings.LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = settings.LLM_TOKENS_PER_MINUTE,
+        initial_concurrency: int = settings.LLM_INITIAL_CONCURRENCY,
+        min_concurrency: int = settings.LLM_MIN_CONCURRENCY,
+        max_concurrency: int = settings.LLM_MAX_CONCURRENCY,
+        max_attempts: int = settings.LLM_RETRY_MAX_ATTEMPTS,
+        base_delay: float = settings.LLM_RETRY_BASE_DELAY,
+        max_delay: float = settings.LLM_RETRY_MAX_DELAY,
+        attempt_timeout: float = settings.LLM_CALL_TIMEOUT
+    ):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.concurrency = AdaptiveConcurrencyLimiter(initial_concurrency, min_concurrency, max_concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+
+        # 워커 프로세스별 카운터
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.errors_by_reason: Dict[str, int] = {}
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        estimated_tokens: int = 0,
+        streaming: bool = False
+    ) -> Any:
+        """
+        한도 안에서 fn을 실행하고, 재시도 가능한 실패는 백오프 후 다시 시도
+
+        Args:
+            fn: 제공자 호출 코루틴 함수 (시도마다 새로 호출)
+            estimated_tokens: 예상 토큰 수 (프롬프트 + 최대 출력, 토큰 버킷에서 차감)
+            streaming: fn이 스트림을 끝까지 받는 호출인지 여부
+                (True면 시도 전체 제한 시간을 두지 않음 - 길지만 정상적으로 생성 중인 응답을 끊고 다시 요청하지 않도록,
+                멈춘 스트림은 fn이 조각 간 제한 시간으로 끊음)
+
+        Returns:
+            Any: fn 결과
+
+        Raises:
+            Exception: 재시도할 수 없는 실패, 또는 재시도 횟수를 모두 쓴 마지막 실패
+        """
+        self.calls += 1
+
+        for attempt in range(1, self.max_attempts + 1):
+            await self._admit(estimated_tokens)
+            await self.concurrency.acquire()
+            try:
+                result = await asyncio.wait_for(fn(), timeout=None if streaming else self.attempt_timeout)
+            except Exception as e:
+                await self._before_retry(e, attempt)
+                continue
+            finally:
+                await self.concurrency.release()
+
+            self.concurrency.on_success()
+            return result
+
+    async def stream(
+        self,
+        make_stream: Callable[[], AsyncIterator[str]],
+        estimated_tokens: int = 0
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 호출 (첫 조각을 받기 전의 실패만 재시도, 스트림이 끝날 때까지 동시 호출 슬롯 유지)
+
+        호출자가 중간에 aclose()하면 제공자 스트림도 바로 닫습니다.
+
+        Args:
+            make_stream: 스트림 생성 함수 (시도마다 새로 호출)
+            estimated_tokens: 예상 토큰 수
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        self.calls += 1
+
+        for attempt in range(1, self.max_attempts + 1):
+            await self._admit(estimated_tokens)
+            await self.concurrency.acquire()
+            started = False
+            source = make_stream()
+            try:
+                async for piece in source:
+                    started = True
+                    yield piece
+            except Exception as e:
+                if started:
+                    self._record_failure(e)
+                    raise
+                await self._before_retry(e, attempt)
+                continue
+            finally:
+                await source.aclose()
+                await self.concurrency.release()
+
+            self.concurrency.on_success()
+            return
+
+    async def _admit(self, estimated_tokens: int) -> None:
+        """요청/토큰 버킷 통과"""
+        self.attempts += 1
+        await self.tokens.acquire(estimated_tokens)
+        await self.requests.acquire(1)
+
+    async def _before_retry(self, error: Exception, attempt: int) -> None:
+        """
+        실패를 분류하고 재시도 전까지 대기 (재시도하지 않을 실패면 예외를 다시 발생)
+
+        대기 시간은 full jitter 지수 백오프(0 ~ base × 2^(시도-1))이며,
+        제공자가 Retry-After를 주면 그보다 짧게 기다리지 않습니다.
+        Retry-After가 max_delay보다 길면 사용자를 오래 붙잡지 않도록 바로 실패합니다.
+        """
+        retryable = classify_error(error)
+        reason = retryable.reason if retryable else "fatal"
+        self.errors_by_reason[reason] = self.errors_by_reason.get(reason, 0) + 1
+
+        if retryable is not None and retryable.reason == "throttled":
+            self.concurrency.on_throttled()
+        else:
+            self.concurrency.on_other()
+
+        if retryable is None or attempt >= self.max_attempts:
+            self.failures += 1
+            raise error
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retryable.retry_after is not None:
+            if retryable.retry_after > self.max_delay:
+                self.failures += 1
+                raise error
+            delay = max(delay, retryable.retry_after)
+            # 같은 제공자로 가는 다른 호출도 Retry-After 동안 멈춤
+            self.requests.pause(retryable.retry_after)
+
+        self.retries += 1
+        logger.warning(
+            f"{self.name} 호출 실패 ({reason}, 시도 {attempt}/{self.max_attempts}) - {delay:.2f}초 후 재시도: {str(error)[:120]}"
+        )
+        await asyncio.sleep(delay)
+
+    def _record_failure(self, error: Exception) -> None:
+        """스트림 도중 실패 (재시도 없음)"""
+        reason = "stream_interrupted"
+        self.errors_by_reason[reason] = self.errors_by_reason.get(reason, 0) + 1
+        self.concurrency.on_other()
+        self.failures += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "failures": self.failures,
+            "errors_by_reason": dict(self.errors_by_reason),
+            "concurrency": self.concurrency.get_stats(),
+            "request_bucket": self.requests.get_stats(),
+            "token_bucket": self.tokens.get_stats()
+        }
+
+
+class ProviderLimiterRegistry:
+    """제공자 이름별 ProviderLimiter (처음 사용할 때 생성)"""
+
+    def __init__(self):
+        self._limiters: Dict[str, ProviderLimiter] = {}
+
+    def get(self, provider: str) -> ProviderLimiter:
+        if provider not in self._limiters:
+            self._limiters[provider] = ProviderLimiter(provider)
+        return self._limiters[provider]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {name: limiter.get_stats() for name, limiter in self._limiters.items()}
+
+
+# 애플리케이션 전역 제공자 호출 제한
+provider_limiters = ProviderLimiterRegistry()
@@ -0,0 +1,311 @@
+"""
+LLM 제공자 라우터 - 제공자/모델별 지연·오류율 추적, 가장 건강한 후보 선택, 헤지 요청
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (제공자, 모델)
+Candidate = Tuple[str, str]
+
+
+class ProviderHealth:
+    """
+    후보 하나의 최근 호출 결과 (개수와 시간 두 기준의 이동 창)
+
+    오래된 기록은 창에서 빠지므로, 오류로 밀려난 후보도 시간이 지나면 표본 부족 상태가 되어 다시 시도됩니다.
+    """
+
+    def __init__(self, window: int, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._samples: deque = deque(maxlen=window)  # (기록 시각, 지연 ms 또는 None=실패)
+        self.selected = 0
+        self.successes = 0
+        self.failures = 0
+
+    def record(self, latency_ms: Optional[float]) -> None:
+        """호출 결과 기록 (latency_ms가 None이면 실패)"""
+        self._samples.append((time.monotonic(), latency_ms))
+        if latency_ms is None:
+            self.failures += 1
+        else:
+            self.successes += 1
+
+    def _recent(self) -> List[Optional[float]]:
+        cutoff = time.monotonic() - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        return [latency for _, latency in self._samples]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """창 안의 표본 수, 오류율, p50/p95 지연"""
+        recent = self._recent()
+        latencies = [latency for latency in recent if latency is not None]
+        errors = len(recent) - len(latencies)
+
+        return {
+            "samples": len(recent),
+            "error_rate": round(errors / len(recent), 4) if recent else 0.0,
+            "p50_ms": round(float(np.percentile(latencies, 50)), 1) if latencies else None,
+            "p95_ms": round(float(np.percentile(latencies, 95)), 1) if latencies else None
+        }
+
+
+class ProviderRouter:
+    """
+    호출마다 가장 건강한 (제공자, 모델) 후보를 고르고, 선택적으로 헤지 요청을 보내는 라우터
+
+    후보 점수는 p95 / (1 - 오류율)로, 실패하면 다시 보내야 하는 비용을 반영한 기대 지연입니다.
+    표본이 LLM_ROUTING_MIN_SAMPLES보다 적은 후보는 먼저 시도하여 지연을 측정합니다.
+    헤지가 켜져 있으면 선택된 후보가 지연 기준 시간 안에 끝나지 않을 때 다음 후보(후보가 하나면 같은 후보)로
+    같은 요청을 하나 더 보내고, 먼저 성공한 응답을 쓰고 나머지는 취소합니다.
+    선택된 후보가 실패하면 아직 시도하지 않은 다음 후보로 넘깁니다.
+    """
+
+    def __init__(
+        self,
+        window: int = settings.LLM_ROUTING_WINDOW,
+        window_seconds: float = settings.LLM_ROUTING_WINDOW_SECONDS,
+        min_samples: int = settings.LLM_ROUTING_MIN_SAMPLES,
+        hedge_enabled: bool = settings.LLM_HEDGE_ENABLED,
+        hedge_delay: float = settings.LLM_HEDGE_DELAY
+    ):
+        self.window = window
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.hedge_enabled = hedge_enabled
+        self.hedge_delay = hedge_delay
+        self._health: Dict[Candidate, ProviderHealth] = {}
+        self._decisions: deque = deque(maxlen=20)  # 최근 라우팅 결정
+
+        # 워커 프로세스별 카운터
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def candidates(self, primary: Candidate) -> List[Candidate]:
+        """
+        라우팅 후보 목록 (LLM_ROUTING_CANDIDATES, 비어 있으면 primary 하나)
+
+        API 키가 없는 제공자는 제외합니다.
+        """
+        configured = [
+            tuple(item.split(":", 1)) for item in settings.LLM_ROUTING_CANDIDATES if ":" in item
+        ]
+        keys = {"openai": settings.OPENAI_API_KEY, "anthropic": settings.ANTHROPIC_API_KEY}
+        available = [candidate for candidate in configured if keys.get(candidate[0])]
+        return available or [primary]
+
+    def rank(self, primary: Candidate) -> List[Candidate]:
+        """
+        후보를 건강한 순서로 정렬 (표본 부족 후보 → 기대 지연이 짧은 후보 → 최근 모두 실패한 후보, 동점이면 설정 순서)
+
+        Args:
+            primary: 기본 후보 (LLMService의 provider, model)
+
+        Returns:
+            List[Candidate]: 정렬된 후보 목록
+        """
+        candidates = self.candidates(primary)
+
+        def score(item: Tuple[int, Candidate]) -> Tuple[int, float, int]:
+            order, candidate = item
+            snapshot = self._get_health(candidate).snapshot()
+            if snapshot["samples"] < self.min_samples:
+                return 0, float(snapshot["samples"]), order
+            if snapshot["p95_ms"] is None:  # 최근 호출이 모두 실패
+                return 2, 0.0, order
+            expected = snapshot["p95_ms"] / max(1.0 - snapshot["error_rate"], 0.05)
+            return 1, expected, order
+
+        return [candidate for _, candidate in sorted(enumerate(candidates), key=score)]
+
+    def choose(self, primary: Candidate) -> List[Candidate]:
+        """
+        호출 1회의 후보 순서를 정하고 선택 수 기록 (첫 번째 후보가 선택된 후보)
+
+        Args:
+            primary: 기본 후보
+
+        Returns:
+            List[Candidate]: 정렬된 후보 목록
+        """
+        ranked = self.rank(primary)
+        self.calls += 1
+        self._get_health(ranked[0]).selected += 1
+        return ranked
+
+    async def call(
+        self,
+        primary: Candidate,
+        run: Callable[[str, str], Awaitable[Any]]
+    ) -> Tuple[Any, Candidate]:
+        """
+        가장 건강한 후보로 run을 실행 (헤지/실패 시 다음 후보)
+
+        Args:
+            primary: 기본 후보 (LLM_ROUTING_CANDIDATES가 비어 있으면 유일한 후보)
+            run: (제공자, 모델)을 받아 호출하는 코루틴 함수
+
+        Returns:
+            Tuple[Any, Candidate]: (run 결과, 응답한 후보)
+
+        Raises:
+            Exception: 모든 후보가 실패하면 마지막 예외
+        """
+        ranked = self.choose(primary)
+        chosen = ranked[0]
+        delay = self._hedge_delay(chosen)
+        self._log_decision(chosen, ranked, delay)
+
+        tasks: Dict[asyncio.Task, Candidate] = {asyncio.create_task(self._attempt(chosen, run)): chosen}
+        tried = [chosen]
+        hedge_task = None
+        hedging = delay is not None
+        last_error: Optional[BaseException] = None
+
+        try:
+            while tasks:
+                timeout = delay if hedging else None
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # 기준 시간 안에 끝나지 않음 → 헤지 요청
+                    target = next((candidate for candidate in ranked if candidate not in tried), chosen)
+                    tried.append(target)
+                    hedge_task = asyncio.create_task(self._attempt(target, run))
+                    tasks[hedge_task] = target
+                    hedging = False
+                    self.hedges += 1
+                    logger.info(f"LLM 헤지 요청 - {chosen[0]}/{chosen[1]} {delay * 1000:.0f}ms 초과 → {target[0]}/{target[1]}")
+                    continue
+
+                # 함께 끝난 작업의 예외는 성공 여부와 관계없이 모두 회수
+                winner = None
+                for task in done:
+                    candidate = tasks.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        winner = winner or (task, candidate)
+                    else:
+                        last_error = error
+                        logger.debug(f"LLM 후보 실패 - {candidate[0]}/{candidate[1]}: {str(error)[:120]}")
+
+                if winner is not None:
+                    task, candidate = winner
+                    if task is hedge_task:
+                        self.hedge_wins += 1
+                    return task.result(), candidate
+
+                if not tasks:
+                    # 진행 중인 호출이 모두 실패 → 시도하지 않은 다음 후보
+                    target = next((candidate for candidate in ranked if candidate not in tried), None)
+                    if target is None:
+                        break
+                    tried.append(target)
+                    tasks[asyncio.create_task(self._attempt(target, run))] = target
+                    hedging = False  # 넘긴 뒤에는 헤지하지 않음
+                    self.failovers += 1
+                    logger.warning(f"LLM 라우팅 전환 - {candidate[0]}/{candidate[1]} 실패 → {target[0]}/{target[1]}: {str(last_error)[:120]}")
+
+            raise last_error
+        finally:
+            # 늦은 쪽 호출을 취소하고 스트림이 정리될 때까지 대기
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _attempt(self, candidate: Candidate, run: Callable[[str, str], Awaitable[Any]]) -> Any:
+        """후보 하나로 실행하고 지연/실패 기록 (취소된 호출은 기록하지 않음)"""
+        started = time.perf_counter()
+        try:
+            result = await run(*candidate)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._get_health(candidate).record(None)
+            raise
+
+        self._get_health(candidate).record((time.perf_counter() - started) * 1000)
+        return result
+
+    def record(self, candidate: Candidate, latency_ms: Optional[float]) -> None:
+        """라우터 밖에서 실행한 호출(스트리밍 등)의 결과 기록 (latency_ms가 None이면 실패)"""
+        self._get_health(candidate).record(latency_ms)
+
+    def _hedge_delay(self, candidate: Candidate) -> Optional[float]:
+        """
+        헤지 요청까지 기다릴 시간 (초, None이면 헤지 안 함)
+
+        LLM_HEDGE_DELAY가 0이면 후보의 p95를 쓰며, 표본이 부족하면 헤지하지 않습니다.
+        """
+        if not self.hedge_enabled:
+            return None
+        if self.hedge_delay > 0:
+            return self.hedge_delay
+
+        snapshot = self._get_health(candidate).snapshot()
+        if snapshot["samples"] < self.min_samples or snapshot["p95_ms"] is None:
+            return None
+        return snapshot["p95_ms"] / 1000
+
+    def _get_health(self, candidate: Candidate) -> ProviderHealth:
+        if candidate not in self._health:
+            self._health[candidate] = ProviderHealth(self.window, self.window_seconds)
+        return self._health[candidate]
+
+    def _log_decision(self, chosen: Candidate, ranked: List[Candidate], delay: Optional[float]) -> None:
+        """라우팅 결정 기록 (후보가 여럿일 때만 로그 출력)"""
+        snapshot = self._get_health(chosen).snapshot()
+        decision = {
+            "at": time.time(),
+            "chosen": f"{chosen[0]}/{chosen[1]}",
+            "ranked": [f"{provider}/{model}" for provider, model in ranked],
+            "p95_ms": snapshot["p95_ms"],
+            "error_rate": snapshot["error_rate"],
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None
+        }
+        self._decisions.append(decision)
+
+        if len(ranked) > 1:
+            logger.info(
+                f"LLM 라우팅 - {decision['chosen']} 선택 (p95 {snapshot['p95_ms']}ms, 오류율 {snapshot['error_rate']}, "
+                f"순서 {decision['ranked']})"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        라우팅 통계 반환
+
+        Returns:
+            Dict[str, Any]: 후보별 p50/p95·오류율·선택 수, 헤지/전환 수, 최근 결정
+        """
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_rate": round(self.hedge_wins / self.hedges, 4) if self.hedges else 0.0,
+            "failovers": self.failovers,
+            "candidates": {
+                f"{provider}/{model}": {
+                    **health.snapshot(),
+                    "selected": health.selected,
+                    "successes": health.successes,
+                    "failures": health.failures
+                }
+                for (provider, model), health in self._health.items()
+            },
+            "recent_decisions": list(self._decisions)
+        }
+
+
+# 애플리케이션 전역 LLM 라우터
+llm_router = ProviderRouter()
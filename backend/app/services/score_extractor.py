@@ -0,0 +1,393 @@
+"""
+직업선호도검사 (L형) 결과지 점수 추출기
+
+LLM 없이 pdfplumber의 표 추출과 단어 위치 정보로 흥미(RIASEC), 성격(Big5),
+생활사 점수를 읽어 CareerIdentityRequest 형태로 구성합니다.
+표 감지에 실패한 섹션은 줄 단위 텍스트(라벨 행 + 숫자 행)로 한 번 더 찾습니다.
+"""
+import io
+import logging
+import re
+from typing import Dict, Any, List, Optional, Tuple, Union
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+# RIASEC 유형 (결과지 표기 → 코드)
+RIASEC_LABELS = {
+    "현실형(R)": "R",
+    "탐구형(I)": "I",
+    "예술형(A)": "A",
+    "사회형(S)": "S",
+    "진취형(E)": "E",
+    "관습형(C)": "C"
+}
+
+# 성격 5요인 (결과지 표기 순서)
+BIG5_FACTORS = ["외향성", "호감성", "성실성", "정서적 불안정성", "경험에 대한 개방성"]
+
+# 생활사 구성요인 (결과지 표기 순서, 직무만족은 직업경험이 있을 때만 산출)
+LIFE_HISTORY_FACTORS = [
+    "대인관계지향", "독립심", "가족친화", "야망", "학업성취",
+    "예술성", "운동선호", "종교성", "직무만족"
+]
+OPTIONAL_LIFE_HISTORY_FACTORS = {"직무만족"}
+
+# 응답 신뢰성 지표
+RELIABILITY_LABELS = ["사회적 바람직성", "부주의성"]
+
+# 하위요인 표 첫 행의 눈금 (10, 20, ..., 100)
+SUBFACTOR_SCALE = {"10", "20", "30", "40", "50", "60", "70", "80", "90", "100"}
+
+_INTEREST_CODE_PATTERN = re.compile(r"흥미\s*코드\s*[:：]\s*([RIASEC]{1,3})")
+_RELIABILITY_LINE_PATTERN = re.compile(r"^([가-힣][가-힣 ]*?)\s+(\d{1,3})\s+(\d{1,3})$")
+_SUBFACTOR_LINE_PATTERN = re.compile(r"^([가-힣][가-힣 ]*?)\s+(\d{1,3})(?:\s|$)")
+
+
+def _compact(text: Optional[str]) -> str:
+    """비교용 문자열 정규화 (공백/줄바꿈 제거)"""
+    return re.sub(r"\s+", "", text or "")
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """셀 값을 정수로 변환 (숫자가 아니면 None)"""
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+def _canonical(label: str, candidates: List[str]) -> Optional[str]:
+    """공백 차이를 무시하고 표준 라벨로 변환"""
+    compact = _compact(label)
+    for candidate in candidates:
+        if _compact(candidate) == compact:
+            return candidate
+    return None
+
+
+def _map_label_row(
+    labels: List[Optional[str]],
+    values: List[Optional[str]],
+    candidates: List[str]
+) -> Dict[str, int]:
+    """
+    라벨 행과 숫자 행을 짝지어 점수 딕셔너리 구성
+
+    Args:
+        labels: 라벨 셀 목록
+        values: 점수 셀 목록
+        candidates: 인정할 표준 라벨 목록
+
+    Returns:
+        Dict[str, int]: 표준 라벨 → 점수
+    """
+    scores = {}
+    for label, value in zip(labels, values):
+        name = _canonical(label or "", candidates)
+        score = _to_int(value)
+        if name is not None and score is not None:
+            scores[name] = score
+    return scores
+
+
+class LTypeScoreExtractor:
+    """직업선호도검사 (L형) 점수 추출기 (페이지를 순서대로 읽으며 섹션별로 채움)"""
+
+    def __init__(self):
+        self.riasec_scores: Dict[str, int] = {}
+        self.riasec_raw_scores: Dict[str, int] = {}
+        self.interest_code: Optional[str] = None
+        self.big5_factor_scores: Dict[str, int] = {}
+        self.big5_sub_factors: Dict[str, Dict[str, int]] = {}
+        self.life_history_scores: Dict[str, int] = {}
+        self.response_reliability: Dict[str, Dict[str, int]] = {}
+        self.pages_scanned = 0
+
+        # 하위요인 표가 다음 페이지로 넘어가는 경우를 위해 마지막 요인 제목 유지
+        self._current_factor: Optional[str] = None
+
+    def is_complete(self) -> bool:
+        """모든 섹션을 찾았는지 여부 (찾았으면 남은 페이지는 읽지 않음)"""
+        required_life = set(LIFE_HISTORY_FACTORS) - OPTIONAL_LIFE_HISTORY_FACTORS
+        return (
+            len(self.riasec_scores) == len(RIASEC_LABELS)
+            and len(self.big5_factor_scores) == len(BIG5_FACTORS)
+            and all(self.big5_sub_factors.get(factor) for factor in BIG5_FACTORS)
+            and required_life <= set(self.life_history_scores)
+            and len(self.response_reliability) == len(RELIABILITY_LABELS)
+        )
+
+    def feed_page(self, page) -> None:
+        """
+        한 페이지에서 점수 섹션 추출
+
+        Args:
+            page: pdfplumber 페이지
+        """
+        self.pages_scanned += 1
+        start_factor = self._current_factor
+        lines = page.extract_text_lines()
+        tables = page.find_tables()
+
+        # 요인 제목 줄과 하위요인 표를 세로 위치 순으로 처리해 표의 소속 요인 결정
+        events: List[Tuple[float, str, Any]] = []
+        for line in lines:
+            factor = _canonical(line["text"], BIG5_FACTORS)
+            if factor is not None:
+                events.append((line["top"], "heading", factor))
+
+        for table in tables:
+            rows = table.extract()
+            if self._is_subfactor_table(rows):
+                events.append((table.bbox[1], "subfactors", rows))
+            else:
+                self._feed_table(rows)
+
+        for _, kind, payload in sorted(events, key=lambda event: event[0]):
+            if kind == "heading":
+                self._current_factor = payload
+            elif self._current_factor is not None:
+                self._feed_subfactor_rows(self._current_factor, payload)
+
+        # 표로 감지되지 않은 섹션은 줄 단위 텍스트로 보완
+        self._feed_lines([line["text"] for line in lines], start_factor)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        추출 결과 구성
+
+        Returns:
+            Dict[str, Any]: CareerIdentityRequest 필드와 부가 정보
+        """
+        big5_scores = {}
+        for factor in BIG5_FACTORS:
+            if factor in self.big5_factor_scores:
+                big5_scores[factor] = {
+                    "score": self.big5_factor_scores[factor],
+                    "subFactors": self.big5_sub_factors.get(factor, {})
+                }
+
+        missing = []
+        if len(self.riasec_scores) < len(RIASEC_LABELS):
+            missing.append("riasec_scores")
+        if len(big5_scores) < len(BIG5_FACTORS):
+            missing.append("big5_scores")
+        elif not all(entry["subFactors"] for entry in big5_scores.values()):
+            missing.append("big5_sub_factors")
+        if not self.life_history_scores:
+            missing.append("life_history_scores")
+
+        return {
+            "riasec_scores": dict(self.riasec_scores),
+            "riasec_raw_scores": dict(self.riasec_raw_scores),
+            "interest_code": self.interest_code,
+            "big5_scores": big5_scores,
+            "life_history_scores": dict(self.life_history_scores),
+            "response_reliability": dict(self.response_reliability),
+            "missing_sections": missing,
+            "pages_scanned": self.pages_scanned
+        }
+
+    @staticmethod
+    def _is_subfactor_table(rows: List[List[Optional[str]]]) -> bool:
+        """눈금(10~100) 머리행을 가진 하위요인 표인지 확인"""
+        if not rows:
+            return False
+        header = {cell.strip() for cell in rows[0] if cell}
+        return len(header & SUBFACTOR_SCALE) >= 5
+
+    def _feed_subfactor_rows(self, factor: str, rows: List[List[Optional[str]]]) -> None:
+        """하위요인 표의 (이름, 점수) 행 수집"""
+        sub_factors = self.big5_sub_factors.setdefault(factor, {})
+        for row in rows[1:]:
+            if len(row) < 2 or not row[0]:
+                continue
+            score = _to_int(row[1])
+            if score is not None:
+                sub_factors.setdefault(re.sub(r"\s+", " ", row[0]).strip(), score)
+
+    def _feed_table(self, rows: List[List[Optional[str]]]) -> None:
+        """점수 표 하나를 섹션별로 분류하여 수집"""
+        for index, row in enumerate(rows):
+            cells = [cell or "" for cell in row]
+            first = _compact(cells[0]) if cells else ""
+
+            # 흥미코드 행
+            match = _INTEREST_CODE_PATTERN.search(" ".join(cells))
+            if match and self.interest_code is None:
+                self.interest_code = match.group(1)
+
+            # RIASEC: 구분 | 현실형(R) ... 관습형(C) / 원점수 / 표준점수
+            if first == "구분" and any(_compact(cell) in RIASEC_LABELS for cell in cells):
+                codes = [RIASEC_LABELS.get(_compact(cell)) for cell in cells]
+                for score_row in rows[index + 1:]:
+                    kind = _compact(score_row[0])
+                    target = {"표준점수": self.riasec_scores, "원점수": self.riasec_raw_scores}.get(kind)
+                    if target is None or target:
+                        continue
+                    for code, value in zip(codes, score_row):
+                        score = _to_int(value)
+                        if code is not None and score is not None:
+                            target[code] = score
+                return
+
+            # 응답 신뢰성: 사회적 바람직성 | 점수 | 기준점수
+            reliability = _canonical(cells[0], RELIABILITY_LABELS) if cells else None
+            if reliability is not None and len(cells) >= 3:
+                score, threshold = _to_int(cells[1]), _to_int(cells[2])
+                if score is not None and threshold is not None:
+                    self.response_reliability.setdefault(
+                        reliability, {"score": score, "threshold": threshold}
+                    )
+                continue
+
+            # Big5 / 생활사: 라벨 행 바로 다음에 숫자 행
+            if index + 1 < len(rows):
+                self._feed_label_row(cells, rows[index + 1])
+
+    def _feed_label_row(self, labels: List[Optional[str]], values: List[Optional[str]]) -> None:
+        """라벨 행 + 숫자 행을 Big5 요인 또는 생활사 점수로 수집"""
+        if not self.big5_factor_scores:
+            scores = _map_label_row(labels, values, BIG5_FACTORS)
+            if len(scores) == len(BIG5_FACTORS):
+                self.big5_factor_scores = scores
+                return
+
+        if not self.life_history_scores:
+            scores = _map_label_row(labels, values, LIFE_HISTORY_FACTORS)
+            if len(scores) >= len(LIFE_HISTORY_FACTORS) - len(OPTIONAL_LIFE_HISTORY_FACTORS):
+                self.life_history_scores = scores
+
+    def _feed_lines(self, lines: List[str], start_factor: Optional[str]) -> None:
+        """
+        줄 단위 텍스트에서 표로 찾지 못한 섹션 보완
+
+        Args:
+            lines: 페이지의 텍스트 줄 목록 (위에서 아래 순)
+            start_factor: 이전 페이지에서 이어지는 요인 제목
+        """
+        for index, line in enumerate(lines):
+            if self.interest_code is None:
+                match = _INTEREST_CODE_PATTERN.search(line)
+                if match:
+                    self.interest_code = match.group(1)
+
+            # 응답 신뢰성: "사회적 바람직성 58 65"
+            match = _RELIABILITY_LINE_PATTERN.match(line)
+            if match:
+                reliability = _canonical(match.group(1), RELIABILITY_LABELS)
+                if reliability is not None:
+                    self.response_reliability.setdefault(
+                        reliability, {"score": int(match.group(2)), "threshold": int(match.group(3))}
+                    )
+                continue
+
+            # RIASEC 라벨 행 다음 원점수/표준점수 행
+            if line.startswith("구분") and not self.riasec_scores:
+                codes = [RIASEC_LABELS.get(token) for token in line.split()[1:]]
+                for score_line in lines[index + 1:index + 3]:
+                    kind, *values = score_line.split()
+                    target = {"표준점수": self.riasec_scores, "원점수": self.riasec_raw_scores}.get(kind)
+                    if target is not None and len(values) == len(codes) and all(v.isdigit() for v in values):
+                        target.update({
+                            code: int(value) for code, value in zip(codes, values) if code
+                        })
+                continue
+
+            if index + 1 >= len(lines):
+                break
+            numbers = lines[index + 1].split()
+            if not numbers or not all(number.isdigit() for number in numbers):
+                continue
+
+            # 라벨 사이 공백이 있을 수 있으므로 표준 라벨 순서대로 줄을 분할
+            for candidates in (BIG5_FACTORS, LIFE_HISTORY_FACTORS):
+                labels = self._split_labels(line, candidates)
+                if labels and len(labels) == len(numbers):
+                    self._feed_label_row(labels, numbers)
+
+        # 하위요인 보완 ("온정성 46" 형태의 줄, 표에서 이미 찾은 요인은 제외)
+        filled = {factor for factor, subs in self.big5_sub_factors.items() if subs}
+        current = start_factor
+        for line in lines:
+            factor = _canonical(line, BIG5_FACTORS)
+            if factor is not None:
+                current = factor
+                continue
+
+            match = _SUBFACTOR_LINE_PATTERN.match(line)
+            if current is None or current in filled or match is None:
+                continue
+            self.big5_sub_factors.setdefault(current, {}).setdefault(
+                match.group(1).strip(), int(match.group(2))
+            )
+
+    @staticmethod
+    def _split_labels(line: str, candidates: List[str]) -> Optional[List[str]]:
+        """공백 무시 비교로 줄을 표준 라벨 순서대로 분할 (모두 일치하지 않으면 None)"""
+        rest = _compact(line)
+        labels = []
+        for candidate in candidates:
+            key = _compact(candidate)
+            if rest.startswith(key):
+                labels.append(candidate)
+                rest = rest[len(key):]
+        return labels if labels and not rest else None
+
+
+def extract_scores_sync(pdf_file: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    L형 결과지에서 점수 추출 (동기, 워커 프로세스에서 실행)
+
+    Args:
+        pdf_file: PDF 파일 바이트 데이터 또는 저장된 PDF 파일 경로
+
+    Returns:
+        Dict[str, Any]: 점수 추출 결과
+    """
+    try:
+        pdf_stream = io.BytesIO(pdf_file) if isinstance(pdf_file, bytes) else pdf_file
+        extractor = LTypeScoreExtractor()
+
+        with pdfplumber.open(pdf_stream) as pdf:
+            total_pages = len(pdf.pages)
+
+            for page in pdf.pages:
+                extractor.feed_page(page)
+                page.flush_cache()
+
+                # 모든 섹션을 찾았으면 남은 페이지(해석/요약)는 읽지 않음
+                if extractor.is_complete():
+                    break
+
+        result = extractor.result()
+        return {
+            "success": not result["missing_sections"],
+            "error": (
+                f"점수 섹션을 찾지 못했습니다: {', '.join(result['missing_sections'])}"
+                if result["missing_sections"] else None
+            ),
+            "total_pages": total_pages,
+            **result
+        }
+
+    except Exception as e:
+        logger.error(f"점수 추출 실패: {str(e)}")
+        return failed_scores_result(e)
+
+
+def failed_scores_result(error: Exception) -> Dict[str, Any]:
+    """
+    점수 추출 실패 결과 생성 (PDF를 열지 못한 경우)
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        Dict[str, Any]: 실패 결과 (빈 점수 섹션 포함)
+    """
+    return {
+        "success": False,
+        "error": str(error),
+        "total_pages": 0,
+        **LTypeScoreExtractor().result()
+    }
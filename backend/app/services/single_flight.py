@@ -0,0 +1,96 @@
+"""
+단일 비행(single-flight) - 같은 키로 동시에 들어온 호출을 하나의 실행으로 합침
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    진행 중인 같은 키의 호출을 공유하는 단일 비행 그룹
+
+    첫 호출(리더)의 작업을 별도 Task로 실행하고, 완료 전에 같은 키로 들어온 호출은
+    새로 실행하지 않고 그 Task의 결과(또는 예외)를 함께 받습니다.
+    Task는 shield로 감싸므로 대기자 중 하나가 취소되어도(클라이언트 연결 종료 등)
+    나머지 대기자의 호출은 계속 진행됩니다.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+
+        # 워커 프로세스별 카운터
+        self.leaders = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.error_waiters = 0
+        self.max_waiters = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        같은 키의 진행 중인 호출이 있으면 그 결과를, 없으면 fn을 실행한 결과를 반환
+
+        Args:
+            key: 호출 식별 키
+            fn: 실행할 코루틴 함수
+
+        Returns:
+            Tuple[Any, bool]: (결과, 다른 호출의 결과를 공유했는지 여부)
+
+        Raises:
+            Exception: 공유된 실행에서 발생한 예외 (모든 대기자에게 같은 예외 전달)
+        """
+        task = self._flights.get(key)
+        coalesced = task is not None
+
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._flights[key] = task
+            self._waiters[key] = 1
+            self.leaders += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._waiters[key] += 1
+            self.coalesced += 1
+            self.max_waiters = max(self.max_waiters, self._waiters[key])
+            logger.info(f"진행 중인 동일 호출에 합류 ({key[:12]}, 대기 {self._waiters[key]}개)")
+
+        return await asyncio.shield(task), coalesced
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """실행 완료 시 그룹에서 제거하고 오류 전파 수 기록"""
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        waiters = self._waiters.pop(key, 1)
+
+        # 대기자가 모두 취소된 경우에도 예외를 회수하여 미회수 경고 방지
+        if task.cancelled() or task.exception() is not None:
+            self.errors += 1
+            self.error_waiters += waiters
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        단일 비행 통계 반환
+
+        Returns:
+            Dict[str, Any]: 실행 수, 합류(중복 제거) 수, 공유된 오류 수
+        """
+        calls = self.leaders + self.coalesced
+
+        return {
+            "in_flight": len(self._flights),
+            "calls": calls,
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / calls, 4) if calls else 0.0,
+            "max_waiters": self.max_waiters,
+            "errors": self.errors,
+            "error_waiters": self.error_waiters
+        }
+
+
+# 애플리케이션 전역 LLM 호출 단일 비행 그룹
+llm_single_flight = SingleFlight()
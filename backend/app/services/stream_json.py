@@ -0,0 +1,327 @@
+"""
+스트리밍 JSON 파서 - 제공자 출력 조각을 받는 대로 구조를 따라가며 스키마 위반을 조기에 감지
+"""
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Type, get_args, get_origin
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaViolation(ValueError):
+    """출력이 더 이상 스키마를 만족할 수 없음 (스트림 중단 사유)"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass
+class FieldSpec:
+    """최상위 필드 하나의 기대 형태"""
+    type: str  # string, array, number, boolean, object
+    item_type: Optional[str] = None  # 배열 항목 형태
+    min_items: Optional[int] = None
+    max_items: Optional[int] = None
+    required: bool = True
+
+
+_PYTHON_TYPES = {str: "string", int: "number", float: "number", bool: "boolean", dict: "object"}
+
+
+def fields_from_model(model: Type[BaseModel]) -> Dict[str, FieldSpec]:
+    """
+    Pydantic 모델에서 최상위 필드 형태 추출 (List[str]의 min_length/max_length 포함)
+
+    Args:
+        model: 응답 형태를 정의한 모델 (예: UserProfile)
+
+    Returns:
+        Dict[str, FieldSpec]: 필드 이름 → 기대 형태
+    """
+    fields = {}
+    for name, info in model.model_fields.items():
+        annotation = info.annotation
+        origin = get_origin(annotation)
+
+        if origin in (list, List):
+            args = get_args(annotation)
+            spec = FieldSpec("array", item_type=_PYTHON_TYPES.get(args[0]) if args else None)
+            for constraint in info.metadata:
+                spec.min_items = getattr(constraint, "min_length", spec.min_items)
+                spec.max_items = getattr(constraint, "max_length", spec.max_items)
+        else:
+            spec = FieldSpec(_PYTHON_TYPES.get(annotation, "object"))
+
+        spec.required = info.is_required()
+        fields[name] = spec
+
+    return fields
+
+
+def _value_type(char: str) -> Optional[str]:
+    """값의 첫 글자로 형태 판별"""
+    if char == "{":
+        return "object"
+    if char == "[":
+        return "array"
+    if char == '"':
+        return "string"
+    if char in "-0123456789":
+        return "number"
+    if char in "tf":
+        return "boolean"
+    if char == "n":
+        return "null"
+    return None
+
+
+class StreamingJSONParser:
+    """
+    조각 단위로 입력받는 JSON 객체 파서
+
+    첫 '{' 이전의 설명 문장이나 코드 펜스(```json)는 건너뛰고, 최상위 객체가 닫히면 완료됩니다.
+    (닫힌 뒤의 펜스/문장은 무시) 최상위 필드의 형태, 배열 항목 수 상한, 항목 형태는 값이 시작되는 순간,
+    배열 항목 수 하한은 배열이 닫히는 순간, 필수 필드 누락은 객체가 닫히는 순간 검사하여
+    위반하면 SchemaViolation을 발생시킵니다.
+    """
+
+    def __init__(self, fields: Dict[str, FieldSpec], name: str = "응답"):
+        """
+        Args:
+            fields: 최상위 필드 형태 (fields_from_model 결과)
+            name: 오류 메시지에 쓸 응답 이름
+        """
+        self.fields = fields
+        self.name = name
+        self.done = False
+        self.received = 0  # 받은 글자 수 (앞뒤 설명 포함)
+
+        self._started = False
+        self._buffer: List[str] = []
+        self._stack: List[Dict[str, Any]] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._key_chars: List[str] = []
+        self._in_scalar = False
+
+    def feed(self, chunk: str) -> None:
+        """
+        출력 조각 입력
+
+        Args:
+            chunk: 스트림에서 받은 텍스트 조각
+
+        Raises:
+            SchemaViolation: 출력이 스키마를 만족할 수 없게 된 경우
+        """
+        self.received += len(chunk)
+
+        for char in chunk:
+            if self.done:
+                return
+
+            if not self._started:
+                if char != "{":
+                    continue
+                self._started = True
+                self._buffer.append(char)
+                self._stack.append({"type": "object", "expect": "key", "keys": set(), "key": None, "items": 0, "field": None})
+                continue
+
+            self._buffer.append(char)
+            self._consume(char)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        완성된 객체 반환
+
+        Raises:
+            SchemaViolation: 객체가 시작되지 않았거나 닫히지 않은 경우
+        """
+        if not self._started:
+            raise SchemaViolation("no_json", f"{self.name}에서 JSON 객체를 찾을 수 없습니다")
+        if not self.done:
+            raise SchemaViolation("incomplete", f"{self.name} JSON이 끝나기 전에 출력이 종료되었습니다")
+
+        try:
+            return json.loads("".join(self._buffer))
+        except json.JSONDecodeError as e:
+            raise SchemaViolation("invalid_json", f"LLM 응답을 JSON으로 파싱할 수 없습니다: {str(e)}")
+
+    def _consume(self, char: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._string_is_key:
+                    self._end_key("".join(self._key_chars))
+                else:
+                    self._end_value()
+                return
+            if self._string_is_key:
+                self._key_chars.append(char)
+            return
+
+        if self._in_scalar:
+            if char not in ",}]" and not char.isspace():
+                return
+            self._in_scalar = False
+            self._end_value()
+
+        if char.isspace():
+            return
+
+        top = self._stack[-1]
+        expect = top["expect"]
+
+        if expect == "key":
+            if char == '"':
+                self._in_string = True
+                self._string_is_key = True
+                self._key_chars = []
+            elif char == "}":
+                self._close(top)
+            else:
+                self._fail("syntax", f"{self.name} JSON 형식 오류 (키 자리에 '{char}')")
+        elif expect == "colon":
+            if char != ":":
+                self._fail("syntax", f"{self.name} JSON 형식 오류 (':' 자리에 '{char}')")
+            top["expect"] = "value"
+        elif expect == "value":
+            if char == "]" and top["type"] == "array" and top["items"] == 0:
+                self._close(top)
+            else:
+                self._begin_value(top, char)
+        else:  # comma_or_end
+            if char == ",":
+                top["expect"] = "key" if top["type"] == "object" else "value"
+            elif (char == "}" and top["type"] == "object") or (char == "]" and top["type"] == "array"):
+                self._close(top)
+            else:
+                self._fail("syntax", f"{self.name} JSON 형식 오류 (',' 자리에 '{char}')")
+
+    def _begin_value(self, parent: Dict[str, Any], char: str) -> None:
+        value_type = _value_type(char)
+        if value_type is None:
+            self._fail("syntax", f"{self.name} JSON 형식 오류 (값 자리에 '{char}')")
+
+        depth = len(self._stack)
+        spec = None
+
+        if depth == 1:
+            spec = self.fields.get(parent["key"])
+            if spec is not None and value_type != spec.type:
+                self._fail("type", f"{parent['key']}는 {spec.type} 형식이어야 합니다 (받은 형식: {value_type})")
+        elif depth == 2 and parent["type"] == "array" and parent["field"] is not None:
+            field = parent["field"]
+            field_spec = self.fields[field]
+            parent["items"] += 1
+            if field_spec.max_items is not None and parent["items"] > field_spec.max_items:
+                self._fail("too_many_items", f"{field}는 최대 {field_spec.max_items}개여야 합니다")
+            if field_spec.item_type is not None and value_type != field_spec.item_type:
+                self._fail("type", f"{field} 항목은 {field_spec.item_type} 형식이어야 합니다 (받은 형식: {value_type})")
+        elif parent["type"] == "array":
+            parent["items"] += 1
+
+        if value_type == "object":
+            self._stack.append({"type": "object", "expect": "key", "keys": set(), "key": None, "items": 0, "field": None})
+        elif value_type == "array":
+            field = parent["key"] if depth == 1 and spec is not None else None
+            self._stack.append({"type": "array", "expect": "value", "keys": set(), "key": None, "items": 0, "field": field})
+        elif value_type == "string":
+            self._in_string = True
+            self._string_is_key = False
+        else:
+            self._in_scalar = True
+
+    def _end_key(self, key: str) -> None:
+        top = self._stack[-1]
+        if len(self._stack) == 1 and key in top["keys"]:
+            self._fail("duplicate_key", f"{key} 필드가 중복되었습니다")
+        top["keys"].add(key)
+        top["key"] = key
+        top["expect"] = "colon"
+
+    def _end_value(self) -> None:
+        self._stack[-1]["expect"] = "comma_or_end"
+
+    def _close(self, container: Dict[str, Any]) -> None:
+        if container["type"] == "array" and container["field"] is not None:
+            spec = self.fields[container["field"]]
+            if spec.min_items is not None and container["items"] < spec.min_items:
+                self._fail("too_few_items", f"{container['field']}는 최소 {spec.min_items}개여야 합니다")
+
+        self._stack.pop()
+
+        if not self._stack:
+            missing = [name for name, spec in self.fields.items() if spec.required and name not in container["keys"]]
+            if missing:
+                self._fail("missing_field", f"필수 필드가 누락되었습니다: {', '.join(missing)}")
+            self.done = True
+        else:
+            self._end_value()
+
+    def _fail(self, reason: str, message: str) -> None:
+        raise SchemaViolation(reason, message)
+
+
+def parse_json_object(text: str, fields: Dict[str, FieldSpec], name: str = "응답") -> Dict[str, Any]:
+    """
+    완성된 텍스트를 같은 규칙으로 파싱 (캐시된 응답, 비스트리밍 응답)
+
+    Args:
+        text: LLM 응답 전체
+        fields: 최상위 필드 형태
+        name: 오류 메시지에 쓸 응답 이름
+
+    Returns:
+        Dict[str, Any]: 파싱된 객체
+
+    Raises:
+        SchemaViolation: JSON이 없거나 스키마를 만족하지 않는 경우
+    """
+    parser = StreamingJSONParser(fields, name)
+    parser.feed(text)
+    return parser.result()
+
+
+class StreamValidationStats:
+    """스트리밍 검증 결과 집계 (중단 사유, 중단 시점까지 받은 글자 수, 재요청 수)"""
+
+    def __init__(self):
+        self.validated = 0
+        self.aborted = 0
+        self.retries = 0
+        self.aborted_chars = 0
+        self.reasons: Dict[str, int] = {}
+
+    def record_success(self) -> None:
+        self.validated += 1
+
+    def record_abort(self, violation: SchemaViolation, received: int) -> None:
+        self.aborted += 1
+        self.aborted_chars += received
+        self.reasons[violation.reason] = self.reasons.get(violation.reason, 0) + 1
+
+    def record_retry(self) -> None:
+        self.retries += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "validated": self.validated,
+            "aborted": self.aborted,
+            "retries": self.retries,
+            "avg_chars_before_abort": round(self.aborted_chars / self.aborted, 1) if self.aborted else 0.0,
+            "abort_reasons": dict(self.reasons)
+        }
+
+
+# 애플리케이션 전역 스트리밍 검증 통계
+stream_validation = StreamValidationStats()
@@ -0,0 +1,223 @@
+"""
+구조화 출력 - 응답 모델에서 제공자용 JSON 스키마 생성, 깨진 JSON 로컬 복구, 제공자별 파싱 실패/복구 집계
+"""
+import re
+import logging
+from typing import Any, Dict, List, Optional, Type
+from pydantic import BaseModel
+from app.services.stream_json import fields_from_model
+
+logger = logging.getLogger(__name__)
+
+# 로컬 복구를 시도할 파싱 실패 사유 (형식 오류, 잘린 출력)
+REPAIRABLE_REASONS = {"syntax", "incomplete", "invalid_json"}
+
+_SCALAR_TAIL = re.compile(r"[-+\w.]+$")
+_COMPLETE_SCALAR = re.compile(r"^(true|false|null|-?\d+(\.\d+)?([eE][-+]?\d+)?)$")
+
+
+def json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    응답 모델에서 제공자용 JSON 스키마 생성 (OpenAI strict 모드 규칙: 모든 필드 필수, 추가 필드 금지)
+
+    Args:
+        model: 응답 형태를 정의한 모델 (예: UserProfile)
+
+    Returns:
+        Dict[str, Any]: JSON 스키마
+    """
+    properties = {}
+    for name, spec in fields_from_model(model).items():
+        prop: Dict[str, Any] = {"type": spec.type}
+        description = model.model_fields[name].description
+        if description:
+            prop["description"] = description
+        if spec.type == "array":
+            if spec.item_type:
+                prop["items"] = {"type": spec.item_type}
+            if spec.min_items is not None:
+                prop["minItems"] = spec.min_items
+            if spec.max_items is not None:
+                prop["maxItems"] = spec.max_items
+        properties[name] = prop
+
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+def repair_json(text: str) -> str:
+    """
+    흔한 LLM JSON 오류를 로컬에서 복구 (재요청 전 단계)
+
+    - 첫 '{' 앞의 설명 문장/코드 펜스와 최상위 객체가 닫힌 뒤의 출력 제거
+    - 닫는 괄호 앞의 쉼표 제거 (trailing comma)
+    - 문자열 안의 이스케이프되지 않은 따옴표와 줄바꿈 이스케이프
+    - 잘린 출력: 열린 문자열을 닫고, 값이 없는 키와 끝나지 않은 값은 버린 뒤 열린 괄호를 닫음
+
+    Args:
+        text: LLM 응답 전체
+
+    Returns:
+        str: 복구한 JSON 텍스트 (복구할 수 없으면 가능한 만큼 정리한 텍스트)
+    """
+    start = text.find("{")
+    if start < 0:
+        return text
+
+    out: List[str] = []
+    stack: List[Dict[str, Any]] = []  # {"type": "{" | "[", "key_pos": 현재 멤버 시작 위치, "expect_key": bool}
+    in_string = False
+    is_key = False
+    escape = False
+
+    for i in range(start, len(text)):
+        char = text[i]
+
+        if in_string:
+            if escape:
+                escape = False
+                out.append(char)
+            elif char == "\\":
+                escape = True
+                out.append(char)
+            elif char == '"':
+                if _closes_string(text, i + 1, is_key):
+                    in_string = False
+                    out.append(char)
+                    if is_key:
+                        stack[-1]["expect_key"] = False
+                else:
+                    out.append('\\"')  # 문자열 안의 따옴표
+            elif char == "\n":
+                out.append("\\n")
+            elif char == "\r":
+                out.append("\\r")
+            elif char == "\t":
+                out.append("\\t")
+            else:
+                out.append(char)
+            continue
+
+        if char == '"':
+            top = stack[-1] if stack else None
+            is_key = top is not None and top["type"] == "{" and top["expect_key"]
+            if is_key:
+                top["key_pos"] = len(out)
+            in_string = True
+            out.append(char)
+        elif char in "{[":
+            stack.append({"type": char, "key_pos": None, "expect_key": char == "{"})
+            out.append(char)
+        elif char in "}]":
+            _strip_trailing_comma(out)
+            if not stack:
+                break
+            stack.pop()
+            out.append("}" if char == "}" else "]")
+            if not stack:
+                return "".join(out)
+        elif char == ",":
+            if stack and stack[-1]["type"] == "{":
+                stack[-1]["expect_key"] = True
+                stack[-1]["key_pos"] = None
+            out.append(char)
+        else:
+            out.append(char)
+
+    # 잘린 출력 마무리
+    if in_string:
+        if is_key:
+            del out[stack[-1]["key_pos"]:]
+        else:
+            out.append('"')
+
+    while stack:
+        _drop_dangling(out, stack[-1])
+        out.append("}" if stack.pop()["type"] == "{" else "]")
+
+    return "".join(out)
+
+
+def _closes_string(text: str, position: int, is_key: bool) -> bool:
+    """따옴표 뒤의 첫 유효 글자로 문자열의 끝인지 판별 (키는 ':', 값은 ',', '}', ']' 또는 출력 끝)"""
+    for char in text[position:]:
+        if char.isspace():
+            continue
+        return char == ":" if is_key else char in ",}]"
+    return True
+
+
+def _strip_trailing_comma(out: List[str]) -> None:
+    """닫는 괄호 직전의 쉼표 제거"""
+    index = len(out) - 1
+    while index >= 0 and out[index].isspace():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index:]
+
+
+def _drop_dangling(out: List[str], frame: Dict[str, Any]) -> None:
+    """잘린 위치의 끝나지 않은 멤버(값이 없는 키, 끝나지 않은 숫자/리터럴)와 쉼표 제거"""
+    while out and out[-1].isspace():
+        out.pop()
+
+    tail = _SCALAR_TAIL.search("".join(out[-16:]))
+    if tail and not _COMPLETE_SCALAR.match(tail.group()):
+        del out[len(out) - len(tail.group()):]
+
+    while out and out[-1].isspace():
+        out.pop()
+
+    if out and out[-1] == ":" and frame["key_pos"] is not None:
+        del out[frame["key_pos"]:]
+    elif frame["type"] == "{" and frame["expect_key"] and frame["key_pos"] is not None:
+        del out[frame["key_pos"]:]
+
+    _strip_trailing_comma(out)
+
+
+class StructuredOutputStats:
+    """
+    제공자별 응답 파싱 결과 집계
+
+    - parsed: 그대로 파싱 성공
+    - repaired: 로컬 복구 후 파싱 성공 (재요청 없음)
+    - repair_failed: 복구해도 형태를 만족하지 않아 재요청
+    - schema_failures: 복구 대상이 아닌 형태 위반 (항목 수, 필드 형식, 스트리밍 조기 중단 포함)
+    """
+
+    OUTCOMES = ("parsed", "repaired", "repair_failed", "schema_failures")
+
+    def __init__(self):
+        self._providers: Dict[str, Dict[str, int]] = {}
+
+    def record(self, provider: str, outcome: str) -> None:
+        entry = self._providers.setdefault(provider, {name: 0 for name in self.OUTCOMES})
+        entry[outcome] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        제공자별 파싱 통계 반환
+
+        Returns:
+            Dict[str, Any]: 결과별 횟수, 파싱 실패율(그대로 파싱하지 못한 비율), 복구 성공률
+        """
+        stats = {}
+        for provider, entry in self._providers.items():
+            responses = sum(entry.values())
+            attempted = entry["repaired"] + entry["repair_failed"]
+            stats[provider] = {
+                **entry,
+                "responses": responses,
+                "parse_failure_rate": round((responses - entry["parsed"]) / responses, 4) if responses else 0.0,
+                "repair_success_rate": round(entry["repaired"] / attempted, 4) if attempted else None
+            }
+        return stats
+
+
+# 애플리케이션 전역 구조화 출력 통계
+structured_output = StructuredOutputStats()
@@ -0,0 +1,293 @@
+"""
+분석 텍스트 압축 - 토큰 예산 안에서 중요한 구간만 선택
+
+PDF에서 추출한 텍스트를 제목/페이지 단위 구간으로 나누고, 형식별 중요도
+(점수표, 결과/해석 제목 등)로 순위를 매겨 토큰 예산 안에 들어가는 구간만 남깁니다.
+선택된 구간은 원래 순서대로 이어 붙여 프롬프트에 사용합니다.
+"""
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except Exception:  # tiktoken 미설치 시 근사치 사용
+    _ENCODING = None
+
+# 형식별 중요도 규칙 (정규식, 가중치) - 음수는 안내문/광고 등 분석에 불필요한 구간
+SALIENCE_RULES: Dict[str, List[Tuple[str, float]]] = {
+    "직업선호도검사 (L형)": [
+        (r"^(원점수|표준점수)(\s+\d{1,3}){3,}", 6.0),
+        (r"흥미\s*코드\s*[:：]", 4.0),
+        (r"하위요인\s*점수|구성요인별\s*점수|5요인별\s*점수|유형별\s*점수", 4.0),
+        (r"^(사회적 바람직성|부주의성)\s+\d+\s+\d+", 2.0),
+        (r"^[가-힣 ]+\s\d{1,3}(\s|$)", 2.0),
+        (r"^\d{1,2}\s*[가-힣]+검사\s*(결과|해석)", 1.0),
+        (r"\((강함|약함)\)", 0.5),
+        (r"www\.|사이트 접속|정보망", -4.0),
+        (r"인쇄|검사실시일|성별|길잡이|바르게 읽기", -3.0),
+        (r"응답하지 않은 문항|\d+/\d+", -3.0),
+    ],
+}
+
+# 형식을 알 수 없을 때 사용하는 공통 규칙
+DEFAULT_SALIENCE_RULES: List[Tuple[str, float]] = [
+    (r"점수|백분위|등급|수준", 3.0),
+    (r"결과|해석|유형|적성|흥미|성격|강점", 1.5),
+    (r"www\.|https?://|사이트|검색", -3.0),
+]
+
+# 점수 행 판정 (한 줄에 숫자 3개 이상)
+_SCORE_ROW_PATTERN = re.compile(r"(?:\b\d{1,3}\b.*){3,}")
+# 구간 제목 판정 ("4 성격검사 결과", "성격 하위요인 점수" 등)
+_HEADING_PATTERN = re.compile(r"^(\d{1,2}\s*[가-힣][가-힣()A-Za-z ]{1,30}|[가-힣 ]{2,20}\s(점수|결과|해석))$")
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+# 구간 최대 줄 수 (긴 해설 페이지를 잘게 나누어 선택 단위를 줄임)
+MAX_SECTION_LINES = 24
+# 예산이 남았을 때 구간 일부라도 넣을 최소 토큰 수
+MIN_PARTIAL_TOKENS = 80
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 계산
+
+    tiktoken이 설치되어 있으면 정확한 값을, 없으면 한글 1글자 ≈ 1토큰,
+    그 외 문자 약 3.5글자 ≈ 1토큰으로 근사합니다.
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        int: 토큰 수
+    """
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+
+    hangul = len(_HANGUL_PATTERN.findall(text))
+    others = len(re.sub(r"\s", "", text)) - hangul
+    return hangul + math.ceil(others / 3.5)
+
+
+class TextCompactor:
+    """분석 텍스트 압축기 (요청별 절감량과 누적 통계 기록)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.compacted_requests = 0
+        self.original_tokens = 0
+        self.compacted_tokens = 0
+
+    def compact(
+        self,
+        text: str,
+        format_detected: Optional[str],
+        token_budget: int
+    ) -> Dict[str, Any]:
+        """
+        토큰 예산 안에서 중요도가 높은 구간만 골라 텍스트 압축
+
+        Args:
+            text: PDF에서 추출된 전체 텍스트
+            format_detected: 감지된 적성검사 형식 (중요도 규칙 선택)
+            token_budget: 최대 토큰 수
+
+        Returns:
+            Dict[str, Any]: 압축된 텍스트와 절감 토큰 등 보고 정보
+        """
+        sections = self._split_sections(text)
+        original_tokens = sum(tokens for _, tokens in sections) if sections else 0
+
+        if original_tokens <= token_budget:
+            # 예산 안이면 원문 그대로 사용
+            selected_text = text
+            selected_count = len(sections)
+        else:
+            rules = SALIENCE_RULES.get(format_detected or "", DEFAULT_SALIENCE_RULES)
+            selected = self._select(sections, rules, token_budget)
+            selected_text = "\n\n".join(body for _, body in sorted(selected))
+            selected_count = len(selected)
+
+            # 고를 구간이 하나도 없으면 (모든 구간이 음수 등) 앞부분을 예산만큼 사용
+            if not selected_text:
+                selected_text = self._truncate_lines(text.splitlines(), token_budget)
+
+        compacted_tokens = estimate_tokens(selected_text)
+        report = {
+            "original_tokens": original_tokens,
+            "compacted_tokens": compacted_tokens,
+            "tokens_saved": max(original_tokens - compacted_tokens, 0),
+            "token_budget": token_budget,
+            "sections_total": len(sections),
+            "sections_selected": selected_count,
+            "estimator": "tiktoken" if _ENCODING is not None else "approx"
+        }
+
+        # 누적 통계
+        self.requests += 1
+        if selected_text is not text:
+            self.compacted_requests += 1
+        self.original_tokens += original_tokens
+        self.compacted_tokens += compacted_tokens
+
+        logger.info(
+            f"분석 텍스트 압축 - {original_tokens} → {compacted_tokens} 토큰 "
+            f"({len(sections)}개 구간 중 {selected_count}개 선택)"
+        )
+
+        return {"text": selected_text, **report}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        누적 압축 통계 반환
+
+        Returns:
+            Dict[str, Any]: 압축 통계
+        """
+        saved = self.original_tokens - self.compacted_tokens
+        return {
+            "requests": self.requests,
+            "compacted_requests": self.compacted_requests,
+            "original_tokens": self.original_tokens,
+            "compacted_tokens": self.compacted_tokens,
+            "tokens_saved": saved,
+            "saved_ratio": round(saved / self.original_tokens, 4) if self.original_tokens else 0.0
+        }
+
+    @staticmethod
+    def _split_sections(text: str) -> List[Tuple[str, int]]:
+        """
+        텍스트를 구간으로 분할 (페이지 경계, 제목 줄, 최대 줄 수 기준)
+
+        Returns:
+            List[Tuple[str, int]]: (구간 텍스트, 토큰 수) 목록 (원래 순서)
+        """
+        sections = []
+
+        for page in re.split(r"\n\s*\n", text or ""):
+            current: List[str] = []
+
+            for line in page.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                if current and (_HEADING_PATTERN.match(line) or len(current) >= MAX_SECTION_LINES):
+                    sections.append("\n".join(current))
+                    current = []
+                current.append(line)
+
+            if current:
+                sections.append("\n".join(current))
+
+        return [(section, estimate_tokens(section)) for section in sections]
+
+    @staticmethod
+    def _salience(section: str, rules: List[Tuple[str, float]]) -> float:
+        """
+        구간 중요도 계산 (규칙 가중치 합 + 점수 행 비율)
+
+        Args:
+            section: 구간 텍스트
+            rules: (정규식, 가중치) 규칙 목록
+
+        Returns:
+            float: 중요도 점수
+        """
+        lines = section.splitlines()
+        score = sum(
+            weight for pattern, weight in rules
+            if re.search(pattern, section, re.MULTILINE)
+        )
+
+        score_rows = sum(1 for line in lines if _SCORE_ROW_PATTERN.search(line))
+        score += 6.0 * score_rows / max(len(lines), 1)
+
+        return score
+
+    def _select(
+        self,
+        sections: List[Tuple[str, int]],
+        rules: List[Tuple[str, float]],
+        token_budget: int
+    ) -> List[Tuple[int, str]]:
+        """
+        중요도 순으로 예산에 맞게 구간 선택 (중복 구간 제외)
+
+        중요도가 0보다 큰 구간을 먼저 고르고, 예산이 남으면 중요도가 0인 구간
+        (점수 행이나 키워드가 없는 일반 문장)을 원래 순서대로 채웁니다.
+        음수 구간(안내문/광고)은 넣지 않습니다.
+
+        Returns:
+            List[Tuple[int, str]]: (원래 위치, 구간 텍스트) 목록
+        """
+        ranked = sorted(
+            ((self._salience(body, rules), index, body, tokens)
+             for index, (body, tokens) in enumerate(sections)),
+            key=lambda item: (-item[0], item[1])
+        )
+
+        line_counts = Counter(
+            line for body, _ in sections for line in body.splitlines()
+        )
+
+        # 중요 구간 → 중요도 0인 구간(원래 순서) 순으로 채움
+        fill = sorted((item for item in ranked if item[0] == 0), key=lambda item: item[1])
+        candidates = [item for item in ranked if item[0] > 0] + fill
+
+        selected: List[Tuple[int, str]] = []
+        seen_lines = set()
+        remaining = token_budget
+
+        for salience, index, body, tokens in candidates:
+            if remaining <= 0:
+                break
+
+            # 요약 페이지처럼 이미 선택한 구간과 대부분 겹치면 제외
+            # (점수 행이 있으면 점수 행 기준, 눈금처럼 문서 전체에 반복되는 줄은 비교에서 제외)
+            lines = body.splitlines()
+            compare = [
+                line for line in lines
+                if _SCORE_ROW_PATTERN.search(line) and line_counts[line] < 3
+            ] or lines
+            overlap = sum(1 for line in compare if line in seen_lines)
+            if overlap >= 0.8 * len(compare):
+                continue
+
+            if tokens > remaining:
+                if remaining < MIN_PARTIAL_TOKENS:
+                    continue
+                body = self._truncate_lines(lines, remaining)
+                if not body:
+                    continue
+                tokens = estimate_tokens(body)
+
+            selected.append((index, body))
+            seen_lines.update(body.splitlines())
+            remaining -= tokens
+
+        return selected
+
+    @staticmethod
+    def _truncate_lines(lines: List[str], token_budget: int) -> str:
+        """예산 안에 들어가는 앞부분 줄만 남김"""
+        kept = []
+        used = 0
+        for line in lines:
+            tokens = estimate_tokens(line)
+            if used + tokens > token_budget:
+                break
+            kept.append(line)
+            used += tokens
+        return "\n".join(kept)
+
+
+# 애플리케이션 전역 텍스트 압축기 (누적 절감량 집계)
+text_compactor = TextCompactor()
@@ -0,0 +1,231 @@
+"""
+업로드 처리 서비스 - 저장, 캐시 조회, 텍스트 추출
+"""
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from app.core.config import settings
+from app.core.metrics import stage_seconds
+from app.core.utils import (
+    generate_unique_filename,
+    save_upload_stream,
+    save_extracted_text,
+    FileTooLargeError
+)
+from app.services.pdf_service import PDFService
+from app.services.extraction_cache import extraction_cache
+
+logger = logging.getLogger(__name__)
+
+
+class UploadService:
+    """PDF 업로드 처리 서비스 (업로드 API와 파이프라인 API가 공유)"""
+
+    def __init__(self):
+        self.pdf_service = PDFService()
+
+    def validate_filename(self, filename: Optional[str]) -> Optional[str]:
+        """
+        업로드 파일 확장자 확인
+
+        Args:
+            filename: 원본 파일명
+
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if not filename or not filename.lower().endswith('.pdf'):
+            return "PDF 파일만 업로드 가능합니다."
+        return None
+
+    def get_size_limit_message(self) -> str:
+        """
+        파일 크기 제한 초과 시 오류 메시지 반환
+
+        Returns:
+            str: 오류 메시지
+        """
+        return f"파일 크기는 {settings.MAX_FILE_SIZE // (1024 * 1024)}MB를 초과할 수 없습니다."
+
+    def get_format_warning(self, format_detected: str) -> Optional[str]:
+        """
+        감지된 형식에 대한 경고 메시지 반환
+
+        Args:
+            format_detected: 감지된 형식
+
+        Returns:
+            Optional[str]: 경고 메시지 (지원 형식이면 None)
+        """
+        if format_detected == "Unknown":
+            return "감지된 형식이 지원 목록에 없습니다. 텍스트 추출은 완료되었으나, 정확한 분석이 어려울 수 있습니다."
+        elif not self.pdf_service.is_supported_format(format_detected):
+            return f"'{format_detected}' 형식은 현재 지원되지 않습니다."
+        return None
+
+    def get_analysis_budget(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        분석용 예산 추출의 문자/페이지 예산 반환
+
+        압축이 켜져 있으면 문자 예산 없이 전체를 추출하고 압축기가 프롬프트에 넣을 구간을 고릅니다.
+        (L형 결과지의 성격 5요인·생활사 점수 페이지는 앞 3000자 뒤에 있음)
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: (char_budget, page_budget) - None이면 제한 없음
+        """
+        char_budget = None if settings.TEXT_COMPACTION_ENABLED else settings.ANALYSIS_CHAR_BUDGET
+        return char_budget, settings.ANALYSIS_PAGE_BUDGET or None
+
+    async def receive_upload(self, upload_file) -> Dict[str, Any]:
+        """
+        업로드 파일을 청크 단위로 읽어 uploads 디렉토리에 저장합니다.
+        (크기 제한과 SHA-256 해시는 읽는 도중에 함께 처리)
+
+        Args:
+            upload_file: 업로드 파일 (FastAPI UploadFile)
+
+        Returns:
+            Dict[str, Any]: 저장 결과 (saved_filename, file_path, file_size, content_hash)
+        """
+        # 고유한 파일명 생성
+        unique_filename = generate_unique_filename(upload_file.filename)
+
+        try:
+            saved = await save_upload_stream(
+                upload_file,
+                unique_filename,
+                max_size=settings.MAX_FILE_SIZE,
+                chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                fsync=settings.FILE_WRITE_FSYNC
+            )
+        except FileTooLargeError:
+            logger.warning(f"Upload rejected (size limit exceeded): {upload_file.filename}")
+            return {
+                "success": False,
+                "error": self.get_size_limit_message()
+            }
+
+        logger.info(f"File saved: {saved['file_path']} ({saved['file_size']} bytes)")
+
+        return {
+            "success": True,
+            "saved_filename": unique_filename,
+            **saved
+        }
+
+    async def process_upload(
+        self,
+        filename: str,
+        upload: Dict[str, Any],
+        char_budget: Optional[int] = None,
+        page_budget: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        저장된 PDF의 텍스트를 추출합니다. (동일 PDF는 추출 캐시 재사용)
+
+        Args:
+            filename: 원본 파일명
+            upload: receive_upload 결과 (저장 경로, 크기, 해시)
+            char_budget: 예산 추출 시 최대 문자 수 (None이면 전체 추출)
+            page_budget: 예산 추출 시 최대 페이지 수 (None이면 제한 없음)
+
+        Returns:
+            Dict[str, Any]: 추출 결과 항목, 콘텐츠 해시, 캐시 적중 여부
+        """
+        content_hash = upload["content_hash"]
+        logger.info(f"Processing PDF file: {filename} ({upload['file_size']} bytes)")
+
+        # 동일한 PDF의 추출 결과가 캐시에 있으면 파싱 없이 반환
+        # (전체 추출 요청에는 일부 페이지만 담긴 항목을 사용하지 않음)
+        budgeted = char_budget is not None or page_budget is not None
+        if settings.EXTRACTION_CACHE_ENABLED:
+            with stage_seconds.time(component="upload_service", stage="cache_lookup"):
+                cached = await extraction_cache.get(content_hash, allow_partial=budgeted)
+            if cached is not None:
+                logger.info(f"Extraction cache hit: {filename} ({content_hash[:12]})")
+
+                # 같은 내용의 사본이 이미 저장되어 있으므로 방금 받은 파일은 삭제
+                if cached["file_path"] != upload["file_path"]:
+                    await asyncio.to_thread(Path(upload["file_path"]).unlink, missing_ok=True)
+
+                return {
+                    "success": True,
+                    "entry": cached,
+                    "content_hash": content_hash,
+                    "cache_hit": True
+                }
+
+        # PDF 텍스트 추출 (저장된 파일을 경로로 전달하여 바이트 복사 없이 처리)
+        result = await self.pdf_service.extract_text_from_pdf(
+            upload["file_path"], char_budget, page_budget
+        )
+
+        if not result["success"]:
+            return {
+                "success": False,
+                "error": result.get("error", "Unknown error"),
+                "content_hash": content_hash,
+                "cache_hit": False
+            }
+
+        # 추출된 텍스트를 파일로 저장
+        with stage_seconds.time(component="upload_service", stage="save_text"):
+            extracted_text_path = await save_extracted_text(result["text"], upload["saved_filename"])
+        logger.info(f"Extracted text save requested: {extracted_text_path}")
+
+        # 캐시 항목 구성 (재업로드 시 그대로 재사용)
+        entry = {
+            "saved_filename": upload["saved_filename"],
+            "file_path": upload["file_path"],
+            "file_size": upload["file_size"],
+            "text": result["text"],
+            "pages": result["pages"],
+            "total_pages": result["metadata"]["total_pages"],
+            "pages_extracted": result["metadata"]["pages_extracted"],
+            "truncated": result["metadata"]["truncated"],
+            "format_detected": result["metadata"]["format_detected"],
+            "extracted_text_path": extracted_text_path
+        }
+
+        if settings.EXTRACTION_CACHE_ENABLED:
+            await extraction_cache.put(content_hash, entry)
+
+        return {
+            "success": True,
+            "entry": entry,
+            "content_hash": content_hash,
+            "cache_hit": False
+        }
+
+    async def complete_extraction(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        """
+        예산 추출로 일부만 읽은 PDF를 전체 추출하여 저장/캐시를 갱신합니다.
+        (응답 이후 백그라운드 작업으로 실행)
+
+        Args:
+            content_hash: PDF 내용의 SHA-256 해시
+            entry: 예산 추출 결과 항목 (저장된 PDF 경로 포함)
+        """
+        result = await self.pdf_service.extract_text_from_pdf(entry["file_path"])
+
+        if not result["success"]:
+            logger.warning(f"백그라운드 전체 추출 실패 ({content_hash[:12]}): {result.get('error')}")
+            return
+
+        # 같은 파일명으로 덮어써서 예산 추출 텍스트를 전체 텍스트로 교체
+        extracted_text_path = await save_extracted_text(result["text"], entry["saved_filename"])
+
+        full_entry = {
+            **entry,
+            "text": result["text"],
+            "pages": result["pages"],
+            "pages_extracted": result["metadata"]["pages_extracted"],
+            "truncated": False,
+            "extracted_text_path": extracted_text_path
+        }
+
+        if settings.EXTRACTION_CACHE_ENABLED:
+            await extraction_cache.put(content_hash, full_entry)
+
+        logger.info(f"백그라운드 전체 추출 완료: {entry['saved_filename']} ({result['metadata']['total_pages']} pages)")
@@ -0,0 +1,448 @@
+"""
+벡터 검색 인덱스 - 직업 임베딩의 상위 k개 코사인 유사도 검색
+
+- ExactIndex: 전체 행렬-벡터 곱 (정확, 직업 수에 비례하는 지연)
+- IVFIndex: 구형 k-means로 나눈 클러스터 중 가까운 nprobe개만 검사 (근사, 대규모 직업 목록용)
+
+두 인덱스 모두 같은 인터페이스(build/add/search/save/load)를 제공하며 create_index로 선택합니다.
+save로 저장한 벡터는 load 시 메모리 맵(np.load mmap_mode="r")으로 열기 때문에
+여러 uvicorn 워커가 같은 파일을 열면 OS 페이지 캐시의 한 사본을 공유합니다.
+
+build 이후 add로 추가한 벡터는 메모리의 증분 구간(delta)에 쌓이고 검색 시 정확하게 비교되며,
+max_delta를 넘으면 기존 클러스터 중심을 유지한 채 본 구간에 합칩니다.
+"""
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Type, Union
+import numpy as np
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 대량 행렬 곱을 나누어 계산할 행 수 (클러스터 배정 시 메모리 사용량 제한)
+_ASSIGN_CHUNK_ROWS = 8192
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    유사도 상위 k개 위치 (내림차순)
+
+    Args:
+        scores: 유사도 배열
+        top_k: 반환할 개수
+
+    Returns:
+        np.ndarray: 상위 k개 위치
+    """
+    if top_k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    # 전체 정렬 대신 상위 k개만 분리한 뒤 그 안에서 정렬
+    candidates = np.argpartition(-scores, top_k)[:top_k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class VectorIndex:
+    """벡터 인덱스 공통 구현 (본 구간 + 증분 구간 관리, 저장/로드)"""
+
+    kind = "base"
+
+    def __init__(self, dim: int, max_delta: int = settings.JOB_INDEX_MAX_DELTA):
+        self.dim = dim
+        self.max_delta = max_delta
+        self.base = np.zeros((0, dim), dtype=np.float32)
+        self.delta = np.zeros((0, dim), dtype=np.float32)
+        self.mmapped = False
+        self.merges = 0
+
+    def __len__(self) -> int:
+        return self.base.shape[0] + self.delta.shape[0]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """전체 벡터 (증분 구간이 없으면 본 구간을 복사 없이 반환)"""
+        if not len(self.delta):
+            return self.base
+        return np.vstack([self.base, self.delta])
+
+    def build(self, vectors: np.ndarray) -> None:
+        """
+        벡터 전체로 인덱스를 새로 구성
+
+        Args:
+            vectors: (N, dim) 정규화된 float32 행렬 (행 번호가 검색 결과 인덱스)
+        """
+        self.base = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.delta = np.zeros((0, self.dim), dtype=np.float32)
+        self.mmapped = False
+        self._train()
+
+    def add(self, vectors: np.ndarray) -> None:
+        """
+        벡터 증분 추가 (추가된 행은 기존 행 뒤의 인덱스를 가짐)
+
+        Args:
+            vectors: (M, dim) 정규화된 float32 행렬
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        self.delta = np.vstack([self.delta, vectors])
+
+        if len(self.delta) > self.max_delta:
+            self._merge()
+
+    def reconstruct(self, indices: np.ndarray) -> np.ndarray:
+        """
+        인덱스에 해당하는 벡터 반환
+
+        Args:
+            indices: 행 번호 배열
+
+        Returns:
+            np.ndarray: (len(indices), dim) 벡터
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        base_count = self.base.shape[0]
+        if not len(self.delta) or not len(indices) or indices.max() < base_count:
+            return self.base[indices]
+        return self.vectors[indices]
+
+    def search(self, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        코사인 유사도 상위 k개 검색 (본 구간 + 증분 구간)
+
+        Args:
+            query: 정규화된 검색 벡터 (dim,)
+            top_k: 반환할 개수
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (행 번호, 유사도) - 유사도 내림차순
+        """
+        if len(self) == 0 or top_k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        indices, scores = self._search_base(query, top_k)
+
+        if len(self.delta):
+            delta_scores = self.delta @ query
+            indices = np.concatenate([indices, np.arange(len(self.delta)) + self.base.shape[0]])
+            scores = np.concatenate([scores, delta_scores])
+            order = top_k_indices(scores, top_k)
+            indices, scores = indices[order], scores[order]
+
+        return indices, scores
+
+    def save(self, directory: Union[str, Path], meta: Optional[Dict[str, Any]] = None) -> None:
+        """
+        인덱스를 디렉토리에 저장 (임시 디렉토리에 쓴 뒤 이름 변경으로 원자적 교체)
+
+        여러 워커가 동시에 저장하면 먼저 끝난 워커의 결과를 사용하고 나머지는 버립니다.
+
+        Args:
+            directory: 저장 디렉토리
+            meta: 함께 기록할 부가 정보 (데이터 지문 등)
+        """
+        if len(self.delta):
+            self._merge()
+
+        directory = Path(directory)
+        tmp_dir = directory.with_name(f"{directory.name}.tmp-{os.getpid()}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        try:
+            np.save(tmp_dir / "vectors.npy", self.base)
+            for name, array in self._arrays().items():
+                np.save(tmp_dir / f"{name}.npy", array)
+
+            with open(tmp_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump({
+                    "kind": self.kind,
+                    "count": int(self.base.shape[0]),
+                    "dim": self.dim,
+                    "saved_at": time.time(),
+                    **(meta or {})
+                }, f, ensure_ascii=False)
+
+            os.rename(tmp_dir, directory)
+        except OSError:
+            # 다른 워커가 먼저 저장을 마친 경우
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not (directory / "meta.json").exists():
+                raise
+
+    def load(self, directory: Union[str, Path], mmap: bool = True) -> None:
+        """
+        저장된 인덱스 로드
+
+        Args:
+            directory: 저장 디렉토리
+            mmap: 벡터를 메모리 맵으로 열지 여부 (워커 간 페이지 캐시 공유)
+        """
+        directory = Path(directory)
+        mode = "r" if mmap else None
+
+        self.base = np.load(directory / "vectors.npy", mmap_mode=mode)
+        self.delta = np.zeros((0, self.dim), dtype=np.float32)
+        self.mmapped = mmap
+        self._load_arrays({
+            path.stem: np.load(path, mmap_mode=mode)
+            for path in directory.glob("*.npy") if path.stem != "vectors"
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인덱스 통계 반환
+
+        Returns:
+            Dict[str, Any]: 인덱스 통계
+        """
+        return {
+            "kind": self.kind,
+            "count": len(self),
+            "base_count": int(self.base.shape[0]),
+            "delta_count": int(self.delta.shape[0]),
+            "mmapped": self.mmapped,
+            "merges": self.merges
+        }
+
+    # 인덱스별 구현
+
+    def _train(self) -> None:
+        """본 구간 벡터로 인덱스 구조 구성"""
+
+    def _merge(self) -> None:
+        """증분 구간을 본 구간에 합침"""
+        self.base = np.vstack([self.base, self.delta])
+        self.delta = np.zeros((0, self.dim), dtype=np.float32)
+        self.mmapped = False
+        self.merges += 1
+
+    def _search_base(self, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """저장할 인덱스 구조 배열"""
+        return {}
+
+    def _load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """저장된 인덱스 구조 배열 복원"""
+
+
+class ExactIndex(VectorIndex):
+    """정확 검색 (전체 행렬-벡터 곱 1회)"""
+
+    kind = "exact"
+
+    def _search_base(self, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if not len(self.base):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        scores = self.base @ query
+        order = top_k_indices(scores, top_k)
+        return order, scores[order]
+
+
+class IVFIndex(VectorIndex):
+    """
+    역파일(IVF) 근사 검색
+
+    벡터를 구형 k-means로 nlist개 클러스터에 배정하고, 검색 시 쿼리와 가까운
+    nprobe개 클러스터의 벡터만 비교합니다. 본 구간 벡터는 클러스터 순서로 재배치하여
+    저장하므로 클러스터 하나가 연속된 행 구간(list_offsets)이 되어 복사 없이 곱셈합니다.
+    list_ids는 저장 위치 → 원래 행 번호, positions는 그 역방향입니다.
+    """
+
+    kind = "ivf"
+
+    def __init__(
+        self,
+        dim: int,
+        nlist: int = settings.JOB_INDEX_NLIST,
+        nprobe: int = settings.JOB_INDEX_NPROBE,
+        train_iterations: int = 15,
+        max_delta: int = settings.JOB_INDEX_MAX_DELTA,
+        seed: int = 0
+    ):
+        super().__init__(dim, max_delta)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iterations = train_iterations
+        self.seed = seed
+        self.centroids = np.zeros((0, dim), dtype=np.float32)
+        self.list_ids = np.zeros(0, dtype=np.int64)
+        self.list_offsets = np.zeros(1, dtype=np.int64)
+        self.positions = np.zeros(0, dtype=np.int64)
+        self.train_time_ms = 0.0
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """전체 벡터 (원래 행 순서)"""
+        return np.vstack([self.base[self.positions], self.delta])
+
+    def reconstruct(self, indices: np.ndarray) -> np.ndarray:
+        indices = np.asarray(indices, dtype=np.int64)
+        base_count = self.base.shape[0]
+        in_base = indices < base_count
+        if in_base.all():
+            return self.base[self.positions[indices]]
+
+        rows = np.empty((len(indices), self.dim), dtype=np.float32)
+        rows[in_base] = self.base[self.positions[indices[in_base]]]
+        rows[~in_base] = self.delta[indices[~in_base] - base_count]
+        return rows
+
+    def _train(self) -> None:
+        """구형 k-means로 클러스터 중심을 학습하고 전체 벡터를 배정"""
+        started = time.perf_counter()
+        vectors = self.base
+        count = vectors.shape[0]
+        nlist = self.nlist or max(int(np.sqrt(count)), 1)
+        nlist = min(nlist, max(count, 1))
+        rng = np.random.default_rng(self.seed)
+
+        # 클러스터당 최대 64개 표본으로 학습 (전체 배정은 학습 후 한 번만)
+        sample_size = min(count, 64 * nlist)
+        sample = vectors[rng.choice(count, sample_size, replace=False)] if count else vectors
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy() if count else sample
+
+        for _ in range(self.train_iterations if count else 0):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+
+            # 비어 있는 클러스터는 무작위 표본으로 다시 시작
+            empty = np.bincount(assignment, minlength=nlist) == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        self.centroids = centroids
+        self._layout(vectors, self._assign(vectors))
+        self.train_time_ms = (time.perf_counter() - started) * 1000
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """벡터별 가장 가까운 클러스터 번호 (행을 나누어 계산)"""
+        if not len(self.centroids) or not len(vectors):
+            return np.zeros(len(vectors), dtype=np.int64)
+        return np.concatenate([
+            np.argmax(vectors[start:start + _ASSIGN_CHUNK_ROWS] @ self.centroids.T, axis=1)
+            for start in range(0, len(vectors), _ASSIGN_CHUNK_ROWS)
+        ])
+
+    def _layout(self, vectors: np.ndarray, assignment: np.ndarray) -> None:
+        """원래 순서의 벡터를 클러스터 순서로 재배치"""
+        order = np.argsort(assignment, kind="stable").astype(np.int64)
+        counts = np.bincount(assignment, minlength=len(self.centroids))
+
+        self.base = np.ascontiguousarray(vectors[order], dtype=np.float32)
+        self.list_ids = order
+        self.list_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self._update_positions()
+
+    def _update_positions(self) -> None:
+        """원래 행 번호 → 저장 위치 역매핑 갱신"""
+        self.positions = np.empty(len(self.list_ids), dtype=np.int64)
+        self.positions[self.list_ids] = np.arange(len(self.list_ids))
+
+    def _merge(self) -> None:
+        """증분 구간을 기존 클러스터 중심에 배정하여 본 구간에 합침 (재학습 없음)"""
+        base_count = self.base.shape[0]
+        offsets = self.list_offsets
+        assignment = np.empty(base_count + len(self.delta), dtype=np.int64)
+        for cluster in range(len(self.centroids)):
+            assignment[self.list_ids[offsets[cluster]:offsets[cluster + 1]]] = cluster
+        assignment[base_count:] = self._assign(self.delta)
+
+        vectors = self.vectors
+        self.delta = np.zeros((0, self.dim), dtype=np.float32)
+        self.mmapped = False
+        self.merges += 1
+        self._layout(vectors, assignment)
+
+    def _search_base(self, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if not len(self.base):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = top_k_indices(self.centroids @ query, nprobe)
+        offsets = self.list_offsets
+
+        # 클러스터별 연속 구간을 복사 없이 곱한 뒤 결과만 이어 붙임
+        spans = [(offsets[cluster], offsets[cluster + 1]) for cluster in probes]
+        scores = np.concatenate([self.base[start:end] @ query for start, end in spans])
+        slots = np.concatenate([np.arange(start, end) for start, end in spans])
+        if not len(scores):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        order = top_k_indices(scores, top_k)
+        return self.list_ids[slots[order]], scores[order]
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "centroids": self.centroids,
+            "list_ids": self.list_ids,
+            "list_offsets": self.list_offsets
+        }
+
+    def _load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        # 클러스터 정보는 작으므로 메모리로 읽어 둠
+        self.centroids = np.asarray(arrays["centroids"], dtype=np.float32)
+        self.list_ids = np.asarray(arrays["list_ids"], dtype=np.int64)
+        self.list_offsets = np.asarray(arrays["list_offsets"], dtype=np.int64)
+        self._update_positions()
+
+    def get_stats(self) -> Dict[str, Any]:
+        sizes = np.diff(self.list_offsets)
+        return {
+            **super().get_stats(),
+            "nlist": len(self.centroids),
+            "nprobe": self.nprobe,
+            "avg_list_size": round(float(sizes.mean()), 1) if len(sizes) else 0.0,
+            "max_list_size": int(sizes.max()) if len(sizes) else 0,
+            "train_time_ms": round(self.train_time_ms, 1)
+        }
+
+
+# 사용 가능한 인덱스 종류 (새 인덱스는 VectorIndex를 상속해 등록)
+INDEX_TYPES: Dict[str, Type[VectorIndex]] = {
+    ExactIndex.kind: ExactIndex,
+    IVFIndex.kind: IVFIndex,
+}
+
+
+def resolve_index_kind(kind: str, count: int) -> str:
+    """
+    설정값으로 인덱스 종류 결정 ("auto"는 직업 수에 따라 선택)
+
+    Args:
+        kind: 설정된 인덱스 종류 (exact, ivf, auto)
+        count: 벡터 수
+
+    Returns:
+        str: 인덱스 종류
+    """
+    if kind == "auto":
+        return IVFIndex.kind if count >= settings.JOB_INDEX_IVF_MIN_ROWS else ExactIndex.kind
+    if kind not in INDEX_TYPES:
+        raise ValueError(f"지원하지 않는 인덱스 종류입니다: {kind} (가능: auto, {', '.join(INDEX_TYPES)})")
+    return kind
+
+
+def create_index(kind: str, dim: int, **options) -> VectorIndex:
+    """
+    인덱스 생성
+
+    Args:
+        kind: 인덱스 종류 (exact, ivf)
+        dim: 벡터 차원
+        **options: 인덱스별 옵션 (nlist, nprobe 등)
+
+    Returns:
+        VectorIndex: 빈 인덱스
+    """
+    return INDEX_TYPES[kind](dim, **options)
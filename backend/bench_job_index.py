@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+직업 검색 인덱스 재현율-지연 벤치마크 (IVF 근사 검색 vs 정확 검색)
+
+Mini-DB(data/jobs.json)의 적성/흥미 문구에 숙련도 변형("고급 ", " 역량" 등)을 붙여
+대규모 직업 목록을 흉내 낸 합성 직업을 만들고, nprobe별 IVF 검색의
+recall@k와 지연을 정확 검색과 비교합니다. 증분 추가와 메모리 맵 로드도 함께 측정합니다.
+
+recall@k는 동점을 고려하여, 반환된 k개 중 정확 검색의 k번째 유사도 이상인 비율로 계산합니다.
+
+사용법:
+    python bench_job_index.py [직업 수] [검색 횟수]
+
+예제:
+    python bench_job_index.py 100000 200
+"""
+
+import sys
+import asyncio
+import json
+import time
+import random
+import shutil
+import tempfile
+import statistics
+import numpy as np
+
+from app.core.config import settings
+from app.services.job_store import JobStore
+from app.services.vector_index import create_index
+
+TOP_K = 10
+NPROBES = [1, 2, 4, 8, 16, 32, 64]
+PREFIXES = ["", "", "기초 ", "고급 ", "실무 ", "전문 "]
+SUFFIXES = ["", "", " 역량", " 스킬", " 능력"]
+
+
+def variant(phrase: str, rng: random.Random) -> str:
+    """숙련도 변형 문구"""
+    return f"{rng.choice(PREFIXES)}{phrase}{rng.choice(SUFFIXES)}"
+
+
+def synthetic_jobs(base_jobs, count: int, rng: random.Random, offset: int = 0):
+    """Mini-DB 문구를 변형/조합한 합성 직업 생성"""
+    aptitudes = sorted({a for job in base_jobs for a in job["required_aptitudes"]})
+    interests = sorted({i for job in base_jobs for i in job["related_interests"]})
+    return [
+        {
+            "job_id": f"syn-{offset + index:06d}",
+            "job_name": f"합성 직업 {offset + index}",
+            "required_aptitudes": [variant(a, rng) for a in rng.sample(aptitudes, 3)],
+            "related_interests": [variant(i, rng) for i in rng.sample(interests, 2)]
+        }
+        for index in range(count)
+    ]
+
+
+def percentile(samples, ratio: float) -> float:
+    """표본 백분위수"""
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * ratio), len(ordered) - 1)]
+
+
+def evaluate(index, queries, truth):
+    """검색 지연(ms)과 동점 고려 recall@k"""
+    samples, hits = [], 0
+    for query, kth_score in zip(queries, truth):
+        started = time.perf_counter()
+        _, scores = index.search(query, TOP_K)
+        samples.append((time.perf_counter() - started) * 1000)
+        hits += int(np.sum(scores >= kth_score - 1e-6))
+    return statistics.median(samples), percentile(samples, 0.95), hits / (len(queries) * TOP_K)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(7)
+
+    with open(settings.JOB_DB_PATH, "r", encoding="utf-8") as f:
+        base_jobs = json.load(f)
+
+    store = JobStore(index_kind="exact", index_dir=None)
+    await store.build(synthetic_jobs(base_jobs, count, rng))
+    vectors = store.index.vectors
+
+    # 실제 Mini-DB 직업 문구(변형 포함)를 프로필로 사용한 검색 벡터
+    queries = [
+        await store.profile_vector({
+            "strengths": [variant(a, rng) for a in job["required_aptitudes"]],
+            "interests": job["related_interests"],
+            "weakness": ""
+        })
+        for job in (base_jobs[i % len(base_jobs)] for i in range(iterations))
+    ]
+
+    exact = create_index("exact", vectors.shape[1])
+    exact.build(vectors)
+    truth = [exact.search(query, TOP_K)[1][-1] for query in queries]
+    exact_p50, exact_p95, _ = evaluate(exact, queries, truth)
+
+    started = time.perf_counter()
+    ivf = create_index("ivf", vectors.shape[1], nlist=settings.JOB_INDEX_NLIST)
+    ivf.build(vectors)
+    build_ms = (time.perf_counter() - started) * 1000
+    stats = ivf.get_stats()
+
+    print(f"직업 {count}개, 검색 {iterations}회, recall@{TOP_K}, 벡터 차원 {vectors.shape[1]}")
+    print(f"IVF 구성 {build_ms:.0f}ms (nlist={stats['nlist']}, 평균 클러스터 크기 {stats['avg_list_size']})")
+    print(f"{'인덱스':>12} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'recall':>7} | {'속도 향상':>8}")
+    print("-" * 58)
+    print(f"{'exact':>12} | {exact_p50:>8.3f} | {exact_p95:>8.3f} | {1.0:>7.3f} | {1.0:>7.1f}x")
+
+    for nprobe in NPROBES:
+        ivf.nprobe = nprobe
+        p50, p95, recall = evaluate(ivf, queries, truth)
+        print(f"{f'ivf/{nprobe}':>12} | {p50:>8.3f} | {p95:>8.3f} | {recall:>7.3f} | {exact_p50 / p50:>7.1f}x")
+
+    # 증분 추가: 5%를 추가하고 정확 검색 기준으로 다시 비교
+    ivf.nprobe = settings.JOB_INDEX_NPROBE
+    # (같은 임베딩 가중치를 쓰도록 정확 검색 저장소에 추가한 뒤 추가분 벡터만 사용)
+    await store.add_jobs(synthetic_jobs(base_jobs, count // 20, rng, offset=count))
+    added = store.index.vectors[count:]
+
+    started = time.perf_counter()
+    for start in range(0, len(added), 100):
+        ivf.add(added[start:start + 100])
+    add_ms = (time.perf_counter() - started) * 1000
+
+    exact.add(added)
+    truth = [exact.search(query, TOP_K)[1][-1] for query in queries]
+    p50, _, recall = evaluate(ivf, queries, truth)
+    stats = ivf.get_stats()
+    print(
+        f"\n증분 추가 {len(added)}개 ({add_ms:.0f}ms, 합치기 {stats['merges']}회, 증분 구간 {stats['delta_count']}개) "
+        f"→ ivf/{ivf.nprobe} p50 {p50:.3f}ms, recall {recall:.3f}"
+    )
+
+    # 저장 후 메모리 맵 로드 (다른 워커가 startup 시 하는 작업)
+    directory = tempfile.mkdtemp()
+    try:
+        ivf.save(f"{directory}/index")
+        started = time.perf_counter()
+        loaded = create_index("ivf", vectors.shape[1], nprobe=ivf.nprobe)
+        loaded.load(f"{directory}/index", mmap=True)
+        load_ms = (time.perf_counter() - started) * 1000
+        p50, _, recall = evaluate(loaded, queries, truth)
+        print(f"메모리 맵 로드 {load_ms:.1f}ms → ivf/{loaded.nprobe} p50 {p50:.3f}ms, recall {recall:.3f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
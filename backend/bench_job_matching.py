@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+직업 매칭 검색 지연 벤치마크 (1k / 10k / 100k 직업)
+
+Mini-DB(data/jobs.json)의 적성/흥미 문구를 무작위로 조합해 합성 직업을 만들고,
+사전 계산된 행렬-벡터 곱 검색과 직업별 반복 계산(기준선)의 지연을 비교합니다.
+
+사용법:
+    python bench_job_matching.py [검색 횟수]
+
+예제:
+    python bench_job_matching.py 200
+"""
+
+import sys
+import asyncio
+import json
+import time
+import random
+import statistics
+import numpy as np
+
+from app.core.config import settings
+from app.services.job_store import JobStore
+
+SIZES = [1_000, 10_000, 100_000]
+TOP_K = 3
+
+
+def synthetic_jobs(base_jobs, count: int, rng: random.Random):
+    """Mini-DB 문구를 조합한 합성 직업 생성"""
+    aptitudes = sorted({a for job in base_jobs for a in job["required_aptitudes"]})
+    interests = sorted({i for job in base_jobs for i in job["related_interests"]})
+    return [
+        {
+            "job_id": f"syn-{index:06d}",
+            "job_name": f"합성 직업 {index}",
+            "required_aptitudes": rng.sample(aptitudes, 3),
+            "related_interests": rng.sample(interests, 2)
+        }
+        for index in range(count)
+    ]
+
+
+def percentile(samples, ratio: float) -> float:
+    """표본 백분위수"""
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * ratio), len(ordered) - 1)]
+
+
+def measure(search, queries, iterations: int):
+    """검색 지연 측정 (ms)"""
+    samples = []
+    for i in range(iterations):
+        query = queries[i % len(queries)]
+        started = time.perf_counter()
+        search(query)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), percentile(samples, 0.95)
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(42)
+
+    with open(settings.JOB_DB_PATH, "r", encoding="utf-8") as f:
+        base_jobs = json.load(f)
+
+    # 실제 Mini-DB 직업의 적성/흥미를 프로필로 사용한 검색 벡터
+    probe = JobStore()
+    queries = [
+        await probe.profile_vector({
+            "strengths": job["required_aptitudes"],
+            "interests": job["related_interests"],
+            "weakness": ""
+        })
+        for job in base_jobs[:50]
+    ]
+
+    print(f"검색 {iterations}회, top_k={TOP_K}, 벡터 차원 {queries[0].shape[0]}")
+    print(f"{'직업 수':>8} | {'구성(ms)':>9} | {'행렬(MB)':>8} | {'행렬 p50':>9} | {'행렬 p95':>9} | {'반복 p50':>9}")
+    print("-" * 70)
+
+    for size in SIZES:
+        store = JobStore(index_kind="exact")
+        await store.build(synthetic_jobs(base_jobs, size, rng))
+
+        matrix_p50, matrix_p95 = measure(lambda q: store.search(q, TOP_K), queries, iterations)
+
+        # 기준선: 직업별로 코사인 유사도를 계산하고 전체 정렬 (검색 횟수를 줄여 측정)
+        rows = list(store.index.vectors)
+
+        def loop_search(query):
+            scores = [float(np.dot(row, query)) for row in rows]
+            return sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:TOP_K]
+
+        loop_p50, _ = measure(loop_search, queries, max(iterations // 50, 3))
+
+        print(
+            f"{size:>8} | {store.build_time_ms:>9.1f} | {store.index.vectors.nbytes / 1e6:>8.2f} | "
+            f"{matrix_p50:>9.4f} | {matrix_p95:>9.4f} | {loop_p50:>9.2f}"
+        )
+
+        # 결과 일치 확인 (행렬 검색 == 반복 계산)
+        indices, _ = store.search(queries[0], TOP_K)
+        assert list(indices) == loop_search(queries[0]), "행렬 검색과 반복 계산 결과가 다릅니다."
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+LLM 클라이언트 호출당 오버헤드 벤치마크 (호출마다 생성 vs 공유 풀)
+
+로컬 스텁 서버(stub_llm_server.py)를 대상으로 실행하므로 API 키나 네트워크가 필요 없습니다.
+
+사용법:
+    python bench_llm_clients.py [호출 횟수]
+
+예제:
+    python bench_llm_clients.py 200
+"""
+
+import sys
+import time
+import asyncio
+import statistics
+import httpx
+from openai import AsyncOpenAI
+from anthropic import AsyncAnthropic
+
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+
+
+PROMPT = "현실형(R): 70점, 탐구형(I): 83점, 예술형(A): 52점"
+
+
+async def per_call_openai(base_url: str):
+    """기존 방식: 호출마다 httpx/AsyncOpenAI 생성 후 종료"""
+    http_client = httpx.AsyncClient()
+    client = AsyncOpenAI(api_key="stub", base_url=f"{base_url}/v1", http_client=http_client)
+    await client.chat.completions.create(
+        model=settings.LLM_MODEL,
+        messages=[{"role": "user", "content": PROMPT}],
+        max_completion_tokens=1000
+    )
+    await http_client.aclose()
+
+
+async def per_call_anthropic(base_url: str):
+    """기존 방식: 호출마다 AsyncAnthropic 생성 (httpx 0.28+ 호환을 위해 http_client 지정)"""
+    http_client = httpx.AsyncClient()
+    client = AsyncAnthropic(api_key="stub", base_url=base_url, http_client=http_client)
+    await client.messages.create(
+        model=settings.LLM_MODEL,
+        max_tokens=1000,
+        messages=[{"role": "user", "content": PROMPT}]
+    )
+    await http_client.aclose()
+
+
+async def measure(label: str, call, iterations: int) -> None:
+    """호출 지연 측정 및 출력"""
+    # 워밍업 (임포트 비용 제외)
+    await call()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"   {label:<28} mean={statistics.mean(samples):7.2f}ms  "
+          f"p50={statistics.median(samples):7.2f}ms  p95={p95:7.2f}ms")
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # 공유 풀이 스텁 서버를 바라보도록 설정
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"{base_url}/v1"
+    settings.ANTHROPIC_BASE_URL = base_url
+    await llm_clients.start()
+
+    llm_service = LLMService()
+
+    print("=" * 80)
+    print(f"LLM 클라이언트 오버헤드 벤치마크 ({iterations}회, 스텁 서버: {base_url})")
+    print("=" * 80)
+
+    print("\n[OpenAI]")
+    await measure("before: 호출마다 생성", lambda: per_call_openai(base_url), iterations)
+    await measure("after: 공유 풀", lambda: llm_service._call_openai(PROMPT, llm_service.model), iterations)
+
+    print("\n[Anthropic]")
+    await measure("before: 호출마다 생성", lambda: per_call_anthropic(base_url), iterations)
+    await measure("after: 공유 풀", lambda: llm_service._call_anthropic(PROMPT, llm_service.model), iterations)
+
+    print("\n※ 스텁 서버는 평문 HTTP이므로 실제 환경에서는 TLS 핸드셰이크 비용만큼 차이가 더 커집니다.")
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,21 +1,51 @@
 """
 FastAPI 백엔드 메인 애플리케이션 (MVC 패턴 적용)
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.controllers import pdf_router, profile_router
+from app.core.middleware import UploadSizeLimitMiddleware, MetricsMiddleware
+from app.core.executor import start_extraction_executor, shutdown_extraction_executor
+from app.core.file_writer import file_writer
+from app.core.metrics import metrics
+from app.services import llm_clients, job_store, analysis_queue, identity_templates
+from app.controllers import pdf_router, profile_router, pipeline_router, job_router, analysis_job_router, metrics_router
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 startup/shutdown 수명주기"""
+    # startup: 공유 리소스 생성
+    await metrics.start()
+    start_extraction_executor()
+    await file_writer.start()
+    await llm_clients.start()
+    await job_store.load()
+    identity_templates.load()
+    await analysis_queue.start()
+
+    yield
+
+    # shutdown: 공유 리소스 정리
+    await analysis_queue.close()
+    await llm_clients.close()
+    await file_writer.close()
+    shutdown_extraction_executor()
+    await metrics.close()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
-    version=settings.APP_VERSION
+    version=settings.APP_VERSION,
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -27,9 +57,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 업로드 요청 본문 크기 제한 (제한을 넘는 업로드는 본문을 끝까지 받기 전에 거절)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.MAX_FILE_SIZE + settings.UPLOAD_BODY_OVERHEAD,
+    paths=["/api/upload-pdf", "/api/upload-and-analyze"]
+)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.BATCH_MAX_BODY_SIZE,
+    paths=["/api/batch-analyze"]
+)
+
+# 요청 메트릭 (가장 바깥에서 처리 중 요청 수와 라우트별 처리 시간 기록)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(pdf_router)
 app.include_router(profile_router)
+app.include_router(pipeline_router)
+app.include_router(job_router)
+app.include_router(analysis_job_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
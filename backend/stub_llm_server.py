@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+"""
+로컬 LLM 스텁 서버 (OpenAI/Anthropic 호환 응답, stream=true 요청은 SSE로 응답)
+
+OpenAI /v1/embeddings 요청에는 입력 문구별로 고정된 의사 난수 벡터를 반환합니다.
+
+제한 초과(429 + Retry-After)와 서버 오류(5xx)를 주입할 수 있어
+호출 제한/재시도 계층을 테스트할 때도 사용합니다. (start_stub_server의 max_concurrent, error_rate,
+server.fail_next 참고)
+형식이 어긋난 응답(항목 수 초과, 코드 펜스 등)은 server.respond_with로 주입합니다.
+Anthropic 요청이 도구 호출을 강제하면(tool_choice) 응답 본문을 tool_use 블록의 입력으로 보냅니다.
+마지막 요청 본문은 server.last_body에 남습니다.
+
+usage에는 프롬프트 캐시를 흉내 낸 캐시 토큰 수를 넣습니다. 시스템 프롬프트가 cache_min_tokens 이상이고
+같은 시스템 프롬프트를 전에 받은 적이 있으면 캐시 적중으로 봅니다. (토큰 수는 글자 수로 근사,
+OpenAI는 자동 캐시, Anthropic은 cache_control 블록이 있을 때만)
+
+벤치마크와 통합 테스트에서 실제 제공자 대신 사용합니다.
+
+사용법:
+    python stub_llm_server.py [포트]
+
+예제:
+    python stub_llm_server.py 9100
+    # .env
+    # OPENAI_API_KEY=stub
+    # OPENAI_BASE_URL=http://127.0.0.1:9100/v1
+    # ANTHROPIC_BASE_URL=http://127.0.0.1:9100
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PROFILE_CONTENT = json.dumps({
+    "strengths": ["논리적 사고력", "문제 해결 능력", "분석력"],
+    "interests": ["IT/기술", "데이터 분석"],
+    "weakness": "대인관계 및 팀워크"
+}, ensure_ascii=False)
+
+CAREER_IDENTITY_CONTENT = json.dumps({
+    "career_identity": "이 사람은 탐구형(I) 성향이 높아 복잡한 문제를 논리적으로 분석하는 일을 선호한다.",
+    "rationale": "- RIASEC 이론: 탐구형(I) 중심의 흥미 패턴"
+}, ensure_ascii=False)
+
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    """OpenAI /v1/chat/completions, /v1/embeddings, Anthropic /v1/messages 스텁 핸들러"""
+
+    # keep-alive 지원 (커넥션 재사용 측정용)
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    # 응답 지연 (초) - 서버 생성 시 설정
+    latency = 0.0
+    # 스트리밍 청크 사이 지연 (초)
+    chunk_delay = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self.server.record_request(self.path, body)
+
+        injected = self.server.enter()
+        self._override = self.server.next_content() if injected is None else None
+        try:
+            if injected is not None:
+                self._send_error(*injected)
+                return
+
+            self._respond(body)
+        finally:
+            self.server.leave(injected is None)
+
+    def _respond(self, body: dict):
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.path.endswith("/chat/completions"):
+            if body.get("stream"):
+                self._send_stream(self._openai_stream_events(body))
+            else:
+                self._send_json(self._openai_response(body))
+        elif self.path.endswith("/embeddings"):
+            self._send_json(self._openai_embeddings(body))
+        elif self.path.endswith("/messages"):
+            if body.get("stream"):
+                self._send_stream(self._anthropic_stream_events(body))
+            else:
+                self._send_json(self._anthropic_response(body))
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 섞이지 않도록 접근 로그 생략
+        pass
+
+    def _content_for(self, body: dict) -> str:
+        """요청 프롬프트에 맞는 응답 본문 선택 (respond_with로 주입한 본문 우선)"""
+        if self._override is not None:
+            return self._override
+        serialized = json.dumps(body, ensure_ascii=False)
+        if "커리어심리" in serialized:
+            return CAREER_IDENTITY_CONTENT
+        return PROFILE_CONTENT
+
+    def _openai_response(self, body: dict) -> dict:
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub-model"),
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": self._content_for(body)}
+            }],
+            "usage": self._openai_usage(body)
+        }
+
+    def _openai_usage(self, body: dict) -> dict:
+        messages = body.get("messages", [])
+        system = "".join(m["content"] for m in messages if m.get("role") == "system")
+        prompt_tokens = sum(len(m["content"]) for m in messages)
+        cached, _ = self.server.prompt_cache("openai", system, enabled=True, increment=128)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": 50,
+            "total_tokens": prompt_tokens + 50,
+            "prompt_tokens_details": {"cached_tokens": cached}
+        }
+
+    def _openai_embeddings(self, body: dict) -> dict:
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = body.get("dimensions") or 1536
+
+        data = []
+        for index, text in enumerate(inputs):
+            # 같은 문구는 항상 같은 벡터
+            rng = random.Random(hashlib.sha256(str(text).encode("utf-8")).digest())
+            data.append({
+                "object": "embedding",
+                "index": index,
+                "embedding": [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+            })
+
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "stub-embedding"),
+            "usage": {"prompt_tokens": 4 * len(inputs), "total_tokens": 4 * len(inputs)}
+        }
+
+    def _anthropic_tool(self, body: dict):
+        """강제 호출할 도구 이름 (없으면 None)"""
+        choice = body.get("tool_choice") or {}
+        return choice.get("name") if choice.get("type") == "tool" else None
+
+    def _anthropic_response(self, body: dict) -> dict:
+        content = self._content_for(body)
+        tool = self._anthropic_tool(body)
+        block = {"type": "text", "text": content}
+        if tool:
+            try:
+                block = {"type": "tool_use", "id": "toolu_stub", "name": tool, "input": json.loads(content)}
+            except json.JSONDecodeError:
+                pass
+
+        return {
+            "id": "msg_stub",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stub-model"),
+            "content": [block],
+            "stop_reason": "tool_use" if block["type"] == "tool_use" else "end_turn",
+            "stop_sequence": None,
+            "usage": self._anthropic_usage(body)
+        }
+
+    def _anthropic_usage(self, body: dict) -> dict:
+        system = body.get("system") or ""
+        blocks = system if isinstance(system, list) else [{"type": "text", "text": system}]
+        system_text = "".join(block.get("text", "") for block in blocks)
+        cacheable = any("cache_control" in block for block in blocks)
+        user_tokens = sum(len(m["content"]) if isinstance(m["content"], str) else 0 for m in body.get("messages", []))
+
+        cached, written = self.server.prompt_cache("anthropic", system_text, enabled=cacheable, report_writes=True)
+        return {
+            "input_tokens": len(system_text) + user_tokens - cached - written,
+            "output_tokens": 50,
+            "cache_read_input_tokens": cached,
+            "cache_creation_input_tokens": written
+        }
+
+    def _content_chunks(self, body: dict, size: int = 8) -> list[str]:
+        """응답 본문을 토큰 스트림처럼 잘게 분할"""
+        content = self._content_for(body)
+        return [content[i:i + size] for i in range(0, len(content), size)]
+
+    def _openai_stream_events(self, body: dict):
+        """OpenAI chat.completion.chunk SSE 이벤트 생성"""
+        base = {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "stub-model")
+        }
+
+        for piece in self._content_chunks(body):
+            yield None, {**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+
+        yield None, {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        if (body.get("stream_options") or {}).get("include_usage"):
+            yield None, {**base, "choices": [], "usage": self._openai_usage(body)}
+        yield None, "[DONE]"
+
+    def _anthropic_stream_events(self, body: dict):
+        """Anthropic Messages 스트리밍 SSE 이벤트 생성"""
+        message = self._anthropic_response(body)
+        message["content"] = []
+        message["stop_reason"] = None
+
+        tool = self._anthropic_tool(body)
+        if tool:
+            block = {"type": "tool_use", "id": "toolu_stub", "name": tool, "input": {}}
+        else:
+            block = {"type": "text", "text": ""}
+
+        yield "message_start", {"type": "message_start", "message": message}
+        yield "content_block_start", {"type": "content_block_start", "index": 0, "content_block": block}
+
+        for piece in self._content_chunks(body):
+            if tool:
+                delta = {"type": "input_json_delta", "partial_json": piece}
+            else:
+                delta = {"type": "text_delta", "text": piece}
+            yield "content_block_delta", {"type": "content_block_delta", "index": 0, "delta": delta}
+
+        yield "content_block_stop", {"type": "content_block_stop", "index": 0}
+        yield "message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None}, "usage": {"output_tokens": 50}}
+        yield "message_stop", {"type": "message_stop"}
+
+    def _send_stream(self, events):
+        """SSE 이벤트를 chunked 인코딩으로 전송"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            for event, data in events:
+                payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+                frame = (f"event: {event}\n" if event else "") + f"data: {payload}\n\n"
+                encoded = frame.encode("utf-8")
+                self.wfile.write(f"{len(encoded):X}\r\n".encode() + encoded + b"\r\n")
+
+                if self.chunk_delay:
+                    time.sleep(self.chunk_delay)
+
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 스트림을 중간에 닫음
+            self.server.record_cancel()
+            self.close_connection = True
+
+    def _send_error(self, status: int, retry_after: float):
+        """주입된 오류 응답 (OpenAI/Anthropic 오류 형식 공통)"""
+        error_type = "rate_limit_error" if status == 429 else "api_error"
+        headers = {"Retry-After": f"{retry_after:g}"} if retry_after else {}
+        self._send_json(
+            {"type": "error", "error": {"type": error_type, "message": f"stub injected {status}"}},
+            status=status,
+            headers=headers
+        )
+
+    def _send_json(self, data: dict, status: int = 200, headers: dict = None):
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    경로별 요청 수를 세는 스텁 서버 (중복 호출 제거 등 테스트 확인용)
+
+    제공자 제한을 흉내 내도록 오류를 주입할 수 있습니다.
+    - max_concurrent: 동시에 처리 중인 요청이 이보다 많으면 429 + Retry-After
+    - error_rate: 이 확률로 503 응답
+    - fail_next(count, status): 다음 count개 요청을 status로 실패
+    - respond_with(content, count): 다음 count개 요청에 지정한 본문으로 응답
+    """
+
+    max_concurrent = 0  # 0이면 제한 없음
+    error_rate = 0.0
+    retry_after = 0.0  # 429/503 응답의 Retry-After (초, 0이면 헤더 없음)
+    cache_min_tokens = 1024  # 프롬프트 캐시 최소 prefix 길이
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request_counts = {}
+        self.active = 0
+        self.max_active = 0  # 정상 처리한 요청의 최대 동시 수
+        self.throttled = 0
+        self.errors = 0
+        self._forced = []
+        self._contents = []
+        self.last_body = None
+        self.cancelled_streams = 0  # 클라이언트가 중간에 닫은 스트림 수
+        self._cached_prefixes = set()
+        self._count_lock = threading.Lock()
+
+    def record_request(self, path: str, body: dict = None) -> None:
+        with self._count_lock:
+            self.request_counts[path] = self.request_counts.get(path, 0) + 1
+            self.last_body = body
+
+    def fail_next(self, count: int, status: int = 503) -> None:
+        """다음 count개 요청을 status 오류로 응답"""
+        with self._count_lock:
+            self._forced.extend([status] * count)
+
+    def respond_with(self, content: str, count: int = 1) -> None:
+        """다음 count개 요청에 content를 응답 본문으로 사용"""
+        with self._count_lock:
+            self._contents.extend([content] * count)
+
+    def next_content(self):
+        """주입된 응답 본문 (없으면 None)"""
+        with self._count_lock:
+            return self._contents.pop(0) if self._contents else None
+
+    def record_cancel(self) -> None:
+        with self._count_lock:
+            self.cancelled_streams += 1
+
+    def enter(self):
+        """
+        요청 처리 시작 (주입할 오류가 있으면 (상태 코드, Retry-After) 반환)
+        """
+        with self._count_lock:
+            if self._forced:
+                status = self._forced.pop(0)
+                self.errors += 1
+                return status, self.retry_after
+            if self.max_concurrent and self.active >= self.max_concurrent:
+                self.throttled += 1
+                return 429, self.retry_after
+            if self.error_rate and random.random() < self.error_rate:
+                self.errors += 1
+                return 503, self.retry_after
+
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            return None
+
+    def prompt_cache(self, provider: str, prefix: str, enabled: bool, increment: int = 1, report_writes: bool = False):
+        """
+        프롬프트 캐시 흉내 (캐시 읽기 토큰 수, 캐시 쓰기 토큰 수) 반환
+
+        Args:
+            provider: 제공자 (캐시는 제공자별로 따로)
+            prefix: 캐시 대상 prefix (시스템 프롬프트)
+            enabled: 캐시 대상 여부 (Anthropic은 cache_control 블록 유무)
+            increment: 캐시 토큰 단위 (OpenAI는 128토큰 단위)
+            report_writes: 처음 캐시할 때 쓰기 토큰 수 보고 (Anthropic)
+        """
+        tokens = len(prefix)
+        if not enabled or tokens < self.cache_min_tokens:
+            return 0, 0
+
+        with self._count_lock:
+            if (provider, prefix) in self._cached_prefixes:
+                return tokens // increment * increment, 0
+            self._cached_prefixes.add((provider, prefix))
+            return 0, (tokens if report_writes else 0)
+
+    def leave(self, admitted: bool) -> None:
+        if admitted:
+            with self._count_lock:
+                self.active -= 1
+
+    @property
+    def request_count(self) -> int:
+        """전체 요청 수"""
+        with self._count_lock:
+            return sum(self.request_counts.values())
+
+
+def start_stub_server(
+    port: int = 0,
+    latency: float = 0.0,
+    chunk_delay: float = 0.0,
+    max_concurrent: int = 0,
+    error_rate: float = 0.0,
+    retry_after: float = 0.0,
+    cache_min_tokens: int = 1024
+) -> StubServer:
+    """
+    스텁 서버를 백그라운드 스레드에서 시작
+
+    Args:
+        port: 포트 번호 (0이면 임의 포트)
+        latency: 응답마다 추가할 지연 (초)
+        chunk_delay: 스트리밍 청크 사이 지연 (초)
+        max_concurrent: 동시 처리 한도 (초과 요청은 429, 0이면 제한 없음)
+        error_rate: 503 응답 확률
+        retry_after: 429/503 응답의 Retry-After (초)
+        cache_min_tokens: 프롬프트 캐시 최소 prefix 길이 (글자 수)
+
+    Returns:
+        StubServer: 실행 중인 서버 (server.server_address로 포트, server.request_count로 요청 수 확인)
+    """
+    handler = type(
+        "ConfiguredStubLLMHandler",
+        (StubLLMHandler,),
+        {"latency": latency, "chunk_delay": chunk_delay}
+    )
+    server = StubServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.max_concurrent = max_concurrent
+    server.error_rate = error_rate
+    server.retry_after = retry_after
+    server.cache_min_tokens = cache_min_tokens
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9100
+    server = StubServer(("127.0.0.1", port), StubLLMHandler)
+    print(f"🧪 LLM 스텁 서버 실행 중: http://127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
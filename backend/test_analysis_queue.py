@@ -0,0 +1,130 @@
+"""
+분석 작업 큐 테스트 (제출/long-poll, 워커 풀 동시 실행, 대기열 제한, 워커 간 공유, 멈춘 작업 복구)
+
+응답마다 지연을 주는 로컬 스텁 LLM 서버를 대상으로, 임시 SQLite 작업 테이블을 사용합니다.
+
+사용법:
+    python test_analysis_queue.py [작업 수] [LLM 지연(초)]
+"""
+import sys
+import time
+import asyncio
+import tempfile
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.analysis_queue import AnalysisJobQueue
+
+PROFILE_PAYLOAD = {"text": "직업선호도검사 L형 결과", "format_detected": "직업선호도검사 (L형)", "use_cache": False}
+CAREER_PAYLOAD = {
+    "riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78},
+    "big5_scores": {"성실성": {"score": 88, "subFactors": {"책임감": 92}}},
+    "life_history_scores": {"기술/IT 경험": 85},
+    "use_cache": False
+}
+
+
+async def test_throughput(db_path: str, count: int, latency: float) -> None:
+    """작업 제출은 즉시 반환되고, 워커 수만큼 동시에 실행되는지 확인"""
+    queue = AnalysisJobQueue(db_path=db_path, workers=4)
+    await queue.start()
+
+    started = time.perf_counter()
+    submitted = [await queue.submit("profile" if i % 2 else "career_identity",
+                                    PROFILE_PAYLOAD if i % 2 else CAREER_PAYLOAD) for i in range(count)]
+    submit_ms = (time.perf_counter() - started) * 1000 / count
+
+    jobs = await asyncio.gather(*(queue.wait(s["job"]["job_id"], timeout=30) for s in submitted))
+    elapsed = time.perf_counter() - started
+    stats = await queue.get_stats()
+
+    print(f"{'✅' if submit_ms < latency * 1000 / 10 else '❌'} 제출 지연: {submit_ms:.1f}ms/건 (LLM 지연 {latency * 1000:.0f}ms)")
+    print(
+        f"{'✅' if all(job['status'] == 'succeeded' for job in jobs) else '❌'} {count}개 완료: {elapsed:.2f}s "
+        f"(워커 4개 이론값 {count / 4 * latency:.2f}s)"
+    )
+    print(f"   대기 시간 {stats['wait_time_ms']}, 실행 시간 {stats['run_time_ms']}")
+    print(f"   결과 예시: {jobs[1]['result']['profile']}")
+    await queue.close()
+
+
+async def test_backpressure(db_path: str) -> None:
+    """대기열이 가득 차면 제출을 거절하는지 확인 (워커 없이 제출만)"""
+    queue = AnalysisJobQueue(db_path=db_path, max_depth=3)
+    results = [await queue.submit("profile", PROFILE_PAYLOAD) for _ in range(4)]
+    positions = [result["job"]["queue_position"] for result in results if result["success"]]
+    print(f"\n{'✅' if positions == [1, 2, 3] and not results[3]['success'] else '❌'} 대기열 순서 {positions}, 4번째: {results[3].get('error')}")
+
+
+async def test_shared_table(db_path: str) -> None:
+    """다른 워커 프로세스(같은 DB를 쓰는 다른 큐)가 대기 작업을 이어받는지 확인"""
+    other_worker = AnalysisJobQueue(db_path=db_path, workers=2, poll_interval=0.1)
+    other_worker.worker_id = "other-process"
+    await other_worker.start()
+
+    # test_backpressure가 남긴 대기 작업 3개
+    submitter = AnalysisJobQueue(db_path=db_path, poll_interval=0.1)
+    started = time.perf_counter()
+    while time.perf_counter() - started < 10:
+        by_status = (await submitter.get_stats())["jobs_by_status"]
+        if by_status["queued"] == by_status["running"] == 0:
+            break
+        await asyncio.sleep(0.1)
+    print(f"{'✅' if by_status['succeeded'] == 3 else '❌'} 다른 워커가 대기 작업 처리: {by_status}")
+    await other_worker.close()
+
+
+async def test_recovery(db_path: str, latency: float) -> None:
+    """종료 시 실행 중 작업 반환, 멈춘 작업(프로세스 중단) 복구 확인"""
+    queue = AnalysisJobQueue(db_path=db_path, workers=1, job_timeout=latency / 4)
+    await queue.start()
+    submitted = await queue.submit("profile", PROFILE_PAYLOAD)
+    job_id = submitted["job"]["job_id"]
+    await asyncio.sleep(latency / 8)
+    await queue.close()
+    job = await queue.get(job_id)
+    print(f"\n{'✅' if job['status'] == 'queued' else '❌'} 종료 시 실행 중 작업 반환: {job['status']}")
+
+    # 실행 중 상태로 가져간 뒤 프로세스가 죽은 것처럼 방치 → 제한 시간 2배 이후 복구
+    claimed = queue._claim_sync()
+    await asyncio.sleep(latency / 2 + 0.05)
+    requeued = queue._maintain_sync()
+    job = await queue.get(claimed["job_id"])
+    print(f"{'✅' if requeued == 1 and job['status'] == 'queued' else '❌'} 멈춘 작업 복구: {requeued}개, 상태 {job['status']}, 실행 횟수 {job['attempts']}")
+
+    # 실행 제한 시간 초과는 실패로 기록
+    await queue.start()
+    job = await queue.wait(job_id, timeout=latency * 2)
+    print(f"{'✅' if job['status'] == 'failed' else '❌'} 실행 제한 시간 초과: {job['error']}")
+    await queue.close()
+
+    # 제한 시간 초과로 버려진 LLM 호출(단일 비행은 요청 취소와 무관하게 진행)이 끝난 뒤 클라이언트 종료
+    await asyncio.sleep(latency * 2)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+    server = start_stub_server(latency=latency)
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    await llm_clients.start()
+
+    print("=" * 80)
+    print(f"분석 작업 큐 테스트 (작업 {count}개, LLM 지연 {latency}s)")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        await test_throughput(f"{directory}/throughput.sqlite3", count, latency)
+        await test_backpressure(f"{directory}/shared.sqlite3")
+        await test_shared_table(f"{directory}/shared.sqlite3")
+        await test_recovery(f"{directory}/recovery.sqlite3", latency)
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
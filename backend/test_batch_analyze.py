@@ -0,0 +1,129 @@
+"""
+일괄 분석 테스트 (여러 PDF/ZIP 업로드, 동시 분석 수별 처리량, 파일별 오류 격리)
+
+샘플 PDF(직업심리검사(L형).pdf) 끝에 서로 다른 주석을 붙여 내용 해시가 다른 사본을 만들고,
+응답마다 지연을 주는 로컬 스텁 LLM 서버를 대상으로 분석합니다.
+
+사용법:
+    python test_batch_analyze.py [사본 수] [LLM 지연(초)]
+"""
+import io
+import os
+import sys
+import asyncio
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+from starlette.datastructures import UploadFile
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.core.executor import start_extraction_executor, shutdown_extraction_executor
+from app.core.file_writer import file_writer
+from app.services.llm_clients import llm_clients
+from app.services.batch_service import BatchService
+
+SAMPLE_PDF = Path(__file__).resolve().parent.parent / "직업심리검사(L형).pdf"
+
+
+def make_copies(count: int, tag: str) -> list:
+    """내용 해시가 서로 다른 샘플 PDF 사본 (PDF 뒤 주석은 파싱에 영향 없음)"""
+    data = SAMPLE_PDF.read_bytes()
+    return [(f"student_{index:03d}.pdf", data + f"\n% {tag}-{index}\n".encode()) for index in range(count)]
+
+
+def as_uploads(files: list) -> list:
+    """(파일명, 바이트) 목록을 UploadFile 목록으로 변환"""
+    return [UploadFile(file=io.BytesIO(data), filename=name) for name, data in files]
+
+
+class CP949ZipInfo(zipfile.ZipInfo):
+    """UTF-8 플래그 없이 cp949로 파일명을 기록하는 ZIP 항목 (한국어 Windows 압축 프로그램 방식)"""
+
+    def _encodeFilenameFlags(self):
+        return self.filename.encode("cp949"), self.flag_bits
+
+
+def make_zip(files: list) -> bytes:
+    """cp949 파일명 ZIP 생성"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in files:
+            archive.writestr(CP949ZipInfo(name), data)
+    return buffer.getvalue()
+
+
+async def run_batch(service: BatchService, uploads: list, concurrency: int) -> tuple:
+    """일괄 분석 실행 후 (파일별 결과, 요약) 반환"""
+    received = await service.receive_files(uploads)
+    assert received["success"], received
+    results = []
+    async for line in service.analyze(received["items"], concurrency, use_cache=False):
+        results.append(line)
+    return results[:-1], results[-1]
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    # uploads/extracted 등 상대 경로 디렉토리는 임시 작업 디렉토리에 생성
+    work_dir = tempfile.mkdtemp()
+    os.chdir(work_dir)
+
+    server = start_stub_server(latency=latency)
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    start_extraction_executor()
+    await file_writer.start()
+    await llm_clients.start()
+    service = BatchService()
+
+    print("=" * 80)
+    print(f"일괄 분석 테스트 (PDF {count}개, LLM 지연 {latency}s)")
+    print("=" * 80)
+
+    # 1. 동시 분석 수별 처리량 (사본마다 해시가 달라 추출 캐시 미적중)
+    for concurrency in (1, 8):
+        results, summary = await run_batch(service, as_uploads(make_copies(count, f"c{concurrency}")), concurrency)
+        order = [result["index"] for result in results]
+        print(
+            f"{'✅' if summary['succeeded'] == count else '❌'} concurrency={concurrency}: "
+            f"{summary['elapsed_seconds']}s, {summary['files_per_second']}개/초 "
+            f"(평균 추출 {summary['avg_extract_ms']}ms, 평균 분석 {summary['avg_analyze_ms']}ms, 완료 순서 {order[:6]}...)"
+        )
+
+    # 2. ZIP (cp949 파일명, PDF가 아닌 파일, 손상된 PDF) + 개별 PDF 혼합
+    files = make_copies(3, "zip")
+    zip_bytes = make_zip([(f"2학년/학생{index}.pdf", data) for index, (_, data) in enumerate(files)] + [
+        ("2학년/안내문.txt", "PDF 아님".encode()),
+        ("2학년/손상됨.pdf", b"%PDF-1.4 broken")
+    ])
+    uploads = as_uploads([("students.zip", zip_bytes), ("memo.docx", b"x")] + make_copies(1, "single"))
+    results, summary = await run_batch(service, uploads, 4)
+
+    names = sorted(result["filename"] for result in results)
+    print(f"\n{'✅' if '2학년/학생0.pdf' in names else '❌'} ZIP 파일명 복원: {names}")
+    print(f"{'✅' if '2학년/안내문.txt' not in names else '❌'} ZIP 안의 PDF가 아닌 파일은 건너뜀")
+    print(
+        f"{'✅' if summary['failures_by_stage'] == {'upload': 1, 'extraction': 1} else '❌'} "
+        f"파일별 오류 격리: 성공 {summary['succeeded']}개, 단계별 실패 {summary['failures_by_stage']}"
+    )
+
+    # 3. PDF 수 제한
+    settings.BATCH_MAX_FILES = 2
+    received = await service.receive_files(as_uploads([("big.zip", zip_bytes)]))
+    print(f"{'✅' if not received['success'] else '❌'} 최대 PDF 수 초과 거절: {received.get('error')}")
+
+    await llm_clients.close()
+    await file_writer.close()
+    shutdown_extraction_executor()
+    server.shutdown()
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+직업정체성 스트리밍 분석 테스트 (로컬 스텁 스트리밍 서버 사용)
+
+사용법:
+    python test_career_identity_stream.py
+"""
+import asyncio
+import time
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+
+
+TEST_DATA = {
+    "riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78},
+    "big5_scores": {"성실성": {"score": 88, "subFactors": {"책임감": 92}}},
+    "life_history_scores": {"기술/IT 경험": 85}
+}
+
+
+async def run_stream(provider: str) -> None:
+    """제공자별 스트리밍 호출 후 첫 바이트 시간과 전체 시간 출력"""
+    llm_service = LLMService()
+    llm_service.provider = provider
+
+    start = time.perf_counter()
+    first_delta = None
+    deltas = 0
+    result = None
+
+    async for event in llm_service.stream_career_identity(TEST_DATA, use_cache=False):
+        if event["event"] == "delta":
+            deltas += 1
+            if first_delta is None:
+                first_delta = time.perf_counter() - start
+        else:
+            result = event
+
+    total = time.perf_counter() - start
+
+    print(f"\n[{provider}]")
+    print(f"   - delta 이벤트: {deltas}개")
+    print(f"   - 첫 delta까지: {first_delta * 1000:.1f}ms" if first_delta else "   - 첫 delta 없음")
+    print(f"   - 전체 완료: {total * 1000:.1f}ms")
+    print(f"   - 마지막 이벤트: {result['event']}")
+
+    if result["event"] == "result":
+        print(f"   - career_identity: {result['data']['career_identity'][:40]}...")
+    else:
+        print(f"   ❌ 실패: {result['data'].get('error')}")
+
+
+async def main():
+    # 청크마다 20ms 지연을 주어 토큰 생성 속도를 흉내냄
+    server = start_stub_server(chunk_delay=0.02)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"{base_url}/v1"
+    settings.ANTHROPIC_BASE_URL = base_url
+
+    print("=" * 80)
+    print("직업정체성 스트리밍 테스트")
+    print("=" * 80)
+
+    await run_stream("openai")
+    await run_stream("anthropic")
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""
+임베딩 백엔드 테스트 (로컬 해싱 임베딩 유사도/지연, 원격 임베딩 문구 캐시)
+
+원격 백엔드는 로컬 스텁 서버(stub_llm_server.py)를 대상으로 실행하므로 API 키나 네트워크가 필요 없습니다.
+
+사용법:
+    python test_embedder.py
+"""
+import asyncio
+import tempfile
+import time
+import numpy as np
+
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.embedder import HashingEmbedder, OpenAIEmbedder, EmbeddingCache
+from app.services.job_store import JobStore
+
+PROFILE = {
+    "strengths": ["논리적 사고력", "문제 해결 능력", "분석력"],
+    "interests": ["IT/기술", "데이터 분석"],
+    "weakness": "대인관계 능력 부족"
+}
+
+# (문구 A, 문구 B, A-B 유사도가 A-C보다 높아야 하는 문구 C)
+SIMILARITY_CASES = [
+    ("논리적 사고력", "논리력", "수리 능력"),
+    ("의사소통 능력", "의사소통", "문제 해결 능력"),
+    ("데이터 분석", "데이터 분석가", "예술/디자인"),
+]
+
+
+async def test_local_embedder():
+    """로컬 임베딩: 표현이 다른 같은 적성이 흔한 접미어("능력")만 같은 문구보다 가까운지, 지연 확인"""
+    store = JobStore(index_dir=None)
+    await store.load()
+    embedder = store.embedder
+
+    print("=" * 80)
+    print(f"로컬 임베딩 (문자 n-gram 해싱 + TF-IDF, dim={embedder.dim}, 학습 문구 {embedder.fitted_documents}개)")
+    print("=" * 80)
+
+    for a, b, c in SIMILARITY_CASES:
+        vectors = await embedder.embed([a, b, c])
+        ab, ac = float(vectors[0] @ vectors[1]), float(vectors[0] @ vectors[2])
+        print(f"{'✅' if ab > ac else '❌'} {a} ↔ {b}: {ab:.3f} / {a} ↔ {c}: {ac:.3f}")
+
+    phrases = PROFILE["strengths"] + PROFILE["interests"] + [PROFILE["weakness"]]
+    iterations = 2000
+    started = time.perf_counter()
+    for _ in range(iterations):
+        embedder.embed_sync(phrases)
+    elapsed_us = (time.perf_counter() - started) * 1e6 / iterations
+    print(f"\n프로필 문구 {len(phrases)}개 임베딩: {elapsed_us:.1f}µs/회")
+
+    result = await store.recommend(PROFILE, 3)
+    print(f"추천: {[job['job_name'] for job in result['recommendations']]} "
+          f"(임베딩 {result['embed_time_ms']:.3f}ms, 검색 {result['search_time_ms']:.3f}ms)")
+
+
+async def test_zero_weight():
+    """가중치 0인 블록은 매칭에서 제외되고 항목별 유사도는 0, 음수/합 0 가중치는 생성 시 거절"""
+    print("\n" + "=" * 80)
+    print("직업 추천 가중치")
+    print("=" * 80)
+
+    store = JobStore(aptitude_weight=1.0, interest_weight=0.0, index_dir=None)
+    await store.load()
+    result = await store.recommend(PROFILE, 3)
+    recommendations = result["recommendations"]
+    print(
+        f"{'✅' if result['success'] and all(job['interest_score'] == 0 and job['aptitude_score'] == job['score'] for job in recommendations) else '❌'} "
+        f"흥미 가중치 0: {[(job['job_name'], job['aptitude_score'], job['interest_score']) for job in recommendations]}"
+    )
+
+    rejected = []
+    for aptitude, interest in ((-0.1, 1.0), (0.0, 0.0)):
+        try:
+            JobStore(aptitude_weight=aptitude, interest_weight=interest, index_dir=None)
+        except ValueError:
+            rejected.append((aptitude, interest))
+    print(f"{'✅' if len(rejected) == 2 else '❌'} 음수/합 0 가중치 거절: {rejected}")
+
+
+async def test_remote_embedder():
+    """원격 임베딩: 같은 문구는 두 번째부터 캐시에서 반환되어 API 호출이 없는지 확인"""
+    server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    print("\n" + "=" * 80)
+    print("원격 임베딩 (스텁 서버) + 문구 캐시")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = f"{directory}/embedding_cache.sqlite3"
+        embedder = OpenAIEmbedder(cache=EmbeddingCache(db_path=cache_path))
+        phrases = PROFILE["strengths"] + PROFILE["interests"]
+
+        first = await embedder.embed(phrases)
+        calls_after_first = embedder.api_calls
+        second = await embedder.embed(phrases + ["  논리적   사고력 "])
+        print(f"{'✅' if embedder.api_calls == calls_after_first == 1 else '❌'} "
+              f"API 호출: 첫 요청 {calls_after_first}회, 반복 요청 {embedder.api_calls - calls_after_first}회")
+        print(f"{'✅' if np.allclose(first, second[:len(phrases)]) else '❌'} 캐시 벡터 = API 벡터")
+        print(f"{'✅' if np.allclose(second[0], second[-1]) else '❌'} 공백만 다른 문구는 같은 캐시 항목 사용")
+
+        # 다른 워커(새 프로세스 메모리)에서도 SQLite 계층으로 재사용
+        other_worker = OpenAIEmbedder(cache=EmbeddingCache(db_path=cache_path))
+        await other_worker.embed(phrases)
+        stats = other_worker.cache.get_stats()
+        print(f"{'✅' if other_worker.api_calls == 0 else '❌'} 다른 워커: API 호출 {other_worker.api_calls}회, "
+              f"디스크 적중 {stats['disk_hits']}개")
+        print(f"\n통계: {embedder.get_stats()}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_local_embedder())
+    asyncio.run(test_zero_weight())
+    asyncio.run(test_remote_embedder())
@@ -0,0 +1,76 @@
+"""
+추출 프로세스 풀 복구 테스트 (워커 비정상 종료 후 풀 재시작 및 재시도)
+
+워커 프로세스를 강제로 종료시켜 BrokenProcessPool을 만들고,
+풀이 한 번 다시 만들어진 뒤 작업이 재시도되는지 확인합니다.
+(backend 디렉토리에서 실행 - 샘플 PDF 상대 경로)
+
+사용법:
+    python test_executor_recovery.py
+"""
+import os
+import asyncio
+import tempfile
+from pathlib import Path
+from app.core.config import settings
+from app.core import executor
+from app.services.pdf_service import PDFService
+
+SAMPLE_PDF = Path(__file__).resolve().parent.parent / "직업심리검사(L형).pdf"
+
+
+def crash_once(marker: str) -> dict:
+    """처음 호출되면 워커 프로세스를 강제 종료, 재시도에서는 정상 반환 (워커 프로세스에서 실행)"""
+    if not os.path.exists(marker):
+        Path(marker).touch()
+        os._exit(1)
+    return {"success": True, "pid": os.getpid()}
+
+
+def crash_always() -> dict:
+    """항상 워커 프로세스를 강제 종료 (워커 프로세스에서 실행)"""
+    os._exit(1)
+
+
+async def test_crash_once(directory: str) -> None:
+    """한 번 비정상 종료된 작업은 새 풀에서 재시도되어 성공"""
+    before = executor.get_extraction_executor()
+    result = await PDFService._run_in_executor("crash_once", crash_once, f"{directory}/marker")
+    after = executor.get_extraction_executor()
+
+    print(f"{'✅' if result.get('success') else '❌'} 풀 재시작 후 재시도 성공: {result}")
+    print(f"{'✅' if after is not before else '❌'} 새 프로세스 풀로 교체")
+
+
+async def test_concurrent_crash() -> None:
+    """동시에 실패한 요청들이 풀을 한 번만 다시 만들고, 다시 실패한 요청은 실패 결과, 이후 추출은 정상"""
+    before = executor.get_extraction_executor()
+    results = await asyncio.gather(
+        *(PDFService._run_in_executor("crash_always", crash_always) for _ in range(3)),
+        return_exceptions=True
+    )
+    rebuilt = executor.get_extraction_executor()
+
+    print(f"\n{'✅' if all(type(r).__name__ == 'BrokenProcessPool' for r in results) else '❌'} 재시도도 실패하면 오류 전달: {[type(r).__name__ for r in results]}")
+
+    extracted = await PDFService().extract_text_from_pdf(str(SAMPLE_PDF), page_budget=1)
+    print(f"{'✅' if extracted['success'] and rebuilt is not before else '❌'} 다음 요청은 새 풀에서 정상 추출: {extracted['metadata']['pages_extracted']}페이지")
+
+
+async def main():
+    settings.PDF_EXTRACTION_WORKERS = 2
+    executor.start_extraction_executor()
+
+    print("=" * 80)
+    print("추출 프로세스 풀 복구 테스트")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        await test_crash_once(directory)
+        await test_concurrent_crash()
+
+    executor.shutdown_extraction_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+추출 결과 캐시 테스트 (메모리 LRU 제거, 디스크 계층 조회, 일부/전체 추출 항목 구분, 적중/미스 통계)
+
+임시 디렉토리를 디스크 계층으로 사용합니다.
+
+사용법:
+    python test_extraction_cache.py
+"""
+import asyncio
+import tempfile
+from pathlib import Path
+from app.services.extraction_cache import ExtractionCache
+
+
+def make_entry(name: str, truncated: bool = False) -> dict:
+    """추출 결과 항목 (예산 추출이면 truncated=True)"""
+    return {"saved_filename": f"{name}.pdf", "text": f"{name} 본문", "pages_extracted": 2 if truncated else 8, "truncated": truncated}
+
+
+async def test_lru(directory: str) -> None:
+    """메모리 계층이 가득 차면 가장 오래 쓰지 않은 항목을 빼고, 뺀 항목은 디스크에서 다시 읽음"""
+    cache = ExtractionCache(max_entries=2, cache_dir=directory)
+    await cache.put("a", make_entry("a"))
+    await cache.put("b", make_entry("b"))
+    await cache.get("a")  # a를 최근 사용으로 → 다음 저장 시 b가 빠짐
+    await cache.put("c", make_entry("c"))
+
+    print(f"{'✅' if list(cache._memory) == ['a', 'c'] else '❌'} LRU 제거: 메모리 {list(cache._memory)} (b 제거)")
+
+    entry = await cache.get("b")
+    stats = cache.get_stats()
+    print(f"{'✅' if entry and entry['text'] == 'b 본문' and stats['disk_hits'] == 1 else '❌'} 제거된 항목은 디스크 계층에서 조회: disk_hits {stats['disk_hits']}")
+    print(f"{'✅' if list(cache._memory) == ['c', 'b'] and stats['memory_entries'] == 2 else '❌'} 디스크 적중 항목은 메모리로 다시 올림: {list(cache._memory)}")
+
+
+async def test_disk_tier(directory: str) -> None:
+    """다른 워커(새 캐시 인스턴스)는 디스크 계층에서 찾고, 깨진 파일은 미스로 처리"""
+    other = ExtractionCache(max_entries=2, cache_dir=directory)
+    entry = await other.get("a")
+    print(f"\n{'✅' if entry and other.get_stats()['disk_hits'] == 1 else '❌'} 새 인스턴스의 디스크 계층 조회: {entry and entry['saved_filename']}")
+
+    (Path(directory) / "broken.json").write_text("{깨진", encoding="utf-8")
+    missing = await other.get("broken")
+    unknown = await other.get("없는 해시")
+    print(f"{'✅' if missing is None and unknown is None and other.get_stats()['misses'] == 2 else '❌'} 깨진 파일/없는 해시는 미스: misses {other.get_stats()['misses']}")
+
+
+async def test_partial(directory: str) -> None:
+    """예산 추출(일부 페이지) 항목은 전체 추출 요청에 쓰지 않음"""
+    cache = ExtractionCache(max_entries=4, cache_dir=directory)
+    await cache.put("partial", make_entry("partial", truncated=True))
+
+    full_request = await cache.get("partial", allow_partial=False)
+    budget_request = await cache.get("partial", allow_partial=True)
+    print(f"\n{'✅' if full_request is None and budget_request and budget_request['truncated'] else '❌'} 메모리 계층: 전체 요청 미스, 예산 요청 적중")
+
+    # 디스크 계층에서도 같은 규칙, 전체 추출로 갱신하면 전체 요청도 적중
+    other = ExtractionCache(max_entries=4, cache_dir=directory)
+    disk_full = await other.get("partial", allow_partial=False)
+    await cache.put("partial", make_entry("partial"))
+    updated = await cache.get("partial", allow_partial=False)
+    print(f"{'✅' if disk_full is None and updated and not updated['truncated'] else '❌'} 디스크 계층 일부 항목 제외, 전체 추출로 갱신 후 적중")
+
+    stats = cache.get_stats()
+    print(
+        f"{'✅' if (stats['memory_hits'], stats['disk_hits'], stats['misses']) == (2, 0, 1) and stats['hit_rate'] == 0.6667 else '❌'} "
+        f"통계: 메모리 적중 {stats['memory_hits']}, 디스크 적중 {stats['disk_hits']}, 미스 {stats['misses']}, 적중률 {stats['hit_rate']}"
+    )
+
+
+async def main():
+    print("=" * 80)
+    print("추출 결과 캐시 테스트")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        await test_lru(directory)
+        await test_disk_tier(directory)
+        await test_partial(directory)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+"""
+직업정체성 근사 캐시 테스트 (점수 구간 서명, 허용 거리 안의 최근접 재사용, RIASEC 상위 코드 구획, 워커 간 공유, 구간별 적중률)
+
+로컬 스텁 LLM 서버와 임시 SQLite 캐시를 사용합니다.
+
+사용법:
+    python test_identity_cache.py
+"""
+import copy
+import asyncio
+import tempfile
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services import identity_cache, llm_cache
+from app.services.identity_cache import CareerIdentityCache, score_signature
+
+BASE_INPUT = {
+    "riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78},
+    "big5_scores": {"성실성": {"score": 88, "subFactors": {"책임감": 92}}},
+    "life_history_scores": {"기술/IT 경험": 85}
+}
+
+
+def variant(changes: dict) -> dict:
+    """BASE_INPUT에서 "구역.키" 또는 "구역.키.하위키" 점수만 바꾼(또는 추가한) 입력"""
+    data = copy.deepcopy(BASE_INPUT)
+    for path, value in changes.items():
+        *parents, leaf = path.split(".")
+        target = data
+        for key in parents:
+            target = target[key]
+        target[leaf] = value
+    return data
+
+
+def test_signature() -> None:
+    """같은 구간이면 같은 서명, RIASEC 순위가 바뀌면 다른 구획"""
+    base = score_signature(BASE_INPUT)
+    same_bin = score_signature(variant({"riasec_scores.R": 71}))
+    reordered = score_signature(variant({"riasec_scores.C": 90}))
+    widths = score_signature(variant({"life_history_scores.봉사 경험": 40}), bin_widths={"life_history_scores": 10})
+
+    print(f"{'✅' if base.key == same_bin.key else '❌'} 같은 구간(70→71) 같은 서명: {base.rank_code} {base.bins.tolist()}")
+    print(f"{'✅' if reordered.rank_code == 'CIR' and reordered.partition != base.partition else '❌'} RIASEC 순위 변경 시 다른 구획: {base.rank_code} → {reordered.rank_code}")
+    print(f"{'✅' if len(widths.bins) == len(base.bins) + 1 else '❌'} 필드 구성이 다르면 다른 구획, 구역별 구간 폭 적용: {widths.bins.tolist()}")
+
+
+async def test_semantic_hits(server, llm_service: LLMService) -> None:
+    """허용 거리 안의 입력은 제공자 호출 없이 재사용"""
+    first = await llm_service.analyze_career_identity(BASE_INPUT)
+    before = server.request_count
+
+    near = await llm_service.analyze_career_identity(variant({"riasec_scores.R": 74, "life_history_scores.기술/IT 경험": 86}))
+    one_bin = await llm_service.analyze_career_identity(variant({"riasec_scores.S": 63}))
+    print(
+        f"\n{'✅' if first['cache_status'] == 'miss' and near['cache_status'] == 'semantic_hit' and near['career_identity'] == first['career_identity'] else '❌'} "
+        f"같은 구간 입력 재사용: {first['cache_status']} → {near['cache_status']}"
+    )
+    print(f"{'✅' if one_bin['cache_status'] == 'semantic_hit' else '❌'} 한 구간 차이(S 58→63) 재사용: {one_bin['cache_status']}")
+    print(f"{'✅' if server.request_count == before else '❌'} 근사 적중 시 제공자 요청 없음: {server.request_count - before}회")
+
+    far = await llm_service.analyze_career_identity(variant({"riasec_scores.S": 69, "big5_scores.성실성.score": 70}))
+    reordered = await llm_service.analyze_career_identity(variant({"riasec_scores.C": 90}))
+    bypass = await llm_service.analyze_career_identity(variant({"riasec_scores.R": 72}), use_cache=False)
+    print(f"{'✅' if far['cache_status'] == 'miss' else '❌'} 허용 거리 밖 입력은 새로 호출: {far['cache_status']}")
+    print(f"{'✅' if reordered['cache_status'] == 'miss' else '❌'} RIASEC 상위 코드 순서가 다르면 새로 호출: {reordered['cache_status']}")
+    print(f"{'✅' if bypass['cache_status'] == 'bypass' else '❌'} use_cache=False 우회: {bypass['cache_status']}")
+
+    events = [event async for event in llm_service.stream_career_identity(variant({"riasec_scores.R": 73}))]
+    print(f"{'✅' if events[-1]['data'].get('cache_status') == 'semantic_hit' and len(events) == 1 else '❌'} SSE 스트리밍도 재사용: 이벤트 {len(events)}개")
+
+
+async def test_shared(path: str) -> None:
+    """다른 워커 프로세스(같은 DB를 쓰는 다른 캐시)가 저장한 서명을 찾음"""
+    other_worker = CareerIdentityCache(db_path=path)
+    found = await other_worker.get(variant({"riasec_scores.R": 73}))
+    print(f"\n{'✅' if found is not None else '❌'} 다른 워커의 인덱스로 조회: 구간 거리 {found and found['distance']}")
+
+    # 허용 거리 0이면 모든 점수가 같은 구간일 때만 재사용
+    strict = CareerIdentityCache(db_path=path, max_distance=0.0)
+    exact = await strict.get(variant({"riasec_scores.R": 73}))
+    one_bin = await strict.get(variant({"riasec_scores.S": 63}))
+    print(f"{'✅' if exact is not None and one_bin is None else '❌'} 허용 거리 0: 같은 구간 {exact and exact['distance']}, 한 구간 차이 {one_bin}")
+
+
+async def main():
+    server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    settings.IDENTITY_CACHE_ENABLED = True
+    await llm_clients.start()
+
+    print("=" * 80)
+    print("직업정체성 근사 캐시 테스트")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 전역 캐시를 임시 경로로 다시 초기화 (정확 캐시 미스 후 근사 캐시 조회)
+        path = f"{directory}/identity_cache.sqlite3"
+        identity_cache.career_identity_cache.__init__(db_path=path)
+        llm_cache.llm_response_cache.__init__(db_path=f"{directory}/llm_cache.sqlite3")
+        llm_service = LLMService()
+
+        test_signature()
+        await test_semantic_hits(server, llm_service)
+        await test_shared(path)
+
+        stats = await identity_cache.career_identity_cache.get_stats()
+        print(
+            f"\n   적중 {stats['hits']}, 미스 {stats['misses']}, 우회 {stats['bypasses']}, 저장 {stats['stores']}, "
+            f"적중률 {stats['hit_rate']}, 항목 {stats['entries']}, 구획 {stats['partitions']}"
+        )
+        print(f"   RIASEC 상위 코드별: {stats['by_rank_code']}")
+        print(f"   구간 거리별 적중: {stats['hits_by_distance']}")
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
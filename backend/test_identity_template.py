@@ -0,0 +1,157 @@
+"""
+직업정체성 템플릿 엔진 테스트 (6단계 문단·근거 블록 구성, 모든 코드 조합/요인 구간, 생성 시간, 무료 등급, LLM 실패 대체)
+
+LLM 실패는 로컬 스텁 서버의 오류 주입으로 재현합니다. (backend 디렉토리에서 실행 - 조각 라이브러리 상대 경로)
+
+사용법:
+    python test_identity_template.py
+"""
+import time
+import asyncio
+import itertools
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.identity_template import identity_templates
+from app.services.score_extractor import extract_scores_sync, BIG5_FACTORS
+
+SAMPLE_PDF = "../직업심리검사(L형).pdf"
+
+SAMPLE_INPUT = {
+    "riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78},
+    "big5_scores": {
+        "성실성": {"score": 88, "subFactors": {"책임감": 92, "계획성": 85}},
+        "신경성": {"score": 35, "subFactors": {"스트레스 취약성": 39}},
+        "개방성": {"score": 80, "subFactors": {"지적 호기심": 88}}
+    },
+    "life_history_scores": {"기술/IT 경험": 85}
+}
+
+
+def test_render() -> None:
+    """문단 구성 순서, 근거 블록, 점수 인용 확인"""
+    result = identity_templates.render(SAMPLE_INPUT)
+    paragraph, rationale = result["career_identity"], result["rationale"]
+    sentences = [s for s in paragraph.split(". ") if s]
+
+    order = ["탐구형(I)", "성실성의 책임감(92점)", "스트레스 취약성(39점)이 낮아", "지적 호기심(88점)은", "기술/IT 경험(85점)은", "직업정체성은"]
+    positions = [paragraph.find(marker) for marker in order]
+    print(f"{'✅' if -1 not in positions and positions == sorted(positions) else '❌'} 6단계 구성 순서: {positions}")
+    print(f"{'✅' if 6 <= len(sentences) <= 8 else '❌'} 문장 수: {len(sentences)}")
+    print(f"{'✅' if len(rationale.splitlines()) <= 5 and rationale.startswith('- RIASEC') else '❌'} 근거 블록 {len(rationale.splitlines())}줄")
+    print(f"   {paragraph[:80]}...")
+
+
+def test_coverage() -> None:
+    """모든 상위 코드 조합 × 요인 구간이 생성되고 같은 입력은 같은 결과"""
+    failures = []
+    for primary, secondary in itertools.permutations("RIASEC", 2):
+        for score in (20, 50, 90):
+            data = {
+                "riasec_scores": {primary: 90, secondary: 80},
+                "big5_scores": {factor: {"score": score, "subFactors": {"하위 요인": score}} for factor in ("성실성", "외향성", "우호성", "신경성", "개방성")},
+                "life_history_scores": {"봉사 경험": score}
+            }
+            try:
+                text = identity_templates.render(data)["career_identity"]
+                if "{" in text or "}" in text:
+                    failures.append((primary, secondary, score))
+            except (KeyError, ValueError) as e:
+                failures.append((primary, secondary, score, str(e)))
+
+    first = identity_templates.render(SAMPLE_INPUT)
+    print(f"\n{'✅' if not failures else '❌'} 코드 조합 30가지 × 구간 3가지 생성: 실패 {failures[:3]}")
+    print(f"{'✅' if identity_templates.render(SAMPLE_INPUT) == first else '❌'} 같은 입력은 같은 결과 (결정적)")
+
+    try:
+        identity_templates.render({"riasec_scores": {}})
+        ok = False
+    except ValueError:
+        ok = True
+    print(f"{'✅' if ok else '❌'} RIASEC 점수가 없으면 ValueError")
+
+    # 요인 점수만 있거나 생활사가 없어도 생성
+    partial = identity_templates.render({"riasec_scores": {"S": 80}, "big5_scores": {"우호성": 30}})
+    print(f"{'✅' if '우호성(30점)이 낮은 편이라' in partial['career_identity'] else '❌'} 일부 자료만 있는 입력: {partial['career_identity'][60:120]}...")
+
+
+def test_report_factors() -> None:
+    """L형 결과지 요인명(호감성, 정서적 불안정성, 경험에 대한 개방성)으로 추출한 점수도 요인별 문장 사용"""
+    scores = extract_scores_sync(SAMPLE_PDF)
+    result = identity_templates.render(scores)
+    paragraph = result["career_identity"]
+
+    generic = [part for part in ("personality", "emotion", "openness") if identity_templates._parts[part]["none"] in paragraph]
+    print(f"\n{'✅' if scores['success'] and set(scores['big5_scores']) == set(BIG5_FACTORS) else '❌'} 점수 추출 결과 요인명: {list(scores['big5_scores'])}")
+    print(f"{'✅' if not generic else '❌'} 성격·정서·개방성 문단 모두 요인별 문장: 일반 문장 {generic}")
+    quoted = [factor for factor in ("호감성", "정서적 불안정성", "경험에 대한 개방성") if factor in paragraph]
+    print(f"{'✅' if len(quoted) == 3 else '❌'} 결과지 요인명 인용: {quoted} / 근거 {result['rationale'].splitlines()[1]}")
+
+
+def test_speed(count: int = 10000) -> None:
+    """문단 1개 생성 시간 (마이크로초 단위)"""
+    started = time.perf_counter()
+    for _ in range(count):
+        identity_templates.render(SAMPLE_INPUT)
+    elapsed_us = (time.perf_counter() - started) * 1_000_000 / count
+    print(f"\n{'✅' if elapsed_us < 1000 else '❌'} 생성 시간: {elapsed_us:.1f}µs/건 ({count}회 평균)")
+
+
+async def test_service(server, llm_service: LLMService) -> None:
+    """무료 등급 요청은 제공자를 호출하지 않고, LLM 실패 시 설정에 따라 템플릿으로 대체"""
+    before = server.request_count
+    result = await llm_service.analyze_career_identity(SAMPLE_INPUT, use_template=True)
+    events = [event async for event in llm_service.stream_career_identity(SAMPLE_INPUT, use_template=True)]
+    print(
+        f"\n{'✅' if result['success'] and result['engine'] == 'template' and server.request_count == before else '❌'} "
+        f"무료 등급 요청: 모델 {result['model_used']}, 제공자 요청 {server.request_count - before}회"
+    )
+    print(f"{'✅' if len(events) == 1 and events[0]['data']['engine'] == 'template' else '❌'} SSE 무료 등급: 이벤트 {[e['event'] for e in events]}")
+
+    settings.IDENTITY_TEMPLATE_FALLBACK = False
+    server.fail_next(1, 400)
+    failed = await llm_service.analyze_career_identity(SAMPLE_INPUT, use_cache=False)
+    print(f"{'✅' if not failed['success'] else '❌'} 대체 꺼짐: LLM 실패 그대로 반환 ({failed.get('error', '')[:40]})")
+
+    settings.IDENTITY_TEMPLATE_FALLBACK = True
+    server.fail_next(1, 400)
+    degraded = await llm_service.analyze_career_identity(SAMPLE_INPUT, use_cache=False)
+    print(f"{'✅' if degraded['success'] and degraded['degraded'] and degraded['engine'] == 'template' else '❌'} 대체 켜짐: LLM 실패 시 템플릿 결과 (degraded={degraded.get('degraded')})")
+
+    server.fail_next(1, 400)
+    events = [event async for event in llm_service.stream_career_identity(SAMPLE_INPUT, use_cache=False)]
+    print(f"{'✅' if events[-1]['event'] == 'result' and events[-1]['data']['degraded'] else '❌'} SSE 대체: 마지막 이벤트 {events[-1]['event']}")
+
+    normal = await llm_service.analyze_career_identity(SAMPLE_INPUT, use_cache=False)
+    print(f"{'✅' if normal['success'] and normal.get('engine', 'llm') == 'llm' else '❌'} 제공자가 정상이면 LLM 결과")
+    settings.IDENTITY_TEMPLATE_FALLBACK = False
+
+    stats = identity_templates.get_stats()
+    print(f"\n   생성 {stats['renders']}회, LLM 실패 대체 {stats['fallbacks']}회, 평균 {stats['avg_render_us']}µs, 라이브러리 로드 {stats['load_time_ms']}ms")
+
+
+async def main():
+    server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    await llm_clients.start()
+
+    print("=" * 80)
+    print("직업정체성 템플릿 엔진 테스트")
+    print("=" * 80)
+
+    print(f"{'✅' if identity_templates.load() else '❌'} 조각 라이브러리 로드: {identity_templates.get_stats()['code_combinations']}개 코드 조합")
+    test_render()
+    test_coverage()
+    test_report_factors()
+    test_speed()
+    await test_service(server, LLMService())
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
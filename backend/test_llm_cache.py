@@ -0,0 +1,148 @@
+"""
+LLM 응답 캐시 테스트 (TTL 만료, max_entries LRU 제거, 적중/미스/우회 통계, 응답한 모델 기록, 이전 스키마 호환)
+
+임시 SQLite 파일을 캐시 저장소로 사용합니다. 응답한 모델 기록은 OpenAI/Anthropic 역할의
+로컬 스텁 서버 두 개를 대상으로 라우터가 다른 후보로 넘긴 경우를 확인합니다.
+
+사용법:
+    python test_llm_cache.py
+"""
+import asyncio
+import sqlite3
+import tempfile
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_cache import LLMResponseCache
+from app.services import llm_cache, identity_cache
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.provider_limiter import ProviderLimiter, provider_limiters
+
+IDENTITY_REQUEST = {
+    "riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78},
+    "big5_scores": {"성실성": {"score": 88, "subFactors": {"책임감": 92}}},
+    "life_history_scores": {"기술/IT 경험": 85}
+}
+
+
+async def test_ttl(directory: str) -> None:
+    """TTL이 지난 항목은 미스로 처리하고 저장소에서 삭제"""
+    cache = LLMResponseCache(db_path=f"{directory}/ttl.sqlite3", ttl_seconds=1, max_entries=10)
+    await cache.set("a", "응답 a", "openai", "gpt-4o")
+    fresh = await cache.get("a")
+
+    await asyncio.sleep(1.2)
+    expired = await cache.get("a")
+    stats = await cache.get_stats()
+
+    print(f"{'✅' if fresh == {'response': '응답 a', 'provider': 'openai', 'model': 'gpt-4o'} else '❌'} TTL 이내 조회: {fresh}")
+    print(f"{'✅' if expired is None and stats['entries'] == 0 else '❌'} TTL 만료 후 미스 및 삭제: {expired}, 항목 {stats['entries']}")
+
+
+async def test_lru(directory: str) -> None:
+    """max_entries를 넘으면 가장 오래 조회되지 않은 항목부터 삭제"""
+    cache = LLMResponseCache(db_path=f"{directory}/lru.sqlite3", ttl_seconds=3600, max_entries=2)
+    await cache.set("a", "응답 a")
+    await asyncio.sleep(0.01)
+    await cache.set("b", "응답 b")
+    await asyncio.sleep(0.01)
+    await cache.get("a")  # a를 최근 사용으로 → 다음 저장 시 b가 빠짐
+    await asyncio.sleep(0.01)
+    await cache.set("c", "응답 c")
+
+    kept = {key: await cache.get(key) for key in ("a", "b", "c")}
+    stats = await cache.get_stats()
+    print(f"\n{'✅' if kept['b'] is None and kept['a'] and kept['c'] else '❌'} LRU 제거: {[key for key, value in kept.items() if value]} 유지 (b 제거)")
+    print(f"{'✅' if stats['entries'] == 2 else '❌'} 항목 수 제한: {stats['entries']}/{stats['max_entries']}")
+
+
+async def test_accounting(directory: str) -> None:
+    """서비스 조회 경로의 적중/미스/우회 집계"""
+    llm_cache.llm_response_cache.__init__(db_path=f"{directory}/service.sqlite3", ttl_seconds=3600, max_entries=10)
+    settings.LLM_CACHE_ENABLED = True
+    service = LLMService()
+    args = ("profile", "시스템", 0.2, "프롬프트")
+
+    key, miss_status, _ = await service._lookup_cache(*args, use_cache=True)
+    await llm_cache.llm_response_cache.set(key, "저장된 응답")
+    _, hit_status, cached = await service._lookup_cache(*args, use_cache=True)
+    _, bypass_status, _ = await service._lookup_cache(*args, use_cache=False)
+
+    stats = await llm_cache.llm_response_cache.get_stats()
+    print(f"\n{'✅' if (miss_status, hit_status, bypass_status) == ('miss', 'hit', 'bypass') and cached['response'] == '저장된 응답' else '❌'} 조회 상태: {miss_status} → {hit_status} → {bypass_status}")
+    print(
+        f"{'✅' if (stats['hits'], stats['misses'], stats['bypasses'], stats['hit_rate']) == (1, 1, 1, 0.5) else '❌'} "
+        f"통계: 적중 {stats['hits']}, 미스 {stats['misses']}, 우회 {stats['bypasses']}, 적중률 {stats['hit_rate']} (우회는 조회에서 제외)"
+    )
+
+
+async def test_attribution(directory: str) -> None:
+    """라우터가 기본 후보 실패로 다른 후보에 넘긴 응답은 캐시/근사 캐시 적중 시에도 실제로 응답한 모델로 보고"""
+    openai_server, anthropic_server = start_stub_server(), start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{openai_server.server_address[1]}/v1"
+    settings.ANTHROPIC_BASE_URL = f"http://127.0.0.1:{anthropic_server.server_address[1]}"
+    settings.LLM_ROUTING_CANDIDATES = ["openai:gpt-4o", "anthropic:claude-3-5-sonnet-20241022"]
+    settings.IDENTITY_CACHE_ENABLED = True
+    await llm_clients.start()
+
+    llm_cache.llm_response_cache.__init__(db_path=f"{directory}/routed.sqlite3")
+    identity_cache.career_identity_cache.__init__(db_path=f"{directory}/identity.sqlite3")
+    provider_limiters._limiters["openai"] = ProviderLimiter("openai", max_attempts=1)
+    service = LLMService()
+    service.provider, service.model = "openai", "gpt-4o"
+
+    openai_server.fail_next(1, 500)
+    first = await service.analyze_profile("라우팅된 응답", "직업선호도검사 (L형)")
+    again = await service.analyze_profile("라우팅된 응답", "직업선호도검사 (L형)")
+    print(
+        f"\n{'✅' if first['model_used'] == again['model_used'] == 'claude-3-5-sonnet-20241022' and again['cache_status'] == 'hit' else '❌'} "
+        f"캐시 적중 시 응답한 모델 보고: {first['model_used']} → {again['cache_status']} {again['model_used']}"
+    )
+
+    openai_server.fail_next(1, 500)
+    first = await service.analyze_career_identity(IDENTITY_REQUEST)
+    nearby = await service.analyze_career_identity({**IDENTITY_REQUEST, "riasec_scores": {**IDENTITY_REQUEST["riasec_scores"], "R": 71}})
+    print(
+        f"{'✅' if first['model_used'] == nearby['model_used'] == 'claude-3-5-sonnet-20241022' and nearby['cache_status'] == 'semantic_hit' else '❌'} "
+        f"근사 캐시 적중 시 응답한 모델 보고: {first['model_used']} → {nearby['cache_status']} {nearby['model_used']}"
+    )
+
+    provider_limiters._limiters.pop("openai")
+    await llm_clients.close()
+    openai_server.shutdown()
+    anthropic_server.shutdown()
+
+
+async def test_legacy_schema(directory: str) -> None:
+    """제공자/모델 열이 없는 이전 캐시 파일도 열을 추가해 사용 (이전 항목의 모델은 None)"""
+    path = f"{directory}/legacy.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE llm_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+    conn.execute("INSERT INTO llm_cache VALUES ('old', '이전 응답', strftime('%s', 'now'), strftime('%s', 'now'))")
+    conn.commit()
+    conn.close()
+
+    cache = LLMResponseCache(db_path=path)
+    old = await cache.get("old")
+    await cache.set("new", "새 응답", "anthropic", "claude-3-5-sonnet-20241022")
+    new = await cache.get("new")
+    print(f"\n{'✅' if old == {'response': '이전 응답', 'provider': None, 'model': None} and new['model'] == 'claude-3-5-sonnet-20241022' else '❌'} 이전 스키마 호환: {old}, {new['model']}")
+
+
+async def main():
+    print("=" * 80)
+    print("LLM 응답 캐시 테스트")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        await test_ttl(directory)
+        await test_lru(directory)
+        await test_accounting(directory)
+        await test_attribution(directory)
+        await test_legacy_schema(directory)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
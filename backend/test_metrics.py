@@ -0,0 +1,151 @@
+"""
+메트릭 테스트 (/metrics 텍스트 형식, 단계별 지연 히스토그램, 토큰 카운터, 게이지, 워커 스냅샷 합산, 기록 비용)
+
+전체 앱을 ASGI로 직접 호출하여 샘플 PDF 업로드와 직업정체성 분석(로컬 스텁 LLM 서버)을 실행한 뒤
+/metrics 응답을 확인합니다. 다른 워커는 임시 디렉토리에 스냅샷 파일을 만들어 흉내 냅니다.
+(backend 디렉토리에서 실행 - 직업 데이터/조각 라이브러리 상대 경로)
+
+사용법:
+    python test_metrics.py
+"""
+import os
+import re
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+import httpx
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+
+SAMPLE_PDF = Path(__file__).resolve().parent.parent / "직업심리검사(L형).pdf"
+
+IDENTITY_REQUEST = {
+    "riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78},
+    "big5_scores": {"성실성": {"score": 88, "subFactors": {"책임감": 92}}},
+    "life_history_scores": {"기술/IT 경험": 85}
+}
+
+LINE = re.compile(r'^([a-z_]+)(\{[^}]*\})? (\S+)$')
+
+
+def parse(text: str) -> dict:
+    """Prometheus 텍스트를 {이름{레이블}: 값}으로 변환 (형식이 맞지 않는 줄은 예외)"""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("# HELP ") or line.startswith("# TYPE "):
+            continue
+        match = LINE.match(line)
+        if match is None:
+            raise ValueError(f"형식 오류: {line}")
+        samples[f"{match.group(1)}{match.group(2) or ''}"] = float(match.group(3))
+    return samples
+
+
+def stage_count(samples: dict, component: str, stage: str) -> float:
+    return samples.get(f'jobjalhane_stage_duration_seconds_count{{component="{component}",stage="{stage}"}}', 0)
+
+
+def token_total(samples: dict, kind: str) -> float:
+    return sum(value for key, value in samples.items() if key.startswith("jobjalhane_llm_tokens_total") and f'type="{kind}"' in key)
+
+
+async def test_endpoint(client: httpx.AsyncClient) -> dict:
+    """업로드·분석 후 단계 히스토그램, 토큰 카운터, 게이지 확인"""
+    # 추출 캐시에 없도록 실행마다 내용 해시가 다른 사본 업로드 (PDF 뒤 주석은 파싱에 영향 없음)
+    data = SAMPLE_PDF.read_bytes() + f"\n% metrics-{time.time_ns()}\n".encode()
+    upload = await client.post("/api/upload-pdf", files={"file": ("sample.pdf", data, "application/pdf")})
+    identity = await client.post("/api/analyze-career-identity", json={**IDENTITY_REQUEST, "use_cache": False})
+    response = await client.get("/metrics")
+    samples = parse(response.text)
+
+    print(f"{'✅' if upload.status_code == 200 and identity.status_code == 200 else '❌'} 업로드/분석 요청: {upload.status_code}, {identity.status_code}")
+    print(f"{'✅' if response.headers['content-type'].startswith('text/plain; version=0.0.4') else '❌'} 응답 형식: {response.headers['content-type']} ({len(samples)}개 샘플)")
+
+    stages = [
+        ("upload", "read"), ("upload", "write"), ("pdf_controller", "receive_upload"), ("pdf_controller", "process_upload"),
+        ("pdf_service", "executor_wait"), ("pdf_service", "extract_text"), ("upload_service", "save_text"),
+        ("llm_service", "provider_call"), ("llm_service", "parse")
+    ]
+    missing = [f"{component}/{stage}" for component, stage in stages if stage_count(samples, component, stage) < 1]
+    print(f"{'✅' if not missing else '❌'} 단계별 히스토그램 기록: 누락 {missing}")
+
+    # 누적 버킷은 단조 증가, +Inf 버킷 = count
+    buckets = [value for key, value in samples.items() if key.startswith('jobjalhane_stage_duration_seconds_bucket{component="pdf_service",stage="extract_text"')]
+    inf = samples['jobjalhane_stage_duration_seconds_bucket{component="pdf_service",stage="extract_text",le="+Inf"}']
+    print(f"{'✅' if buckets == sorted(buckets) and inf == stage_count(samples, 'pdf_service', 'extract_text') else '❌'} 누적 버킷 단조 증가, +Inf = count ({len(buckets)}개 버킷)")
+
+    print(
+        f"{'✅' if token_total(samples, 'input') > 0 and token_total(samples, 'output') > 0 else '❌'} "
+        f"토큰 카운터: 입력 {token_total(samples, 'input'):.0f}, 출력 {token_total(samples, 'output'):.0f}, 캐시 {token_total(samples, 'cached'):.0f}"
+    )
+    route = 'jobjalhane_http_request_duration_seconds_count{method="POST",route="/api/upload-pdf",status="200"}'
+    print(f"{'✅' if samples.get(route) == 1 else '❌'} 라우트 템플릿별 요청 시간: {route.split('{')[1]}")
+    print(
+        f"{'✅' if samples.get('jobjalhane_http_requests_in_flight') == 1 and 'jobjalhane_extraction_executor_queue_depth' in samples else '❌'} "
+        f"게이지: 처리 중 요청 {samples.get('jobjalhane_http_requests_in_flight')} (/metrics 자신), 추출 대기 {samples.get('jobjalhane_extraction_executor_queue_depth')}"
+    )
+    return samples
+
+
+async def test_workers(client: httpx.AsyncClient, directory: str, before: dict) -> None:
+    """다른 워커의 스냅샷 합산 (종료된 워커는 카운터/히스토그램만)"""
+    from app.core.metrics import metrics
+
+    await metrics.flush()
+    own_file = Path(directory) / f"{os.getpid()}.json"
+    again = parse((await client.get("/metrics")).text)
+    print(f"\n{'✅' if own_file.exists() and token_total(again, 'input') == token_total(before, 'input') else '❌'} 자기 스냅샷 파일은 다시 합산하지 않음")
+
+    # 살아 있는 다른 워커(부모 프로세스 pid)와 종료된 워커(없는 pid) 흉내
+    snapshot = metrics.snapshot()
+    snapshot["metrics"]["jobjalhane_http_requests_in_flight"] = {"": 5}
+    for pid in (os.getppid(), 2 ** 22 + 7):
+        (Path(directory) / f"{pid}.json").write_text(json.dumps({**snapshot, "pid": pid}), encoding="utf-8")
+
+    merged = parse((await client.get("/metrics")).text)
+    print(f"{'✅' if token_total(merged, 'input') == 3 * token_total(before, 'input') else '❌'} 토큰 카운터 3개 워커 합산: {token_total(before, 'input'):.0f} → {token_total(merged, 'input'):.0f}")
+    print(f"{'✅' if stage_count(merged, 'llm_service', 'provider_call') == 3 * stage_count(before, 'llm_service', 'provider_call') else '❌'} 히스토그램 합산 (종료된 워커 포함)")
+    print(f"{'✅' if merged['jobjalhane_http_requests_in_flight'] == 1 + 5 else '❌'} 게이지는 살아 있는 워커만: 처리 중 요청 {merged['jobjalhane_http_requests_in_flight']:.0f} (자신 1 + 살아 있는 워커 5)")
+
+
+def test_overhead(count: int = 100000) -> None:
+    """관측 1회 기록 비용"""
+    from app.core.metrics import stage_seconds
+
+    started = time.perf_counter()
+    for _ in range(count):
+        stage_seconds.observe(0.012, component="benchmark", stage="observe")
+    elapsed_us = (time.perf_counter() - started) * 1_000_000 / count
+    print(f"\n{'✅' if elapsed_us < 10 else '❌'} 기록 비용: {elapsed_us:.2f}µs/회 ({count}회 평균)")
+
+
+async def main():
+    server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    print("=" * 80)
+    print("메트릭 테스트")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 스냅샷 경로만 임시 디렉토리로 변경 (lifespan에서 저장 작업 시작)
+        from main import app, lifespan
+        from app.core.metrics import metrics
+        metrics.directory = Path(directory)
+
+        async with lifespan(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as client:
+                before = await test_endpoint(client)
+                await test_workers(client, directory, before)
+        test_overhead()
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""
+프롬프트 캐시용 프롬프트 구조 테스트 (정적 prefix 고정, 캐시 토큰 기록)
+
+사용자 데이터가 달라도 시스템 프롬프트(정적 지침)가 바이트 단위로 같은지 확인하고,
+프롬프트 캐시를 흉내 내는 로컬 스텁 서버의 usage에서 캐시 토큰이 집계되는지 확인합니다.
+
+사용법:
+    python test_prompt_cache.py [호출 수]
+"""
+import sys
+import asyncio
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.core.prompts import PROFILE_ANALYSIS_INPUT, CAREER_IDENTITY_INPUT
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.llm_usage import llm_usage
+from app.services.text_compactor import estimate_tokens
+
+FORMAT = "직업선호도검사 (L형)"
+CAREER_INPUT = {"riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78}}
+
+
+def test_prefix_layout() -> None:
+    """정적 지침은 시스템 프롬프트에만, 사용자 메시지는 데이터만"""
+    first = PROFILE_ANALYSIS_INPUT.format(format_detected=FORMAT, text="탐구형(I) 88점")
+    second = PROFILE_ANALYSIS_INPUT.format(format_detected=FORMAT, text="예술형(A) 91점")
+    guideline_in_user = "중요한 지침" in first or "출력 스타일 규칙" in CAREER_IDENTITY_INPUT
+    print(f"{'✅' if not guideline_in_user else '❌'} 사용자 메시지에 정적 지침 없음 (프로필 {estimate_tokens(first)}토큰 / {estimate_tokens(second)}토큰)")
+
+    for name, system in (
+        ("프로필", LLMService.PROFILE_SYSTEM_MESSAGE),
+        ("직업정체성", LLMService.CAREER_IDENTITY_SYSTEM_MESSAGE)
+    ):
+        tokens = estimate_tokens(system)
+        placeholders = [field for field in ("{format_detected}", "{text}", "{input_data}") if field in system]
+        print(
+            f"{'✅' if not placeholders else '❌'} {name} 시스템 프롬프트에 사용자 데이터 자리 없음 "
+            f"(약 {tokens}토큰, 제공자 최소 캐시 길이 1024토큰 {'이상' if tokens >= 1024 else '미만 - 지침이 늘어나면 적용'})"
+        )
+
+
+async def test_cached_usage(llm_service: LLMService, provider: str, count: int) -> None:
+    """같은 시스템 프롬프트로 반복 호출하면 두 번째부터 캐시 토큰이 기록되는지 확인"""
+    llm_service.provider = provider
+    for i in range(count):
+        await llm_service.analyze_profile(f"탐구형(I) {60 + i}점", FORMAT, use_cache=False)
+    await llm_service.analyze_career_identity({**CAREER_INPUT, "seq": 0}, use_cache=False)
+    events = [event async for event in llm_service.stream_career_identity({**CAREER_INPUT, "seq": 1}, use_cache=False)]
+
+    stats = llm_usage.get_stats()
+    profile = stats[f"{provider}/{llm_service.model}/profile"]
+    career = stats[f"{provider}/{llm_service.model}/career_identity"]
+    print(
+        f"\n{'✅' if profile['cache_hit_calls'] == count - 1 else '❌'} {provider} 프로필 {count}회: "
+        f"캐시 적중 {profile['cache_hit_calls']}회, 캐시된 입력 비율 {profile['cached_input_ratio']}, "
+        f"캐시 쓰기 {profile['cache_write_tokens']}토큰"
+    )
+    print(
+        f"{'✅' if career['calls'] == 2 and career['cache_hit_calls'] == 1 and events[-1]['event'] == 'result' else '❌'} "
+        f"{provider} 직업정체성 (일반 1회 + 스트리밍 1회) usage 기록: 호출 {career['calls']}회, 캐시 적중 {career['cache_hit_calls']}회"
+    )
+    print(f"   평균 지연: 적중 {profile['avg_hit_latency_ms']}ms / 미적중 {profile['avg_miss_latency_ms']}ms")
+
+
+async def test_cache_control_disabled(llm_service: LLMService) -> None:
+    """LLM_PROMPT_CACHE_ENABLED=False면 Anthropic 요청에 cache_control을 넣지 않음"""
+    settings.LLM_PROMPT_CACHE_ENABLED = False
+    llm_service.provider = "anthropic"
+    before = llm_usage.get_stats()["anthropic/" + llm_service.model + "/profile"]["cache_hit_calls"]
+    await llm_service.analyze_profile("cache_control 비활성화", FORMAT, use_cache=False)
+    after = llm_usage.get_stats()["anthropic/" + llm_service.model + "/profile"]["cache_hit_calls"]
+    print(f"\n{'✅' if after == before else '❌'} cache_control 비활성화 시 Anthropic 캐시 미사용")
+    settings.LLM_PROMPT_CACHE_ENABLED = True
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    # 실제 지침 길이로 캐시 동작을 확인하도록 스텁의 최소 캐시 길이를 낮춤
+    server = start_stub_server(cache_min_tokens=200)
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    settings.ANTHROPIC_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    await llm_clients.start()
+
+    llm_service = LLMService()
+
+    print("=" * 80)
+    print("프롬프트 캐시용 프롬프트 구조 테스트")
+    print("=" * 80)
+
+    test_prefix_layout()
+    await test_cached_usage(llm_service, "openai", count)
+    await test_cached_usage(llm_service, "anthropic", count)
+    await test_cache_control_disabled(llm_service)
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+"""
+LLM 제공자 호출 제한 테스트 (적응형 동시 호출 제한, Retry-After 준수, 재시도 분류, 요청/토큰 버킷)
+
+동시 처리 한도를 넘으면 429를 돌려주는 로컬 스텁 서버를 대상으로 합니다.
+
+사용법:
+    python test_provider_limiter.py [동시 요청 수] [서버 동시 처리 한도]
+"""
+import sys
+import time
+import asyncio
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.provider_limiter import ProviderLimiter, TokenBucket, provider_limiters
+
+FORMAT = "직업선호도검사 (L형)"
+
+
+def make_limiter(**overrides) -> ProviderLimiter:
+    """테스트용 짧은 백오프의 OpenAI 제한 계층으로 교체"""
+    options = {"base_delay": 0.05, "max_delay": 2.0, "max_attempts": 8, **overrides}
+    limiter = ProviderLimiter("openai", **options)
+    provider_limiters._limiters["openai"] = limiter
+    return limiter
+
+
+async def test_adaptive_concurrency(server, llm_service: LLMService, count: int, server_limit: int) -> None:
+    """서버 한도보다 큰 동시 호출 한도에서 시작해 429를 받으며 한도가 줄어드는지 확인"""
+    limiter = make_limiter(initial_concurrency=server_limit * 4, max_concurrency=server_limit * 8)
+    before = server.request_count
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        llm_service.analyze_profile(f"직업선호도검사 결과 #{i}", FORMAT, use_cache=False) for i in range(count)
+    ))
+    elapsed = time.perf_counter() - started
+    stats = limiter.get_stats()
+
+    print(
+        f"{'✅' if all(result['success'] for result in results) else '❌'} "
+        f"{count}개 모두 성공: {elapsed:.2f}s, 제공자 요청 {server.request_count - before}회 (429 {server.throttled}회)"
+    )
+    print(
+        f"{'✅' if stats['concurrency']['limit'] <= server_limit * 2 and stats['concurrency']['decreases'] > 0 else '❌'} "
+        f"동시 호출 한도 {server_limit * 4} → {stats['concurrency']['limit']} "
+        f"(감소 {stats['concurrency']['decreases']}회, 최근 429 비율 {stats['concurrency']['recent_throttle_rate']})"
+    )
+
+
+async def test_retry_after(server, llm_service: LLMService) -> None:
+    """429의 Retry-After만큼 기다린 뒤 재시도하는지 확인"""
+    limiter = make_limiter()
+    server.retry_after = 0.5
+    server.fail_next(1, 429)
+
+    started = time.perf_counter()
+    result = await llm_service.analyze_profile("Retry-After 확인", FORMAT, use_cache=False)
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n{'✅' if result['success'] and elapsed >= 0.5 and limiter.retries == 1 else '❌'} "
+        f"Retry-After 0.5s 준수: {elapsed:.2f}s, 재시도 {limiter.retries}회"
+    )
+
+    # Retry-After가 재시도 대기 상한보다 길면 바로 실패
+    limiter = make_limiter(max_delay=0.2)
+    server.fail_next(1, 429)
+    started = time.perf_counter()
+    result = await llm_service.analyze_profile("Retry-After 초과", FORMAT, use_cache=False)
+    elapsed = time.perf_counter() - started
+    print(f"{'✅' if not result['success'] and elapsed < 0.5 else '❌'} 대기 상한 초과 Retry-After는 즉시 실패: {elapsed:.2f}s")
+    server.retry_after = 0.0
+
+
+async def test_error_classification(server, llm_service: LLMService) -> None:
+    """5xx는 재시도, 400은 재시도하지 않음"""
+    limiter = make_limiter()
+    server.fail_next(2, 503)
+    result = await llm_service.analyze_profile("503 재시도", FORMAT, use_cache=False)
+    print(f"\n{'✅' if result['success'] and limiter.retries == 2 else '❌'} 503 두 번 후 성공: 재시도 {limiter.retries}회")
+
+    limiter = make_limiter()
+    server.fail_next(1, 400)
+    result = await llm_service.analyze_profile("400 실패", FORMAT, use_cache=False)
+    print(
+        f"{'✅' if not result['success'] and limiter.attempts == 1 else '❌'} "
+        f"400은 재시도 없이 실패: 시도 {limiter.attempts}회, {limiter.errors_by_reason}"
+    )
+
+    limiter = make_limiter(max_attempts=3)
+    server.fail_next(3, 500)
+    result = await llm_service.analyze_profile("재시도 소진", FORMAT, use_cache=False)
+    print(f"{'✅' if not result['success'] and limiter.attempts == 3 else '❌'} 최대 시도 횟수 후 실패: 시도 {limiter.attempts}회")
+
+    # 스트리밍은 첫 조각 전 실패만 재시도
+    limiter = make_limiter()
+    server.fail_next(1, 503)
+    events = [event async for event in llm_service.stream_career_identity({"riasec_scores": {"I": 88}}, use_cache=False)]
+    print(f"{'✅' if events[-1]['event'] == 'result' and limiter.retries == 1 else '❌'} 스트리밍 시작 전 503 재시도: 마지막 이벤트 {events[-1]['event']}")
+
+
+async def test_buckets(llm_service: LLMService) -> None:
+    """분당 요청/토큰 한도에 맞춰 호출 속도를 제한하는지 확인"""
+    limiter = make_limiter(requests_per_minute=600)  # 초당 10회, 버스트 10회
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        llm_service.analyze_profile(f"요청 버킷 #{i}", FORMAT, use_cache=False) for i in range(30)
+    ))
+    elapsed = time.perf_counter() - started
+    print(f"\n{'✅' if 1.8 <= elapsed <= 3.0 else '❌'} 분당 600회 한도로 30회: {elapsed:.2f}s (이론값 2.0s)")
+
+    limiter = make_limiter(tokens_per_minute=60 * 2500)  # 초당 2500토큰, 호출당 약 1100토큰
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        llm_service.analyze_profile(f"토큰 버킷 #{i}", FORMAT, use_cache=False) for i in range(8)
+    ))
+    elapsed = time.perf_counter() - started
+    stats = limiter.get_stats()
+    print(
+        f"{'✅' if elapsed >= 2.0 else '❌'} 분당 15만 토큰 한도로 8회: {elapsed:.2f}s, "
+        f"토큰 버킷 대기 누적 {stats['token_bucket']['waited_seconds']}s"
+    )
+
+
+async def test_oversized_estimate() -> None:
+    """1초 보충량(버킷 용량)보다 큰 추정치도 전체를 차감하여 분당 한도를 지키는지 확인"""
+    bucket = TokenBucket(6000)  # 초당 100토큰, 용량 100
+    started = time.perf_counter()
+    for _ in range(3):
+        await bucket.acquire(200)
+    elapsed = time.perf_counter() - started
+    rate = 3 * 200 / elapsed * 60 if elapsed else float("inf")
+    # 첫 호출은 가득 찬 버킷에서 바로, 이후 호출은 부족분 200토큰(2초)씩 대기
+    print(f"{'✅' if elapsed >= 3.9 else '❌'} 용량의 2배인 200토큰 추정치 3회: {elapsed:.2f}s (이론값 4.0s, 분당 {rate:.0f}토큰)")
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    server_limit = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    server = start_stub_server(latency=0.2, max_concurrent=server_limit)
+    settings.OPENAI_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    await llm_clients.start()
+
+    llm_service = LLMService()
+    llm_service.provider = "openai"
+
+    print("=" * 80)
+    print(f"LLM 제공자 호출 제한 테스트 (동시 요청 {count}개, 서버 동시 처리 한도 {server_limit})")
+    print("=" * 80)
+
+    await test_adaptive_concurrency(server, llm_service, count, server_limit)
+    server.max_concurrent = 0
+    await test_retry_after(server, llm_service)
+    await test_error_classification(server, llm_service)
+
+    server.RequestHandlerClass.latency = 0.0
+    await test_buckets(llm_service)
+    await test_oversized_estimate()
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
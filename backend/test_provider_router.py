@@ -0,0 +1,179 @@
+"""
+LLM 제공자 라우팅 테스트 (지연 기반 선택, 느려진 후보 회피, 실패 시 전환, 헤지 요청, 늦은 호출 정리)
+
+OpenAI/Anthropic 역할을 하는 지연이 다른 로컬 스텁 서버 두 개를 대상으로 합니다.
+
+사용법:
+    python test_provider_router.py [호출 수]
+"""
+import gc
+import sys
+import time
+import asyncio
+from collections import Counter
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.provider_limiter import ProviderLimiter, provider_limiters
+from app.services.provider_router import llm_router
+
+FORMAT = "직업선호도검사 (L형)"
+CANDIDATES = ["openai:gpt-4o", "anthropic:claude-3-5-sonnet-20241022"]
+
+
+def reset_router(**options) -> None:
+    """라우터 기록 초기화 (테스트용 작은 창)"""
+    llm_router._health.clear()
+    llm_router.window = options.get("window", 10)
+    llm_router.min_samples = options.get("min_samples", 3)
+    llm_router.hedge_enabled = options.get("hedge_enabled", False)
+    llm_router.hedge_delay = options.get("hedge_delay", 0.0)
+    llm_router.calls = llm_router.hedges = llm_router.hedge_wins = llm_router.failovers = 0
+
+
+async def run_calls(llm_service: LLMService, label: str, count: int) -> Counter:
+    """순차 호출 후 응답 모델별 횟수 반환"""
+    used = Counter()
+    for i in range(count):
+        result = await llm_service.analyze_profile(f"{label} #{i}", FORMAT, use_cache=False)
+        used[result["model_used"] if result["success"] else "실패"] += 1
+    return used
+
+
+async def test_latency_routing(openai_server, anthropic_server, llm_service: LLMService, count: int) -> None:
+    """빠른 후보로 몰리고, 그 후보가 느려지면 다른 후보로 옮겨가는지 확인"""
+    reset_router()
+    openai_server.RequestHandlerClass.latency = 0.02
+    anthropic_server.RequestHandlerClass.latency = 0.15
+
+    used = await run_calls(llm_service, "지연 라우팅", count)
+    print(f"{'✅' if used['gpt-4o'] >= count * 0.8 else '❌'} 빠른 후보 선택: {dict(used)}")
+
+    openai_server.RequestHandlerClass.latency = 0.3
+    used = await run_calls(llm_service, "느려진 후보", count)
+    print(f"{'✅' if used['claude-3-5-sonnet-20241022'] >= count * 0.6 else '❌'} 느려진 후보 회피: {dict(used)}")
+
+    stats = llm_router.get_stats()["candidates"]
+    for name, candidate in stats.items():
+        print(f"   {name}: p50 {candidate['p50_ms']}ms, p95 {candidate['p95_ms']}ms, 선택 {candidate['selected']}회")
+
+
+async def test_failover(openai_server, anthropic_server, llm_service: LLMService) -> None:
+    """선택된 후보가 실패하면 다음 후보로 넘겨 응답하는지 확인"""
+    reset_router()
+    openai_server.RequestHandlerClass.latency = 0.02
+    provider_limiters._limiters["openai"] = ProviderLimiter("openai", max_attempts=1)
+    openai_server.fail_next(3, 500)
+
+    used = await run_calls(llm_service, "전환", 3)
+    stats = llm_router.get_stats()
+    print(
+        f"\n{'✅' if used['claude-3-5-sonnet-20241022'] == 3 and stats['failovers'] == 3 else '❌'} "
+        f"실패 시 전환: {dict(used)}, 전환 {stats['failovers']}회"
+    )
+
+    used = await run_calls(llm_service, "오류율 반영", 4)
+    openai = stats["candidates"]["openai/gpt-4o"]
+    print(f"{'✅' if used['claude-3-5-sonnet-20241022'] == 4 else '❌'} 오류율 높은 후보 후순위: {dict(used)} (openai 오류율 {openai['error_rate']})")
+    provider_limiters._limiters.pop("openai")
+
+
+async def test_hedge(openai_server, anthropic_server, llm_service: LLMService) -> None:
+    """선택된 후보가 기준 시간 안에 끝나지 않으면 헤지 요청이 먼저 응답하는지 확인"""
+    reset_router(hedge_enabled=True, hedge_delay=0.1)
+    openai_server.RequestHandlerClass.latency = 0.8  # 표본이 없어 설정 순서대로 먼저 선택됨
+    anthropic_server.RequestHandlerClass.latency = 0.05
+
+    started = time.perf_counter()
+    result = await llm_service.analyze_profile("헤지 요청", FORMAT, use_cache=False)
+    elapsed = time.perf_counter() - started
+    stats = llm_router.get_stats()
+    print(
+        f"\n{'✅' if result['success'] and elapsed < 0.4 and stats['hedge_wins'] == 1 else '❌'} "
+        f"헤지 응답 사용: {elapsed:.2f}s ({result['model_used']}), 헤지 {stats['hedges']}회, 헤지 승리 {stats['hedge_wins']}회"
+    )
+
+    # 기준 시간 안에 끝나면 헤지하지 않음
+    openai_server.RequestHandlerClass.latency = 0.02
+    reset_router(hedge_enabled=True, hedge_delay=0.1)
+    before = openai_server.request_count + anthropic_server.request_count
+    await llm_service.analyze_profile("헤지 불필요", FORMAT, use_cache=False)
+    sent = openai_server.request_count + anthropic_server.request_count - before
+    print(f"{'✅' if sent == 1 and llm_router.hedges == 0 else '❌'} 빠른 응답은 헤지 없음: 제공자 요청 {sent}회")
+    print(f"   최근 결정: {llm_router.get_stats()['recent_decisions'][-1]}")
+
+
+async def test_task_cleanup() -> None:
+    """함께 끝난 실패 호출의 예외를 회수하고, 늦은 쪽 호출은 call이 반환되기 전에 정리되는지 확인"""
+    reset_router(hedge_enabled=True, hedge_delay=0.05)
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context["message"]))
+    primary = ("openai", "gpt-4o")
+
+    # 한쪽 실패와 다른 쪽 성공이 같은 순간에 끝남 (기본 후보/헤지 어느 쪽이 실패해도)
+    answered = Counter()
+    for failing in ("openai", "anthropic"):
+        finish = asyncio.Event()
+
+        async def one_fails(provider: str, model: str) -> str:
+            await finish.wait()
+            if provider == failing:
+                raise RuntimeError(f"{provider} 실패")
+            return model
+
+        loop.call_later(0.08, finish.set)
+        _, candidate = await llm_router.call(primary, one_fails)
+        answered[candidate[0]] += 1
+    gc.collect()
+    await asyncio.sleep(0.05)
+    print(f"\n{'✅' if answered == Counter(openai=1, anthropic=1) and not unhandled else '❌'} 함께 끝난 실패 호출의 예외 회수: 응답 {dict(answered)}, 처리되지 않은 예외 {unhandled}")
+
+    # 헤지가 먼저 응답하면 느린 기본 후보 호출은 반환 전에 취소 완료
+    closed = []
+
+    async def slow_primary(provider: str, model: str) -> str:
+        if provider == "openai":
+            try:
+                await asyncio.sleep(1.0)
+            finally:
+                closed.append(provider)
+        return model
+
+    result, candidate = await llm_router.call(primary, slow_primary)
+    print(f"{'✅' if candidate[0] == 'anthropic' and closed == ['openai'] else '❌'} 늦은 호출은 반환 전에 정리: 응답 {result}, 정리된 호출 {closed}")
+    loop.set_exception_handler(None)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    openai_server = start_stub_server()
+    anthropic_server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{openai_server.server_address[1]}/v1"
+    settings.ANTHROPIC_BASE_URL = f"http://127.0.0.1:{anthropic_server.server_address[1]}"
+    settings.LLM_ROUTING_CANDIDATES = CANDIDATES
+    await llm_clients.start()
+
+    llm_service = LLMService()
+    llm_service.provider = "openai"
+
+    print("=" * 80)
+    print(f"LLM 제공자 라우팅 테스트 (후보 {CANDIDATES})")
+    print("=" * 80)
+
+    await test_latency_routing(openai_server, anthropic_server, llm_service, count)
+    await test_failover(openai_server, anthropic_server, llm_service)
+    await test_hedge(openai_server, anthropic_server, llm_service)
+    await test_task_cleanup()
+
+    await llm_clients.close()
+    openai_server.shutdown()
+    anthropic_server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
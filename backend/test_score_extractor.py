@@ -0,0 +1,57 @@
+"""
+직업선호도검사 (L형) 점수 추출 테스트 (LLM 호출 없음)
+
+사용법:
+    python test_score_extractor.py [PDF 경로]
+"""
+import asyncio
+import json
+import sys
+import time
+from app.models import CareerIdentityRequest
+from app.services.pdf_service import PDFService
+
+
+DEFAULT_PDF_PATH = "../직업심리검사(L형).pdf"
+
+
+async def test_score_extractor(pdf_path: str):
+    """L형 결과지에서 점수를 추출하고 CareerIdentityRequest로 검증"""
+    pdf_service = PDFService()
+
+    print("=" * 80)
+    print("L형 점수 추출 테스트")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    result = await pdf_service.extract_scores(pdf_path)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n📄 {pdf_path}")
+    print(f"   - 읽은 페이지: {result['pages_scanned']}/{result['total_pages']}")
+    print(f"   - 소요 시간: {elapsed * 1000:.1f}ms")
+    print(f"   - 흥미 코드: {result['interest_code']}")
+
+    if not result["success"]:
+        print(f"\n❌ 추출 실패: {result.get('error')}")
+        return result
+
+    # CareerIdentityRequest에 그대로 들어가는지 확인
+    request = CareerIdentityRequest(
+        riasec_scores=result["riasec_scores"],
+        big5_scores=result["big5_scores"],
+        life_history_scores=result["life_history_scores"]
+    )
+
+    print("\n✅ 추출 성공 (CareerIdentityRequest 검증 통과)")
+    print("\n[CareerIdentityRequest]")
+    print(json.dumps(request.model_dump(exclude={"use_cache"}), ensure_ascii=False, indent=2))
+    print("\n[응답 신뢰성]")
+    print(json.dumps(result["response_reliability"], ensure_ascii=False, indent=2))
+
+    return result
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PDF_PATH
+    asyncio.run(test_score_extractor(path))
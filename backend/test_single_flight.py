@@ -0,0 +1,85 @@
+"""
+동일 LLM 호출 합치기(single-flight) 테스트
+
+같은 프롬프트로 동시에 들어온 분석 요청이 제공자를 한 번만 호출하는지,
+실패가 합류한 모든 요청에 전달되는지, 리더 요청이 취소되어도 나머지는 결과를 받는지 확인합니다.
+
+사용법:
+    python test_single_flight.py [동시 요청 수]
+"""
+import sys
+import asyncio
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.single_flight import llm_single_flight
+
+SAMPLE_TEXT = "직업선호도검사 L형 결과 - 탐구형(I) 88점, 관습형(C) 78점"
+FORMAT = "직업선호도검사 (L형)"
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    server = start_stub_server(latency=0.3)
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    settings.ANTHROPIC_BASE_URL = "http://127.0.0.1:9"  # 연결 거부 (오류 전파 확인용)
+    await llm_clients.start()
+
+    llm_service = LLMService()
+    llm_service.provider = "openai"
+
+    print("=" * 80)
+    print(f"동일 LLM 호출 합치기 테스트 (동시 요청 {count}개)")
+    print("=" * 80)
+
+    # 1. 같은 프롬프트 동시 요청 → 제공자 호출 1회
+    results = await asyncio.gather(*(
+        llm_service.analyze_profile(SAMPLE_TEXT, FORMAT, use_cache=False) for _ in range(count)
+    ))
+    coalesced = sum(result["coalesced"] for result in results)
+    print(
+        f"{'✅' if server.request_count == 1 and all(r['success'] for r in results) else '❌'} "
+        f"같은 프롬프트 {count}개: 제공자 호출 {server.request_count}회, 합류 {coalesced}개"
+    )
+
+    # 2. 다른 프롬프트는 합치지 않음 / 완료 후 같은 프롬프트는 새로 호출
+    before = server.request_count
+    await asyncio.gather(
+        llm_service.analyze_profile(SAMPLE_TEXT + " (A)", FORMAT, use_cache=False),
+        llm_service.analyze_profile(SAMPLE_TEXT + " (B)", FORMAT, use_cache=False),
+        llm_service.analyze_profile(SAMPLE_TEXT, FORMAT, use_cache=False)
+    )
+    print(f"{'✅' if server.request_count - before == 3 else '❌'} 다른 프롬프트/완료 후 재요청: 제공자 호출 {server.request_count - before}회")
+
+    # 3. 리더 요청이 취소되어도 합류한 요청은 결과를 받음
+    leader = asyncio.create_task(llm_service.analyze_profile(SAMPLE_TEXT + " (C)", FORMAT, use_cache=False))
+    await asyncio.sleep(0.05)
+    follower = asyncio.create_task(llm_service.analyze_profile(SAMPLE_TEXT + " (C)", FORMAT, use_cache=False))
+    await asyncio.sleep(0.05)
+    leader.cancel()
+    result = await follower
+    print(f"{'✅' if result['success'] and result['coalesced'] else '❌'} 리더 취소 후 합류 요청: success={result['success']}")
+
+    # 4. 실패는 합류한 모든 요청에 전달
+    llm_service.provider = "anthropic"
+    results = await asyncio.gather(*(
+        llm_service.analyze_career_identity({"riasec_scores": {"I": 88}}, use_cache=False) for _ in range(5)
+    ))
+    errors = {result.get("error") for result in results}
+    print(
+        f"{'✅' if not any(r['success'] for r in results) and len(errors) == 1 else '❌'} "
+        f"실패 전파: 5개 모두 실패, 오류 {errors}"
+    )
+
+    print(f"\n통계: {llm_single_flight.get_stats()}")
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,190 @@
+"""
+스트리밍 응답 형태 검증 테스트 (조각 단위 파싱, 형태 위반 시 스트림 조기 중단과 즉시 재요청, 조각 간 제한 시간)
+
+형식이 어긋난 응답을 주입할 수 있는 로컬 스텁 서버를 대상으로 합니다.
+
+사용법:
+    python test_stream_json.py [청크 지연(초)]
+"""
+import sys
+import json
+import time
+import asyncio
+from stub_llm_server import start_stub_server, PROFILE_CONTENT
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.stream_json import SchemaViolation, StreamingJSONParser, stream_validation
+from app.services.provider_limiter import provider_limiters
+
+FORMAT = "직업선호도검사 (L형)"
+CAREER_INPUT = {"riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78}}
+
+# strengths 네 번째 항목에서 형태 위반 (뒤에 긴 출력이 이어짐)
+TOO_MANY_STRENGTHS = json.dumps({
+    "strengths": ["논리적 사고력", "문제 해결 능력", "분석력", "끈기"],
+    "interests": ["IT/기술", "데이터 분석"],
+    "weakness": "대인관계 및 팀워크. " * 30
+}, ensure_ascii=False)
+
+FENCED_WITH_PROSE = f"분석 결과는 다음과 같습니다.\n```json\n{PROFILE_CONTENT}\n```\n참고하세요."
+
+
+def test_parser() -> None:
+    """조각 단위 파싱 규칙 확인"""
+    fields = LLMService.PROFILE_FIELDS
+
+    parser = StreamingJSONParser(fields, "프로필")
+    for i in range(0, len(FENCED_WITH_PROSE), 5):
+        parser.feed(FENCED_WITH_PROSE[i:i + 5])
+    print(f"{'✅' if parser.done and parser.result()['weakness'] == '대인관계 및 팀워크' else '❌'} 앞 설명 문장/코드 펜스 무시")
+
+    cases = [
+        ("too_many_items", TOO_MANY_STRENGTHS),
+        ("too_few_items", '{"strengths": ["분석력"], "interests": ["IT", "예술"], "weakness": "시간 관리"}'),
+        ("type", '{"strengths": "분석력", "interests": ["IT", "예술"], "weakness": "시간 관리"}'),
+        ("missing_field", '{"strengths": ["a", "b", "c"], "interests": ["IT", "예술"]}'),
+        ("duplicate_key", '{"weakness": "a", "weakness": "b"}'),
+    ]
+    for reason, text in cases:
+        parser = StreamingJSONParser(fields, "프로필")
+        try:
+            for i in range(0, len(text), 8):
+                parser.feed(text[i:i + 8])
+            parser.result()
+            print(f"❌ {reason}: 위반을 감지하지 못함")
+        except SchemaViolation as e:
+            ok = e.reason == reason
+            print(f"{'✅' if ok else '❌'} {reason}: {str(e)} ({parser.received}/{len(text)}자에서 중단)")
+
+
+async def test_early_abort(server, llm_service: LLMService, chunk_delay: float) -> None:
+    """형태 위반 시 나머지 출력을 기다리지 않고 중단한 뒤 즉시 재요청"""
+    # 위반 없는 긴 응답을 끝까지 받는 시간 (비교 기준)
+    server.respond_with(TOO_MANY_STRENGTHS.replace(', "끈기"', ""))
+    started = time.perf_counter()
+    await llm_service.analyze_profile("기준 응답", FORMAT, use_cache=False)
+    full = time.perf_counter() - started
+
+    before = stream_validation.get_stats()
+    server.respond_with(TOO_MANY_STRENGTHS)
+    started = time.perf_counter()
+    result = await llm_service.analyze_profile("항목 수 초과", FORMAT, use_cache=False)
+    elapsed = time.perf_counter() - started
+    stats = stream_validation.get_stats()
+
+    print(
+        f"\n{'✅' if result['success'] and stats['retries'] == before['retries'] + 1 else '❌'} "
+        f"네 번째 strengths에서 중단 후 재요청 성공: {elapsed:.2f}s (위반 없는 긴 응답 끝까지 {full:.2f}s), "
+        f"중단 시점 평균 {stats['avg_chars_before_abort']}자/{len(TOO_MANY_STRENGTHS)}자"
+    )
+    print(f"{'✅' if elapsed < full else '❌'} 중단한 스트림 + 재요청이 긴 응답 하나보다 빠름")
+
+    await asyncio.sleep(chunk_delay * 5)  # 서버가 닫힌 연결을 감지할 때까지
+    print(f"{'✅' if server.cancelled_streams >= 1 else '❌'} 제공자 스트림 연결 닫힘: {server.cancelled_streams}회")
+
+
+async def test_retry_exhausted(server, llm_service: LLMService) -> None:
+    """재요청 횟수를 모두 쓰면 실패로 반환"""
+    server.respond_with(TOO_MANY_STRENGTHS, settings.LLM_SCHEMA_RETRY_ATTEMPTS + 1)
+    result = await llm_service.analyze_profile("계속 위반", FORMAT, use_cache=False)
+    print(f"\n{'✅' if not result['success'] else '❌'} 재요청 후에도 위반이면 실패: {result.get('error')}")
+
+
+async def test_fenced_response(server, llm_service: LLMService) -> None:
+    """설명 문장과 코드 펜스로 감싼 응답도 검증 통과"""
+    server.respond_with(FENCED_WITH_PROSE)
+    result = await llm_service.analyze_profile("코드 펜스", FORMAT, use_cache=False)
+    print(f"{'✅' if result['success'] and len(result['profile']['strengths']) == 3 else '❌'} 코드 펜스 응답 검증 통과")
+
+
+async def test_sse_violation(server, llm_service: LLMService) -> None:
+    """SSE 스트리밍은 위반한 조각을 전달하지 않고 error 이벤트로 종료"""
+    server.respond_with(json.dumps({"career_identity": "문단", "rationale": ["근거1", "근거2"]}, ensure_ascii=False))
+    events = [event async for event in llm_service.stream_career_identity(CAREER_INPUT, use_cache=False)]
+    sent = "".join(event["data"]["text"] for event in events if event["event"] == "delta")
+    print(
+        f"\n{'✅' if events[-1]['event'] == 'error' and '[' not in sent else '❌'} "
+        f"SSE 형태 위반: 마지막 이벤트 {events[-1]['event']}, 전달된 delta {sent!r}"
+    )
+
+
+async def test_disabled(server, llm_service: LLMService) -> None:
+    """검증을 끄면 일반 호출 후 전체 응답 파싱"""
+    settings.LLM_STREAM_VALIDATION_ENABLED = False
+    before = stream_validation.get_stats()
+    server.respond_with(TOO_MANY_STRENGTHS)
+    result = await llm_service.analyze_profile("검증 비활성화", FORMAT, use_cache=False)
+    after = stream_validation.get_stats()
+    print(
+        f"{'✅' if result['success'] and after['aborted'] == before['aborted'] else '❌'} "
+        f"검증 비활성화: 전체 응답 파싱 후 재요청 ({after['retries'] - before['retries']}회)"
+    )
+    settings.LLM_STREAM_VALIDATION_ENABLED = True
+
+
+async def test_stream_timeouts(server, llm_service: LLMService, chunk_delay: float) -> None:
+    """길지만 계속 생성 중인 응답은 시도 제한 시간에 끊기지 않고, 멈춘 스트림은 조각 간 제한 시간으로 끊김"""
+    limiter = provider_limiters.get("openai")
+    attempt_timeout = limiter.attempt_timeout
+    limiter.attempt_timeout = 0.2
+    before = limiter.retries
+
+    long_response = TOO_MANY_STRENGTHS.replace(', "끈기"', "")
+    server.respond_with(long_response)
+    started = time.perf_counter()
+    result = await llm_service.analyze_profile("긴 생성", FORMAT, use_cache=False)
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n{'✅' if result['success'] and elapsed > limiter.attempt_timeout and limiter.retries == before else '❌'} "
+        f"시도 제한 시간({limiter.attempt_timeout}s)보다 긴 스트림도 끝까지 수신: {elapsed:.2f}s, 재시도 {limiter.retries - before}회"
+    )
+
+    # 조각 사이 지연이 제한 시간을 넘으면 멈춘 스트림으로 보고 재시도
+    idle_timeout = settings.LLM_STREAM_IDLE_TIMEOUT
+    settings.LLM_STREAM_IDLE_TIMEOUT = chunk_delay * 2
+    server.RequestHandlerClass.chunk_delay = chunk_delay * 10
+    server.respond_with(long_response, 1)
+    timeouts = limiter.errors_by_reason.get("timeout", 0)
+    result = await llm_service.analyze_profile("멈춘 스트림", FORMAT, use_cache=False)
+    print(
+        f"{'✅' if limiter.errors_by_reason.get('timeout', 0) > timeouts else '❌'} "
+        f"조각 간 제한 시간({settings.LLM_STREAM_IDLE_TIMEOUT}s) 초과 시 중단 후 재시도: timeout {limiter.errors_by_reason.get('timeout', 0) - timeouts}회"
+    )
+
+    server.RequestHandlerClass.chunk_delay = chunk_delay
+    settings.LLM_STREAM_IDLE_TIMEOUT = idle_timeout
+    limiter.attempt_timeout = attempt_timeout
+
+
+async def main():
+    chunk_delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.01
+
+    server = start_stub_server(chunk_delay=chunk_delay)
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    await llm_clients.start()
+
+    llm_service = LLMService()
+    llm_service.provider = "openai"
+
+    print("=" * 80)
+    print(f"스트리밍 응답 형태 검증 테스트 (청크 지연 {chunk_delay}s)")
+    print("=" * 80)
+
+    test_parser()
+    await test_early_abort(server, llm_service, chunk_delay)
+    await test_retry_exhausted(server, llm_service)
+    await test_fenced_response(server, llm_service)
+    await test_sse_violation(server, llm_service)
+    await test_disabled(server, llm_service)
+    await test_stream_timeouts(server, llm_service, chunk_delay)
+    print(f"\n   검증 통계: {stream_validation.get_stats()}")
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
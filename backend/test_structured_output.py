@@ -0,0 +1,128 @@
+"""
+구조화 출력 테스트 (응답 모델 기반 JSON 스키마 요청, 깨진 JSON 로컬 복구, 제공자별 파싱 통계)
+
+형식이 어긋난 응답을 주입할 수 있는 로컬 스텁 서버를 대상으로 합니다.
+
+사용법:
+    python test_structured_output.py
+"""
+import json
+import asyncio
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.llm_clients import llm_clients
+from app.services.llm_service import LLMService
+from app.services.structured_output import repair_json, structured_output
+
+FORMAT = "직업선호도검사 (L형)"
+CAREER_INPUT = {"riasec_scores": {"R": 70, "I": 88, "A": 52, "S": 58, "E": 55, "C": 78}}
+
+BROKEN_RESPONSES = {
+    "trailing comma": '{"strengths": ["논리적 사고력", "문제 해결 능력", "분석력",], "interests": ["IT/기술", "데이터 분석"], "weakness": "시간 관리",}',
+    "따옴표 미이스케이프": '{"strengths": ["논리적 사고력", "문제 해결 능력", "분석력"], "interests": ["IT/기술", "데이터 분석"], "weakness": "스스로를 "완벽주의자"라고 느낌"}',
+    "잘린 문자열": '{"strengths": ["논리적 사고력", "문제 해결 능력", "분석력"], "interests": ["IT/기술", "데이터 분석"], "weakness": "대인관계 및 팀',
+    "줄바꿈 포함": '```json\n{"strengths": ["논리적 사고력", "문제 해결\n능력", "분석력"], "interests": ["IT/기술", "데이터 분석"], "weakness": "시간 관리"}\n```',
+}
+
+
+def test_repair() -> None:
+    """로컬 복구 규칙 확인"""
+    for name, text in BROKEN_RESPONSES.items():
+        repaired = repair_json(text)
+        try:
+            data = json.loads(repaired)
+            ok = len(data["strengths"]) == 3 and data["weakness"]
+        except (json.JSONDecodeError, KeyError):
+            ok = False
+        print(f"{'✅' if ok else '❌'} {name} 복구: {repaired[-40:]!r}")
+
+    truncated = repair_json('{"strengths": ["논리적 사고력", "문제 해결 능력", "분석력"], "interests": ["IT/기술", "데이터 분석"], "weak')
+    print(f"{'✅' if json.loads(truncated) and 'weak' not in truncated else '❌'} 잘린 키 제거: {truncated[-30:]!r}")
+
+
+async def test_schema_request(server, llm_service: LLMService) -> None:
+    """요청에 응답 모델에서 만든 스키마가 들어가는지 확인"""
+    llm_service.provider = "openai"
+    result = await llm_service.analyze_profile("스키마 요청", FORMAT, use_cache=False)
+    response_format = (server.last_body or {}).get("response_format") or {}
+    schema = response_format.get("json_schema", {}).get("schema", {})
+    print(
+        f"\n{'✅' if result['success'] and response_format.get('type') == 'json_schema' and schema['properties']['strengths']['maxItems'] == 3 else '❌'} "
+        f"OpenAI json_schema 요청 (strict={response_format.get('json_schema', {}).get('strict')}, 필드 {list(schema.get('properties', {}))})"
+    )
+
+    llm_service.provider = "anthropic"
+    for enabled in (True, False):
+        settings.LLM_STREAM_VALIDATION_ENABLED = enabled
+        result = await llm_service.analyze_profile(f"도구 호출 {enabled}", FORMAT, use_cache=False)
+        tool_choice = (server.last_body or {}).get("tool_choice") or {}
+        print(
+            f"{'✅' if result['success'] and tool_choice.get('name') == 'user_profile' and result['profile']['weakness'] else '❌'} "
+            f"Anthropic 도구 호출 출력 ({'스트리밍' if enabled else '일반'} 호출): {result['profile'] and result['profile']['strengths']}"
+        )
+    settings.LLM_STREAM_VALIDATION_ENABLED = True
+
+    events = [event async for event in llm_service.stream_career_identity(CAREER_INPUT, use_cache=False)]
+    print(f"{'✅' if events[-1]['event'] == 'result' else '❌'} Anthropic 도구 호출 SSE 스트리밍: 마지막 이벤트 {events[-1]['event']}")
+    llm_service.provider = "openai"
+
+
+async def test_repair_without_recall(server, llm_service: LLMService) -> None:
+    """형식 오류 응답은 재요청 없이 로컬 복구로 처리"""
+    for streaming in (True, False):
+        settings.LLM_STREAM_VALIDATION_ENABLED = streaming
+        before = server.request_count
+        results = []
+        for name, text in BROKEN_RESPONSES.items():
+            server.respond_with(text)
+            results.append(await llm_service.analyze_profile(f"복구 {name} {streaming}", FORMAT, use_cache=False))
+        sent = server.request_count - before
+        print(
+            f"\n{'✅' if all(r['success'] for r in results) and sent == len(BROKEN_RESPONSES) else '❌'} "
+            f"{'스트리밍' if streaming else '일반'} 호출: 깨진 응답 {len(BROKEN_RESPONSES)}개 모두 재요청 없이 복구 (제공자 요청 {sent}회)"
+        )
+    settings.LLM_STREAM_VALIDATION_ENABLED = True
+
+    # 복구해도 형태를 만족하지 않으면 재요청
+    before = server.request_count
+    server.respond_with('{"strengths": ["논리적 사고력", "문제 해결')
+    result = await llm_service.analyze_profile("복구 실패", FORMAT, use_cache=False)
+    print(f"{'✅' if result['success'] and server.request_count - before == 2 else '❌'} 복구 후 항목 수 부족이면 재요청: 제공자 요청 {server.request_count - before}회")
+
+    # 복구한 응답은 캐시에 복구된 형태로 저장
+    server.respond_with(BROKEN_RESPONSES["trailing comma"])
+    first = await llm_service.analyze_profile("복구 캐시", FORMAT)
+    second = await llm_service.analyze_profile("복구 캐시", FORMAT)
+    print(f"{'✅' if second.get('cache_status') == 'hit' and json.loads(second['raw_response']) == first['profile'] else '❌'} 복구한 응답 캐시 재사용")
+
+    stats = structured_output.get_stats()["openai"]
+    print(
+        f"\n   openai 파싱 통계: 응답 {stats['responses']}개, 그대로 {stats['parsed']}, 복구 {stats['repaired']}, "
+        f"복구 실패 {stats['repair_failed']}, 파싱 실패율 {stats['parse_failure_rate']}, 복구 성공률 {stats['repair_success_rate']}"
+    )
+
+
+async def main():
+    server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.ANTHROPIC_API_KEY = "stub"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    settings.ANTHROPIC_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    await llm_clients.start()
+
+    llm_service = LLMService()
+
+    print("=" * 80)
+    print("구조화 출력 테스트")
+    print("=" * 80)
+
+    test_repair()
+    await test_schema_request(server, llm_service)
+    await test_repair_without_recall(server, llm_service)
+
+    await llm_clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
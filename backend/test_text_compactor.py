@@ -0,0 +1,118 @@
+"""
+분석 텍스트 압축 테스트 (토큰 예산별 절감량과 점수 구간 포함 여부, 중요 구간이 없는 예산 초과 입력,
+업로드-분석 파이프라인 프롬프트의 점수 구간 포함 여부 확인)
+
+파이프라인은 앱을 ASGI로 직접 호출하고 로컬 스텁 LLM 서버가 받은 프롬프트를 확인합니다.
+(backend 디렉토리에서 실행 - 샘플 PDF 상대 경로)
+
+사용법:
+    python test_text_compactor.py [PDF 경로]
+"""
+import asyncio
+import json
+import sys
+import time
+import httpx
+from stub_llm_server import start_stub_server
+from app.core.config import settings
+from app.services.pdf_service import PDFService
+from app.services.text_compactor import TextCompactor, estimate_tokens
+
+
+DEFAULT_PDF_PATH = "../직업심리검사(L형).pdf"
+
+# 분석에 반드시 들어가야 하는 점수 행 (샘플 결과지 기준)
+SCORE_MARKERS = {
+    "RIASEC 표준점수": "표준점수 70 83 52 58 55 54",
+    "성격 5요인": "43 68 58 51 46",
+    "성격 하위요인": "온정성 46",
+    "생활사": "42 37 35 35 46 72 54 34 64",
+}
+
+
+async def test_text_compactor(pdf_path: str):
+    """예산별 압축 결과를 앞부분 자르기(text[:3000])와 비교"""
+    pdf_service = PDFService()
+    result = await pdf_service.extract_text_from_pdf(pdf_path)
+    text = result["text"]
+    format_detected = result["metadata"]["format_detected"]
+
+    print("=" * 80)
+    print(f"분석 텍스트 압축 테스트 - {format_detected}")
+    print("=" * 80)
+
+    truncated = text[:3000]
+    print(f"\n[기존] 앞 3000자: {estimate_tokens(truncated)} 토큰")
+    for name, marker in SCORE_MARKERS.items():
+        print(f"   - {name}: {'✅' if marker in truncated else '❌'}")
+
+    for budget in (800, 1500, 3000):
+        compacted = TextCompactor().compact(text, format_detected, budget)
+        print(f"\n[압축] 예산 {budget} 토큰: {compacted['original_tokens']} → {compacted['compacted_tokens']} "
+              f"(절감 {compacted['tokens_saved']}, 구간 {compacted['sections_selected']}/{compacted['sections_total']})")
+        for name, marker in SCORE_MARKERS.items():
+            print(f"   - {name}: {'✅' if marker in compacted['text'] else '❌'}")
+
+
+def test_plain_prose(budget: int = 1500):
+    """점수 행·키워드가 없는 일반 문장만 있는 입력도 예산만큼 원래 순서대로 채움"""
+    paragraphs = [
+        f"{index}번째 문단입니다. 학생은 방과 후에 친구들과 함께 도서관에서 책을 읽고 이야기를 나누는 시간을 즐겼다고 말했습니다. " * 4
+        for index in range(1, 31)
+    ]
+    prose = "\n\n".join(paragraphs)
+
+    print("\n[일반 문장] 중요 구간이 없는 예산 초과 입력")
+    for format_detected in (None, "직업선호도검사 (L형)"):
+        compacted = TextCompactor().compact(prose, format_detected, budget)
+        text = compacted["text"]
+        ordered = text.startswith("1번째 문단") and text.find("2번째 문단") < text.find("3번째 문단")
+        print(
+            f"   {'✅' if text and ordered and compacted['compacted_tokens'] <= budget else '❌'} {format_detected or '형식 미확인'}: "
+            f"{compacted['original_tokens']} → {compacted['compacted_tokens']} 토큰 (구간 {compacted['sections_selected']}/{compacted['sections_total']})"
+        )
+
+    # 모든 구간이 안내문(음수)이어도 빈 텍스트 대신 앞부분 사용
+    notices = "\n\n".join(f"{index} 자세한 내용은 www.work.go.kr 사이트에서 검색하세요. " * 6 for index in range(40))
+    compacted = TextCompactor().compact(notices, None, 200)
+    print(f"   {'✅' if compacted['text'] and compacted['compacted_tokens'] <= 200 else '❌'} 안내문만 있는 입력: {compacted['compacted_tokens']} 토큰 (앞부분 사용)")
+
+
+async def test_pipeline(pdf_path: str):
+    """업로드-분석 기본 경로(예산 추출)에서도 성격 5요인·생활사 점수 구간이 프롬프트에 들어가는지 확인"""
+    server = start_stub_server()
+    settings.OPENAI_API_KEY = "stub"
+    settings.LLM_PROVIDER = "openai"
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    from main import app, lifespan
+
+    # 추출 캐시에 없도록 실행마다 내용 해시가 다른 사본 업로드 (PDF 뒤 주석은 파싱에 영향 없음)
+    with open(pdf_path, "rb") as f:
+        data = f.read() + f"\n% compactor-{time.time_ns()}\n".encode()
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as client:
+            response = await client.post(
+                "/api/upload-and-analyze",
+                files={"file": ("sample.pdf", data, "application/pdf")},
+                data={"use_cache": "false"}
+            )
+    server.shutdown()
+
+    result = response.json()
+    prompt = json.dumps(server.last_body or {}, ensure_ascii=False)
+    print(f"\n[파이프라인] /api/upload-and-analyze: {response.status_code}, "
+          f"추출 {result.get('pages_extracted')}/{result.get('total_pages')}페이지, 압축 {(result.get('compaction') or {}).get('compacted_tokens')} 토큰")
+    for name, marker in SCORE_MARKERS.items():
+        print(f"   - {name}: {'✅' if marker in prompt else '❌'}")
+    factors = [factor for factor in ("성실성", "호감성", "생활사") if factor in prompt]
+    print(f"   {'✅' if len(factors) == 3 else '❌'} 프롬프트에 포함된 항목: {factors}")
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PDF_PATH
+    asyncio.run(test_text_compactor(path))
+    test_plain_prose()
+    asyncio.run(test_pipeline(path))
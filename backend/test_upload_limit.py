@@ -0,0 +1,114 @@
+"""
+업로드 크기 제한 테스트 (Content-Length 사전 거절, 청크 전송 중 첫 초과 청크에서 중단, 부분 파일(.part) 정리)
+
+앱을 ASGI로 직접 호출합니다. 청크 전송은 Content-Length 없이 multipart 본문을
+청크 단위로 내보내는 비동기 제너레이터로 보내며, 읽힌 청크 수를 셉니다.
+
+사용법:
+    python test_upload_limit.py
+"""
+import asyncio
+import hashlib
+import tempfile
+from pathlib import Path
+import httpx
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from app.core.config import settings
+from app.core.middleware import UploadSizeLimitMiddleware
+from app.core.utils import save_upload_stream, FileTooLargeError
+
+CHUNK = 16 * 1024
+BOUNDARY = "upload-limit-test"
+
+
+def build_app(directory: str, body_limit: int, file_limit: int) -> FastAPI:
+    """크기 제한 미들웨어와 save_upload_stream으로 저장하는 업로드 라우트"""
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        app.state.calls += 1
+        try:
+            return await save_upload_stream(file, "upload.pdf", max_size=file_limit, chunk_size=CHUNK, upload_dir=directory)
+        except FileTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_size=body_limit, paths=["/upload"])
+    return app
+
+
+class ChunkedUpload:
+    """multipart 본문을 청크 단위로 내보내는 요청 본문 (길이를 알 수 없음, 읽힌 파일 청크 수 기록)"""
+
+    def __init__(self, chunks: int):
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        yield (
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="large.pdf"\r\n'
+            f"Content-Type: application/pdf\r\n\r\n"
+        ).encode()
+        for _ in range(self.chunks):
+            self.sent += 1
+            yield b"0" * CHUNK
+        yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+async def test_content_length() -> None:
+    """선언된 길이가 제한을 넘으면 본문을 읽기 전에 거절 (main 앱 설정)"""
+    from main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        data = b"%PDF-1.4\n" + b"0" * (settings.MAX_FILE_SIZE + settings.UPLOAD_BODY_OVERHEAD)
+        response = await client.post("/api/upload-pdf", files={"file": ("large.pdf", data, "application/pdf")})
+    print(f"{'✅' if response.status_code == 413 else '❌'} Content-Length 초과 거절: {response.status_code} {response.json()['detail']}")
+
+
+async def test_streaming(directory: str) -> None:
+    """길이를 알 수 없는 요청은 누적 크기가 제한을 넘는 첫 청크에서 중단"""
+    app = build_app(directory, body_limit=4 * CHUNK, file_limit=100 * CHUNK)
+    body = ChunkedUpload(chunks=10)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/upload", content=body, headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"})
+
+    print(f"\n{'✅' if response.status_code == 413 else '❌'} 청크 전송 중 거절: {response.status_code} {response.json()['detail']}")
+    # 멀티파트 헤더 + 파일 청크 4개에서 제한(4청크)을 넘음
+    print(f"{'✅' if body.sent == 4 and app.state.calls == 0 else '❌'} 제한을 넘는 첫 청크에서 중단: 파일 청크 {body.sent}/{body.chunks}개 읽음, 핸들러 실행 {app.state.calls}회")
+
+
+async def test_part_cleanup(directory: str) -> None:
+    """파일 크기 제한 초과 시 부분 파일 삭제, 제한 이내면 .part 없이 저장"""
+    app = build_app(directory, body_limit=100 * CHUNK, file_limit=3 * CHUNK)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/upload", files={"file": ("large.pdf", b"0" * (5 * CHUNK), "application/pdf")})
+        leftovers = sorted(path.name for path in Path(directory).iterdir())
+        print(f"\n{'✅' if response.status_code == 413 else '❌'} 파일 크기 초과: {response.status_code} {response.json()['detail']}")
+        print(f"{'✅' if not leftovers else '❌'} 부분 파일 정리: 남은 파일 {leftovers}")
+
+        data = b"1" * (2 * CHUNK + 7)
+        saved = (await client.post("/upload", files={"file": ("small.pdf", data, "application/pdf")})).json()
+
+    leftovers = sorted(path.name for path in Path(directory).iterdir())
+    print(
+        f"{'✅' if leftovers == ['upload.pdf'] and saved['file_size'] == len(data) and saved['content_hash'] == hashlib.sha256(data).hexdigest() else '❌'} "
+        f"제한 이내 저장: {leftovers}, {saved['file_size']} bytes"
+    )
+
+
+async def main():
+    print("=" * 80)
+    print("업로드 크기 제한 테스트")
+    print("=" * 80)
+
+    await test_content_length()
+    with tempfile.TemporaryDirectory() as directory:
+        await test_streaming(directory)
+        await test_part_cleanup(directory)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
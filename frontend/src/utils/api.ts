@@ -36,3 +36,280 @@ export const uploadPDF = async (file: File): Promise<PDFUploadResponse> => {
 
   return response.data;
 };
+
+export interface UserProfile {
+  strengths: string[];
+  interests: string[];
+  weakness: string;
+}
+
+export interface PipelineAnalysisResponse {
+  success: boolean;
+  filename: string;
+  saved_filename: string;
+  content_hash: string;
+  file_size: number;
+  total_pages: number;
+  text_length: number;
+  format_detected: string;
+  is_supported_format: boolean;
+  extraction_cache_hit: boolean;
+  profile: UserProfile;
+  model_used: string;
+  cache_status: string;
+  text?: string | null;
+  warning?: string | null;
+}
+
+/**
+ * PDF 업로드부터 프로필 분석까지 한 번에 처리 (텍스트 왕복 없음)
+ */
+export const uploadAndAnalyze = async (
+  file: File,
+  includeText = false
+): Promise<PipelineAnalysisResponse> => {
+  const formData = new FormData();
+  formData.append('file', file);
+  formData.append('include_text', String(includeText));
+
+  const response = await axios.post<PipelineAnalysisResponse>(
+    `${API_BASE_URL}/upload-and-analyze`,
+    formData,
+    {
+      headers: {
+        'Content-Type': 'multipart/form-data',
+      },
+    }
+  );
+
+  return response.data;
+};
+
+export interface Big5FactorScore {
+  score: number;
+  subFactors: Record<string, number>;
+}
+
+export interface ScoreExtractionResponse {
+  success: boolean;
+  filename: string;
+  saved_filename: string;
+  content_hash: string;
+  riasec_scores: Record<string, number>;
+  riasec_raw_scores: Record<string, number>;
+  interest_code?: string | null;
+  big5_scores: Record<string, Big5FactorScore>;
+  life_history_scores: Record<string, number>;
+  response_reliability: Record<string, { score: number; threshold: number }>;
+  missing_sections: string[];
+  pages_scanned: number;
+  total_pages: number;
+  error?: string | null;
+}
+
+/**
+ * 직업선호도검사 (L형) PDF에서 점수 직접 추출 (LLM 호출 없음)
+ */
+export const extractScores = async (file: File): Promise<ScoreExtractionResponse> => {
+  const formData = new FormData();
+  formData.append('file', file);
+
+  const response = await axios.post<ScoreExtractionResponse>(
+    `${API_BASE_URL}/extract-scores`,
+    formData,
+    {
+      headers: {
+        'Content-Type': 'multipart/form-data',
+      },
+    }
+  );
+
+  return response.data;
+};
+
+export interface JobRecommendation {
+  job_id: string;
+  job_name: string;
+  category: string;
+  riasec: string;
+  description: string;
+  required_aptitudes: string[];
+  related_interests: string[];
+  score: number;
+  aptitude_score: number;
+  interest_score: number;
+}
+
+export interface JobRecommendationResponse {
+  success: boolean;
+  recommendations: JobRecommendation[];
+  total_jobs: number;
+  embed_time_ms: number;
+  search_time_ms: number;
+}
+
+/**
+ * 사용자 프로필과 유사한 직업 추천 (Mini-DB 벡터 매칭)
+ */
+export const recommendJobs = async (
+  profile: UserProfile,
+  topK: number = 3
+): Promise<JobRecommendationResponse> => {
+  const response = await axios.post<JobRecommendationResponse>(
+    `${API_BASE_URL}/recommend-jobs`,
+    { profile, top_k: topK }
+  );
+
+  return response.data;
+};
+
+export interface BatchItemResult {
+  type: 'result';
+  index: number;
+  filename: string;
+  success: boolean;
+  stage?: 'upload' | 'extraction' | 'analysis';
+  error?: string;
+  content_hash?: string;
+  saved_filename?: string;
+  total_pages?: number;
+  pages_extracted?: number;
+  format_detected?: string;
+  is_supported_format?: boolean;
+  extraction_cache_hit?: boolean;
+  profile?: UserProfile;
+  model_used?: string;
+  cache_status?: string;
+  warning?: string;
+  extract_ms?: number;
+  analyze_ms?: number;
+}
+
+export interface BatchSummary {
+  type: 'summary';
+  total_files: number;
+  succeeded: number;
+  failed: number;
+  failures_by_stage: Record<string, number>;
+  concurrency: number;
+  elapsed_seconds: number;
+  files_per_second: number;
+  extraction_cache_hits: number;
+  llm_cache_hits: number;
+  avg_extract_ms: number;
+  avg_analyze_ms: number;
+}
+
+/**
+ * 여러 PDF/ZIP 일괄 분석 (파일별 결과를 완료 순서대로 onResult로 전달, 마지막에 요약 반환)
+ */
+export const batchAnalyze = async (
+  files: File[],
+  onResult: (result: BatchItemResult) => void,
+  concurrency?: number
+): Promise<BatchSummary | null> => {
+  const formData = new FormData();
+  files.forEach((file) => formData.append('files', file));
+  if (concurrency) {
+    formData.append('concurrency', String(concurrency));
+  }
+
+  // axios는 브라우저에서 응답 스트리밍을 지원하지 않으므로 fetch 사용
+  const response = await fetch(`${API_BASE_URL}/batch-analyze`, {
+    method: 'POST',
+    body: formData,
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => null);
+    throw new Error(error?.detail ?? `일괄 분석 요청 실패 (${response.status})`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let summary: BatchSummary | null = null;
+
+  const handleLine = (line: string) => {
+    if (!line.trim()) return;
+    const data = JSON.parse(line) as BatchItemResult | BatchSummary;
+    if (data.type === 'summary') {
+      summary = data;
+    } else {
+      onResult(data);
+    }
+  };
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() ?? '';
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer + decoder.decode());
+
+  return summary;
+};
+
+export type AnalysisJobStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+
+export interface AnalysisJobSubmitResponse {
+  job_id: string;
+  kind: 'profile' | 'career_identity';
+  status: AnalysisJobStatus;
+  queue_position?: number | null;
+  queue_depth: number;
+  status_url: string;
+}
+
+export interface AnalysisJobStatusResponse<T = unknown> {
+  job_id: string;
+  kind: 'profile' | 'career_identity';
+  status: AnalysisJobStatus;
+  queue_position?: number | null;
+  attempts: number;
+  created_at: number;
+  started_at?: number | null;
+  finished_at?: number | null;
+  wait_time_ms?: number | null;
+  run_time_ms?: number | null;
+  result?: T | null;
+  error?: string | null;
+}
+
+/**
+ * 프로필 분석을 작업 큐에 제출 (작업 ID 즉시 반환)
+ */
+export const submitProfileAnalysis = async (
+  text: string,
+  formatDetected: string
+): Promise<AnalysisJobSubmitResponse> => {
+  const response = await axios.post<AnalysisJobSubmitResponse>(
+    `${API_BASE_URL}/analysis-jobs/profile`,
+    { text, format_detected: formatDetected }
+  );
+
+  return response.data;
+};
+
+/**
+ * 작업이 끝날 때까지 long-poll로 기다린 뒤 최종 상태 반환
+ */
+export const waitForAnalysisJob = async <T = unknown>(
+  jobId: string,
+  waitSeconds: number = 20
+): Promise<AnalysisJobStatusResponse<T>> => {
+  for (;;) {
+    const response = await axios.get<AnalysisJobStatusResponse<T>>(
+      `${API_BASE_URL}/analysis-jobs/${jobId}`,
+      { params: { wait: waitSeconds } }
+    );
+
+    if (response.data.status === 'succeeded' || response.data.status === 'failed') {
+      return response.data;
+    }
+  }
+};